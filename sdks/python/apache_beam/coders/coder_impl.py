@@ -1712,6 +1712,12 @@ class ParamWindowedValueCoderImpl(WindowedValueCoderImpl):
     return estimated_size, observables
 
 
+# Length prefixed values of at least this many bytes are decoded from a view of
+# the input, rather than from a copy of their encoding. Smaller values are
+# copied, which is cheaper than creating a view and a stream over it.
+_MIN_LENGTH_PREFIXED_VIEW_SIZE = 1 << 12
+
+
 class LengthPrefixCoderImpl(StreamCoderImpl):
   """For internal use only; no backwards-compatibility guarantees.
 
@@ -1729,7 +1735,10 @@ class LengthPrefixCoderImpl(StreamCoderImpl):
   def decode_from_stream(self, in_stream, nested):
     # type: (create_InputStream, bool) -> Any
     value_length = in_stream.read_var_int64()
-    return self._value_coder.decode(in_stream.read(value_length))
+    if value_length < _MIN_LENGTH_PREFIXED_VIEW_SIZE:
+      return self._value_coder.decode(in_stream.read(value_length))
+    return self._value_coder.decode_from_stream(
+        create_InputStream(in_stream.read_view(value_length)), False)
 
   def estimate_size(self, value, nested=False):
     # type: (Any, bool) -> int
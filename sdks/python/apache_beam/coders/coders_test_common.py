@@ -915,6 +915,21 @@ class CodersTest(unittest.TestCase):
     self.check_coder(
         coders.TupleCoder((coder, coder)), (b'', b'a'), (b'bc', b'def'))
 
+  def test_length_prefix_coder_large_values(self):
+    # Large values are decoded from a view of the encoded input.
+    large = b'x' * (1 << 16)
+    self.check_coder(coders.LengthPrefixCoder(coders.BytesCoder()), large)
+    self.check_coder(
+        coders.LengthPrefixCoder(coders.FastPrimitivesCoder()),
+        large, ('a' * (1 << 14), [large]), {'key': large})
+    coder = coders.TupleCoder(
+        (coders.LengthPrefixCoder(coders.PickleCoder()), coders.VarIntCoder()))
+    self.check_coder(coder, ({'key': large}, 7))
+    self.assertIsInstance(
+        coders.LengthPrefixCoder(coders.BytesCoder()).decode(
+            coders.LengthPrefixCoder(coders.BytesCoder()).encode(large)),
+        bytes)
+
   def test_nested_observables(self):
     class FakeObservableIterator(observable.ObservableMixin):
       def __iter__(self):
@@ -23,6 +23,8 @@ For internal use only; no backwards-compatibility guarantees.
 
 import struct
 from typing import List
+from typing import Optional
+from typing import Union
 
 
 class OutputStream(object):
@@ -122,20 +124,32 @@ class InputStream(object):
   """For internal use only; no backwards-compatibility guarantees.
 
   A pure Python implementation of stream.InputStream."""
-  def __init__(self, data: bytes) -> None:
+  def __init__(self, data: Union[bytes, bytearray, memoryview]) -> None:
+    if not isinstance(data, bytes):
+      data = memoryview(data).cast('B')
     self.data = data
     self.pos = 0
+    self.view: Optional[memoryview] = None
 
   def size(self):
     return len(self.data) - self.pos
 
   def read(self, size: int) -> bytes:
     self.pos += size
-    return self.data[self.pos - size:self.pos]
+    return bytes(self.data[self.pos - size:self.pos])
+
+  def read_view(self, size: int) -> memoryview:
+    if self.view is None:
+      self.view = memoryview(self.data)
+    self.pos += size
+    return self.view[self.pos - size:self.pos]
 
   def read_all(self, nested: bool) -> bytes:
     return self.read(self.read_var_int64() if nested else self.size())
 
+  def read_all_view(self, nested: bool = False) -> memoryview:
+    return self.read_view(self.read_var_int64() if nested else self.size())
+
   def read_byte(self) -> int:
     self.pos += 1
     return self.data[self.pos - 1]
@@ -57,11 +57,16 @@ cdef class ByteCountingOutputStream(OutputStream):
 
 cdef class InputStream(object):
   cdef size_t pos
-  cdef bytes all
+  cdef object all
   cdef char* allc
+  cdef ssize_t length
+  cdef Py_buffer buffer
+  cdef bint has_buffer
+  cdef object view
 
   cpdef ssize_t size(self) except? -1
   cpdef bytes read(self, size_t len)
+  cpdef read_view(self, size_t len)
   cpdef long read_byte(self) except? -1
   cpdef libc.stdint.int64_t read_var_int64(self) except? -1
   cpdef libc.stdint.int32_t read_var_int32(self) except? -1
@@ -72,5 +77,6 @@ cdef class InputStream(object):
   cpdef double read_bigendian_double(self) except? -1
   cpdef float read_bigendian_float(self) except? -1
   cpdef bytes read_all(self, bint nested=*)
+  cpdef read_all_view(self, bint nested=*)
 
 cpdef libc.stdint.int64_t get_varint_size(libc.stdint.int64_t value)
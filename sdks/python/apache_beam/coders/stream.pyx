@@ -20,6 +20,7 @@
 For internal use only; no backwards-compatibility guarantees.
 """
 
+cimport cpython.buffer
 cimport libc.stdlib
 cimport libc.string
 
@@ -189,15 +190,47 @@ cdef class ByteCountingOutputStream(OutputStream):
 
 
 cdef class InputStream(object):
-  """An input string stream implementation supporting read() and size()."""
+  """An input string stream implementation supporting read() and size().
+
+  The stream reads from bytes, or from any other object supporting the
+  contiguous buffer protocol (such as a bytearray or memoryview), without
+  copying it.
+  """
 
   def __init__(self, all):
-    self.allc = self.all = all
+    if self.has_buffer:
+      cpython.buffer.PyBuffer_Release(&self.buffer)
+      self.has_buffer = False
+    self.all = all
+    self.view = None
+    if type(all) is bytes:
+      self.allc = <bytes>all
+      self.length = len(<bytes>all)
+    else:
+      cpython.buffer.PyObject_GetBuffer(
+          all, &self.buffer, cpython.buffer.PyBUF_SIMPLE)
+      self.has_buffer = True
+      self.allc = <char*>self.buffer.buf
+      self.length = self.buffer.len
+
+  def __dealloc__(self):
+    if self.has_buffer:
+      cpython.buffer.PyBuffer_Release(&self.buffer)
 
   cpdef bytes read(self, size_t size):
     self.pos += size
     return self.allc[self.pos - size : self.pos]
 
+  cpdef read_view(self, size_t size):
+    """Returns a memoryview of the next size bytes, without copying them.
+
+    The view shares the memory of the underlying buffer, which it keeps alive.
+    """
+    if self.view is None:
+      self.view = memoryview(self.all).cast('B')
+    self.pos += size
+    return self.view[self.pos - size : self.pos]
+
   cpdef long read_byte(self) except? -1:
     self.pos += 1
     # Note: Some C++ compilers treats the char array below as a signed char.
@@ -206,11 +239,15 @@ cdef class InputStream(object):
     return <long>(<unsigned char> self.allc[self.pos - 1])
 
   cpdef ssize_t size(self) except? -1:
-    return len(self.all) - self.pos
+    return self.length - self.pos
 
   cpdef bytes read_all(self, bint nested=False):
     return self.read(<ssize_t>self.read_var_int64() if nested else self.size())
 
+  cpdef read_all_view(self, bint nested=False):
+    return self.read_view(
+        <ssize_t>self.read_var_int64() if nested else self.size())
+
   cpdef libc.stdint.int64_t read_var_int64(self) except? -1:
     """Decode a variable-length encoded long from a stream."""
     # Inline common case.
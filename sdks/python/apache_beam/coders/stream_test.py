@@ -52,6 +52,38 @@ class StreamTest(unittest.TestCase):
     in_s = self.InputStream(out_s.get())
     self.assertEqual(b'abc', in_s.read_all(False))
 
+  def test_read_from_buffers(self):
+    out_s = self.OutputStream()
+    out_s.write(b'abc')
+    out_s.write(b'xyz', True)
+    out_s.write_var_int64(1 << 20)
+    encoded = out_s.get()
+    for data in (encoded, bytearray(encoded), memoryview(encoded)):
+      in_s = self.InputStream(data)
+      self.assertEqual(len(encoded), in_s.size())
+      self.assertEqual(b'abc', in_s.read(3))
+      self.assertIsInstance(in_s.read(0), bytes)
+      self.assertEqual(b'xyz', in_s.read_all(True))
+      self.assertEqual(1 << 20, in_s.read_var_int64())
+      self.assertEqual(0, in_s.size())
+
+  def test_read_view(self):
+    out_s = self.OutputStream()
+    out_s.write(b'abc')
+    out_s.write(b'xyz', True)
+    out_s.write(b'rest')
+    data = bytearray(out_s.get())
+    in_s = self.InputStream(data)
+    view = in_s.read_view(3)
+    self.assertIsInstance(view, memoryview)
+    self.assertEqual(b'abc', bytes(view))
+    self.assertEqual(b'xyz', bytes(in_s.read_all_view(True)))
+    self.assertEqual(b'rest', bytes(in_s.read_all_view(False)))
+    self.assertEqual(0, in_s.size())
+    # Views share the memory of the underlying buffer.
+    data[0:1] = b'A'
+    self.assertEqual(b'Abc', bytes(view))
+
   def test_read_write_byte(self):
     out_s = self.OutputStream()
     out_s.write_byte(1)
@@ -19,6 +19,7 @@
 
 # pytype: skip-file
 
+import contextlib
 import logging
 import os
 import re
@@ -30,6 +31,7 @@ from apache_beam.io import iobase
 from apache_beam.io.filesystem import BeamIOError
 from apache_beam.io.filesystem import CompressionTypes
 from apache_beam.io.filesystems import FileSystems
+from apache_beam.metrics.metric import Metrics
 from apache_beam.options.value_provider import StaticValueProvider
 from apache_beam.options.value_provider import ValueProvider
 from apache_beam.options.value_provider import check_accessible
@@ -371,80 +373,30 @@ class FileBasedSink(iobase.Sink):
     writer_results = sorted(writer_results)
     num_shards = len(writer_results)
 
-    src_files, dst_files, delete_files, num_skipped = (
-        self._check_state_for_finalize_write(writer_results, num_shards, w))
+    finalizer = _FileFinalizer(
+        self.file_path_prefix.get(),
+        FileBasedSink,
+        max_threads=FileBasedSink._MAX_RENAME_THREADS)
+    with finalizer.phase('finalize_check_state'):
+      src_files, dst_files, delete_files, num_skipped = (
+          self._check_state_for_finalize_write(writer_results, num_shards, w))
     num_skipped += len(delete_files)
-    FileSystems.delete(delete_files)
+    with finalizer.phase('finalize_delete'):
+      delete_exceptions = finalizer.delete(delete_files)
+    if delete_exceptions:
+      raise Exception(
+          'Encountered exceptions in finalize_write: %s' % delete_exceptions)
     num_shards_to_finalize = len(src_files)
-    min_threads = min(num_shards_to_finalize, FileBasedSink._MAX_RENAME_THREADS)
-    num_threads = max(1, min_threads)
-
-    chunk_size = FileSystems.get_chunk_size(self.file_path_prefix.get())
-    source_file_batch = [
-        src_files[i:i + chunk_size]
-        for i in range(0, len(src_files), chunk_size)
-    ]
-    destination_file_batch = [
-        dst_files[i:i + chunk_size]
-        for i in range(0, len(dst_files), chunk_size)
-    ]
 
     if num_shards_to_finalize:
       start_time = time.time()
+      with finalizer.phase('finalize_rename'):
+        all_exceptions = finalizer.rename(src_files, dst_files)
+      if all_exceptions:
+        raise Exception(
+            'Encountered exceptions in finalize_write: %s' % all_exceptions)
 
-      def _rename_batch(batch):
-        """_rename_batch executes batch rename operations."""
-        source_files, destination_files = batch
-        exceptions = []
-        try:
-          FileSystems.rename(source_files, destination_files)
-          return exceptions
-        except BeamIOError as exp:
-          if exp.exception_details is None:
-            raise
-          for (src, dst), exception in exp.exception_details.items():
-            if exception:
-              _LOGGER.error(
-                  ('Exception in _rename_batch. src: %s, '
-                   'dst: %s, err: %s'),
-                  src,
-                  dst,
-                  exception)
-              exceptions.append(exception)
-            else:
-              _LOGGER.debug('Rename successful: %s -> %s', src, dst)
-          return exceptions
-
-      if w is None or isinstance(w, window.GlobalWindow):
-        # bounded input was handled by finalize_write legacy method
-        # the implementation here should be called by finalize_write
-        # Use a thread pool for renaming operations.
-        exception_batches = util.run_using_threadpool(
-            _rename_batch,
-            list(zip(source_file_batch, destination_file_batch)),
-            num_threads)
-
-        all_exceptions = [
-            e for exception_batch in exception_batches for e in exception_batch
-        ]
-        if all_exceptions:
-          raise Exception(
-              'Encountered exceptions in finalize_write: %s' % all_exceptions)
-
-        yield from dst_files
-      else:
-        # unbounded input
-        batch = list([src_files, dst_files])
-        exception_batches = _rename_batch(batch)
-
-        all_exceptions = [
-            e for exception_batch in exception_batches for e in exception_batch
-        ]
-        if all_exceptions:
-          raise Exception(
-              'Encountered exceptions in finalize_write: %s' % all_exceptions)
-
-        yield from dst_files
+      yield from dst_files
 
       _LOGGER.info(
           'Renamed %d shards in %.2f seconds.',
@@ -534,6 +486,113 @@ class FileBasedSink(iobase.Sink):
     return type(self) == type(other) and self.__dict__ == other.__dict__
 
 
+class _FileFinalizer(object):
+  """Renames and deletes the files of a write with bounded parallelism.
+
+  The files are split into batches of the chunk size of their filesystem, and
+  up to ``max_threads`` batches are renamed or deleted concurrently. Files
+  that were already renamed or deleted, for example by a retried
+  finalization, are skipped.
+  """
+  def __init__(self, path, metrics_namespace, max_threads):
+    """Initializes a _FileFinalizer.
+
+    Args:
+      path: A path of the filesystem of the files.
+      metrics_namespace: The namespace of the timing metrics of the phases.
+      max_threads: The maximum number of concurrent batches.
+    """
+    self._chunk_size = FileSystems.get_chunk_size(path)
+    self._metrics_namespace = metrics_namespace
+    self._max_threads = max_threads
+
+  @contextlib.contextmanager
+  def phase(self, name):
+    """Reports the time spent in a phase of the finalization as the
+    ``<name>_msecs`` distribution metric."""
+    start_time = time.time()
+    try:
+      yield
+    finally:
+      Metrics.distribution(self._metrics_namespace, '%s_msecs' % name).update(
+          int(1000 * (time.time() - start_time)))
+
+  def rename(self, src_files, dst_files):
+    """Renames each of src_files to the corresponding dst_files.
+
+    Returns:
+      The exceptions raised for the files that could not be renamed.
+    """
+    return self._run_batches(
+        self._rename_batch, list(zip(src_files, dst_files)))
+
+  def delete(self, files):
+    """Deletes files.
+
+    Returns:
+      The exceptions raised for the files that could not be deleted.
+    """
+    return self._run_batches(self._delete_batch, files)
+
+  def _run_batches(self, batch_fn, items):
+    batches = [
+        items[i:i + self._chunk_size]
+        for i in range(0, len(items), self._chunk_size)
+    ]
+    if not batches:
+      return []
+    if len(batches) == 1 or self._max_threads <= 1:
+      exception_batches = [batch_fn(batch) for batch in batches]
+    else:
+      exception_batches = util.run_using_threadpool(
+          batch_fn, batches, self._max_threads)
+    return [e for exception_batch in exception_batches for e in exception_batch]
+
+  def _rename_batch(self, batch):
+    """_rename_batch executes batch rename operations."""
+    source_files = [src for src, _ in batch]
+    destination_files = [dst for _, dst in batch]
+    exceptions = []
+    try:
+      FileSystems.rename(source_files, destination_files)
+      return exceptions
+    except BeamIOError as exp:
+      if exp.exception_details is None:
+        raise
+      for (src, dst), exception in exp.exception_details.items():
+        if not exception:
+          _LOGGER.debug('Rename successful: %s -> %s', src, dst)
+        elif not FileSystems.exists(src) and FileSystems.exists(dst):
+          _LOGGER.debug(
+              'src: %s -> dst: %s already renamed, skipping', src, dst)
+        else:
+          _LOGGER.error(
+              ('Exception in _rename_batch. src: %s, '
+               'dst: %s, err: %s'),
+              src,
+              dst,
+              exception)
+          exceptions.append(exception)
+      return exceptions
+
+  def _delete_batch(self, batch):
+    """_delete_batch executes batch delete operations."""
+    exceptions = []
+    try:
+      FileSystems.delete(batch)
+      return exceptions
+    except BeamIOError as exp:
+      if exp.exception_details is None:
+        raise
+      for path, exception in exp.exception_details.items():
+        if not exception or not FileSystems.exists(path):
+          continue
+        _LOGGER.error(
+            'Exception in _delete_batch. path: %s, err: %s', path, exception)
+        exceptions.append(exception)
+      return exceptions
+
+
 class FileBasedSinkWriter(iobase.Writer):
   """The writer for FileBasedSink.
   """
@@ -399,6 +399,93 @@ class TestFileBasedSink(_TestCaseWithTempDirCleanUp):
       sink.pre_finalize(init_token, [res1, res2])
 
 
+class TestFileFinalizer(_TestCaseWithTempDirCleanUp):
+  def _create_files(self, dir, names):
+    paths = [os.path.join(dir, name) for name in names]
+    for path in paths:
+      with open(path, 'w') as f:
+        f.write(os.path.basename(path))
+    return paths
+
+  def test_rename(self):
+    src_dir = self._new_tempdir()
+    dst_dir = self._new_tempdir()
+    names = ['file-%d' % i for i in range(10)]
+    src_files = self._create_files(src_dir, names)
+    dst_files = [os.path.join(dst_dir, name) for name in names]
+
+    finalizer = filebasedsink._FileFinalizer(src_dir, 'ns', max_threads=4)
+    self.assertEqual([], finalizer.rename(src_files, dst_files))
+    self.assertEqual([], glob.glob(os.path.join(src_dir, '*')))
+    for name, dst in zip(names, dst_files):
+      with open(dst) as f:
+        self.assertEqual(name, f.read())
+
+  def test_rename_skips_renamed_files(self):
+    src_dir = self._new_tempdir()
+    dst_dir = self._new_tempdir()
+    names = ['file-%d' % i for i in range(10)]
+    src_files = self._create_files(src_dir, names)
+    dst_files = [os.path.join(dst_dir, name) for name in names]
+    # A previous, failed attempt already renamed some of the files.
+    for src, dst in list(zip(src_files, dst_files))[::2]:
+      os.rename(src, dst)
+
+    finalizer = filebasedsink._FileFinalizer(src_dir, 'ns', max_threads=4)
+    self.assertEqual([], finalizer.rename(src_files, dst_files))
+    self.assertCountEqual(dst_files, glob.glob(os.path.join(dst_dir, '*')))
+
+  def test_rename_missing_files(self):
+    src_dir = self._new_tempdir()
+    dst_dir = self._new_tempdir()
+    src_files = self._create_files(src_dir, ['file-0', 'file-1'])
+    src_files.append(os.path.join(src_dir, 'missing'))
+    dst_files = [
+        os.path.join(dst_dir, name) for name in ['file-0', 'file-1', 'missing']
+    ]
+
+    finalizer = filebasedsink._FileFinalizer(src_dir, 'ns', max_threads=4)
+    exceptions = finalizer.rename(src_files, dst_files)
+    self.assertEqual(1, len(exceptions))
+    self.assertTrue(os.path.exists(dst_files[0]))
+    self.assertTrue(os.path.exists(dst_files[1]))
+
+  def test_delete_skips_deleted_files(self):
+    temp_dir = self._new_tempdir()
+    files = self._create_files(temp_dir, ['file-%d' % i for i in range(10)])
+    for path in files[::2]:
+      os.remove(path)
+
+    finalizer = filebasedsink._FileFinalizer(temp_dir, 'ns', max_threads=4)
+    self.assertEqual([], finalizer.delete(files))
+    self.assertEqual([], glob.glob(os.path.join(temp_dir, '*')))
+
+  @mock.patch.object(filebasedsink.FileSystems, 'delete')
+  def test_delete_error(self, delete_mock):
+    temp_dir = self._new_tempdir()
+    files = self._create_files(temp_dir, ['file-0', 'file-1'])
+
+    def delete(paths):
+      if files[1] in paths:
+        raise BeamIOError(
+            'mock delete error', {files[1]: IOError('mock delete error')})
+
+    delete_mock.side_effect = delete
+
+    finalizer = filebasedsink._FileFinalizer(temp_dir, 'ns', max_threads=4)
+    exceptions = finalizer.delete(files)
+    self.assertEqual(1, len(exceptions))
+
+  @mock.patch.object(filebasedsink.Metrics, 'distribution')
+  def test_phase_metrics(self, distribution_mock):
+    finalizer = filebasedsink._FileFinalizer(
+        self._new_tempdir(), 'ns', max_threads=4)
+    with finalizer.phase('finalize_rename'):
+      pass
+    distribution_mock.assert_called_once_with('ns', 'finalize_rename_msecs')
+    distribution_mock.return_value.update.assert_called_once()
+
+
 if __name__ == '__main__':
   logging.getLogger().setLevel(logging.INFO)
   unittest.main()
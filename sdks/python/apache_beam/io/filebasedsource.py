@@ -37,6 +37,7 @@ from apache_beam.internal import pickler
 from apache_beam.io import concat_source
 from apache_beam.io import iobase
 from apache_beam.io import range_trackers
+from apache_beam.io.filesystem import CompressedFile
 from apache_beam.io.filesystem import CompressionTypes
 from apache_beam.io.filesystem import FileMetadata
 from apache_beam.io.filesystems import FileSystems
@@ -68,7 +69,9 @@ class FileBasedSource(iobase.BoundedSource):
       min_bundle_size=0,
       compression_type=CompressionTypes.AUTO,
       splittable=True,
-      validate=True):
+      validate=True,
+      read_ahead=False,
+      split_compressed_blocks=False):
     """Initializes :class:`FileBasedSource`.
 
     Args:
@@ -91,9 +94,16 @@ class FileBasedSource(iobase.BoundedSource):
         :data:`True` by the user, :class:`FileBasedSource` may choose to not
         split the file, for example, for compressed files where currently it is
         not possible to efficiently read a data range without decompressing the
-        whole file.
+        whole file. See **split_compressed_blocks**.
       validate (bool): Boolean flag to verify that the files exist during the
         pipeline creation time.
+      read_ahead (bool): If True, compressed files are read and decompressed
+        on a background thread, ahead of the records being read.
+      split_compressed_blocks (bool): If True, compressed files that are made
+        of several independently compressed blocks, such as multi-member gzip
+        files, bgzip files, and zstd files of several frames, are split at the
+        boundaries of blocks. Finding the blocks reads the headers of bgzip
+        files, but decompresses other files once when the source is split.
 
     Raises:
       TypeError: when **compression_type** is not valid or if
@@ -123,6 +133,11 @@ class FileBasedSource(iobase.BoundedSource):
           'was %s' % type(compression_type))
     self._compression_type = compression_type
     self._splittable = splittable
+    self._read_ahead = read_ahead
+    self._split_compressed_blocks = split_compressed_blocks
+    # The block index of the file of a sub-source of a compressed file that
+    # is split at the boundaries of its blocks.
+    self._block_index = None
     if validate and file_pattern.is_accessible():
       self._validate()
 
@@ -175,10 +190,48 @@ class FileBasedSource(iobase.BoundedSource):
     return self._concat_source
 
   def open_file(self, file_name):
-    return FileSystems.open(
+    compression_type = self._get_compression_type(file_name)
+    if (compression_type == CompressionTypes.UNCOMPRESSED or
+        not (self._read_ahead or self._block_index)):
+      return FileSystems.open(
+          file_name,
+          'application/octet-stream',
+          compression_type=self._compression_type)
+
+    raw_file = FileSystems.open(
         file_name,
         'application/octet-stream',
-        compression_type=self._compression_type)
+        compression_type=CompressionTypes.UNCOMPRESSED)
+    return CompressedFile(
+        raw_file,
+        compression_type,
+        read_ahead=self._read_ahead,
+        block_index=self._block_index)
+
+  def _get_compression_type(self, file_name):
+    if self._compression_type == CompressionTypes.AUTO:
+      return CompressionTypes.detect_compression_type(file_name)
+    return self._compression_type
+
+  def _read_block_index(self, file_name, max_block_size):
+    """Returns the block index of a compressed file, as returned by
+    :meth:`CompressedFile.read_block_index`, or None."""
+    compression_type = self._get_compression_type(file_name)
+    if compression_type not in CompressedFile.BLOCK_COMPRESSION_TYPES:
+      return None
+    with FileSystems.open(
+        file_name,
+        'application/octet-stream',
+        compression_type=CompressionTypes.UNCOMPRESSED) as raw_file:
+      return CompressedFile.read_block_index(
+          raw_file, compression_type, max_block_size=max_block_size)
+
+  def _with_block_index(self, block_index):
+    """Returns a copy of this source that reads files using the given block
+    index."""
+    source = pickler.roundtrip(self)
+    source._block_index = block_index
+    return source
 
   @check_accessible(['_pattern'])
   def _validate(self):
@@ -248,7 +301,8 @@ class _SingleFileSource(iobase.BoundedSource):
       start_offset,
       stop_offset,
       min_bundle_size=0,
-      splittable=True):
+      splittable=True,
+      compressed_size=None):
     if not isinstance(start_offset, int):
       raise TypeError(
           'start_offset must be a number. Received: %r' % start_offset)
@@ -269,6 +323,10 @@ class _SingleFileSource(iobase.BoundedSource):
     self._min_bundle_size = min_bundle_size
     self._file_based_source = file_based_source
     self._splittable = splittable
+    # Sources that read a range of the uncompressed data of a compressed file
+    # are sized by the compressed bytes they read, like compressed files that
+    # are read whole.
+    self._compressed_size = compressed_size
 
   def split(self, desired_bundle_size, start_offset=None, stop_offset=None):
     if start_offset is None:
@@ -280,8 +338,9 @@ class _SingleFileSource(iobase.BoundedSource):
       splits = OffsetRange(start_offset, stop_offset).split(
           desired_bundle_size, self._min_bundle_size)
       for split in splits:
+        size = self._estimate_size(split.start, split.stop)
         yield iobase.SourceBundle(
-            split.stop - split.start,
+            size,
             _SingleFileSource(
                 # Copying this so that each sub-source gets a fresh instance.
                 pickler.roundtrip(self._file_based_source),
@@ -289,10 +348,18 @@ class _SingleFileSource(iobase.BoundedSource):
                 split.start,
                 split.stop,
                 min_bundle_size=self._min_bundle_size,
-                splittable=self._splittable),
+                splittable=self._splittable,
+                compressed_size=(
+                    None if self._compressed_size is None else size)),
             split.start,
             split.stop)
     else:
+      block_index = self._read_block_index(
+          desired_bundle_size, start_offset, stop_offset)
+      if block_index:
+        yield from self._split_at_blocks(block_index, desired_bundle_size)
+        return
+
       # Returning a single sub-source with end offset set to OFFSET_INFINITY (so
       # that all data of the source gets read) since this source is
       # unsplittable. Choosing size of the file as end offset will be wrong for
@@ -309,8 +376,61 @@ class _SingleFileSource(iobase.BoundedSource):
           start_offset,
           range_trackers.OffsetRangeTracker.OFFSET_INFINITY)
 
+  def _read_block_index(self, desired_bundle_size, start_offset, stop_offset):
+    # Only whole compressed files larger than a bundle are split at blocks.
+    if (not self._file_based_source._split_compressed_blocks or
+        not self._file_based_source.splittable or start_offset != 0 or
+        desired_bundle_size is None or
+        stop_offset == range_trackers.OffsetRangeTracker.OFFSET_INFINITY or
+        stop_offset <= desired_bundle_size):
+      return None
+    return self._file_based_source._read_block_index(
+        self._file_name, max_block_size=desired_bundle_size)
+
+  def _split_at_blocks(self, block_index, desired_bundle_size):
+    # Groups the blocks of a compressed file into sub-sources of about
+    # desired_bundle_size compressed bytes. The offsets of these sub-sources
+    # are offsets in the uncompressed data, and their files are read using
+    # the block index to seek to their start.
+    blocks = block_index[:-1]
+    start = 0
+    while start < len(blocks):
+      stop = start + 1
+      while (stop < len(blocks) and
+             blocks[stop][1] - blocks[start][1] < desired_bundle_size):
+        stop += 1
+      start_offset = blocks[start][0]
+      stop_offset, stop_compressed_offset = block_index[stop]
+      if start_offset < stop_offset:
+        # Reading a range starts with the end of the last record that starts
+        # before it, in the previous block.
+        file_based_source = self._file_based_source._with_block_index(
+            blocks[max(start - 1, 0):stop])
+        compressed_size = stop_compressed_offset - blocks[start][1]
+        yield iobase.SourceBundle(
+            compressed_size,
+            _SingleFileSource(
+                file_based_source,
+                self._file_name,
+                start_offset,
+                stop_offset,
+                min_bundle_size=self._min_bundle_size,
+                splittable=True,
+                compressed_size=compressed_size),
+            start_offset,
+            stop_offset)
+      start = stop
+
+  def _estimate_size(self, start_offset, stop_offset):
+    size = stop_offset - start_offset
+    if self._compressed_size is None:
+      return size
+    return (
+        self._compressed_size * size //
+        (self._stop_offset - self._start_offset))
+
   def estimate_size(self):
-    return self._stop_offset - self._start_offset
+    return self._estimate_size(self._start_offset, self._stop_offset)
 
   def get_range_tracker(self, start_position, stop_position):
     if start_position is None:
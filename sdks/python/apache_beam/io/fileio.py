@@ -89,6 +89,7 @@ parameter can be anything, as long as elements can be grouped by it.
 # pytype: skip-file
 
 import collections
+import io
 import logging
 import random
 import uuid
@@ -105,6 +106,7 @@ from typing import Tuple
 from typing import Union
 
 import apache_beam as beam
+from apache_beam.io import filebasedsink
 from apache_beam.io import filesystem
 from apache_beam.io import filesystems
 from apache_beam.io.filesystem import BeamIOError
@@ -518,10 +520,19 @@ class WriteToFiles(beam.PTransform):
   their destination, and window, at the moment).
   """
 
-  # We allow up to 20 different destinations to be written in a single bundle.
+  # We allow up to 20 files to be open for writing in a single bundle.
   # Too many files will add memory pressure to the worker, so we let it be 20.
   MAX_NUM_WRITERS_PER_BUNDLE = 20
 
+  # The files that are least recently written to are closed to open new ones,
+  # and reopened as new files when more records arrive. Once a bundle has
+  # written this many files, records without an active writer are spilled.
+  MAX_NUM_FILES_PER_BUNDLE = 1000
+
+  # Records are buffered in memory, up to this many bytes per bundle, before
+  # they are written to their files.
+  MAX_BUFFERED_BYTES_PER_BUNDLE = 64 << 20
+
   DEFAULT_SHARDING = 5
 
   def __init__(
@@ -533,7 +544,9 @@ class WriteToFiles(beam.PTransform):
       sink=None,
       shards=None,
       output_fn=None,
-      max_writers_per_bundle=MAX_NUM_WRITERS_PER_BUNDLE):
+      max_writers_per_bundle=MAX_NUM_WRITERS_PER_BUNDLE,
+      max_files_per_bundle=MAX_NUM_FILES_PER_BUNDLE,
+      max_buffered_bytes_per_bundle=MAX_BUFFERED_BYTES_PER_BUNDLE):
     """Initializes a WriteToFiles transform.
 
     Args:
@@ -557,6 +570,14 @@ class WriteToFiles(beam.PTransform):
         parameter is currently unused and retained for backward compatibility.
       max_writers_per_bundle (int): The number of writers that can be open
         concurrently in a single worker that's processing one bundle.
+      max_files_per_bundle (int): The number of files that can be written in a
+        single bundle. The least recently used writers are closed to open new
+        ones, and their destinations are continued in new files. Once this many
+        files were written, records of destinations without an open writer are
+        written by shards, after a shuffle.
+      max_buffered_bytes_per_bundle (int): The number of bytes of records that
+        can be buffered in memory in a single bundle before they are written to
+        their files.
     """
     self.path = (
         path if isinstance(path, ValueProvider) else StaticValueProvider(
@@ -569,6 +590,8 @@ class WriteToFiles(beam.PTransform):
     self.output_fn = output_fn or (lambda x: x)
 
     self._max_num_writers_per_bundle = max_writers_per_bundle
+    self._max_num_files_per_bundle = max_files_per_bundle
+    self._max_buffered_bytes_per_bundle = max_buffered_bytes_per_bundle
 
   @staticmethod
   def _get_sink_fn(input_sink) -> Callable[[Any], FileSink]:
@@ -610,10 +633,12 @@ class WriteToFiles(beam.PTransform):
                 base_path=self._temp_directory,
                 destination_fn=self.destination_fn,
                 sink_fn=self.sink_fn,
-                max_writers_per_bundle=self._max_num_writers_per_bundle)).
-        with_outputs(
-            _WriteUnshardedRecordsFn.SPILLED_RECORDS,
-            _WriteUnshardedRecordsFn.WRITTEN_FILES))
+                max_writers_per_bundle=self._max_num_writers_per_bundle,
+                max_files_per_bundle=self._max_num_files_per_bundle,
+                max_buffered_bytes_per_bundle=self.
+                _max_buffered_bytes_per_bundle)).with_outputs(
+                    _WriteUnshardedRecordsFn.SPILLED_RECORDS,
+                    _WriteUnshardedRecordsFn.WRITTEN_FILES))
 
     written_files_pc = output[_WriteUnshardedRecordsFn.WRITTEN_FILES]
     spilled_records_pc = output[_WriteUnshardedRecordsFn.SPILLED_RECORDS]
@@ -669,11 +694,24 @@ def _create_writer(
 
 
 class _MoveTempFilesIntoFinalDestinationFn(beam.DoFn):
+  """Moves the temporary files of a bundle into their final destinations.
+
+  The files of all the destinations of a bundle are moved at once, in
+  concurrent batches.
+  """
+
+  # Max number of threads to be used for moving files.
+  _MAX_RENAME_THREADS = 64
+
   def __init__(self, path, file_naming_fn, temp_dir):
     self.path = path
     self.file_naming_fn = file_naming_fn
     self.temporary_directory = temp_dir
 
+  def start_bundle(self):
+    # Lists of (destination, window, temp_file_results, final_file_results).
+    self._pending_moves = []
+
   def process(self, element, w=beam.DoFn.WindowParam):
     destination = element[0]
     # list of FileResult objects for temp files
@@ -695,8 +733,22 @@ class _MoveTempFilesIntoFinalDestinationFn(beam.DoFn):
               r.pane,
               destination))
 
-    move_from = [f.file_name for f in temp_file_results]
-    move_to = [f.file_name for f in final_file_results]
+    self._pending_moves.append(
+        (destination, w, temp_file_results, final_file_results))
+
+  def finish_bundle(self):
+    pending_moves, self._pending_moves = self._pending_moves, []
+    if not pending_moves:
+      return
+
+    move_from = [
+        f.file_name for _, _, temp_file_results, _ in pending_moves
+        for f in temp_file_results
+    ]
+    move_to = [
+        f.file_name for _, _, _, final_file_results in pending_moves
+        for f in final_file_results
+    ]
 
     _LOGGER.info(
         'Moving %d temporary files to dir: %s as %s',
@@ -712,26 +764,33 @@ class _MoveTempFilesIntoFinalDestinationFn(beam.DoFn):
         # Usually harmless. Especially if see FileExistsError so no need to log
         _LOGGER.debug('Fail to create dir for final destination: %s', cause)
 
-    try:
-      filesystems.FileSystems.rename(
+    finalizer = filebasedsink._FileFinalizer(
+        self.path.get(),
+        _MoveTempFilesIntoFinalDestinationFn,
+        max_threads=self._MAX_RENAME_THREADS)
+    with finalizer.phase('finalize_rename'):
+      exceptions = finalizer.rename(
           move_from,
           [filesystems.FileSystems.join(self.path.get(), f) for f in move_to])
-    except BeamIOError:
-      # This error is not serious, because it may happen on a retry of the
-      # bundle. We simply log it.
-      _LOGGER.debug(
-          'Exception occurred during moving files: %s. This may be due to a'
-          ' bundle being retried.',
-          move_from)
-
-    yield from final_file_results
-
-    _LOGGER.debug(
-        'Checking orphaned temporary files for destination %s and window %s',
-        destination,
-        w)
-    writer_key = (destination, w)
-    self._check_orphaned_files(writer_key)
+    if exceptions:
+      # Files that were already moved, such as on a retry of the bundle, are
+      # skipped, so these are not expected. Like other errors of moving files,
+      # we simply log them.
+      _LOGGER.warning('Exceptions occurred during moving files: %s', exceptions)
+
+    with finalizer.phase('finalize_check_orphaned'):
+      for destination, w, _, _ in pending_moves:
+        _LOGGER.debug(
+            'Checking orphaned temporary files for destination %s and '
+            'window %s',
+            destination,
+            w)
+        self._check_orphaned_files((destination, w))
+
+    for _, w, _, final_file_results in pending_moves:
+      for file_result in final_file_results:
+        yield beam.transforms.window.WindowedValue(
+            file_result, timestamp=w.max_timestamp(), windows=[w])
 
   def _check_orphaned_files(self, writer_key):
     try:
@@ -816,71 +875,175 @@ class _AppendShardedDestination(beam.DoFn):
     yield ((destination, shard), record)
 
 
+class _BufferedFileHandle(io.BufferedIOBase):
+  """A file handle that buffers the bytes written to it in memory, until they
+  are drained into a file."""
+  def __init__(self):
+    self._chunks = []
+    self._position = 0
+    self.buffered_bytes = 0
+
+  def writable(self):
+    return True
+
+  def write(self, b):
+    b = bytes(b)
+    self._chunks.append(b)
+    self._position += len(b)
+    self.buffered_bytes += len(b)
+    return len(b)
+
+  def tell(self):
+    return self._position
+
+  def drain(self, file_handle):
+    if self._chunks:
+      file_handle.write(b''.join(self._chunks))
+    self._chunks = []
+    self.buffered_bytes = 0
+
+
+class _PooledWriter(object):
+  """Writes the records of a destination and window into a temporary file.
+
+  The sink writes records into an in-memory buffer, which is drained into the
+  file when it gets full. The file is only created on the first drain.
+  """
+  def __init__(self, writer_key, sink):
+    self.writer_key = writer_key
+    self.sink = sink
+    self.buffer = _BufferedFileHandle()
+    self.file_name = None
+    self.file_handle = None
+    sink.open(self.buffer)
+
+  def open_file(self, base_path):
+    self.file_name, self.file_handle = _create_writer(
+        base_path=base_path,
+        writer_key=self.writer_key,
+        create_metadata_fn=self.sink.create_metadata)
+
+  def drain(self):
+    self.buffer.drain(self.file_handle)
+
+  def close(self):
+    self.file_handle.close()
+    self.file_handle = None
+
+
 class _WriteUnshardedRecordsFn(beam.DoFn):
+  """Writes records into a file per destination and window, without a shuffle.
+
+  Up to ``max_writers_per_bundle`` files are open at once. When another file
+  must be opened, the least recently used writer is closed, and its
+  destination and window continue in a new file if more of their records
+  arrive. Records are buffered in memory per writer, and the largest buffers
+  are written to their files once ``max_buffered_bytes_per_bundle`` is
+  exceeded. Records are only spilled, to be written by shards after a
+  shuffle, once a bundle has written ``max_files_per_bundle`` files.
+  """
 
   SPILLED_RECORDS = 'spilled_records'
   WRITTEN_FILES = 'written_files'
 
-  _writers_and_sinks: Dict[Tuple[str, BoundedWindow], Tuple[BinaryIO,
-                                                            FileSink]] = None
-  _file_names: Dict[Tuple[str, BoundedWindow], str] = None
+  # The number of bytes buffered for a writer before they are written to its
+  # file.
+  _WRITER_BUFFER_BYTES = 1 << 20
+
+  _writers: Dict[Tuple[str, BoundedWindow], _PooledWriter] = None
+  _written_files: List[Tuple[Tuple[str, BoundedWindow], str]] = None
 
   def __init__(
       self,
       base_path,
       destination_fn,
       sink_fn,
-      max_writers_per_bundle=WriteToFiles.MAX_NUM_WRITERS_PER_BUNDLE):
+      max_writers_per_bundle=WriteToFiles.MAX_NUM_WRITERS_PER_BUNDLE,
+      max_files_per_bundle=WriteToFiles.MAX_NUM_FILES_PER_BUNDLE,
+      max_buffered_bytes_per_bundle=WriteToFiles.MAX_BUFFERED_BYTES_PER_BUNDLE):
     self.base_path = base_path
     self.destination_fn = destination_fn
     self.sink_fn = sink_fn
     self.max_num_writers_per_bundle = max_writers_per_bundle
+    self.max_num_files_per_bundle = max_files_per_bundle
+    self.max_buffered_bytes_per_bundle = max_buffered_bytes_per_bundle
 
   def start_bundle(self):
-    self._writers_and_sinks = {}
-    self._file_names = {}
+    # The writers by their (destination, window), least recently used first.
+    self._writers = collections.OrderedDict()
+    self._written_files = []
+    self._num_open_files = 0
+    self._buffered_bytes = 0
 
   def process(
       self, record, w=beam.DoFn.WindowParam, pane=beam.DoFn.PaneInfoParam):
     destination = self.destination_fn(record)
 
-    writer, sink = self._get_or_create_writer_and_sink(destination, w)
+    writer = self._get_or_create_writer(destination, w)
 
-    if not writer:
+    if writer is None:
       return [beam.pvalue.TaggedOutput(self.SPILLED_RECORDS, record)]
-    else:
-      sink.write(record)
 
-  def _get_or_create_writer_and_sink(self, destination, window):
-    """Returns a tuple of writer, sink."""
+    buffered_bytes = writer.buffer.buffered_bytes
+    writer.sink.write(record)
+    self._buffered_bytes += writer.buffer.buffered_bytes - buffered_bytes
+
+    if writer.buffer.buffered_bytes >= self._WRITER_BUFFER_BYTES:
+      self._drain(writer)
+    while self._buffered_bytes > self.max_buffered_bytes_per_bundle:
+      self._drain(
+          max(
+              self._writers.values(),
+              key=lambda writer: writer.buffer.buffered_bytes))
+
+  def _get_or_create_writer(self, destination, window):
+    """Returns the writer of a destination and window, or None if its records
+    must be spilled."""
     writer_key = (destination, window)
-    if writer_key in self._writers_and_sinks:
-      return self._writers_and_sinks.get(writer_key)
-    elif len(self._writers_and_sinks) >= self.max_num_writers_per_bundle:
-      # The writer does not exist, and we have too many writers already.
-      return None, None
+    if writer_key in self._writers:
+      self._writers.move_to_end(writer_key)
+      return self._writers[writer_key]
+    elif (self.max_num_writers_per_bundle <= 0 or
+          len(self._written_files) + len(self._writers)
+          >= self.max_num_files_per_bundle):
+      # The writer does not exist, and we have written too many files already.
+      return None
     else:
-      # The writer does not exist, but we can still create a new one.
-      sink = self.sink_fn(destination)
-
-      full_file_name, writer = _create_writer(
-          base_path=self.base_path.get(),
-          writer_key=writer_key,
-          create_metadata_fn=sink.create_metadata)
-
-      sink.open(writer)
-      self._writers_and_sinks[writer_key] = (writer, sink)
-      self._file_names[writer_key] = full_file_name
-      return self._writers_and_sinks[writer_key]
+      writer = _PooledWriter(writer_key, self.sink_fn(destination))
+      self._writers[writer_key] = writer
+      return writer
+
+  def _open_file(self, writer):
+    if self._num_open_files >= self.max_num_writers_per_bundle:
+      # Close the least recently used writer with an open file.
+      lru_key = next(
+          key for key, w in self._writers.items() if w.file_handle is not None)
+      self._close(self._writers.pop(lru_key))
+    writer.open_file(self.base_path.get())
+    self._num_open_files += 1
+
+  def _drain(self, writer):
+    if writer.file_handle is None:
+      self._open_file(writer)
+    self._buffered_bytes -= writer.buffer.buffered_bytes
+    writer.drain()
+
+  def _close(self, writer):
+    buffered_bytes = writer.buffer.buffered_bytes
+    writer.sink.flush()
+    self._buffered_bytes += writer.buffer.buffered_bytes - buffered_bytes
+    self._drain(writer)
+    writer.close()
+    self._num_open_files -= 1
+    self._written_files.append((writer.writer_key, writer.file_name))
 
   def finish_bundle(self):
-    for key, (writer, sink) in self._writers_and_sinks.items():
-
-      sink.flush()
-      writer.close()
+    while self._writers:
+      self._close(self._writers.pop(next(iter(self._writers))))
 
+    for key, file_name in self._written_files:
       file_result = FileResult(
-          self._file_names[key],
+          file_name,
           shard_index=-1,
           total_shards=0,
           window=key[1],
@@ -19,6 +19,7 @@
 
 # pytype: skip-file
 
+import collections
 import csv
 import io
 import json
@@ -38,6 +39,7 @@ from apache_beam.io.filesystem import CompressionTypes
 from apache_beam.io.filesystems import FileSystems
 from apache_beam.options.pipeline_options import PipelineOptions
 from apache_beam.options.pipeline_options import StandardOptions
+from apache_beam.options.value_provider import StaticValueProvider
 from apache_beam.testing.test_pipeline import TestPipeline
 from apache_beam.testing.test_stream import TestStream
 from apache_beam.testing.test_utils import compute_hash
@@ -582,6 +584,102 @@ class WriteFilesTest(_TestCaseWithTempDirCleanUp):
                     if row['foundation'] == 'apache']),
           label='verifyApache')
 
+  def _write_unsharded_records(self, dir, records, **kwargs):
+    write_fn = fileio._WriteUnshardedRecordsFn(
+        base_path=StaticValueProvider(str, dir),
+        destination_fn=lambda record: record.split('-')[0],
+        sink_fn=lambda destination: fileio.TextSink(),
+        **kwargs)
+    write_fn.start_bundle()
+    spilled_records = []
+    for record in records:
+      spilled_records.extend(
+          spilled.value for spilled in
+          write_fn.process(record, w=GlobalWindow(), pane=None) or [])
+      self.assertLessEqual(
+          write_fn._num_open_files, write_fn.max_num_writers_per_bundle)
+    file_results = [written.value.value for written in write_fn.finish_bundle()]
+    return write_fn, file_results, spilled_records
+
+  def _read_file_results(self, file_results):
+    records_by_destination = collections.defaultdict(list)
+    for file_result in file_results:
+      with open(file_result.file_name) as f:
+        records_by_destination[file_result.destination].extend(
+            f.read().splitlines())
+    return records_by_destination
+
+  def test_write_unsharded_records_reopens_writers(self):
+    dir = self._new_tempdir()
+    records = ['%d-%d' % (i % 10, i) for i in range(100)]
+
+    write_fn, file_results, spilled_records = self._write_unsharded_records(
+        dir, records, max_writers_per_bundle=2,
+        max_buffered_bytes_per_bundle=20)
+
+    self.assertEqual([], spilled_records)
+    self.assertEqual(0, write_fn._num_open_files)
+    # Writers are closed to make room for others, and continued in new files.
+    self.assertGreater(len(file_results), 10)
+    self.assertEqual(
+        len(file_results), len(set(r.file_name for r in file_results)))
+    records_by_destination = self._read_file_results(file_results)
+    for destination in map(str, range(10)):
+      expected = [r for r in records if r.split('-')[0] == destination]
+      self.assertEqual(expected, records_by_destination[destination])
+
+  def test_write_unsharded_records_buffers_records(self):
+    dir = self._new_tempdir()
+    records = ['%d-%d' % (i % 10, i) for i in range(100)]
+
+    _, file_results, spilled_records = self._write_unsharded_records(
+        dir, records, max_writers_per_bundle=2)
+
+    self.assertEqual([], spilled_records)
+    # All records fit in the buffers, so each destination gets one file.
+    self.assertEqual(10, len(file_results))
+    records_by_destination = self._read_file_results(file_results)
+    self.assertCountEqual(records, sum(records_by_destination.values(), []))
+
+  def test_write_unsharded_records_spills_after_max_files(self):
+    dir = self._new_tempdir()
+    records = ['%d-%d' % (i % 10, i) for i in range(100)]
+
+    _, file_results, spilled_records = self._write_unsharded_records(
+        dir, records, max_writers_per_bundle=2, max_files_per_bundle=4)
+
+    self.assertEqual(4, len(file_results))
+    records_by_destination = self._read_file_results(file_results)
+    self.assertCountEqual(
+        records, sum(records_by_destination.values(), spilled_records))
+    self.assertCountEqual(['0', '1', '2', '3'], records_by_destination.keys())
+
+  def test_write_many_destinations_few_writers(self):
+    dir = self._new_tempdir()
+
+    with TestPipeline() as p:
+      _ = (
+          p
+          | beam.Create(range(200))
+          | beam.Map(str)
+          | beam.io.fileio.WriteToFiles(
+              path=dir,
+              destination=lambda record: int(record) % 20,
+              file_naming=fileio.destination_prefix_naming(),
+              max_writers_per_bundle=2,
+              max_buffered_bytes_per_bundle=50))
+
+    with TestPipeline() as p:
+      result = (
+          p
+          | fileio.MatchFiles(FileSystems.join(dir, '*'))
+          | fileio.ReadMatches()
+          | beam.FlatMap(
+              lambda f: [(os.path.basename(f.metadata.path).split('-')[0], r)
+                         for r in f.read_utf8().strip().split('\n')]))
+
+      assert_that(result, equal_to([(str(i % 20), str(i)) for i in range(200)]))
+
   @unittest.skip('https://github.com/apache/beam/issues/21269')
   def test_find_orphaned_files(self):
     dir = self._new_tempdir()
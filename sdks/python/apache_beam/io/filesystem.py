@@ -25,14 +25,20 @@ Note to implementors:
 # pytype: skip-file
 
 import abc
+import bisect
 import bz2
 import io
 import logging
 import lzma
 import os
 import posixpath
+import queue
 import re
+import struct
+import threading
 import time
+import traceback
+import weakref
 import zlib
 from typing import BinaryIO  # pylint: disable=unused-import
 from typing import Iterator
@@ -143,11 +149,47 @@ class CompressedFile(object):
   # decompressor objects.
   _gzip_mask = zlib.MAX_WBITS | 16  # Mask when using GZIP headers.
 
+  # Compression types whose files may be concatenations of independently
+  # compressed blocks: gzip members, bzip2 and xz streams, and zstd frames.
+  BLOCK_COMPRESSION_TYPES = (
+      CompressionTypes.BZIP2,
+      CompressionTypes.GZIP,
+      CompressionTypes.LZMA,
+      CompressionTypes.ZSTD)
+
+  # The number of decompressed chunks that are read ahead of the reader.
+  _READ_AHEAD_CHUNKS = 2
+
+  # The header of the blocks of BGZF files written by bgzip: a gzip member
+  # header with a single 'BC' extra subfield that holds the block size.
+  _bgzf_header_prefix = b'\x1f\x8b\x08\x04'
+  _bgzf_extra_field_prefix = b'\x06\x00BC\x02\x00'
+  _bgzf_header_size = 18
+
   def __init__(
       self,
       fileobj: BinaryIO,
       compression_type=CompressionTypes.GZIP,
-      read_size=DEFAULT_READ_BUFFER_SIZE):
+      read_size=DEFAULT_READ_BUFFER_SIZE,
+      read_ahead=False,
+      block_index: Optional[List[Tuple[int, int]]] = None):
+    """Initializes a CompressedFile.
+
+    Args:
+      fileobj: The underlying file object, at position 0.
+      compression_type: The compression type of the file.
+      read_size: The number of compressed bytes read from the underlying file
+        object at once.
+      read_ahead: If True, compressed data is read and decompressed on a
+        background thread, up to ``_READ_AHEAD_CHUNKS`` chunks ahead of the
+        reader, so that reading and decompression overlap with the processing
+        of the decompressed data.
+      block_index: Optional ``(uncompressed_offset, compressed_offset)`` pairs
+        of the starts of independently compressed blocks of the file, as
+        returned by :meth:`read_block_index`, sorted by offset. Seeking then
+        starts decompressing from the last block before the new position
+        rather than from the start of the file.
+    """
     if not fileobj:
       raise ValueError('File object must not be None')
 
@@ -174,6 +216,13 @@ class CompressedFile(object):
       self._read_buffer = io.BytesIO()
       self._read_position = 0
       self._read_eof = False
+      self._decompressed_chunks: Optional[Iterator[bytes]] = None
+      self._read_ahead = read_ahead
+      self._read_ahead_thread: Optional[threading.Thread] = None
+      self._block_index = block_index or []
+      self._block_starts = [
+          uncompressed_offset for uncompressed_offset, _ in self._block_index
+      ]
 
       self._initialize_decompressor()
     else:
@@ -185,22 +234,26 @@ class CompressedFile(object):
       self._compressor = None
 
   def _initialize_decompressor(self):
-    if self._compression_type == CompressionTypes.BZIP2:
-      self._decompressor = bz2.BZ2Decompressor()
-    elif self._compression_type == CompressionTypes.DEFLATE:
-      self._decompressor = zlib.decompressobj()
-    elif self._compression_type == CompressionTypes.ZSTD:
+    self._decompressor = self._create_decompressor(self._compression_type)
+
+  @classmethod
+  def _create_decompressor(cls, compression_type):
+    if compression_type == CompressionTypes.BZIP2:
+      return bz2.BZ2Decompressor()
+    elif compression_type == CompressionTypes.DEFLATE:
+      return zlib.decompressobj()
+    elif compression_type == CompressionTypes.ZSTD:
       # hardcoded max_window_size to avoid too much memory
       # errors when reading big files, please refer
       # to the following issue for further explanation:
       # https://github.com/indygreg/python-zstandard/issues/157
-      self._decompressor = zstandard.ZstdDecompressor(
+      return zstandard.ZstdDecompressor(
           max_window_size=2147483648).decompressobj()
-    elif self._compression_type == CompressionTypes.LZMA:
-      self._decompressor = lzma.LZMADecompressor()
+    elif compression_type == CompressionTypes.LZMA:
+      return lzma.LZMADecompressor()
     else:
-      assert self._compression_type == CompressionTypes.GZIP
-      self._decompressor = zlib.decompressobj(self._gzip_mask)
+      assert compression_type == CompressionTypes.GZIP
+      return zlib.decompressobj(cls._gzip_mask)
 
   def _initialize_compressor(self):
     if self._compression_type == CompressionTypes.BZIP2:
@@ -249,38 +302,117 @@ class CompressedFile(object):
     assert self._decompressor
     while not self._read_eof and (self._read_buffer.tell() -
                                   self._read_position) < num_bytes:
-      # Continue reading from the underlying file object until enough bytes are
-      # available, or EOF is reached.
-      if not self._decompressor.unused_data:
-        buf = self._file.read(self._read_size)
+      decompressed = self._next_decompressed_chunk()
+      if decompressed is None:
+        # Record that we have hit the end of file, so we won't unnecessarily
+        # repeat the completeness verification step above.
+        self._read_eof = True
       else:
-        # Any uncompressed data at the end of the stream of a gzip or bzip2
-        # file that is not corrupted points to a concatenated compressed
-        # file. We read concatenated files by recursively creating decompressor
-        # objects for the unused compressed data.
-        buf = self._decompressor.unused_data
-        self._initialize_decompressor()
-      if buf:
-        decompressed = self._decompressor.decompress(buf)
-        del buf  # Free up some possibly large and no-longer-needed memory.
         self._read_buffer.write(decompressed)
-      else:
-        # EOF of current stream reached.
-        if (self._compression_type == CompressionTypes.BZIP2 or
-            self._compression_type == CompressionTypes.DEFLATE or
-            self._compression_type == CompressionTypes.ZSTD or
-            self._compression_type == CompressionTypes.GZIP or
-            self._compression_type == CompressionTypes.LZMA):
+
+  def _next_decompressed_chunk(self) -> Optional[bytes]:
+    """Returns the next chunk of decompressed data, or None at EOF."""
+    if not self._read_ahead:
+      if self._decompressed_chunks is None:
+        self._decompressed_chunks = self._decompress_chunks()
+      return next(self._decompressed_chunks, None)
+
+    if self._read_ahead_thread is None:
+      self._start_read_ahead()
+    chunk = self._read_ahead_queue.get()
+    if isinstance(chunk, Exception):
+      raise chunk
+    return chunk
+
+  def _decompress_chunk(self) -> Optional[bytes]:
+    """Reads and decompresses the next chunk of the underlying file object, or
+    returns None once its EOF is reached."""
+    if not self._decompressor.unused_data:
+      buf = self._file.read(self._read_size)
+      if self._decompressor.eof:
+        # The previous compressed stream ended with the previous read.
+        self._initialize_decompressor()
+    else:
+      # Any uncompressed data at the end of the stream of a gzip or bzip2
+      # file that is not corrupted points to a concatenated compressed
+      # file. We read concatenated files by recursively creating decompressor
+      # objects for the unused compressed data.
+      buf = self._decompressor.unused_data
+      self._initialize_decompressor()
+    if not buf:
+      return None
+    return self._decompressor.decompress(buf)
+
+  def _decompress_chunks(self) -> Iterator[bytes]:
+    """Reads and decompresses the underlying file object in chunks."""
+    while True:
+      # Continue reading from the underlying file object until EOF is reached.
+      decompressed = self._decompress_chunk()
+      if decompressed is None:
+        break
+      yield decompressed
+
+    # EOF of current stream reached.
+    if (self._compression_type == CompressionTypes.BZIP2 or
+        self._compression_type == CompressionTypes.DEFLATE or
+        self._compression_type == CompressionTypes.ZSTD or
+        self._compression_type == CompressionTypes.GZIP or
+        self._compression_type == CompressionTypes.LZMA):
+      pass
+    else:
+      # Deflate, Gzip and bzip2 formats do not require flushing
+      # remaining data in the decompressor into the read buffer when
+      # fully decompressing files.
+      yield self._decompressor.flush()
+
+  def _start_read_ahead(self) -> None:
+    self._read_ahead_queue: queue.Queue = queue.Queue(self._READ_AHEAD_CHUNKS)
+    stopped = threading.Event()
+    # The thread is stopped when the file is closed, or garbage collected
+    # without having been closed.
+    self._stop_read_ahead_thread = weakref.finalize(self, stopped.set)
+    self._read_ahead_thread = threading.Thread(
+        target=self._decompress_ahead,
+        args=(weakref.ref(self), self._read_ahead_queue, stopped),
+        daemon=True)
+    self._read_ahead_thread.start()
+
+  @staticmethod
+  def _decompress_ahead(file_ref, chunks, stopped):
+    # Decompresses chunks on a background thread, followed by None at EOF or
+    # by the exception raised while reading, until the reader stops it. The
+    # file is only referenced while a chunk is decompressed, and not while
+    # waiting for the reader, so that it can be garbage collected.
+    def put(chunk):
+      while not stopped.is_set():
+        try:
+          chunks.put(chunk, timeout=0.1)
+          return True
+        except queue.Full:
           pass
-        else:
-          # Deflate, Gzip and bzip2 formats do not require flushing
-          # remaining data in the decompressor into the read buffer when
-          # fully decompressing files.
-          self._read_buffer.write(self._decompressor.flush())
+      return False
 
-        # Record that we have hit the end of file, so we won't unnecessarily
-        # repeat the completeness verification step above.
-        self._read_eof = True
+    while True:
+      compressed_file = file_ref()
+      if compressed_file is None:
+        return
+      try:
+        chunk = compressed_file._decompress_chunk()
+      except Exception as e:  # pylint: disable=broad-except
+        # Drop the references of the traceback to the file.
+        traceback.clear_frames(e.__traceback__)
+        chunk = e
+      del compressed_file
+      if not put(chunk) or not isinstance(chunk, bytes):
+        return
+
+  def _stop_read_ahead(self) -> None:
+    """Stops the background thread before the file or the decompressor are
+    used by the reader."""
+    if self._read_ahead_thread is not None:
+      self._stop_read_ahead_thread()
+      self._read_ahead_thread.join()
+      self._read_ahead_thread = None
 
   def _read_from_internal_buffer(self, read_fn):
     """Read from the internal buffer by using the supplied read_fn."""
@@ -324,6 +456,7 @@ class CompressedFile(object):
 
   def close(self) -> None:
     if self.readable():
+      self._stop_read_ahead()
       self._read_buffer.close()
 
     if self.writeable():
@@ -352,9 +485,17 @@ class CompressedFile(object):
   def _rewind_file(self) -> None:
     """Seeks to the beginning of the input file. Input file's EOF marker
     is cleared and _uncompressed_position is reset to zero"""
-    self._file.seek(0, os.SEEK_SET)
+    self._seek_file(0, 0)
+
+  def _seek_file(self, uncompressed_offset, compressed_offset) -> None:
+    """Seeks to the start of a compressed block of the input file. Input
+    file's EOF marker is cleared and _uncompressed_position is set to the
+    offset of the block."""
+    self._stop_read_ahead()
+    self._file.seek(compressed_offset, os.SEEK_SET)
     self._read_eof = False
-    self._uncompressed_position = 0
+    self._uncompressed_position = uncompressed_offset
+    self._decompressed_chunks = None
 
   def _rewind(self) -> None:
     """Seeks to the beginning of the input file and resets the internal read
@@ -366,6 +507,13 @@ class CompressedFile(object):
     # Re-initialize decompressor to clear any data buffered prior to rewind
     self._initialize_decompressor()
 
+  def _seek_to_block(self, uncompressed_offset, compressed_offset) -> None:
+    """Seeks to the start of a compressed block of the input file and resets
+    the internal read buffer and the decompressor object."""
+    self._clear_read_buffer()
+    self._seek_file(uncompressed_offset, compressed_offset)
+    self._initialize_decompressor()
+
   def seek(self, offset: int, whence: int = os.SEEK_SET) -> None:
     """Set the file's current offset.
 
@@ -418,8 +566,13 @@ class CompressedFile(object):
       raise ValueError("Whence mode %r is invalid." % whence)
 
     # Determine how many bytes needs to be read before we reach
-    # the requested offset. Rewind if we already passed the position.
-    if absolute_offset < self._uncompressed_position:
+    # the requested offset. Rewind if we already passed the position, or
+    # skip to the last block that starts before the requested offset.
+    block = bisect.bisect_right(self._block_starts, absolute_offset) - 1
+    if block >= 0 and (absolute_offset < self._uncompressed_position or
+                       self._block_starts[block] > self._uncompressed_position):
+      self._seek_to_block(*self._block_index[block])
+    elif absolute_offset < self._uncompressed_position:
       self._rewind()
     bytes_to_skip = absolute_offset - self._uncompressed_position
 
@@ -434,6 +587,118 @@ class CompressedFile(object):
     """Returns current position in uncompressed file."""
     return self._uncompressed_position
 
+  @classmethod
+  def read_block_index(
+      cls,
+      fileobj: BinaryIO,
+      compression_type,
+      max_block_size: Optional[int] = None,
+      read_size: int = 1 << 20) -> Optional[List[Tuple[int, int]]]:
+    """Returns the offsets of the independently compressed blocks of a file.
+
+    Files of ``BLOCK_COMPRESSION_TYPES`` may be concatenations of gzip
+    members, bzip2 or xz streams, or zstd frames, each of which can be
+    decompressed on its own. The blocks of BGZF files written by ``bgzip``
+    are found from their headers; other files are decompressed once to find
+    their blocks.
+
+    Args:
+      fileobj: A seekable file object of the compressed file.
+      compression_type: The compression type of the file.
+      max_block_size: If set, the index isn't read for files with blocks of
+        more compressed bytes, which are read up to the first such block.
+      read_size: The number of compressed bytes read at once.
+
+    Returns:
+      A list of ``(uncompressed_offset, compressed_offset)`` pairs of the
+      starts of the blocks, followed by the uncompressed and compressed sizes
+      of the file, or None if the file isn't made of several blocks.
+    """
+    if compression_type not in cls.BLOCK_COMPRESSION_TYPES:
+      return None
+    fileobj.seek(0, os.SEEK_SET)
+    header = fileobj.read(cls._bgzf_header_size)
+    if (compression_type == CompressionTypes.GZIP and
+        cls._is_bgzf_header(header)):
+      block_index = cls._read_bgzf_block_index(fileobj)
+    else:
+      block_index = cls._read_block_index_by_decompressing(
+          fileobj, compression_type, max_block_size, read_size)
+    if not block_index or len(block_index) < 3:
+      return None
+    if max_block_size and any(
+        next_block[1] - block[1] > max_block_size
+        for block, next_block in zip(block_index, block_index[1:])):
+      return None
+    return block_index
+
+  @classmethod
+  def _is_bgzf_header(cls, header):
+    return (
+        len(header) == cls._bgzf_header_size and
+        header.startswith(cls._bgzf_header_prefix) and
+        header[10:16] == cls._bgzf_extra_field_prefix)
+
+  @classmethod
+  def _read_bgzf_block_index(cls, fileobj):
+    block_index = []
+    uncompressed_offset = compressed_offset = 0
+    while True:
+      fileobj.seek(compressed_offset, os.SEEK_SET)
+      header = fileobj.read(cls._bgzf_header_size)
+      if not header:
+        break
+      if not cls._is_bgzf_header(header):
+        return None
+      block_size = struct.unpack('<H', header[16:18])[0] + 1
+      # The last 4 bytes of a block hold its uncompressed size.
+      fileobj.seek(compressed_offset + block_size - 4, os.SEEK_SET)
+      trailer = fileobj.read(4)
+      if len(trailer) < 4:
+        return None
+      uncompressed_size = struct.unpack('<I', trailer)[0]
+      # The empty block that marks the end of BGZF files holds no data.
+      if uncompressed_size:
+        block_index.append((uncompressed_offset, compressed_offset))
+      uncompressed_offset += uncompressed_size
+      compressed_offset += block_size
+    block_index.append((uncompressed_offset, compressed_offset))
+    return block_index
+
+  @classmethod
+  def _read_block_index_by_decompressing(
+      cls, fileobj, compression_type, max_block_size, read_size):
+    fileobj.seek(0, os.SEEK_SET)
+    block_index = []
+    decompressor = None
+    uncompressed_offset = compressed_offset = 0
+    buf = b''
+    while True:
+      if not buf:
+        buf = fileobj.read(read_size)
+        if not buf:
+          break
+      if decompressor is None:
+        decompressor = cls._create_decompressor(compression_type)
+        block_index.append((uncompressed_offset, compressed_offset))
+      try:
+        uncompressed_offset += len(decompressor.decompress(buf))
+      except (EOFError, OSError, ValueError, zlib.error, zstandard.ZstdError):
+        # Data after the last block, such as padding, can't be split.
+        return None
+      if decompressor.eof:
+        compressed_offset += len(buf) - len(decompressor.unused_data)
+        buf = decompressor.unused_data
+        decompressor = None
+      else:
+        compressed_offset += len(buf)
+        buf = b''
+      if (max_block_size and
+          compressed_offset - block_index[-1][1] > max_block_size):
+        return None
+    block_index.append((uncompressed_offset, compressed_offset))
+    return block_index
+
   def __enter__(self):
     return self
 
@@ -26,6 +26,7 @@ import lzma
 import ntpath
 import os
 import posixpath
+import struct
 import tempfile
 import unittest
 import zlib
@@ -505,6 +506,158 @@ atomized in instants hammered around the
         if not line:
           break
 
+  def _compress_blocks(self, compression_type, blocks):
+    # Compresses each block on its own and concatenates them.
+    compress = {
+        CompressionTypes.BZIP2: bz2.compress,
+        CompressionTypes.GZIP: gzip.compress,
+        CompressionTypes.LZMA: lzma.compress,
+        CompressionTypes.ZSTD: zstandard.ZstdCompressor().compress,
+    }[compression_type]
+    return [compress(block) for block in blocks]
+
+  def _bgzf_block(self, data):
+    compressor = zlib.compressobj(
+        zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -zlib.MAX_WBITS)
+    deflated = compressor.compress(data) + compressor.flush()
+    block_size = 18 + len(deflated) + 8
+    return (
+        b'\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC\x02\x00' +
+        struct.pack('<H', block_size - 1) + deflated +
+        struct.pack('<II', zlib.crc32(data), len(data)))
+
+  def _create_block_compressed_file(self, compressed_blocks):
+    file_name = self._create_temp_file()
+    with open(file_name, 'wb') as f:
+      f.write(b''.join(compressed_blocks))
+    return file_name
+
+  def _expected_block_index(self, blocks, compressed_blocks):
+    uncompressed_offset = compressed_offset = 0
+    block_index = []
+    for block, compressed_block in zip(blocks, compressed_blocks):
+      block_index.append((uncompressed_offset, compressed_offset))
+      uncompressed_offset += len(block)
+      compressed_offset += len(compressed_block)
+    block_index.append((uncompressed_offset, compressed_offset))
+    return block_index
+
+  def test_read_block_index(self):
+    blocks = [line + b'\n' for line in self.content.split(b'\n')]
+    for compression_type in CompressedFile.BLOCK_COMPRESSION_TYPES:
+      with self.subTest(compression_type=compression_type):
+        compressed_blocks = self._compress_blocks(compression_type, blocks)
+        file_name = self._create_block_compressed_file(compressed_blocks)
+        with open(file_name, 'rb') as f:
+          self.assertEqual(
+              self._expected_block_index(blocks, compressed_blocks),
+              CompressedFile.read_block_index(
+                  f, compression_type, read_size=self.read_block_size))
+
+  def test_read_block_index_bgzf(self):
+    blocks = [line + b'\n' for line in self.content.split(b'\n')]
+    # bgzip ends files with an empty block.
+    compressed_blocks = [self._bgzf_block(block)
+                         for block in blocks] + [self._bgzf_block(b'')]
+    file_name = self._create_block_compressed_file(compressed_blocks)
+    with open(file_name, 'rb') as f:
+      self.assertEqual(
+          self._expected_block_index(blocks, compressed_blocks[:-1])[:-1] +
+          [(len(self.content) + 1, os.path.getsize(file_name))],
+          CompressedFile.read_block_index(f, CompressionTypes.GZIP))
+      f.seek(0)
+      self.assertEqual(
+          self.content + b'\n',
+          CompressedFile(f, CompressionTypes.GZIP).read(2 * len(self.content)))
+
+  def test_read_block_index_of_single_block(self):
+    for compression_type in CompressedFile.BLOCK_COMPRESSION_TYPES:
+      file_name = self._create_compressed_file(compression_type, self.content)
+      with open(file_name, 'rb') as f:
+        self.assertIsNone(CompressedFile.read_block_index(f, compression_type))
+
+  def test_read_block_index_with_large_blocks(self):
+    blocks = [os.urandom(10), os.urandom(100), os.urandom(10)]
+    compressed_blocks = self._compress_blocks(CompressionTypes.ZSTD, blocks)
+    file_name = self._create_block_compressed_file(compressed_blocks)
+    with open(file_name, 'rb') as f:
+      self.assertIsNone(
+          CompressedFile.read_block_index(
+              f, CompressionTypes.ZSTD, max_block_size=50))
+      self.assertIsNotNone(
+          CompressedFile.read_block_index(
+              f, CompressionTypes.ZSTD, max_block_size=200))
+
+  def test_seek_with_block_index(self):
+    blocks = [line + b'\n' for line in self.content.split(b'\n')]
+    for compression_type in CompressedFile.BLOCK_COMPRESSION_TYPES:
+      with self.subTest(compression_type=compression_type):
+        compressed_blocks = self._compress_blocks(compression_type, blocks)
+        file_name = self._create_block_compressed_file(compressed_blocks)
+        block_index = self._expected_block_index(blocks, compressed_blocks)
+        with open(file_name, 'rb') as f:
+          compressed_fd = CompressedFile(
+              f,
+              compression_type,
+              read_size=self.read_block_size,
+              # The index may not cover the start of the file.
+              block_index=block_index[2:-1])
+          reference_fd = BytesIO(self.content + b'\n')
+          for seek_position in (len(self.content) // 2,
+                                1,
+                                block_index[3][0],
+                                block_index[3][0] + 1,
+                                len(self.content) - 1,
+                                block_index[2][0] - 1,
+                                0):
+            compressed_fd.seek(seek_position, os.SEEK_SET)
+            reference_fd.seek(seek_position, os.SEEK_SET)
+            self.assertEqual(reference_fd.readline(), compressed_fd.readline())
+            self.assertEqual(reference_fd.tell(), compressed_fd.tell())
+
+  def test_read_ahead(self):
+    for compression_type in [CompressionTypes.BZIP2,
+                             CompressionTypes.DEFLATE,
+                             CompressionTypes.GZIP,
+                             CompressionTypes.ZSTD,
+                             CompressionTypes.LZMA]:
+      with self.subTest(compression_type=compression_type):
+        file_name = self._create_compressed_file(compression_type, self.content)
+        with open(file_name, 'rb') as f:
+          with CompressedFile(f,
+                              compression_type,
+                              read_size=self.read_block_size,
+                              read_ahead=True) as compressed_fd:
+            self.assertEqual(
+                self.content, compressed_fd.read(len(self.content)))
+            self.assertEqual(b'', compressed_fd.read())
+            compressed_fd.seek(5, os.SEEK_SET)
+            self.assertEqual(self.content[5:15], compressed_fd.read(10))
+
+  def test_read_ahead_raises_errors(self):
+    file_name = self._create_temp_file()
+    with open(file_name, 'wb') as f:
+      f.write(gzip.compress(self.content)[:20] + b'corrupted data')
+    with open(file_name, 'rb') as f:
+      compressed_fd = CompressedFile(
+          f, CompressionTypes.GZIP, read_size=4, read_ahead=True)
+      with self.assertRaises(zlib.error):
+        compressed_fd.read(len(self.content))
+      compressed_fd.close()
+
+  def test_read_ahead_stops_when_not_closed(self):
+    file_name = self._create_compressed_file(
+        CompressionTypes.GZIP, self.content)
+    with open(file_name, 'rb') as f:
+      compressed_fd = CompressedFile(
+          f, CompressionTypes.GZIP, read_size=4, read_ahead=True)
+      self.assertEqual(self.content[:10], compressed_fd.read(10))
+      read_ahead_thread = compressed_fd._read_ahead_thread
+      # The file is garbage collected while the thread waits for its reader.
+      del compressed_fd
+      read_ahead_thread.join(timeout=10)
+      self.assertFalse(read_ahead_thread.is_alive())
+
   def test_concatenated_compressed_file(self):
     # The test apache_beam.io.textio_test.test_read_gzip_concat
     # does not encounter the problem in the Beam 2.13 and earlier
@@ -386,6 +386,27 @@ class RangeTracker(object):
     """
     raise NotImplementedError
 
+  def try_claim_many(self, positions):
+    """Atomically determines which of the given records are within the range.
+
+    This is equivalent to invoking ``try_claim()`` for each position in order
+    until it returns ``False``, which is what the default implementation does.
+    ``RangeTracker``s may override it to claim the positions at once, so that
+    sources that read many records per block claim them with less overhead.
+
+    Args:
+      positions: increasing starting positions of records at split points
+        being read by a source.
+
+    Returns:
+      The number of positions, from the start of ``positions``, that fall
+      within the current range.
+    """
+    for index, position in enumerate(positions):
+      if not self.try_claim(position):
+        return index
+    return len(positions)
+
   def set_current_position(self, position):
     """Updates the last-consumed position to the given position.
 
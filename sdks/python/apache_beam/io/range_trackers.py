@@ -19,6 +19,7 @@
 """
 # pytype: skip-file
 
+import bisect
 import codecs
 import logging
 import math
@@ -131,6 +132,25 @@ class OffsetRangeTracker(iobase.RangeTracker):
       self._split_points_seen += 1
       return True
 
+  def try_claim_many(self, record_starts):
+    with self._lock:
+      if not record_starts:
+        return 0
+      if record_starts[0] <= self._last_attempted_record_start:
+        raise ValueError(
+            'Trying to return a record [starting at %d] which is not greater'
+            'than the last-attempted record [starting at %d]' %
+            (record_starts[0], self._last_attempted_record_start))
+      self._validate_record_start(record_starts[0], True)
+      num_claimed = bisect.bisect_left(record_starts, self.stop_position())
+      self._last_attempted_record_start = record_starts[min(
+          num_claimed, len(record_starts) - 1)]
+      if num_claimed:
+        self._offset_of_last_split_point = record_starts[num_claimed - 1]
+        self._last_record_start = record_starts[num_claimed - 1]
+        self._split_points_seen += num_claimed
+      return num_claimed
+
   def set_current_position(self, record_start):
     with self._lock:
       self._validate_record_start(record_start, False)
@@ -329,6 +349,9 @@ class UnsplittableRangeTracker(iobase.RangeTracker):
   def try_claim(self, position):
     return self._range_tracker.try_claim(position)
 
+  def try_claim_many(self, positions):
+    return self._range_tracker.try_claim_many(positions)
+
   def try_split(self, position):
     return None
 
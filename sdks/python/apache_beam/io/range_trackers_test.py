@@ -57,6 +57,21 @@ class OffsetRangeTrackerTest(unittest.TestCase):
     with self.assertRaises(Exception):
       tracker.try_claim(6)
 
+  def test_try_claim_many(self):
+    tracker = range_trackers.OffsetRangeTracker(1, 10)
+    self.assertEqual(0, tracker.try_claim_many([]))
+    self.assertEqual(3, tracker.try_claim_many([1, 3, 5]))
+    self.assertEqual(5, tracker.last_attempted_record_start)
+    self.assertEqual(2, tracker.split_points()[0])
+
+    self.assertEqual(7, tracker.try_split(7)[0])
+    self.assertEqual(1, tracker.try_claim_many([6, 7, 8]))
+    self.assertEqual(7, tracker.last_attempted_record_start)
+    self.assertEqual(3, tracker.split_points()[0])
+
+    with self.assertRaises(Exception):
+      tracker.try_claim_many([7, 8])
+
   def test_set_current_position(self):
     tracker = range_trackers.OffsetRangeTracker(0, 6)
     self.assertTrue(tracker.try_claim(2))
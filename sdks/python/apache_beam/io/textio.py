@@ -19,8 +19,11 @@
 
 # pytype: skip-file
 
+import itertools
 import logging
+import mmap
 import os
+import stat
 from functools import partial
 from typing import TYPE_CHECKING
 from typing import Any
@@ -40,12 +43,18 @@ from apache_beam.io.iobase import Write
 from apache_beam.transforms import PTransform
 from apache_beam.transforms.display import DisplayDataItem
 
+try:
+  import pyarrow as pa
+except ImportError:
+  pa = None
+
 if TYPE_CHECKING:
   from apache_beam.io import fileio
 
 __all__ = [
     'ReadFromText',
     'ReadFromTextWithFilename',
+    'ReadFromTextBatched',
     'ReadAllFromText',
     'ReadAllFromTextContinuously',
     'WriteToText',
@@ -70,6 +79,9 @@ class _TextSource(filebasedsource.FileBasedSource):
   """
 
   DEFAULT_READ_BUFFER_SIZE = 8192
+  # The number of bytes of memory-mapped files that are split into records
+  # at once.
+  BULK_READ_SIZE = 1 << 20
 
   class ReadBuffer(object):
     # A buffer that gives the buffered data and next position in the
@@ -117,7 +129,10 @@ class _TextSource(filebasedsource.FileBasedSource):
       skip_header_lines=0,
       header_processor_fns=(None, None),
       delimiter=None,
-      escapechar=None):
+      escapechar=None,
+      memory_map=False,
+      read_ahead=False,
+      split_compressed_blocks=False):
     """Initialize a _TextSource
 
     Args:
@@ -135,6 +150,13 @@ class _TextSource(filebasedsource.FileBasedSource):
         ambiguous parsing.
       escapechar (bytes) Optional: a single byte to escape the records
         delimiter, can also escape itself.
+      memory_map (bool): If True, local uncompressed files are memory-mapped
+        and split into records in blocks of ``BULK_READ_SIZE`` bytes, and the
+        records of each block are claimed at once.
+      read_ahead (bool): If True, compressed files are decompressed on a
+        background thread, ahead of the records being read.
+      split_compressed_blocks (bool): If True, compressed files of several
+        independently compressed blocks are split at the boundaries of blocks.
     Raises:
       ValueError: if skip_lines is negative.
 
@@ -145,7 +167,9 @@ class _TextSource(filebasedsource.FileBasedSource):
         file_pattern,
         min_bundle_size,
         compression_type=compression_type,
-        validate=validate)
+        validate=validate,
+        read_ahead=read_ahead,
+        split_compressed_blocks=split_compressed_blocks)
 
     self._strip_trailing_newlines = strip_trailing_newlines
     self._compression_type = compression_type
@@ -171,6 +195,7 @@ class _TextSource(filebasedsource.FileBasedSource):
         raise ValueError(
             "escapechar must be bytes of size 1: '%s'" % escapechar)
     self._escapechar = escapechar
+    self._memory_map = memory_map
 
   def display_data(self):
     parent_dd = super().display_data()
@@ -182,18 +207,16 @@ class _TextSource(filebasedsource.FileBasedSource):
     return parent_dd
 
   def read_records(self, file_name, range_tracker):
+    for records in self._read_record_blocks(file_name, range_tracker):
+      yield from records
+
+  def _read_record_blocks(self, file_name, range_tracker):
+    # Yields iterables of the decoded records within the range: a list for
+    # each block of a file that is read in bulk, or else a single iterator
+    # that reads the records one at a time.
     start_offset = range_tracker.start_position()
     read_buffer = _TextSource.ReadBuffer(b'', 0)
 
-    next_record_start_position = -1
-
-    def split_points_unclaimed(stop_position):
-      return (
-          0 if stop_position <= next_record_start_position else
-          iobase.RangeTracker.SPLIT_POINTS_UNKNOWN)
-
-    range_tracker.set_split_points_unclaimed_callback(split_points_unclaimed)
-
     with self.open_file(file_name) as file_to_read:
       position_after_processing_header_lines = (
           self._process_header(file_to_read, read_buffer))
@@ -233,25 +256,129 @@ class _TextSource(filebasedsource.FileBasedSource):
       else:
         next_record_start_position = position_after_processing_header_lines
 
-      while range_tracker.try_claim(next_record_start_position):
-        record, num_bytes_to_next_record = self._read_record(file_to_read,
-                                                             read_buffer)
-        # For compressed text files that use an unsplittable OffsetRangeTracker
-        # with infinity as the end position, above 'try_claim()' invocation
-        # would pass for an empty record at the end of file that is not
-        # followed by a new line character. Since such a record is at the last
-        # position of a file, it should not be a part of the considered range.
-        # We do this check to ignore such records.
-        if len(record) == 0 and num_bytes_to_next_record < 0:  # pylint: disable=len-as-condition
-          break
+      if self._can_read_in_bulk(file_to_read, next_record_start_position):
+        yield from self._read_records_in_bulk(
+            file_to_read, range_tracker, next_record_start_position)
+      else:
+        yield self._read_buffered_records(
+            file_to_read,
+            read_buffer,
+            range_tracker,
+            next_record_start_position)
+
+  def _read_buffered_records(
+      self,
+      file_to_read,
+      read_buffer,
+      range_tracker,
+      next_record_start_position):
+    def split_points_unclaimed(stop_position):
+      return (
+          0 if stop_position <= next_record_start_position else
+          iobase.RangeTracker.SPLIT_POINTS_UNKNOWN)
+
+    range_tracker.set_split_points_unclaimed_callback(split_points_unclaimed)
 
-        # Record delimiter must be larger than zero bytes.
-        assert num_bytes_to_next_record != 0
-        if num_bytes_to_next_record > 0:
-          next_record_start_position += num_bytes_to_next_record
+    while range_tracker.try_claim(next_record_start_position):
+      record, num_bytes_to_next_record = self._read_record(file_to_read,
+                                                           read_buffer)
+      # For compressed text files that use an unsplittable OffsetRangeTracker
+      # with infinity as the end position, above 'try_claim()' invocation
+      # would pass for an empty record at the end of file that is not
+      # followed by a new line character. Since such a record is at the last
+      # position of a file, it should not be a part of the considered range.
+      # We do this check to ignore such records.
+      if len(record) == 0 and num_bytes_to_next_record < 0:  # pylint: disable=len-as-condition
+        break
 
-        yield self._coder.decode(record)
-        if num_bytes_to_next_record < 0:
+      # Record delimiter must be larger than zero bytes.
+      assert num_bytes_to_next_record != 0
+      if num_bytes_to_next_record > 0:
+        next_record_start_position += num_bytes_to_next_record
+
+      yield self._coder.decode(record)
+      if num_bytes_to_next_record < 0:
+        break
+
+  def _can_read_in_bulk(self, file_to_read, start_position):
+    # Records of local uncompressed files, which can be memory-mapped, are
+    # split in bulk unless delimiters may be escaped.
+    if not self._memory_map or self._escapechar is not None:
+      return False
+    try:
+      file_stat = os.fstat(file_to_read.fileno())
+    except (AttributeError, OSError, ValueError):
+      # Files of other filesystems and compressed files have no file
+      # descriptor.
+      return False
+    return (
+        stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > start_position)
+
+  def _read_records_in_bulk(self, file_to_read, range_tracker, start_position):
+    # Reads the records of a memory-mapped file from start_position, splitting
+    # blocks of about BULK_READ_SIZE bytes into records at once and claiming
+    # the records of each block with a single call to the range tracker.
+    # Yields a list of the decoded records of each block.
+    delimiter = self._delimiter or b'\n'
+    delimiter_len = len(delimiter)
+    next_record_start_position = start_position
+
+    def split_points_unclaimed(stop_position):
+      return (
+          0 if stop_position <= next_record_start_position else
+          iobase.RangeTracker.SPLIT_POINTS_UNKNOWN)
+
+    range_tracker.set_split_points_unclaimed_callback(split_points_unclaimed)
+
+    with mmap.mmap(file_to_read.fileno(), 0,
+                   access=mmap.ACCESS_READ) as mapped_file:
+      size = len(mapped_file)
+      while next_record_start_position < size:
+        block_end = min(next_record_start_position + self.BULK_READ_SIZE, size)
+        last_delimiter = mapped_file.rfind(
+            delimiter, next_record_start_position, block_end)
+        if last_delimiter < 0:
+          # The next record is longer than a block.
+          last_delimiter = mapped_file.find(
+              delimiter, next_record_start_position)
+        block_end = size if last_delimiter < 0 else (
+            last_delimiter + delimiter_len)
+
+        records = mapped_file[next_record_start_position:block_end].split(
+            delimiter)
+        # The bytes after the last delimiter of the block are either empty or
+        # the last record of the file, which is not followed by a delimiter.
+        last_record = records.pop()
+        record_starts = list(
+            itertools.accumulate(
+                [len(record) + delimiter_len for record in records],
+                initial=next_record_start_position))
+        if not last_record:
+          record_starts.pop()
+
+        num_claimed = range_tracker.try_claim_many(record_starts)
+        if num_claimed < len(record_starts):
+          next_record_start_position = record_starts[num_claimed]
+        else:
+          next_record_start_position = block_end
+
+        if self._strip_trailing_newlines:
+          if self._delimiter is None:
+            # Strip the '\r' of '\r\n' delimiters.
+            records = [
+                record[:-1] if record.endswith(b'\r') else record
+                for record in records[:num_claimed]
+            ]
+        else:
+          records = [record + delimiter for record in records[:num_claimed]]
+        if last_record and num_claimed == len(record_starts):
+          records.append(last_record)
+
+        if num_claimed:
+          decode = self._coder.decode
+          yield [decode(record) for record in records[:num_claimed]]
+
+        if num_claimed < len(record_starts):
           break
 
   def _process_header(self, file_to_read, read_buffer):
@@ -435,6 +562,77 @@ class _TextSourceWithFilename(_TextSource):
     return typehints.KV[str, super().output_type_hint()]
 
 
+class _TextSourceBatched(_TextSource):
+  """A source that reads text files into batches of records.
+
+  Files that are read in bulk give a batch for each block of records claimed
+  at once, and other files give a batch for every ``max_batch_size`` records.
+  Blocks of more than ``max_batch_size`` records are split into several
+  batches.
+  """
+
+  BATCH_FORMATS = ('list', 'pyarrow')
+
+  def __init__(
+      self, *args, batch_format='list', max_batch_size=10000, **kwargs):
+    """Initialize a _TextSourceBatched
+
+    Args:
+      batch_format (str): ``'list'`` to read batches into lists of records, or
+        ``'pyarrow'`` to read them into ``pyarrow.Array``s.
+      max_batch_size (int): The maximum number of records of a batch.
+      *args: Arguments of :class:`_TextSource`.
+      **kwargs: Keyword arguments of :class:`_TextSource`.
+    Raises:
+      ValueError: if batch_format is unknown or max_batch_size isn't positive.
+      ImportError: if batch_format is ``'pyarrow'`` and pyarrow isn't
+        installed.
+    """
+    super().__init__(*args, **kwargs)
+    if batch_format not in self.BATCH_FORMATS:
+      raise ValueError(
+          'batch_format must be one of %s, got %r' %
+          (self.BATCH_FORMATS, batch_format))
+    if batch_format == 'pyarrow' and pa is None:
+      raise ImportError(
+          "pyarrow is required to read text with batch_format='pyarrow'.")
+    if max_batch_size <= 0:
+      raise ValueError(
+          'max_batch_size must be positive, got %d' % max_batch_size)
+    self._batch_format = batch_format
+    self._max_batch_size = max_batch_size
+
+  def display_data(self):
+    parent_dd = super().display_data()
+    parent_dd['batch_format'] = DisplayDataItem(
+        self._batch_format, label='Batch Format')
+    parent_dd['max_batch_size'] = DisplayDataItem(
+        self._max_batch_size, label='Max Batch Size')
+    return parent_dd
+
+  def read_records(self, file_name, range_tracker):
+    for records in self._read_record_blocks(file_name, range_tracker):
+      if isinstance(records, list) and len(records) <= self._max_batch_size:
+        yield self._to_batch(records)
+        continue
+      records = iter(records)
+      while True:
+        batch = list(itertools.islice(records, self._max_batch_size))
+        if not batch:
+          break
+        yield self._to_batch(batch)
+
+  def _to_batch(self, records):
+    if self._batch_format == 'pyarrow':
+      return pa.array(records)
+    return records
+
+  def output_type_hint(self):
+    if self._batch_format == 'pyarrow':
+      return pa.Array
+    return typehints.List[super().output_type_hint()]
+
+
 class _TextSink(filebasedsink.FileBasedSink):
   """A sink to a GCS or local text file or files."""
   def __init__(
@@ -566,7 +764,9 @@ def _create_text_source(
     validate=False,
     skip_header_lines=None,
     delimiter=None,
-    escapechar=None):
+    escapechar=None,
+    memory_map=False,
+    read_ahead=False):
   return _TextSource(
       file_pattern=file_pattern,
       min_bundle_size=min_bundle_size,
@@ -576,7 +776,9 @@ def _create_text_source(
       validate=validate,
       skip_header_lines=skip_header_lines,
       delimiter=delimiter,
-      escapechar=escapechar)
+      escapechar=escapechar,
+      memory_map=memory_map,
+      read_ahead=read_ahead)
 
 
 class ReadAllFromText(PTransform):
@@ -616,6 +818,8 @@ class ReadAllFromText(PTransform):
       with_filename=False,
       delimiter=None,
       escapechar=None,
+      memory_map=False,
+      read_ahead=False,
       **kwargs):
     """Initialize the ``ReadAllFromText`` transform.
 
@@ -645,6 +849,15 @@ class ReadAllFromText(PTransform):
         ambiguous parsing.
       escapechar (bytes) Optional: a single byte to escape the records
         delimiter, can also escape itself.
+      memory_map (bool): If True, local uncompressed files are memory-mapped
+        and split into records in blocks of about 1 MiB, and the records of
+        each block are claimed at once. This reads large files much faster,
+        but dynamic work rebalancing can then only split files at the
+        boundaries of blocks. Other files, and files read with an
+        ``escapechar``, are read as usual.
+      read_ahead (bool): If True, compressed files are read and decompressed
+        on a background thread, which overlaps decompression with the
+        processing of the lines read.
     """
     super().__init__(**kwargs)
     self._source_from_file = partial(
@@ -656,7 +869,9 @@ class ReadAllFromText(PTransform):
         coder=coder,
         skip_header_lines=skip_header_lines,
         delimiter=delimiter,
-        escapechar=escapechar)
+        escapechar=escapechar,
+        memory_map=memory_map,
+        read_ahead=read_ahead)
     self._desired_bundle_size = desired_bundle_size
     self._min_bundle_size = min_bundle_size
     self._compression_type = compression_type
@@ -767,6 +982,9 @@ class ReadFromText(PTransform):
       skip_header_lines=0,
       delimiter=None,
       escapechar=None,
+      memory_map=False,
+      read_ahead=False,
+      split_compressed_blocks=False,
       **kwargs):
     """Initialize the :class:`ReadFromText` transform.
 
@@ -795,6 +1013,21 @@ class ReadFromText(PTransform):
         ambiguous parsing.
       escapechar (bytes) Optional: a single byte to escape the records
         delimiter, can also escape itself.
+      memory_map (bool): If True, local uncompressed files are memory-mapped
+        and split into records in blocks of about 1 MiB, and the records of
+        each block are claimed at once. This reads large files much faster,
+        but dynamic work rebalancing can then only split files at the
+        boundaries of blocks. Other files, and files read with an
+        ``escapechar``, are read as usual.
+      read_ahead (bool): If True, compressed files are read and decompressed
+        on a background thread, which overlaps decompression with the
+        processing of the lines read.
+      split_compressed_blocks (bool): If True, compressed files that are made
+        of several independently compressed blocks, such as multi-member gzip
+        files, bgzip files, and zstd files of several frames, are split at the
+        boundaries of blocks so that they can be read in parallel. Finding the
+        blocks reads the headers of bgzip files, but decompresses other files
+        once when the source is split.
     """
 
     super().__init__(**kwargs)
@@ -814,7 +1047,10 @@ class ReadFromText(PTransform):
         validate=validate,
         skip_header_lines=skip_header_lines,
         delimiter=delimiter,
-        escapechar=escapechar)
+        escapechar=escapechar,
+        memory_map=memory_map,
+        read_ahead=read_ahead,
+        split_compressed_blocks=split_compressed_blocks)
 
   def expand(self, pvalue):
     return pvalue.pipeline | Read(self._source).with_output_types(
@@ -832,6 +1068,47 @@ class ReadFromTextWithFilename(ReadFromText):
   _source_class = _TextSourceWithFilename
 
 
+class ReadFromTextBatched(ReadFromText):
+  r"""A :class:`~apache_beam.io.textio.ReadFromText` for reading text files
+  into batches of lines.
+
+  Each output element is a batch of consecutive lines of a file, either a
+  ``list`` or a ``pyarrow.Array`` of the decoded lines. Reading batches avoids
+  the per-element overhead of pipelines that process lines in bulk.
+
+  Local uncompressed files are memory-mapped by default, and each batch holds
+  the lines of one block of about 1 MiB that is claimed at once, so dynamic
+  work rebalancing only splits files at the boundaries of blocks. Lines of
+  other files are batched as they are read.
+  """
+  def __init__(
+      self,
+      file_pattern=None,
+      batch_format='list',
+      max_batch_size=10000,
+      memory_map=True,
+      **kwargs):
+    """Initialize the :class:`ReadFromTextBatched` transform.
+
+    Args:
+      file_pattern (str): The file path to read from as a local file path or a
+        GCS ``gs://`` path. The path can contain glob characters
+        (``*``, ``?``, and ``[...]`` sets).
+      batch_format (str): ``'list'`` to output lists of lines, or
+        ``'pyarrow'`` to output ``pyarrow.Array``s of lines, which requires
+        pyarrow.
+      max_batch_size (int): The maximum number of lines of a batch.
+      memory_map (bool): If True, local uncompressed files are memory-mapped
+        and read in blocks of about 1 MiB.
+      **kwargs: Keyword arguments of :class:`ReadFromText`.
+    """
+    self._source_class = partial(
+        _TextSourceBatched,
+        batch_format=batch_format,
+        max_batch_size=max_batch_size)
+    super().__init__(file_pattern, memory_map=memory_map, **kwargs)
+
+
 class WriteToText(PTransform):
   """A :class:`~apache_beam.transforms.ptransform.PTransform` for writing to
   text files."""
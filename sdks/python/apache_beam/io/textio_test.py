@@ -31,22 +31,26 @@ import unittest
 import zlib
 from datetime import datetime
 
+import mock
 import pytz
 
 import apache_beam as beam
 from apache_beam import coders
 from apache_beam.io import iobase
 from apache_beam.io import source_test_utils
+from apache_beam.io.filesystem import CompressedFile
 from apache_beam.io.filesystem import CompressionTypes
 from apache_beam.io.filesystems import FileSystems
 # Importing following private classes for testing.
 from apache_beam.io.textio import ReadAllFromText
 from apache_beam.io.textio import ReadAllFromTextContinuously
 from apache_beam.io.textio import ReadFromText
+from apache_beam.io.textio import ReadFromTextBatched
 from apache_beam.io.textio import ReadFromTextWithFilename
 from apache_beam.io.textio import WriteToText
 from apache_beam.io.textio import _TextSink as TextSink
 from apache_beam.io.textio import _TextSource as TextSource
+from apache_beam.io.textio import _TextSourceBatched as TextSourceBatched
 from apache_beam.options.pipeline_options import PipelineOptions
 from apache_beam.testing.test_pipeline import TestPipeline
 from apache_beam.testing.test_stream import TestStream
@@ -58,6 +62,11 @@ from apache_beam.transforms.userstate import CombiningValueStateSpec
 from apache_beam.transforms.util import LogElements
 from apache_beam.utils.timestamp import Timestamp
 
+try:
+  import pyarrow as pa
+except ImportError:
+  pa = None
+
 
 class DummyCoder(coders.Coder):
   def encode(self, x):
@@ -538,6 +547,160 @@ class TextSourceTest(unittest.TestCase):
         splits[0].stop_position,
         perform_multi_threaded_test=False)
 
+  def _create_memory_mapped_source(
+      self, file_name, strip_trailing_newlines=True, delimiter=None):
+    source = TextSource(
+        file_name,
+        0,
+        CompressionTypes.UNCOMPRESSED,
+        strip_trailing_newlines,
+        coders.StrUtf8Coder(),
+        delimiter=delimiter,
+        memory_map=True)
+    # Small blocks split records across several blocks.
+    source.BULK_READ_SIZE = 20
+    return source
+
+  def test_read_memory_mapped(self):
+    for eol in (EOL.LF,
+                EOL.CRLF,
+                EOL.MIXED,
+                EOL.LF_WITH_NOTHING_AT_LAST_LINE,
+                EOL.CUSTOM_DELIMITER):
+      for strip_trailing_newlines in (True, False):
+        with self.subTest(eol=eol, strip=strip_trailing_newlines):
+          delimiter = b'|\x00' if eol == EOL.CUSTOM_DELIMITER else None
+          file_name, _ = write_data(100, eol=eol, custom_delimiter=delimiter)
+          expected_data = source_test_utils.read_from_source(
+              TextSource(
+                  file_name,
+                  0,
+                  CompressionTypes.UNCOMPRESSED,
+                  strip_trailing_newlines,
+                  coders.StrUtf8Coder(),
+                  delimiter=delimiter))
+          source = self._create_memory_mapped_source(
+              file_name, strip_trailing_newlines, delimiter)
+          self.assertEqual(
+              expected_data, source_test_utils.read_from_source(source))
+
+  def test_read_memory_mapped_records_longer_than_block(self):
+    file_name, expected_data = write_data(10, line_value=b'x' * 50)
+    source = self._create_memory_mapped_source(file_name)
+    self.assertEqual(expected_data, source_test_utils.read_from_source(source))
+
+  def test_read_memory_mapped_empty_file(self):
+    file_name, expected_data = write_data(0)
+    source = self._create_memory_mapped_source(file_name)
+    self.assertEqual(expected_data, source_test_utils.read_from_source(source))
+
+  def test_read_memory_mapped_after_splitting(self):
+    file_name, _ = write_data(100)
+    source = self._create_memory_mapped_source(file_name)
+    splits = list(source.split(desired_bundle_size=33))
+
+    reference_source_info = (source, None, None)
+    sources_info = ([(split.source, split.start_position, split.stop_position)
+                     for split in splits])
+    source_test_utils.assert_sources_equal_reference_source(
+        reference_source_info, sources_info)
+
+  def test_dynamic_work_rebalancing_memory_mapped(self):
+    file_name, expected_data = write_data(15, eol=EOL.MIXED)
+    assert len(expected_data) == 15
+    source = self._create_memory_mapped_source(file_name)
+    splits = list(source.split(desired_bundle_size=100000))
+    assert len(splits) == 1
+    source_test_utils.assert_split_at_fraction_exhaustive(
+        splits[0].source, splits[0].start_position, splits[0].stop_position)
+
+  def test_read_batched_memory_mapped(self):
+    file_name, expected_data = write_data(100, eol=EOL.CRLF)
+    source = TextSourceBatched(
+        file_name,
+        0,
+        CompressionTypes.UNCOMPRESSED,
+        True,
+        coders.StrUtf8Coder(),
+        memory_map=True)
+    source.BULK_READ_SIZE = 100
+    batches = source_test_utils.read_from_source(source)
+    self.assertGreater(len(batches), 1)
+    self.assertEqual(
+        expected_data, [line for batch in batches for line in batch])
+
+  def test_read_batched_max_batch_size(self):
+    file_name, expected_data = write_data(10)
+    for memory_map in (True, False):
+      source = TextSourceBatched(
+          file_name,
+          0,
+          CompressionTypes.UNCOMPRESSED,
+          True,
+          coders.StrUtf8Coder(),
+          memory_map=memory_map,
+          max_batch_size=4)
+      self.assertEqual(
+          [expected_data[:4], expected_data[4:8], expected_data[8:]],
+          source_test_utils.read_from_source(source))
+
+  def test_read_batched_after_splitting(self):
+    file_name, expected_data = write_data(100)
+    source = TextSourceBatched(
+        file_name,
+        0,
+        CompressionTypes.UNCOMPRESSED,
+        True,
+        coders.StrUtf8Coder(),
+        memory_map=True)
+    source.BULK_READ_SIZE = 50
+    lines = []
+    for split in source.split(desired_bundle_size=200):
+      for batch in source_test_utils.read_from_source(split.source,
+                                                      split.start_position,
+                                                      split.stop_position):
+        lines.extend(batch)
+    self.assertEqual(expected_data, lines)
+
+  def test_read_batched_invalid_arguments(self):
+    with self.assertRaises(ValueError):
+      TextSourceBatched(
+          'dummy_pattern',
+          0,
+          CompressionTypes.UNCOMPRESSED,
+          True,
+          coders.StrUtf8Coder(),
+          validate=False,
+          batch_format='dict')
+    with self.assertRaises(ValueError):
+      TextSourceBatched(
+          'dummy_pattern',
+          0,
+          CompressionTypes.UNCOMPRESSED,
+          True,
+          coders.StrUtf8Coder(),
+          validate=False,
+          max_batch_size=0)
+
+  def test_read_from_text_batched(self):
+    file_name, expected_data = write_data(5)
+    with TestPipeline() as pipeline:
+      pcoll = (
+          pipeline
+          | 'Read' >> ReadFromTextBatched(file_name)
+          | beam.FlatMap(lambda batch: batch))
+      assert_that(pcoll, equal_to(expected_data))
+
+  @unittest.skipIf(pa is None, 'pyarrow is not installed')
+  def test_read_from_text_batched_pyarrow(self):
+    file_name, expected_data = write_data(5)
+    with TestPipeline() as pipeline:
+      pcoll = (
+          pipeline
+          | 'Read' >> ReadFromTextBatched(file_name, batch_format='pyarrow')
+          | beam.FlatMap(lambda batch: batch.to_pylist()))
+      assert_that(pcoll, equal_to(expected_data))
+
   def test_read_from_text_single_file(self):
     file_name, expected_data = write_data(5)
     assert len(expected_data) == 5
@@ -917,6 +1080,101 @@ class TextSourceTest(unittest.TestCase):
             file_name, 0, CompressionTypes.GZIP, True, coders.StrUtf8Coder())
         assert_that(pcoll, equal_to(lines))
 
+  def _write_multi_member_gzip(self, tempdir, lines, lines_per_member):
+    # Lines span several members, like blocks of bgzip files.
+    data = '\n'.join(lines).encode('utf-8')
+    member_size = len(data) * lines_per_member // len(lines)
+    file_name = tempdir.create_temp_file()
+    with open(file_name, 'wb') as f:
+      for start in range(0, len(data), member_size):
+        f.write(gzip.compress(data[start:start + member_size]))
+    return file_name
+
+  def test_read_multi_member_gzip_after_splitting(self):
+    _, lines = write_data(100)
+    with TempDir() as tempdir:
+      file_name = self._write_multi_member_gzip(tempdir, lines, 5)
+      source = TextSource(
+          file_name,
+          0,
+          CompressionTypes.GZIP,
+          True,
+          coders.StrUtf8Coder(),
+          split_compressed_blocks=True)
+      splits = list(source.split(desired_bundle_size=100))
+      self.assertGreater(len(splits), 1)
+
+      reference_source_info = (source, None, None)
+      sources_info = ([
+          (split.source, split.start_position, split.stop_position)
+          for split in splits
+      ])
+      source_test_utils.assert_sources_equal_reference_source(
+          reference_source_info, sources_info)
+
+  def test_multi_member_gzip_splits_are_sized_in_compressed_bytes(self):
+    _, lines = write_data(100)
+    with TempDir() as tempdir:
+      file_name = self._write_multi_member_gzip(tempdir, lines, 5)
+      source = TextSource(
+          file_name,
+          0,
+          CompressionTypes.GZIP,
+          True,
+          coders.StrUtf8Coder(),
+          split_compressed_blocks=True)
+      splits = list(source.split(desired_bundle_size=100))
+      self.assertGreater(len(splits), 1)
+      for split in splits:
+        self.assertEqual(split.weight, split.source.estimate_size())
+        for sub_split in split.source.split(desired_bundle_size=10):
+          self.assertEqual(sub_split.weight, sub_split.source.estimate_size())
+      self.assertEqual(
+          os.path.getsize(file_name), sum(split.weight for split in splits))
+
+  def test_multi_member_gzip_not_split_by_default(self):
+    _, lines = write_data(100)
+    with TempDir() as tempdir:
+      file_name = self._write_multi_member_gzip(tempdir, lines, 5)
+      source = TextSource(
+          file_name, 0, CompressionTypes.GZIP, True, coders.StrUtf8Coder())
+      with mock.patch.object(CompressedFile, 'read_block_index') as index:
+        splits = list(source.split(desired_bundle_size=100))
+      index.assert_not_called()
+      self.assertEqual(1, len(splits))
+
+  def test_dynamic_work_rebalancing_multi_member_gzip(self):
+    _, lines = write_data(15)
+    with TempDir() as tempdir:
+      file_name = self._write_multi_member_gzip(tempdir, lines, 3)
+      source = TextSource(
+          file_name,
+          0,
+          CompressionTypes.GZIP,
+          True,
+          coders.StrUtf8Coder(),
+          read_ahead=True,
+          split_compressed_blocks=True)
+      splits = list(source.split(desired_bundle_size=100))
+      self.assertGreater(len(splits), 1)
+      source_test_utils.assert_split_at_fraction_exhaustive(
+          splits[1].source,
+          splits[1].start_position,
+          splits[1].stop_position,
+          perform_multi_threaded_test=False)
+
+  def test_read_gzip_read_ahead(self):
+    _, lines = write_data(15)
+    with TempDir() as tempdir:
+      file_name = tempdir.create_temp_file()
+      with gzip.GzipFile(file_name, 'wb') as f:
+        f.write('\n'.join(lines).encode('utf-8'))
+
+      with TestPipeline() as pipeline:
+        pcoll = pipeline | 'Read' >> ReadFromText(
+            file_name, compression_type=CompressionTypes.GZIP, read_ahead=True)
+        assert_that(pcoll, equal_to(lines))
+
   def test_read_corrupted_gzip_fails(self):
     _, lines = write_data(15)
     with TempDir() as tempdir:
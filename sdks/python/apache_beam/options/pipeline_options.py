@@ -978,6 +978,14 @@ class DirectOptions(PipelineOptions):
         default='in_memory',
         choices=['in_memory', 'multi_threading', 'multi_processing'],
         help='Workers running environment.')
+    parser.add_argument(
+        '--direct_grouping_buffer_memory_mb',
+        type=int,
+        default=0,
+        help='The amount of memory (in MB) that each GroupByKey buffer of the '
+        'FnApiRunner may use before it spills sorted runs of its data to '
+        'local disk. Set to 0 (the default) to keep all grouped data in '
+        'memory.')
     parser.add_argument(
         '--direct_embed_docker_python',
         default=False,
@@ -1535,6 +1543,61 @@ class WorkerOptions(PipelineOptions):
             'responsible for executing the user code and communicating with '
             'the runner. Depending on the runner, there may be more than one '
             'SDK Harness process running on the same worker node.'))
+    parser.add_argument(
+        '--state_cache_shards',
+        dest='state_cache_shards',
+        type=int,
+        default=1,
+        help=(
+            'Number of independently locked shards of the SDK Harness cache '
+            'set by --max_cache_memory_usage_mb. Sharding reduces lock '
+            'contention between concurrently processed bundles, at the cost '
+            'of evicting entries only approximately in least recently used '
+            'order across shards. The cache size is split evenly across '
+            'the shards.'))
+    parser.add_argument(
+        '--estimate_state_cache_weights',
+        dest='estimate_state_cache_weights',
+        action='store_true',
+        help=(
+            'Weigh the entries of the SDK Harness cache set by '
+            '--max_cache_memory_usage_mb with a cheaper estimate of their '
+            'size, which sizes lists of primitives directly and large lists '
+            'and dicts from a sample of their elements, rather than by '
+            'traversing all of their objects.'))
+    parser.add_argument(
+        '--max_side_input_cache_memory_usage_mb',
+        dest='max_side_input_cache_memory_usage_mb',
+        type=int,
+        default=100,
+        help=(
+            'Size in MB of the cache that keeps the views of recently '
+            'accessed windows of each side input for the duration of a '
+            'bundle. If the cache is full, the views of the least recently '
+            'accessed windows are evicted, but the view of the most recently '
+            'accessed window is always kept.'))
+    parser.add_argument(
+        '--prewarm_bundle_processors',
+        dest='prewarm_bundle_processors',
+        type=int,
+        default=0,
+        help=(
+            'Number of bundle processors that the SDK Harness creates in the '
+            'background for each stage, once the stage is registered or first '
+            'processed. Creating a bundle processor deserializes the DoFns of '
+            'the stage and runs their setup, so creating them ahead of time '
+            'avoids the latency for the first bundles, e.g. after scaling up. '
+            'Bundle processors are created on first use by default.'))
+    parser.add_argument(
+        '--max_bundle_processor_cache_memory_usage_mb',
+        dest='max_bundle_processor_cache_memory_usage_mb',
+        type=int,
+        default=None,
+        help=(
+            'Estimated size in MB of the idle bundle processors that the SDK '
+            'Harness keeps for reuse. If the cache is full, the bundle '
+            'processors of the least recently used stages are shut down. The '
+            'cache is unbounded by default.'))
     parser.add_argument(
         '--element_processing_timeout_minutes',
         type=int,
@@ -0,0 +1,56 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+For internal use only; no backwards-compatibility guarantees.
+Automatically generated when running python -m build.
+"""
+from .org.apache.beam.model.pipeline import v1
+from .org.apache.beam.model.interactive import v1 as v1_2
+from .org.apache.beam.model.job_management import v1 as v1_3
+from .org.apache.beam.model.fn_execution import v1 as v1_4
+
+beam_runner_api_pb2_grpc = v1.beam_runner_api_pb2_grpc
+schema_pb2_urns = v1.schema_pb2_urns
+standard_window_fns_pb2_grpc = v1.standard_window_fns_pb2_grpc
+external_transforms_pb2_grpc = v1.external_transforms_pb2_grpc
+metrics_pb2_grpc = v1.metrics_pb2_grpc
+schema_pb2_grpc = v1.schema_pb2_grpc
+metrics_pb2_urns = v1.metrics_pb2_urns
+external_transforms_pb2 = v1.external_transforms_pb2
+beam_runner_api_pb2 = v1.beam_runner_api_pb2
+schema_pb2 = v1.schema_pb2
+endpoints_pb2_grpc = v1.endpoints_pb2_grpc
+external_transforms_pb2_urns = v1.external_transforms_pb2_urns
+metrics_pb2 = v1.metrics_pb2
+beam_runner_api_pb2_urns = v1.beam_runner_api_pb2_urns
+standard_window_fns_pb2 = v1.standard_window_fns_pb2
+endpoints_pb2 = v1.endpoints_pb2
+standard_window_fns_pb2_urns = v1.standard_window_fns_pb2_urns
+beam_interactive_api_pb2 = v1_2.beam_interactive_api_pb2
+beam_interactive_api_pb2_grpc = v1_2.beam_interactive_api_pb2_grpc
+beam_artifact_api_pb2_urns = v1_3.beam_artifact_api_pb2_urns
+beam_expansion_api_pb2_grpc = v1_3.beam_expansion_api_pb2_grpc
+beam_job_api_pb2_grpc = v1_3.beam_job_api_pb2_grpc
+beam_artifact_api_pb2_grpc = v1_3.beam_artifact_api_pb2_grpc
+beam_job_api_pb2 = v1_3.beam_job_api_pb2
+beam_artifact_api_pb2 = v1_3.beam_artifact_api_pb2
+beam_expansion_api_pb2 = v1_3.beam_expansion_api_pb2
+beam_fn_api_pb2_urns = v1_4.beam_fn_api_pb2_urns
+beam_fn_api_pb2_grpc = v1_4.beam_fn_api_pb2_grpc
+beam_provision_api_pb2_grpc = v1_4.beam_provision_api_pb2_grpc
+beam_fn_api_pb2 = v1_4.beam_fn_api_pb2
+beam_provision_api_pb2 = v1_4.beam_provision_api_pb2
@@ -0,0 +1,2993 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+TODO: Consider consolidating common components in another package
+and language namespaces for re-use with Runner Api.
+"""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import duration_pb2 as _duration_pb2
+from google.protobuf import message as _message
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from ...pipeline.v1 import beam_runner_api_pb2 as _beam_runner_api_pb2
+from ...pipeline.v1 import endpoints_pb2 as _endpoints_pb2
+from ...pipeline.v1 import metrics_pb2 as _metrics_pb2
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class FnApiTransforms(_message.Message):
+    """Describes transforms necessary to execute Beam over the FnAPI but are
+    implementation details rather than part of the core model.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _Runner:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _RunnerEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[FnApiTransforms._Runner.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        DATA_SOURCE: FnApiTransforms._Runner.ValueType  # 0
+        """DataSource is a Root Transform, and a source of data for downstream
+        transforms in the same ProcessBundleDescriptor.
+        It represents a stream of values coming in from an external source/over
+        a data channel, typically from the runner. It's not the PCollection itself
+        but a description of how to get the portion of the PCollection for a given
+        bundle.
+
+        The DataSource transform is implemented in each SDK and not explicitly
+        provided during pipeline construction. A runner inserts the transform
+        in ProcessBundleDescriptors to indicate where the bundle
+        can retrieve data for an associated ProcessBundleRequest.
+        Data for the same request will be retrieved with the matching instruction ID,
+        and transform ID determined by the runner.
+
+        The DataSource transform will take a stream of bytes from the remote
+        source for the matching instruction ID and decode them as windowed
+        values using the provided coder ID, which must be a windowed value coder.
+
+        Payload: RemoteGrpcPort
+        """
+        DATA_SINK: FnApiTransforms._Runner.ValueType  # 1
+        """DataSink is a transform that sends PCollection elements to a remote
+        port using the Data API.
+
+        The DataSink transform is implemented in each SDK and not explicitly
+        provided during pipeline construction. A runner inserts the transform in
+        ProcessBundleDescriptors to indicate where the bundle can send
+        data for each associated ProcessBundleRequest. Data for the same
+        request will be sent with the matching instruction ID and transform ID.
+        Each PCollection that exits the ProcessBundleDescriptor subgraph will have
+        it's own DataSink, keyed by a transform ID determined by the runner.
+
+        The DataSink will take in a stream of elements for a given instruction ID
+        and encode them for transmission to the remote sink. The coder ID must be
+        for a windowed value coder.
+
+        Payload: RemoteGrpcPort
+        """
+
+    class Runner(_Runner, metaclass=_RunnerEnumTypeWrapper): ...
+    DATA_SOURCE: FnApiTransforms.Runner.ValueType  # 0
+    """DataSource is a Root Transform, and a source of data for downstream
+    transforms in the same ProcessBundleDescriptor.
+    It represents a stream of values coming in from an external source/over
+    a data channel, typically from the runner. It's not the PCollection itself
+    but a description of how to get the portion of the PCollection for a given
+    bundle.
+
+    The DataSource transform is implemented in each SDK and not explicitly
+    provided during pipeline construction. A runner inserts the transform
+    in ProcessBundleDescriptors to indicate where the bundle
+    can retrieve data for an associated ProcessBundleRequest.
+    Data for the same request will be retrieved with the matching instruction ID,
+    and transform ID determined by the runner.
+
+    The DataSource transform will take a stream of bytes from the remote
+    source for the matching instruction ID and decode them as windowed
+    values using the provided coder ID, which must be a windowed value coder.
+
+    Payload: RemoteGrpcPort
+    """
+    DATA_SINK: FnApiTransforms.Runner.ValueType  # 1
+    """DataSink is a transform that sends PCollection elements to a remote
+    port using the Data API.
+
+    The DataSink transform is implemented in each SDK and not explicitly
+    provided during pipeline construction. A runner inserts the transform in
+    ProcessBundleDescriptors to indicate where the bundle can send
+    data for each associated ProcessBundleRequest. Data for the same
+    request will be sent with the matching instruction ID and transform ID.
+    Each PCollection that exits the ProcessBundleDescriptor subgraph will have
+    it's own DataSink, keyed by a transform ID determined by the runner.
+
+    The DataSink will take in a stream of elements for a given instruction ID
+    and encode them for transmission to the remote sink. The coder ID must be
+    for a windowed value coder.
+
+    Payload: RemoteGrpcPort
+    """
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___FnApiTransforms: _TypeAlias = FnApiTransforms  # noqa: Y015
+
+@_typing.final
+class RemoteGrpcPort(_message.Message):
+    """A descriptor for connecting to a remote port using the Beam Fn Data API.
+    Allows for communication between two environments (for example between the
+    runner and the SDK).
+    Stable
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    API_SERVICE_DESCRIPTOR_FIELD_NUMBER: _builtins.int
+    CODER_ID_FIELD_NUMBER: _builtins.int
+    coder_id: _builtins.str
+    """(Required) The ID of the Coder that will be used to encode and decode data
+    sent over this port.
+    """
+    @_builtins.property
+    def api_service_descriptor(self) -> _endpoints_pb2.ApiServiceDescriptor:
+        """(Required) An API descriptor which describes where to
+        connect to including any authentication that is required.
+        """
+
+    def __init__(
+        self,
+        *,
+        api_service_descriptor: _endpoints_pb2.ApiServiceDescriptor | None = ...,
+        coder_id: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["api_service_descriptor", b"api_service_descriptor"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["api_service_descriptor", b"api_service_descriptor", "coder_id", b"coder_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RemoteGrpcPort: _TypeAlias = RemoteGrpcPort  # noqa: Y015
+
+@_typing.final
+class GetProcessBundleDescriptorRequest(_message.Message):
+    """Requests the ProcessBundleDescriptor with the given id."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROCESS_BUNDLE_DESCRIPTOR_ID_FIELD_NUMBER: _builtins.int
+    process_bundle_descriptor_id: _builtins.str
+    def __init__(
+        self,
+        *,
+        process_bundle_descriptor_id: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["process_bundle_descriptor_id", b"process_bundle_descriptor_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetProcessBundleDescriptorRequest: _TypeAlias = GetProcessBundleDescriptorRequest  # noqa: Y015
+
+@_typing.final
+class InstructionRequest(_message.Message):
+    """A request sent by a runner which the SDK is asked to fulfill.
+    For any unsupported request type, an error should be returned with a
+    matching instruction id.
+    Stable
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    INSTRUCTION_ID_FIELD_NUMBER: _builtins.int
+    PROCESS_BUNDLE_FIELD_NUMBER: _builtins.int
+    PROCESS_BUNDLE_PROGRESS_FIELD_NUMBER: _builtins.int
+    PROCESS_BUNDLE_SPLIT_FIELD_NUMBER: _builtins.int
+    FINALIZE_BUNDLE_FIELD_NUMBER: _builtins.int
+    MONITORING_INFOS_FIELD_NUMBER: _builtins.int
+    HARNESS_MONITORING_INFOS_FIELD_NUMBER: _builtins.int
+    SAMPLE_DATA_FIELD_NUMBER: _builtins.int
+    REGISTER_FIELD_NUMBER: _builtins.int
+    instruction_id: _builtins.str
+    """(Required) A unique identifier provided by the runner which represents
+    this requests execution. The InstructionResponse MUST have the matching id.
+    """
+    @_builtins.property
+    def process_bundle(self) -> Global___ProcessBundleRequest: ...
+    @_builtins.property
+    def process_bundle_progress(self) -> Global___ProcessBundleProgressRequest: ...
+    @_builtins.property
+    def process_bundle_split(self) -> Global___ProcessBundleSplitRequest: ...
+    @_builtins.property
+    def finalize_bundle(self) -> Global___FinalizeBundleRequest: ...
+    @_builtins.property
+    def monitoring_infos(self) -> Global___MonitoringInfosMetadataRequest: ...
+    @_builtins.property
+    def harness_monitoring_infos(self) -> Global___HarnessMonitoringInfosRequest: ...
+    @_builtins.property
+    def sample_data(self) -> Global___SampleDataRequest: ...
+    @_builtins.property
+    def register(self) -> Global___RegisterRequest:
+        """DEPRECATED"""
+
+    def __init__(
+        self,
+        *,
+        instruction_id: _builtins.str | None = ...,
+        process_bundle: Global___ProcessBundleRequest | None = ...,
+        process_bundle_progress: Global___ProcessBundleProgressRequest | None = ...,
+        process_bundle_split: Global___ProcessBundleSplitRequest | None = ...,
+        finalize_bundle: Global___FinalizeBundleRequest | None = ...,
+        monitoring_infos: Global___MonitoringInfosMetadataRequest | None = ...,
+        harness_monitoring_infos: Global___HarnessMonitoringInfosRequest | None = ...,
+        sample_data: Global___SampleDataRequest | None = ...,
+        register: Global___RegisterRequest | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["finalize_bundle", b"finalize_bundle", "harness_monitoring_infos", b"harness_monitoring_infos", "monitoring_infos", b"monitoring_infos", "process_bundle", b"process_bundle", "process_bundle_progress", b"process_bundle_progress", "process_bundle_split", b"process_bundle_split", "register", b"register", "request", b"request", "sample_data", b"sample_data"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["finalize_bundle", b"finalize_bundle", "harness_monitoring_infos", b"harness_monitoring_infos", "instruction_id", b"instruction_id", "monitoring_infos", b"monitoring_infos", "process_bundle", b"process_bundle", "process_bundle_progress", b"process_bundle_progress", "process_bundle_split", b"process_bundle_split", "register", b"register", "request", b"request", "sample_data", b"sample_data"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_request: _TypeAlias = _typing.Literal["process_bundle", "process_bundle_progress", "process_bundle_split", "finalize_bundle", "monitoring_infos", "harness_monitoring_infos", "sample_data", "register"]  # noqa: Y015
+    _WhichOneofArgType_request: _TypeAlias = _typing.Literal["request", b"request"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_request) -> _WhichOneofReturnType_request | None: ...
+
+Global___InstructionRequest: _TypeAlias = InstructionRequest  # noqa: Y015
+
+@_typing.final
+class InstructionResponse(_message.Message):
+    """The response for an associated request the SDK had been asked to fulfill.
+    Stable
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    INSTRUCTION_ID_FIELD_NUMBER: _builtins.int
+    ERROR_FIELD_NUMBER: _builtins.int
+    PROCESS_BUNDLE_FIELD_NUMBER: _builtins.int
+    PROCESS_BUNDLE_PROGRESS_FIELD_NUMBER: _builtins.int
+    PROCESS_BUNDLE_SPLIT_FIELD_NUMBER: _builtins.int
+    FINALIZE_BUNDLE_FIELD_NUMBER: _builtins.int
+    MONITORING_INFOS_FIELD_NUMBER: _builtins.int
+    HARNESS_MONITORING_INFOS_FIELD_NUMBER: _builtins.int
+    SAMPLE_DATA_FIELD_NUMBER: _builtins.int
+    REGISTER_FIELD_NUMBER: _builtins.int
+    instruction_id: _builtins.str
+    """(Required) A reference provided by the runner which represents a requests
+    execution. The InstructionResponse MUST have the matching id when
+    responding to the runner.
+    """
+    error: _builtins.str
+    """If this is specified, then this instruction has failed.
+    A human readable string representing the reason as to why processing has
+    failed.
+    """
+    @_builtins.property
+    def process_bundle(self) -> Global___ProcessBundleResponse: ...
+    @_builtins.property
+    def process_bundle_progress(self) -> Global___ProcessBundleProgressResponse: ...
+    @_builtins.property
+    def process_bundle_split(self) -> Global___ProcessBundleSplitResponse: ...
+    @_builtins.property
+    def finalize_bundle(self) -> Global___FinalizeBundleResponse: ...
+    @_builtins.property
+    def monitoring_infos(self) -> Global___MonitoringInfosMetadataResponse: ...
+    @_builtins.property
+    def harness_monitoring_infos(self) -> Global___HarnessMonitoringInfosResponse: ...
+    @_builtins.property
+    def sample_data(self) -> Global___SampleDataResponse: ...
+    @_builtins.property
+    def register(self) -> Global___RegisterResponse:
+        """DEPRECATED"""
+
+    def __init__(
+        self,
+        *,
+        instruction_id: _builtins.str | None = ...,
+        error: _builtins.str | None = ...,
+        process_bundle: Global___ProcessBundleResponse | None = ...,
+        process_bundle_progress: Global___ProcessBundleProgressResponse | None = ...,
+        process_bundle_split: Global___ProcessBundleSplitResponse | None = ...,
+        finalize_bundle: Global___FinalizeBundleResponse | None = ...,
+        monitoring_infos: Global___MonitoringInfosMetadataResponse | None = ...,
+        harness_monitoring_infos: Global___HarnessMonitoringInfosResponse | None = ...,
+        sample_data: Global___SampleDataResponse | None = ...,
+        register: Global___RegisterResponse | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["finalize_bundle", b"finalize_bundle", "harness_monitoring_infos", b"harness_monitoring_infos", "monitoring_infos", b"monitoring_infos", "process_bundle", b"process_bundle", "process_bundle_progress", b"process_bundle_progress", "process_bundle_split", b"process_bundle_split", "register", b"register", "response", b"response", "sample_data", b"sample_data"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["error", b"error", "finalize_bundle", b"finalize_bundle", "harness_monitoring_infos", b"harness_monitoring_infos", "instruction_id", b"instruction_id", "monitoring_infos", b"monitoring_infos", "process_bundle", b"process_bundle", "process_bundle_progress", b"process_bundle_progress", "process_bundle_split", b"process_bundle_split", "register", b"register", "response", b"response", "sample_data", b"sample_data"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_response: _TypeAlias = _typing.Literal["process_bundle", "process_bundle_progress", "process_bundle_split", "finalize_bundle", "monitoring_infos", "harness_monitoring_infos", "sample_data", "register"]  # noqa: Y015
+    _WhichOneofArgType_response: _TypeAlias = _typing.Literal["response", b"response"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_response) -> _WhichOneofReturnType_response | None: ...
+
+Global___InstructionResponse: _TypeAlias = InstructionResponse  # noqa: Y015
+
+@_typing.final
+class SampleDataRequest(_message.Message):
+    """If supported, the `SampleDataRequest` will respond with a
+    `SampleDataResponse`. The SDK being queried must have the
+    "beam:protocol:data_sampling:v1" capability. Samples are taken only from the
+    specified PCollection ids. An empty list will return everything.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PCOLLECTION_IDS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def pcollection_ids(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """(Optional) The PCollection ids to filter for."""
+
+    def __init__(
+        self,
+        *,
+        pcollection_ids: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["pcollection_ids", b"pcollection_ids"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SampleDataRequest: _TypeAlias = SampleDataRequest  # noqa: Y015
+
+@_typing.final
+class SampledElement(_message.Message):
+    """An element sampled when the SDK is processing a bundle. This is a proto
+    message to allow for additional per-element metadata.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class Exception(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        INSTRUCTION_ID_FIELD_NUMBER: _builtins.int
+        TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+        ERROR_FIELD_NUMBER: _builtins.int
+        instruction_id: _builtins.str
+        """(Required) The instruction ID of the associated ProcessBundleRequest."""
+        transform_id: _builtins.str
+        """(Required) The transform ID of the executing PTransform during the
+        exception.
+        """
+        error: _builtins.str
+        """(Required) The error message to be displayed to the user. Can use the
+        other fields to query for contextual logs.
+        """
+        def __init__(
+            self,
+            *,
+            instruction_id: _builtins.str | None = ...,
+            transform_id: _builtins.str | None = ...,
+            error: _builtins.str | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["error", b"error", "instruction_id", b"instruction_id", "transform_id", b"transform_id"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    ELEMENT_FIELD_NUMBER: _builtins.int
+    SAMPLE_TIMESTAMP_FIELD_NUMBER: _builtins.int
+    EXCEPTION_FIELD_NUMBER: _builtins.int
+    element: _builtins.bytes
+    """(Required) Sampled raw bytes for an element. This is a
+    single encoded element in the nested context.
+    """
+    @_builtins.property
+    def sample_timestamp(self) -> _timestamp_pb2.Timestamp:
+        """(Required) Timestamp of when the sample was taken."""
+
+    @_builtins.property
+    def exception(self) -> Global___SampledElement.Exception:
+        """(Optional) This will be set if this element was sampled because of a user
+        exception.
+        """
+
+    def __init__(
+        self,
+        *,
+        element: _builtins.bytes | None = ...,
+        sample_timestamp: _timestamp_pb2.Timestamp | None = ...,
+        exception: Global___SampledElement.Exception | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["exception", b"exception", "sample_timestamp", b"sample_timestamp"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["element", b"element", "exception", b"exception", "sample_timestamp", b"sample_timestamp"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SampledElement: _TypeAlias = SampledElement  # noqa: Y015
+
+@_typing.final
+class SampleDataResponse(_message.Message):
+    """If supported, the `SampleDataResponse` will contain samples from PCollections
+    based upon the filters specified in the request.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class ElementList(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        ELEMENTS_FIELD_NUMBER: _builtins.int
+        @_builtins.property
+        def elements(self) -> _containers.RepeatedCompositeFieldContainer[Global___SampledElement]:
+            """Required. The individual elements sampled from a PCollection."""
+
+        def __init__(
+            self,
+            *,
+            elements: _abc.Iterable[Global___SampledElement] | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["elements", b"elements"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ElementSamplesEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        @_builtins.property
+        def value(self) -> Global___SampleDataResponse.ElementList: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: Global___SampleDataResponse.ElementList | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    ELEMENT_SAMPLES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def element_samples(self) -> _containers.MessageMap[_builtins.str, Global___SampleDataResponse.ElementList]:
+        """Map from PCollection id to sampled elements."""
+
+    def __init__(
+        self,
+        *,
+        element_samples: _abc.Mapping[_builtins.str, Global___SampleDataResponse.ElementList] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["element_samples", b"element_samples"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SampleDataResponse: _TypeAlias = SampleDataResponse  # noqa: Y015
+
+@_typing.final
+class HarnessMonitoringInfosRequest(_message.Message):
+    """A request to provide full MonitoringInfo associated with the entire SDK
+    harness process, not specific to a bundle.
+
+    An SDK can report metrics using an identifier that only contains the
+    associated payload. A runner who wants to receive the full metrics
+    information can request all the monitoring metadata via a
+    MonitoringInfosMetadataRequest providing a list of ids as necessary.
+
+    The SDK is allowed to reuse the identifiers
+    for the lifetime of the associated control connection as long
+    as the MonitoringInfo could be reconstructed fully by overwriting its
+    payload field with the bytes specified here.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___HarnessMonitoringInfosRequest: _TypeAlias = HarnessMonitoringInfosRequest  # noqa: Y015
+
+@_typing.final
+class HarnessMonitoringInfosResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class MonitoringDataEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        value: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    MONITORING_DATA_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def monitoring_data(self) -> _containers.ScalarMap[_builtins.str, _builtins.bytes]:
+        """An identifier to MonitoringInfo.payload mapping containing
+        Metrics associated with the SDK harness, not a specific bundle.
+
+        An SDK can report metrics using an identifier that only contains the
+        associated payload. A runner who wants to receive the full metrics
+        information can request all the monitoring metadata via a
+        MonitoringInfosMetadataRequest providing a list of ids as necessary.
+
+        The SDK is allowed to reuse the identifiers
+        for the lifetime of the associated control connection as long
+        as the MonitoringInfo could be reconstructed fully by overwriting its
+        payload field with the bytes specified here.
+        """
+
+    def __init__(
+        self,
+        *,
+        monitoring_data: _abc.Mapping[_builtins.str, _builtins.bytes] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["monitoring_data", b"monitoring_data"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___HarnessMonitoringInfosResponse: _TypeAlias = HarnessMonitoringInfosResponse  # noqa: Y015
+
+@_typing.final
+class RegisterRequest(_message.Message):
+    """A list of objects which can be referred to by the runner in
+    future requests.
+    Stable
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PROCESS_BUNDLE_DESCRIPTOR_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def process_bundle_descriptor(self) -> _containers.RepeatedCompositeFieldContainer[Global___ProcessBundleDescriptor]:
+        """(Optional) The set of descriptors used to process bundles."""
+
+    def __init__(
+        self,
+        *,
+        process_bundle_descriptor: _abc.Iterable[Global___ProcessBundleDescriptor] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["process_bundle_descriptor", b"process_bundle_descriptor"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RegisterRequest: _TypeAlias = RegisterRequest  # noqa: Y015
+
+@_typing.final
+class RegisterResponse(_message.Message):
+    """Stable"""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RegisterResponse: _TypeAlias = RegisterResponse  # noqa: Y015
+
+@_typing.final
+class ProcessBundleDescriptor(_message.Message):
+    """Definitions that should be used to construct the bundle processing graph."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class TransformsEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        @_builtins.property
+        def value(self) -> _beam_runner_api_pb2.PTransform: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: _beam_runner_api_pb2.PTransform | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class PcollectionsEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        @_builtins.property
+        def value(self) -> _beam_runner_api_pb2.PCollection: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: _beam_runner_api_pb2.PCollection | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class WindowingStrategiesEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        @_builtins.property
+        def value(self) -> _beam_runner_api_pb2.WindowingStrategy: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: _beam_runner_api_pb2.WindowingStrategy | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class CodersEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        @_builtins.property
+        def value(self) -> _beam_runner_api_pb2.Coder: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: _beam_runner_api_pb2.Coder | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class EnvironmentsEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        @_builtins.property
+        def value(self) -> _beam_runner_api_pb2.Environment: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: _beam_runner_api_pb2.Environment | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    ID_FIELD_NUMBER: _builtins.int
+    TRANSFORMS_FIELD_NUMBER: _builtins.int
+    PCOLLECTIONS_FIELD_NUMBER: _builtins.int
+    WINDOWING_STRATEGIES_FIELD_NUMBER: _builtins.int
+    CODERS_FIELD_NUMBER: _builtins.int
+    ENVIRONMENTS_FIELD_NUMBER: _builtins.int
+    STATE_API_SERVICE_DESCRIPTOR_FIELD_NUMBER: _builtins.int
+    TIMER_API_SERVICE_DESCRIPTOR_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    """(Required) A pipeline level unique id which can be used as a reference to
+    refer to this.
+    """
+    @_builtins.property
+    def transforms(self) -> _containers.MessageMap[_builtins.str, _beam_runner_api_pb2.PTransform]:
+        """(Required) A map from pipeline-scoped id to PTransform."""
+
+    @_builtins.property
+    def pcollections(self) -> _containers.MessageMap[_builtins.str, _beam_runner_api_pb2.PCollection]:
+        """(Required) A map from pipeline-scoped id to PCollection."""
+
+    @_builtins.property
+    def windowing_strategies(self) -> _containers.MessageMap[_builtins.str, _beam_runner_api_pb2.WindowingStrategy]:
+        """(Required) A map from pipeline-scoped id to WindowingStrategy."""
+
+    @_builtins.property
+    def coders(self) -> _containers.MessageMap[_builtins.str, _beam_runner_api_pb2.Coder]:
+        """(Required) A map from pipeline-scoped id to Coder."""
+
+    @_builtins.property
+    def environments(self) -> _containers.MessageMap[_builtins.str, _beam_runner_api_pb2.Environment]:
+        """(Required) A map from pipeline-scoped id to Environment."""
+
+    @_builtins.property
+    def state_api_service_descriptor(self) -> _endpoints_pb2.ApiServiceDescriptor:
+        """A descriptor describing the end point to use for State API
+        calls. Required if the Runner intends to send remote references over the
+        data plane or if any of the transforms rely on user state or side inputs.
+        """
+
+    @_builtins.property
+    def timer_api_service_descriptor(self) -> _endpoints_pb2.ApiServiceDescriptor:
+        """A descriptor describing the end point to use for Data API for user timers.
+        Required if the ProcessBundleDescriptor contains any transforms that have user timers.
+        """
+
+    def __init__(
+        self,
+        *,
+        id: _builtins.str | None = ...,
+        transforms: _abc.Mapping[_builtins.str, _beam_runner_api_pb2.PTransform] | None = ...,
+        pcollections: _abc.Mapping[_builtins.str, _beam_runner_api_pb2.PCollection] | None = ...,
+        windowing_strategies: _abc.Mapping[_builtins.str, _beam_runner_api_pb2.WindowingStrategy] | None = ...,
+        coders: _abc.Mapping[_builtins.str, _beam_runner_api_pb2.Coder] | None = ...,
+        environments: _abc.Mapping[_builtins.str, _beam_runner_api_pb2.Environment] | None = ...,
+        state_api_service_descriptor: _endpoints_pb2.ApiServiceDescriptor | None = ...,
+        timer_api_service_descriptor: _endpoints_pb2.ApiServiceDescriptor | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["state_api_service_descriptor", b"state_api_service_descriptor", "timer_api_service_descriptor", b"timer_api_service_descriptor"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["coders", b"coders", "environments", b"environments", "id", b"id", "pcollections", b"pcollections", "state_api_service_descriptor", b"state_api_service_descriptor", "timer_api_service_descriptor", b"timer_api_service_descriptor", "transforms", b"transforms", "windowing_strategies", b"windowing_strategies"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ProcessBundleDescriptor: _TypeAlias = ProcessBundleDescriptor  # noqa: Y015
+
+@_typing.final
+class BundleApplication(_message.Message):
+    """One of the applications specifying the scope of work for a bundle.
+    See
+    https://docs.google.com/document/d/1tUDb45sStdR8u7-jBkGdw3OGFK7aa2-V7eo86zYSE_4/edit#heading=h.9g3g5weg2u9
+    for further details.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class OutputWatermarksEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        @_builtins.property
+        def value(self) -> _timestamp_pb2.Timestamp: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: _timestamp_pb2.Timestamp | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+    INPUT_ID_FIELD_NUMBER: _builtins.int
+    ELEMENT_FIELD_NUMBER: _builtins.int
+    OUTPUT_WATERMARKS_FIELD_NUMBER: _builtins.int
+    IS_BOUNDED_FIELD_NUMBER: _builtins.int
+    transform_id: _builtins.str
+    """(Required) The transform to which to pass the element"""
+    input_id: _builtins.str
+    """(Required) Name of the transform's input to which to pass the element."""
+    element: _builtins.bytes
+    """(Required) The encoded element to pass to the transform."""
+    is_bounded: _beam_runner_api_pb2.IsBounded.Enum.ValueType
+    """Whether this application potentially produces an unbounded
+    amount of data. Note that this should only be set to BOUNDED if and
+    only if the application is known to produce a finite amount of output.
+    """
+    @_builtins.property
+    def output_watermarks(self) -> _containers.MessageMap[_builtins.str, _timestamp_pb2.Timestamp]:
+        """The map is keyed by the local output name of the PTransform. Each
+        value represents a lower bound on the timestamps of elements that
+        are produced by this PTransform into each of its output PCollections
+        when invoked with this application.
+
+        If there is no watermark reported from RestrictionTracker, the runner will
+        use MIN_TIMESTAMP by default.
+        """
+
+    def __init__(
+        self,
+        *,
+        transform_id: _builtins.str | None = ...,
+        input_id: _builtins.str | None = ...,
+        element: _builtins.bytes | None = ...,
+        output_watermarks: _abc.Mapping[_builtins.str, _timestamp_pb2.Timestamp] | None = ...,
+        is_bounded: _beam_runner_api_pb2.IsBounded.Enum.ValueType | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["element", b"element", "input_id", b"input_id", "is_bounded", b"is_bounded", "output_watermarks", b"output_watermarks", "transform_id", b"transform_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___BundleApplication: _TypeAlias = BundleApplication  # noqa: Y015
+
+@_typing.final
+class DelayedBundleApplication(_message.Message):
+    """An Application should be scheduled for execution after a delay.
+    Either an absolute timestamp or a relative timestamp can represent a
+    scheduled execution time.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    APPLICATION_FIELD_NUMBER: _builtins.int
+    REQUESTED_TIME_DELAY_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def application(self) -> Global___BundleApplication:
+        """(Required) The application that should be scheduled."""
+
+    @_builtins.property
+    def requested_time_delay(self) -> _duration_pb2.Duration:
+        """Recommended time delay at which the application should be scheduled to
+        execute by the runner. Time delay that equals 0 may be scheduled to execute
+        immediately. The unit of time delay should be microsecond.
+        """
+
+    def __init__(
+        self,
+        *,
+        application: Global___BundleApplication | None = ...,
+        requested_time_delay: _duration_pb2.Duration | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["application", b"application", "requested_time_delay", b"requested_time_delay"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["application", b"application", "requested_time_delay", b"requested_time_delay"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DelayedBundleApplication: _TypeAlias = DelayedBundleApplication  # noqa: Y015
+
+@_typing.final
+class ProcessBundleRequest(_message.Message):
+    """A request to process a given bundle.
+    Stable
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class CacheToken(_message.Message):
+        """Contains the cache token and also defines the scope of what the token applies to.
+
+        See https://s.apache.org/beam-fn-state-api-and-bundle-processing#heading=h.7ghoih5aig5m
+        for additional details on how to use the cache token with the State API
+        to cache data across bundle boundaries.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        @_typing.final
+        class UserState(_message.Message):
+            """A flag to indicate a cache token is valid for all user state."""
+
+            DESCRIPTOR: _descriptor.Descriptor
+
+            def __init__(
+                self,
+            ) -> None: ...
+            _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+            def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+            _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+            def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+            def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+        @_typing.final
+        class SideInput(_message.Message):
+            """A flag to indicate a cache token is valid for a side input."""
+
+            DESCRIPTOR: _descriptor.Descriptor
+
+            TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+            SIDE_INPUT_ID_FIELD_NUMBER: _builtins.int
+            transform_id: _builtins.str
+            """(Required) The id of the PTransform containing a side input."""
+            side_input_id: _builtins.str
+            """(Required) The id of the side input."""
+            def __init__(
+                self,
+                *,
+                transform_id: _builtins.str | None = ...,
+                side_input_id: _builtins.str | None = ...,
+            ) -> None: ...
+            _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+            def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+            _ClearFieldArgType: _TypeAlias = _typing.Literal["side_input_id", b"side_input_id", "transform_id", b"transform_id"]  # noqa: Y015
+            def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+            def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+        USER_STATE_FIELD_NUMBER: _builtins.int
+        SIDE_INPUT_FIELD_NUMBER: _builtins.int
+        TOKEN_FIELD_NUMBER: _builtins.int
+        token: _builtins.bytes
+        """An opaque token used with the StateKey to create a globally unique
+        identifier.
+        """
+        @_builtins.property
+        def user_state(self) -> Global___ProcessBundleRequest.CacheToken.UserState: ...
+        @_builtins.property
+        def side_input(self) -> Global___ProcessBundleRequest.CacheToken.SideInput: ...
+        def __init__(
+            self,
+            *,
+            user_state: Global___ProcessBundleRequest.CacheToken.UserState | None = ...,
+            side_input: Global___ProcessBundleRequest.CacheToken.SideInput | None = ...,
+            token: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["side_input", b"side_input", "type", b"type", "user_state", b"user_state"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["side_input", b"side_input", "token", b"token", "type", b"type", "user_state", b"user_state"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        _WhichOneofReturnType_type: _TypeAlias = _typing.Literal["user_state", "side_input"]  # noqa: Y015
+        _WhichOneofArgType_type: _TypeAlias = _typing.Literal["type", b"type"]  # noqa: Y015
+        def WhichOneof(self, oneof_group: _WhichOneofArgType_type) -> _WhichOneofReturnType_type | None: ...
+
+    PROCESS_BUNDLE_DESCRIPTOR_ID_FIELD_NUMBER: _builtins.int
+    CACHE_TOKENS_FIELD_NUMBER: _builtins.int
+    ELEMENTS_FIELD_NUMBER: _builtins.int
+    HAS_NO_STATE_FIELD_NUMBER: _builtins.int
+    ONLY_BUNDLE_FOR_KEYS_FIELD_NUMBER: _builtins.int
+    process_bundle_descriptor_id: _builtins.str
+    """(Required) A reference to the process bundle descriptor that must be
+    instantiated and executed by the SDK harness.
+    """
+    has_no_state: _builtins.bool
+    """indicates that the runner has no stare for the keys in this bundle
+    so SDk can safely begin stateful processing with a locally-generated
+    initial empty state
+    """
+    only_bundle_for_keys: _builtins.bool
+    """indicates that the runner will never process another bundle for the keys
+    in this bundle so state need not be included in the bundle commit.
+    """
+    @_builtins.property
+    def cache_tokens(self) -> _containers.RepeatedCompositeFieldContainer[Global___ProcessBundleRequest.CacheToken]:
+        """(Optional) A list of cache tokens that can be used by an SDK to reuse
+        cached data returned by the State API across multiple bundles.
+
+        Note that SDKs that can efficiently consume this field should declare
+        the beam:protocol:state_caching:v1 capability enabling runners to reduce
+        the amount of memory used.
+
+        See https://s.apache.org/beam-fn-state-api-and-bundle-processing#heading=h.7ghoih5aig5m
+        for additional details on how to use the cache token with the State API
+        to cache data across bundle boundaries.
+        """
+
+    @_builtins.property
+    def elements(self) -> Global___Elements:
+        """(Optional) Elements to be processed with the bundle. Either all or
+        none of the bundle elements should be included in the ProcessBundleRequest.
+        This embedding is to achieve better efficiency for bundles that contain
+        only small amounts of data and are cheap to be processed on the SDK harness
+        side. This field can be set only if the SDK declares that it supports the
+        beam:protocol:control_request_elements_embedding:v1 capability. See more
+        at https://s.apache.org/beam-fn-api-control-data-embedding.
+        """
+
+    def __init__(
+        self,
+        *,
+        process_bundle_descriptor_id: _builtins.str | None = ...,
+        cache_tokens: _abc.Iterable[Global___ProcessBundleRequest.CacheToken] | None = ...,
+        elements: Global___Elements | None = ...,
+        has_no_state: _builtins.bool | None = ...,
+        only_bundle_for_keys: _builtins.bool | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["elements", b"elements"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["cache_tokens", b"cache_tokens", "elements", b"elements", "has_no_state", b"has_no_state", "only_bundle_for_keys", b"only_bundle_for_keys", "process_bundle_descriptor_id", b"process_bundle_descriptor_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ProcessBundleRequest: _TypeAlias = ProcessBundleRequest  # noqa: Y015
+
+@_typing.final
+class ProcessBundleResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class MonitoringDataEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        value: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    RESIDUAL_ROOTS_FIELD_NUMBER: _builtins.int
+    MONITORING_INFOS_FIELD_NUMBER: _builtins.int
+    REQUIRES_FINALIZATION_FIELD_NUMBER: _builtins.int
+    MONITORING_DATA_FIELD_NUMBER: _builtins.int
+    ELEMENTS_FIELD_NUMBER: _builtins.int
+    requires_finalization: _builtins.bool
+    """(Optional) Specifies that the runner must callback to this worker
+    once the output of the bundle is committed. The Runner must send a
+    FinalizeBundleRequest with the instruction id of the ProcessBundleRequest
+    that is related to this ProcessBundleResponse.
+    """
+    @_builtins.property
+    def residual_roots(self) -> _containers.RepeatedCompositeFieldContainer[Global___DelayedBundleApplication]:
+        """(Optional) Specifies that the bundle has not been completed and the
+        following applications need to be scheduled and executed in the future.
+        A runner that does not yet support residual roots MUST still check that
+        this is empty for correctness.
+
+        Note that these residual roots must not have been returned as part of a
+        prior split for this bundle.
+        """
+
+    @_builtins.property
+    def monitoring_infos(self) -> _containers.RepeatedCompositeFieldContainer[_metrics_pb2.MonitoringInfo]:
+        """DEPRECATED (Required) The list of metrics or other MonitoredState
+        collected while processing this bundle.
+        """
+
+    @_builtins.property
+    def monitoring_data(self) -> _containers.ScalarMap[_builtins.str, _builtins.bytes]:
+        """An identifier to MonitoringInfo.payload mapping.
+
+        An SDK can report metrics using an identifier that only contains the
+        associated payload. A runner who wants to receive the full metrics
+        information can request all the monitoring metadata via a
+        MonitoringInfosMetadataRequest providing a list of ids as necessary.
+
+        The SDK is allowed to reuse the identifiers across multiple bundles as long
+        as the MonitoringInfo could be reconstructed fully by overwriting its
+        payload field with the bytes specified here.
+        """
+
+    @_builtins.property
+    def elements(self) -> Global___Elements:
+        """(Optional) Output elements of the processed bundle. Either all or
+        none of the bundle elements should be included in the ProcessBundleResponse.
+        This embedding is to achieve better efficiency for bundles that only
+        contain small amounts of data. his field can be set only if the runner
+        declares that it supports the
+        beam:protocol:control_request_elements_embedding:v1 capability. See more at
+        https://s.apache.org/beam-fn-api-control-data-embedding.
+        """
+
+    def __init__(
+        self,
+        *,
+        residual_roots: _abc.Iterable[Global___DelayedBundleApplication] | None = ...,
+        monitoring_infos: _abc.Iterable[_metrics_pb2.MonitoringInfo] | None = ...,
+        requires_finalization: _builtins.bool | None = ...,
+        monitoring_data: _abc.Mapping[_builtins.str, _builtins.bytes] | None = ...,
+        elements: Global___Elements | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["elements", b"elements"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["elements", b"elements", "monitoring_data", b"monitoring_data", "monitoring_infos", b"monitoring_infos", "requires_finalization", b"requires_finalization", "residual_roots", b"residual_roots"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ProcessBundleResponse: _TypeAlias = ProcessBundleResponse  # noqa: Y015
+
+@_typing.final
+class ProcessBundleProgressRequest(_message.Message):
+    """A request to report progress information for a given bundle.
+    This is an optional request to be handled and is used to support advanced
+    SDK features such as SplittableDoFn, user level metrics etc.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    INSTRUCTION_ID_FIELD_NUMBER: _builtins.int
+    instruction_id: _builtins.str
+    """(Required) A reference to an active process bundle request with the given
+    instruction id.
+    """
+    def __init__(
+        self,
+        *,
+        instruction_id: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["instruction_id", b"instruction_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ProcessBundleProgressRequest: _TypeAlias = ProcessBundleProgressRequest  # noqa: Y015
+
+@_typing.final
+class MonitoringInfosMetadataRequest(_message.Message):
+    """A request to provide full MonitoringInfo for a set of provided ids.
+
+    An SDK can report metrics using an identifier that only contains the
+    associated payload. A runner who wants to receive the full metrics
+    information can request all the monitoring metadata via a
+    MonitoringInfosMetadataRequest providing a list of ids as necessary.
+
+    The SDK is allowed to reuse the identifiers for the lifetime of the
+    associated control connection as long as the MonitoringInfo could be
+    reconstructed fully by overwriting its payload field with the bytes specified
+    here.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    MONITORING_INFO_ID_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def monitoring_info_id(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """A list of ids for which the full MonitoringInfo is requested for."""
+
+    def __init__(
+        self,
+        *,
+        monitoring_info_id: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["monitoring_info_id", b"monitoring_info_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MonitoringInfosMetadataRequest: _TypeAlias = MonitoringInfosMetadataRequest  # noqa: Y015
+
+@_typing.final
+class ProcessBundleProgressResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class MonitoringDataEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        value: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    MONITORING_INFOS_FIELD_NUMBER: _builtins.int
+    MONITORING_DATA_FIELD_NUMBER: _builtins.int
+    CONSUMING_RECEIVED_DATA_FIELD_NUMBER: _builtins.int
+    consuming_received_data: _builtins.bool
+    """Indicates that the SDK is still busy consuming the data that as already
+    been received on the data channel. If this is set, a runner may abstain
+    from sending further data on the data channel until this field becomes
+    unset. This field is currently used during shuffle reads on large elements.
+    """
+    @_builtins.property
+    def monitoring_infos(self) -> _containers.RepeatedCompositeFieldContainer[_metrics_pb2.MonitoringInfo]:
+        """DEPRECATED (Required) The list of metrics or other MonitoredState
+        collected while processing this bundle.
+        """
+
+    @_builtins.property
+    def monitoring_data(self) -> _containers.ScalarMap[_builtins.str, _builtins.bytes]:
+        """An identifier to MonitoringInfo.payload mapping.
+
+        An SDK can report metrics using an identifier that only contains the
+        associated payload. A runner who wants to receive the full metrics
+        information can request all the monitoring metadata via a
+        MonitoringInfosMetadataRequest providing a list of ids as necessary.
+
+        The SDK is allowed to reuse the identifiers
+        for the lifetime of the associated control connection as long
+        as the MonitoringInfo could be reconstructed fully by overwriting its
+        payload field with the bytes specified here.
+        """
+
+    def __init__(
+        self,
+        *,
+        monitoring_infos: _abc.Iterable[_metrics_pb2.MonitoringInfo] | None = ...,
+        monitoring_data: _abc.Mapping[_builtins.str, _builtins.bytes] | None = ...,
+        consuming_received_data: _builtins.bool | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["_consuming_received_data", b"_consuming_received_data", "consuming_received_data", b"consuming_received_data"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["_consuming_received_data", b"_consuming_received_data", "consuming_received_data", b"consuming_received_data", "monitoring_data", b"monitoring_data", "monitoring_infos", b"monitoring_infos"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType__consuming_received_data: _TypeAlias = _typing.Literal["consuming_received_data"]  # noqa: Y015
+    _WhichOneofArgType__consuming_received_data: _TypeAlias = _typing.Literal["_consuming_received_data", b"_consuming_received_data"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__consuming_received_data) -> _WhichOneofReturnType__consuming_received_data | None: ...
+
+Global___ProcessBundleProgressResponse: _TypeAlias = ProcessBundleProgressResponse  # noqa: Y015
+
+@_typing.final
+class MonitoringInfosMetadataResponse(_message.Message):
+    """A response that contains the full mapping information associated with
+    a specified set of identifiers.
+
+    An SDK can report metrics using an identifier that only contains the
+    associated payload. A runner who wants to receive the full metrics
+    information can request all the monitoring metadata via a
+    MonitoringInfosMetadataRequest providing a list of ids as necessary.
+
+    The SDK is allowed to reuse the identifiers
+    for the lifetime of the associated control connection as long
+    as the MonitoringInfo could be reconstructed fully by overwriting its
+    payload field with the bytes specified here.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class MonitoringInfoEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        @_builtins.property
+        def value(self) -> _metrics_pb2.MonitoringInfo: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: _metrics_pb2.MonitoringInfo | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    MONITORING_INFO_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def monitoring_info(self) -> _containers.MessageMap[_builtins.str, _metrics_pb2.MonitoringInfo]:
+        """A mapping from an identifier to the full metrics information."""
+
+    def __init__(
+        self,
+        *,
+        monitoring_info: _abc.Mapping[_builtins.str, _metrics_pb2.MonitoringInfo] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["monitoring_info", b"monitoring_info"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MonitoringInfosMetadataResponse: _TypeAlias = MonitoringInfosMetadataResponse  # noqa: Y015
+
+@_typing.final
+class ProcessBundleSplitRequest(_message.Message):
+    """Represents a request to the SDK to split a currently active bundle."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class DesiredSplit(_message.Message):
+        """A message specifying the desired split for a single transform."""
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        FRACTION_OF_REMAINDER_FIELD_NUMBER: _builtins.int
+        ALLOWED_SPLIT_POINTS_FIELD_NUMBER: _builtins.int
+        ESTIMATED_INPUT_ELEMENTS_FIELD_NUMBER: _builtins.int
+        fraction_of_remainder: _builtins.float
+        """(Required) The fraction of known work remaining in this bundle
+        for this transform that should be kept by the SDK after this split.
+
+        Set to 0 to "checkpoint" as soon as possible (keeping as little work as
+        possible and returning the remainder).
+        """
+        estimated_input_elements: _builtins.int
+        """(Required for gRPC Read operation transforms) Number of total elements
+        expected to be sent to this GrpcRead operation, required to correctly
+        account for unreceived data when determining where to split.
+        """
+        @_builtins.property
+        def allowed_split_points(self) -> _containers.RepeatedScalarFieldContainer[_builtins.int]:
+            """(Optional) A set of allowed element indices where the SDK may split. When
+            this is empty, there are no constraints on where to split.
+            """
+
+        def __init__(
+            self,
+            *,
+            fraction_of_remainder: _builtins.float | None = ...,
+            allowed_split_points: _abc.Iterable[_builtins.int] | None = ...,
+            estimated_input_elements: _builtins.int | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["allowed_split_points", b"allowed_split_points", "estimated_input_elements", b"estimated_input_elements", "fraction_of_remainder", b"fraction_of_remainder"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class DesiredSplitsEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        @_builtins.property
+        def value(self) -> Global___ProcessBundleSplitRequest.DesiredSplit: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: Global___ProcessBundleSplitRequest.DesiredSplit | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    INSTRUCTION_ID_FIELD_NUMBER: _builtins.int
+    DESIRED_SPLITS_FIELD_NUMBER: _builtins.int
+    instruction_id: _builtins.str
+    """(Required) A reference to an active process bundle request with the given
+    instruction id.
+    """
+    @_builtins.property
+    def desired_splits(self) -> _containers.MessageMap[_builtins.str, Global___ProcessBundleSplitRequest.DesiredSplit]:
+        """(Required) Specifies the desired split for each transform.
+
+        Currently only splits at gRPC read operations are supported.
+        This may, of course, limit the amount of work downstream operations
+        receive.
+        """
+
+    def __init__(
+        self,
+        *,
+        instruction_id: _builtins.str | None = ...,
+        desired_splits: _abc.Mapping[_builtins.str, Global___ProcessBundleSplitRequest.DesiredSplit] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["desired_splits", b"desired_splits", "instruction_id", b"instruction_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ProcessBundleSplitRequest: _TypeAlias = ProcessBundleSplitRequest  # noqa: Y015
+
+@_typing.final
+class ProcessBundleSplitResponse(_message.Message):
+    """Represents a partition of the bundle: a "primary" and a "residual", with the
+    following properties:
+    - The work in primary and residual doesn't overlap, and combined, adds up
+      to the work in the current bundle if the split hadn't happened.
+    - The current bundle, if it keeps executing, will have done exactly none of
+      the work under residual_roots and none of the elements at and beyond the
+      first_residual_element.
+    - The current bundle, if no further splits happen, will have done exactly
+      the work under primary_roots and all elements up to and including the
+      channel split's last_primary_element.
+
+    This allows the SDK to relinquish ownership of and commit to not process some
+    of the elements that it may have been sent (the residual) while retaining
+    ownership and commitment to finish the other portion (the primary).
+
+    Example with three splits of a single bundle:
+    Let's say the SDK is processing elements [A B C D E]. These elements make
+    up the 0-indexed channel.
+
+    ** First Split **
+    Channel Split = [ A B C D <> E ]
+    Primary Roots = [] (No elements were split)
+    Residual Roots = []
+
+    Say a split request comes in. The SDK could return a response with a channel
+    split representing a last_primary_element of 3 (D) and
+    first_residual_element of 4 (E). The SDK is now responsible for processing A
+    B C D and the runner must process E in the future.
+
+    (A B C D) | (E)
+
+    ** Second Split **
+    Channel Split = [ A < B C > D E ]
+    Primary Roots = [B1 C1]
+    Residual Roots = [B2 C2]
+
+    A future split request could have the SDK split the elements B into B1 and
+    B2 and C into C1 and C2 representing their primary and residual roots. The
+
+    (A B1 C1) | (B2 C2 D)
+
+    SDK would return a response with a channel split representing a
+    last_primary_element of 0 (A) and first_residual_element of 3 (D) with
+    primary_roots (B1, C1) and residual_roots (B2, C2). The SDK is now
+    responsible for processing A B1 C1 and the runner must process B2 C2 D (and
+    E from the prior split) in the future.
+
+    ** Third Split **
+    Channel Split = [ A < B C > D E ]
+    Primary Roots = [B1a]
+    Residual Roots [B1b C1]
+    Yet another future split request could have the SDK could split B1 further
+    into B1a and B1b primary and residuals and return C1 as a residual (assuming
+    C1 was left unprocessed). The SDK would return a response with a channel
+    split representing a last_primary_element of 0 (A) and
+    first_residual_element of 3 (E) with primary_roots (B1a) and residual_roots
+    (B1b, C1). The SDK is now responsible for processing A B1a the runner must
+    process B1b C1 (in addition to C2, D, E from prior splits) in the future.
+
+    (A B1a) | (B1b C1)
+
+    For more rigorous definitions see https://s.apache.org/beam-breaking-fusion
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class ChannelSplit(_message.Message):
+        """Represents contiguous portions of the data channel that are either
+        entirely processed or entirely unprocessed and belong to the primary
+        or residual respectively.
+
+        This affords both a more efficient representation over the FnAPI
+        (if the bundle is large) and often a more efficient representation
+        on the runner side (e.g. if the set of elements can be represented
+        as some range in an underlying dataset).
+
+        Note that for a split the following properties must hold:
+        - last_primary_element < first_residual_element
+        - primary roots and residual roots can only be specified if the
+          last_primary_element + 1 < first_residual_element
+          (typically there is one primary and residual root per element in the
+          range (last_primary_element, first_residual_element))
+        - primary roots and residual roots must represent a disjoint but full
+          coverage of work represented by the elements between last_primary_element
+          and first_residual_element
+
+        Note that subsequent splits of the same bundle must ensure that:
+        - the first_residual_element does not increase
+        - the first_residual_element does not decrease if there were residual
+          or primary roots returned in a prior split.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+        LAST_PRIMARY_ELEMENT_FIELD_NUMBER: _builtins.int
+        FIRST_RESIDUAL_ELEMENT_FIELD_NUMBER: _builtins.int
+        transform_id: _builtins.str
+        """(Required) The grpc read transform reading this channel."""
+        last_primary_element: _builtins.int
+        """(Required) The last element of the input channel that should be entirely
+        considered part of the primary, identified by its absolute zero-based
+        index in the (ordered) channel.
+        """
+        first_residual_element: _builtins.int
+        """(Required) The first element of the input channel that should be entirely
+        considered part of the residual, identified by its absolute zero-based
+        index in the (ordered) channel.
+        """
+        def __init__(
+            self,
+            *,
+            transform_id: _builtins.str | None = ...,
+            last_primary_element: _builtins.int | None = ...,
+            first_residual_element: _builtins.int | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["first_residual_element", b"first_residual_element", "last_primary_element", b"last_primary_element", "transform_id", b"transform_id"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    PRIMARY_ROOTS_FIELD_NUMBER: _builtins.int
+    RESIDUAL_ROOTS_FIELD_NUMBER: _builtins.int
+    CHANNEL_SPLITS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def primary_roots(self) -> _containers.RepeatedCompositeFieldContainer[Global___BundleApplication]:
+        """(Optional) Root applications that should replace the current bundle.
+
+        Note that primary roots can only be specified if a channel split's
+        last_primary_element + 1 < first_residual_element
+
+        Note that there must be a corresponding residual root contained within
+        residual_roots representing the remainder of processing for the original
+        element this this primary root represents a fraction of.
+        """
+
+    @_builtins.property
+    def residual_roots(self) -> _containers.RepeatedCompositeFieldContainer[Global___DelayedBundleApplication]:
+        """(Optional) Root applications that have been removed from the current bundle and
+        have to be executed in a separate bundle (e.g. in parallel on a different
+        worker, or after the current bundle completes, etc.)
+
+        Note that residual roots can only be specified if a channel split's
+        last_primary_element + 1 < first_residual_element
+
+        Note that there must be a corresponding primary root contained within
+        primary_roots representing the remainder of processing for the original
+        element this this residual root represents a fraction of.
+
+        Note that subsequent splits must not return prior residual roots.
+        """
+
+    @_builtins.property
+    def channel_splits(self) -> _containers.RepeatedCompositeFieldContainer[Global___ProcessBundleSplitResponse.ChannelSplit]:
+        """(Required) Partitions of input data channels into primary and residual
+        elements, if any. Must not include any elements represented in the bundle
+        applications roots above of the current split or any prior split of the
+        same bundle.
+        """
+
+    def __init__(
+        self,
+        *,
+        primary_roots: _abc.Iterable[Global___BundleApplication] | None = ...,
+        residual_roots: _abc.Iterable[Global___DelayedBundleApplication] | None = ...,
+        channel_splits: _abc.Iterable[Global___ProcessBundleSplitResponse.ChannelSplit] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["channel_splits", b"channel_splits", "primary_roots", b"primary_roots", "residual_roots", b"residual_roots"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ProcessBundleSplitResponse: _TypeAlias = ProcessBundleSplitResponse  # noqa: Y015
+
+@_typing.final
+class FinalizeBundleRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    INSTRUCTION_ID_FIELD_NUMBER: _builtins.int
+    instruction_id: _builtins.str
+    """(Required) A reference to a completed process bundle request with the given
+    instruction id.
+    """
+    def __init__(
+        self,
+        *,
+        instruction_id: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["instruction_id", b"instruction_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___FinalizeBundleRequest: _TypeAlias = FinalizeBundleRequest  # noqa: Y015
+
+@_typing.final
+class FinalizeBundleResponse(_message.Message):
+    """Empty"""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___FinalizeBundleResponse: _TypeAlias = FinalizeBundleResponse  # noqa: Y015
+
+@_typing.final
+class Elements(_message.Message):
+    """
+    Data Plane API
+
+    Messages used to represent logical byte streams.
+    Stable
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class Data(_message.Message):
+        """Represents multiple encoded elements in nested context for a given named
+        instruction and transform.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        INSTRUCTION_ID_FIELD_NUMBER: _builtins.int
+        TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+        DATA_FIELD_NUMBER: _builtins.int
+        IS_LAST_FIELD_NUMBER: _builtins.int
+        instruction_id: _builtins.str
+        """(Required) A reference to an active instruction request with the given
+        instruction id.
+        """
+        transform_id: _builtins.str
+        """(Required) A definition representing a consumer or producer of this data.
+        If received by a harness, this represents the consumer within that
+        harness that should consume these bytes. If sent by a harness, this
+        represents the producer of these bytes.
+
+        Note that a single element may span multiple Data messages.
+
+        Note that a sending/receiving pair should share the same identifier.
+        """
+        data: _builtins.bytes
+        """(Optional) Represents a part of a logical byte stream. Elements within
+        the logical byte stream are encoded in the nested context and
+        concatenated together.
+        """
+        is_last: _builtins.bool
+        """(Optional) Set this bit to indicate the this is the last data block
+        for the given instruction and transform, ending the stream.
+        """
+        def __init__(
+            self,
+            *,
+            instruction_id: _builtins.str | None = ...,
+            transform_id: _builtins.str | None = ...,
+            data: _builtins.bytes | None = ...,
+            is_last: _builtins.bool | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["data", b"data", "instruction_id", b"instruction_id", "is_last", b"is_last", "transform_id", b"transform_id"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class DrainMode(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        class _Enum:
+            ValueType = _typing.NewType("ValueType", _builtins.int)
+            V: _TypeAlias = ValueType  # noqa: Y015
+
+        class _EnumEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[Elements.DrainMode._Enum.ValueType], _builtins.type):
+            DESCRIPTOR: _descriptor.EnumDescriptor
+            UNSPECIFIED: Elements.DrainMode._Enum.ValueType  # 0
+            NOT_DRAINING: Elements.DrainMode._Enum.ValueType  # 1
+            DRAINING: Elements.DrainMode._Enum.ValueType  # 2
+
+        class Enum(_Enum, metaclass=_EnumEnumTypeWrapper): ...
+        UNSPECIFIED: Elements.DrainMode.Enum.ValueType  # 0
+        NOT_DRAINING: Elements.DrainMode.Enum.ValueType  # 1
+        DRAINING: Elements.DrainMode.Enum.ValueType  # 2
+
+        def __init__(
+            self,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class ElementMetadata(_message.Message):
+        """Element metadata passed as part of WindowedValue to make WindowedValue
+        extensible and backward compatible
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        DRAIN_FIELD_NUMBER: _builtins.int
+        TRACEPARENT_FIELD_NUMBER: _builtins.int
+        TRACESTATE_FIELD_NUMBER: _builtins.int
+        drain: Global___Elements.DrainMode.Enum.ValueType
+        traceparent: _builtins.str
+        """(Optional) As part of https://www.w3.org/TR/trace-context/ we are forwarding a trace and participating in it.
+        Traceparent header represents the incoming request in a tracing system in a common format.
+        Example value: 00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01
+        """
+        tracestate: _builtins.str
+        """(Optional) tracestate extends traceparent with open telemetry data represented by a set of name/value pairs.
+        Format specified https://www.w3.org/TR/trace-context/#list for interoperability and commonly used
+        across IOs - Kafka, PubSub, http.
+        Example value: congo=t61rcWkgMzE
+        """
+        def __init__(
+            self,
+            *,
+            drain: Global___Elements.DrainMode.Enum.ValueType | None = ...,
+            traceparent: _builtins.str | None = ...,
+            tracestate: _builtins.str | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["_drain", b"_drain", "_traceparent", b"_traceparent", "_tracestate", b"_tracestate", "drain", b"drain", "traceparent", b"traceparent", "tracestate", b"tracestate"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["_drain", b"_drain", "_traceparent", b"_traceparent", "_tracestate", b"_tracestate", "drain", b"drain", "traceparent", b"traceparent", "tracestate", b"tracestate"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        _WhichOneofReturnType__drain: _TypeAlias = _typing.Literal["drain"]  # noqa: Y015
+        _WhichOneofArgType__drain: _TypeAlias = _typing.Literal["_drain", b"_drain"]  # noqa: Y015
+        _WhichOneofReturnType__traceparent: _TypeAlias = _typing.Literal["traceparent"]  # noqa: Y015
+        _WhichOneofArgType__traceparent: _TypeAlias = _typing.Literal["_traceparent", b"_traceparent"]  # noqa: Y015
+        _WhichOneofReturnType__tracestate: _TypeAlias = _typing.Literal["tracestate"]  # noqa: Y015
+        _WhichOneofArgType__tracestate: _TypeAlias = _typing.Literal["_tracestate", b"_tracestate"]  # noqa: Y015
+        @_typing.overload
+        def WhichOneof(self, oneof_group: _WhichOneofArgType__drain) -> _WhichOneofReturnType__drain | None: ...
+        @_typing.overload
+        def WhichOneof(self, oneof_group: _WhichOneofArgType__traceparent) -> _WhichOneofReturnType__traceparent | None: ...
+        @_typing.overload
+        def WhichOneof(self, oneof_group: _WhichOneofArgType__tracestate) -> _WhichOneofReturnType__tracestate | None: ...
+
+    @_typing.final
+    class Timers(_message.Message):
+        """Represent the encoded user timer for a given instruction, transform and
+        timer id.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        INSTRUCTION_ID_FIELD_NUMBER: _builtins.int
+        TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+        TIMER_FAMILY_ID_FIELD_NUMBER: _builtins.int
+        TIMERS_FIELD_NUMBER: _builtins.int
+        IS_LAST_FIELD_NUMBER: _builtins.int
+        instruction_id: _builtins.str
+        """(Required) A reference to an active instruction request with the given
+        instruction id.
+        """
+        transform_id: _builtins.str
+        """(Required) A definition representing a consumer or producer of this data.
+        If received by a harness, this represents the consumer within that
+        harness that should consume these timers. If sent by a harness, this
+        represents the producer of these timers.
+        """
+        timer_family_id: _builtins.str
+        """(Required) The local timer family name used to identify the associated
+        timer family specification
+        """
+        timers: _builtins.bytes
+        """(Optional) Represents a logical byte stream of timers. Encoded according
+        to the coder in the timer spec.
+        """
+        is_last: _builtins.bool
+        """(Optional) Set this bit to indicate the this is the last data block
+        for the given instruction and transform, ending the stream.
+        """
+        def __init__(
+            self,
+            *,
+            instruction_id: _builtins.str | None = ...,
+            transform_id: _builtins.str | None = ...,
+            timer_family_id: _builtins.str | None = ...,
+            timers: _builtins.bytes | None = ...,
+            is_last: _builtins.bool | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["instruction_id", b"instruction_id", "is_last", b"is_last", "timer_family_id", b"timer_family_id", "timers", b"timers", "transform_id", b"transform_id"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    DATA_FIELD_NUMBER: _builtins.int
+    TIMERS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def data(self) -> _containers.RepeatedCompositeFieldContainer[Global___Elements.Data]:
+        """(Optional) A list containing parts of logical byte streams."""
+
+    @_builtins.property
+    def timers(self) -> _containers.RepeatedCompositeFieldContainer[Global___Elements.Timers]:
+        """(Optional)  A list of timer byte streams."""
+
+    def __init__(
+        self,
+        *,
+        data: _abc.Iterable[Global___Elements.Data] | None = ...,
+        timers: _abc.Iterable[Global___Elements.Timers] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["data", b"data", "timers", b"timers"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Elements: _TypeAlias = Elements  # noqa: Y015
+
+@_typing.final
+class StateRequest(_message.Message):
+    """
+    State API
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    INSTRUCTION_ID_FIELD_NUMBER: _builtins.int
+    STATE_KEY_FIELD_NUMBER: _builtins.int
+    GET_FIELD_NUMBER: _builtins.int
+    APPEND_FIELD_NUMBER: _builtins.int
+    CLEAR_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    """(Required) A unique identifier provided by the SDK which represents this
+    requests execution. The StateResponse corresponding with this request
+    will have the matching id.
+    """
+    instruction_id: _builtins.str
+    """(Required) The associated instruction id of the work that is currently
+    being processed. This allows for the runner to associate any modifications
+    to state to be committed with the appropriate work execution.
+    """
+    @_builtins.property
+    def state_key(self) -> Global___StateKey:
+        """(Required) The state key this request is for."""
+
+    @_builtins.property
+    def get(self) -> Global___StateGetRequest:
+        """A request to get state."""
+
+    @_builtins.property
+    def append(self) -> Global___StateAppendRequest:
+        """A request to append to state."""
+
+    @_builtins.property
+    def clear(self) -> Global___StateClearRequest:
+        """A request to clear state."""
+
+    def __init__(
+        self,
+        *,
+        id: _builtins.str | None = ...,
+        instruction_id: _builtins.str | None = ...,
+        state_key: Global___StateKey | None = ...,
+        get: Global___StateGetRequest | None = ...,
+        append: Global___StateAppendRequest | None = ...,
+        clear: Global___StateClearRequest | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["append", b"append", "clear", b"clear", "get", b"get", "request", b"request", "state_key", b"state_key"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["append", b"append", "clear", b"clear", "get", b"get", "id", b"id", "instruction_id", b"instruction_id", "request", b"request", "state_key", b"state_key"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_request: _TypeAlias = _typing.Literal["get", "append", "clear"]  # noqa: Y015
+    _WhichOneofArgType_request: _TypeAlias = _typing.Literal["request", b"request"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_request) -> _WhichOneofReturnType_request | None: ...
+
+Global___StateRequest: _TypeAlias = StateRequest  # noqa: Y015
+
+@_typing.final
+class StateResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    ERROR_FIELD_NUMBER: _builtins.int
+    GET_FIELD_NUMBER: _builtins.int
+    APPEND_FIELD_NUMBER: _builtins.int
+    CLEAR_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    """(Required) A reference provided by the SDK which represents a requests
+    execution. The StateResponse must have the matching id when responding
+    to the SDK.
+    """
+    error: _builtins.str
+    """(Optional) If this is specified, then the state request has failed.
+    A human readable string representing the reason as to why the request
+    failed.
+    """
+    @_builtins.property
+    def get(self) -> Global___StateGetResponse:
+        """A response to getting state."""
+
+    @_builtins.property
+    def append(self) -> Global___StateAppendResponse:
+        """A response to appending to state."""
+
+    @_builtins.property
+    def clear(self) -> Global___StateClearResponse:
+        """A response to clearing state."""
+
+    def __init__(
+        self,
+        *,
+        id: _builtins.str | None = ...,
+        error: _builtins.str | None = ...,
+        get: Global___StateGetResponse | None = ...,
+        append: Global___StateAppendResponse | None = ...,
+        clear: Global___StateClearResponse | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["append", b"append", "clear", b"clear", "get", b"get", "response", b"response"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["append", b"append", "clear", b"clear", "error", b"error", "get", b"get", "id", b"id", "response", b"response"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_response: _TypeAlias = _typing.Literal["get", "append", "clear"]  # noqa: Y015
+    _WhichOneofArgType_response: _TypeAlias = _typing.Literal["response", b"response"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_response) -> _WhichOneofReturnType_response | None: ...
+
+Global___StateResponse: _TypeAlias = StateResponse  # noqa: Y015
+
+@_typing.final
+class StateKey(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class Runner(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        key: _builtins.bytes
+        """(Required) Opaque information supplied by the runner. Used to support
+        remote references.
+        https://s.apache.org/beam-fn-api-send-and-receive-data
+
+        Used by state backed iterable. And in this use case, request type can
+        only be of type get. Details see:
+        https://s.apache.org/beam-fn-api-state-backed-iterables
+        """
+        def __init__(
+            self,
+            *,
+            key: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class IterableSideInput(_message.Message):
+        """Represents a request for the values associated with a specified window
+        in a PCollection. See
+        https://s.apache.org/beam-fn-state-api-and-bundle-processing for further
+        details.
+
+        Can only be used to perform StateGetRequests on side inputs of the URN
+        beam:side_input:iterable:v1.
+
+        For a PCollection<V>, the response data stream will be a concatenation
+        of all V's. See https://s.apache.org/beam-fn-api-send-and-receive-data
+        for further details.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+        SIDE_INPUT_ID_FIELD_NUMBER: _builtins.int
+        WINDOW_FIELD_NUMBER: _builtins.int
+        transform_id: _builtins.str
+        """(Required) The id of the PTransform containing a side input."""
+        side_input_id: _builtins.str
+        """(Required) The id of the side input."""
+        window: _builtins.bytes
+        """(Required) The window (after mapping the currently executing elements
+        window into the side input windows domain) encoded in a nested context.
+        """
+        def __init__(
+            self,
+            *,
+            transform_id: _builtins.str | None = ...,
+            side_input_id: _builtins.str | None = ...,
+            window: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["side_input_id", b"side_input_id", "transform_id", b"transform_id", "window", b"window"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class MultimapSideInput(_message.Message):
+        """Represents a request for the values associated with a specified user key
+        and window in a PCollection. See
+        https://s.apache.org/beam-fn-state-api-and-bundle-processing for further
+        details.
+
+        Can only be used to perform StateGetRequests on side inputs of the URN
+        beam:side_input:multimap:v1.
+
+        For a PCollection<KV<K, V>>, the response data stream will be a
+        concatenation of all V's associated with the specified key K. See
+        https://s.apache.org/beam-fn-api-send-and-receive-data for further
+        details.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+        SIDE_INPUT_ID_FIELD_NUMBER: _builtins.int
+        WINDOW_FIELD_NUMBER: _builtins.int
+        KEY_FIELD_NUMBER: _builtins.int
+        transform_id: _builtins.str
+        """(Required) The id of the PTransform containing a side input."""
+        side_input_id: _builtins.str
+        """(Required) The id of the side input."""
+        window: _builtins.bytes
+        """(Required) The window (after mapping the currently executing elements
+        window into the side input windows domain) encoded in a nested context.
+        """
+        key: _builtins.bytes
+        """(Required) The key encoded in a nested context."""
+        def __init__(
+            self,
+            *,
+            transform_id: _builtins.str | None = ...,
+            side_input_id: _builtins.str | None = ...,
+            window: _builtins.bytes | None = ...,
+            key: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "side_input_id", b"side_input_id", "transform_id", b"transform_id", "window", b"window"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class MultimapKeysSideInput(_message.Message):
+        """Represents a request for the keys associated with a specified window in a PCollection. See
+        https://s.apache.org/beam-fn-state-api-and-bundle-processing for further
+        details.
+
+        Can only be used to perform StateGetRequests on side inputs of the URN
+        beam:side_input:multimap:v1.
+
+        For a PCollection<KV<K, V>>, the response data stream will be a
+        concatenation of all K's associated with the specified window. See
+        https://s.apache.org/beam-fn-api-send-and-receive-data for further
+        details.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+        SIDE_INPUT_ID_FIELD_NUMBER: _builtins.int
+        WINDOW_FIELD_NUMBER: _builtins.int
+        transform_id: _builtins.str
+        """(Required) The id of the PTransform containing a side input."""
+        side_input_id: _builtins.str
+        """(Required) The id of the side input."""
+        window: _builtins.bytes
+        """(Required) The window (after mapping the currently executing elements
+        window into the side input windows domain) encoded in a nested context.
+        """
+        def __init__(
+            self,
+            *,
+            transform_id: _builtins.str | None = ...,
+            side_input_id: _builtins.str | None = ...,
+            window: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["side_input_id", b"side_input_id", "transform_id", b"transform_id", "window", b"window"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class MultimapKeysValuesSideInput(_message.Message):
+        """Represents a request for the keys and values associated with a specified window in a PCollection. See
+        https://s.apache.org/beam-fn-state-api-and-bundle-processing for further
+        details.
+
+        This is expected to be more efficient than iterating over they keys and
+        looking up the values one at a time.  If a runner chooses not to implement
+        this protocol, or a key has too many values to fit into a single response,
+        the runner is free to fail the request and a fallback to point lookups
+        will be performed by the SDK.
+
+        Can only be used to perform StateGetRequests on side inputs of the URN
+        beam:side_input:multimap:v1.
+
+        For a PCollection<KV<K, V>>, the response data stream will be a
+        concatenation of all KVs associated with the specified window,
+        encoded with the the KV<K, Iterable<V>> coder.
+        See
+        https://s.apache.org/beam-fn-api-send-and-receive-data for further
+        details.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+        SIDE_INPUT_ID_FIELD_NUMBER: _builtins.int
+        WINDOW_FIELD_NUMBER: _builtins.int
+        transform_id: _builtins.str
+        """(Required) The id of the PTransform containing a side input."""
+        side_input_id: _builtins.str
+        """(Required) The id of the side input."""
+        window: _builtins.bytes
+        """(Required) The window (after mapping the currently executing elements
+        window into the side input windows domain) encoded in a nested context.
+        """
+        def __init__(
+            self,
+            *,
+            transform_id: _builtins.str | None = ...,
+            side_input_id: _builtins.str | None = ...,
+            window: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["side_input_id", b"side_input_id", "transform_id", b"transform_id", "window", b"window"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class BagUserState(_message.Message):
+        """Represents a request for an unordered set of values associated with a
+        specified user key and window for a PTransform. See
+        https://s.apache.org/beam-fn-state-api-and-bundle-processing for further
+        details.
+
+        The response data stream will be a concatenation of all V's associated
+        with the specified user key and window.
+        See https://s.apache.org/beam-fn-api-send-and-receive-data for further
+        details.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+        USER_STATE_ID_FIELD_NUMBER: _builtins.int
+        WINDOW_FIELD_NUMBER: _builtins.int
+        KEY_FIELD_NUMBER: _builtins.int
+        transform_id: _builtins.str
+        """(Required) The id of the PTransform containing user state."""
+        user_state_id: _builtins.str
+        """(Required) The id of the user state."""
+        window: _builtins.bytes
+        """(Required) The window encoded in a nested context."""
+        key: _builtins.bytes
+        """(Required) The key of the currently executing element encoded in a
+        nested context.
+        """
+        def __init__(
+            self,
+            *,
+            transform_id: _builtins.str | None = ...,
+            user_state_id: _builtins.str | None = ...,
+            window: _builtins.bytes | None = ...,
+            key: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "transform_id", b"transform_id", "user_state_id", b"user_state_id", "window", b"window"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class MultimapKeysUserState(_message.Message):
+        """Represents a request for the keys of a multimap associated with a specified
+        user key and window for a PTransform. See
+        https://s.apache.org/beam-fn-state-api-and-bundle-processing for further
+        details.
+
+        Can only be used to perform StateGetRequests and StateClearRequests on the
+        user state.
+
+        The response data stream will be a concatenation of all K's associated
+        with the specified user key and window.
+        See https://s.apache.org/beam-fn-api-send-and-receive-data for further
+        details.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+        USER_STATE_ID_FIELD_NUMBER: _builtins.int
+        WINDOW_FIELD_NUMBER: _builtins.int
+        KEY_FIELD_NUMBER: _builtins.int
+        transform_id: _builtins.str
+        """(Required) The id of the PTransform containing user state."""
+        user_state_id: _builtins.str
+        """(Required) The id of the user state."""
+        window: _builtins.bytes
+        """(Required) The window encoded in a nested context."""
+        key: _builtins.bytes
+        """(Required) The key of the currently executing element encoded in a
+        nested context.
+        """
+        def __init__(
+            self,
+            *,
+            transform_id: _builtins.str | None = ...,
+            user_state_id: _builtins.str | None = ...,
+            window: _builtins.bytes | None = ...,
+            key: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "transform_id", b"transform_id", "user_state_id", b"user_state_id", "window", b"window"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class MultimapEntriesUserState(_message.Message):
+        """Represents a request for all of the entries of a multimap associated with a
+        specified user key and window for a PTransform. See
+        https://s.apache.org/beam-fn-state-api-and-bundle-processing for further
+        details.
+
+        Can only be used to perform StateGetRequests and StateClearRequests on the
+        user state.
+
+        The response data stream will be a concatenation of pairs, where the first
+        component is the map key and the second component is a concatenation of
+        values associated with that map key.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+        USER_STATE_ID_FIELD_NUMBER: _builtins.int
+        WINDOW_FIELD_NUMBER: _builtins.int
+        KEY_FIELD_NUMBER: _builtins.int
+        transform_id: _builtins.str
+        """(Required) The id of the PTransform containing user state."""
+        user_state_id: _builtins.str
+        """(Required) The id of the user state."""
+        window: _builtins.bytes
+        """(Required) The window encoded in a nested context."""
+        key: _builtins.bytes
+        """(Required) The key of the currently executing element encoded in a
+        nested context.
+        """
+        def __init__(
+            self,
+            *,
+            transform_id: _builtins.str | None = ...,
+            user_state_id: _builtins.str | None = ...,
+            window: _builtins.bytes | None = ...,
+            key: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "transform_id", b"transform_id", "user_state_id", b"user_state_id", "window", b"window"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class MultimapUserState(_message.Message):
+        """Represents a request for the values of the map key associated with a
+        specified user key and window for a PTransform. See
+        https://s.apache.org/beam-fn-state-api-and-bundle-processing for further
+        details.
+
+        The response data stream will be a concatenation of all V's associated
+        with the specified map key, user key, and window.
+        See https://s.apache.org/beam-fn-api-send-and-receive-data for further
+        details.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+        USER_STATE_ID_FIELD_NUMBER: _builtins.int
+        WINDOW_FIELD_NUMBER: _builtins.int
+        KEY_FIELD_NUMBER: _builtins.int
+        MAP_KEY_FIELD_NUMBER: _builtins.int
+        transform_id: _builtins.str
+        """(Required) The id of the PTransform containing user state."""
+        user_state_id: _builtins.str
+        """(Required) The id of the user state."""
+        window: _builtins.bytes
+        """(Required) The window encoded in a nested context."""
+        key: _builtins.bytes
+        """(Required) The key of the currently executing element encoded in a
+        nested context.
+        """
+        map_key: _builtins.bytes
+        """(Required) The map key encoded in a nested context."""
+        def __init__(
+            self,
+            *,
+            transform_id: _builtins.str | None = ...,
+            user_state_id: _builtins.str | None = ...,
+            window: _builtins.bytes | None = ...,
+            key: _builtins.bytes | None = ...,
+            map_key: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "map_key", b"map_key", "transform_id", b"transform_id", "user_state_id", b"user_state_id", "window", b"window"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class OrderedListUserState(_message.Message):
+        """Represents a request for an ordered list of values associated with a
+        specified user key and window for a PTransform. See
+        https://s.apache.org/beam-fn-state-api-and-bundle-processing for further
+        details.
+
+        The response data stream will be a concatenation of all entries of sort key
+        and V's associated with the specified user key and window.
+        See https://s.apache.org/beam-fn-api-send-and-receive-data for further
+        details.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+        USER_STATE_ID_FIELD_NUMBER: _builtins.int
+        WINDOW_FIELD_NUMBER: _builtins.int
+        KEY_FIELD_NUMBER: _builtins.int
+        RANGE_FIELD_NUMBER: _builtins.int
+        transform_id: _builtins.str
+        """(Required) The id of the PTransform containing user state."""
+        user_state_id: _builtins.str
+        """(Required) The id of the user state."""
+        window: _builtins.bytes
+        """(Required) The window encoded in a nested context."""
+        key: _builtins.bytes
+        """(Required) The key of the currently executing element encoded in a
+        nested context.
+        """
+        @_builtins.property
+        def range(self) -> Global___OrderedListRange:
+            """(Required) The sort range encoded in a nested context."""
+
+        def __init__(
+            self,
+            *,
+            transform_id: _builtins.str | None = ...,
+            user_state_id: _builtins.str | None = ...,
+            window: _builtins.bytes | None = ...,
+            key: _builtins.bytes | None = ...,
+            range: Global___OrderedListRange | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["range", b"range"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "range", b"range", "transform_id", b"transform_id", "user_state_id", b"user_state_id", "window", b"window"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    RUNNER_FIELD_NUMBER: _builtins.int
+    MULTIMAP_SIDE_INPUT_FIELD_NUMBER: _builtins.int
+    BAG_USER_STATE_FIELD_NUMBER: _builtins.int
+    ITERABLE_SIDE_INPUT_FIELD_NUMBER: _builtins.int
+    MULTIMAP_KEYS_SIDE_INPUT_FIELD_NUMBER: _builtins.int
+    MULTIMAP_KEYS_VALUES_SIDE_INPUT_FIELD_NUMBER: _builtins.int
+    MULTIMAP_KEYS_USER_STATE_FIELD_NUMBER: _builtins.int
+    MULTIMAP_ENTRIES_USER_STATE_FIELD_NUMBER: _builtins.int
+    MULTIMAP_USER_STATE_FIELD_NUMBER: _builtins.int
+    ORDERED_LIST_USER_STATE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def runner(self) -> Global___StateKey.Runner: ...
+    @_builtins.property
+    def multimap_side_input(self) -> Global___StateKey.MultimapSideInput: ...
+    @_builtins.property
+    def bag_user_state(self) -> Global___StateKey.BagUserState: ...
+    @_builtins.property
+    def iterable_side_input(self) -> Global___StateKey.IterableSideInput: ...
+    @_builtins.property
+    def multimap_keys_side_input(self) -> Global___StateKey.MultimapKeysSideInput: ...
+    @_builtins.property
+    def multimap_keys_values_side_input(self) -> Global___StateKey.MultimapKeysValuesSideInput: ...
+    @_builtins.property
+    def multimap_keys_user_state(self) -> Global___StateKey.MultimapKeysUserState: ...
+    @_builtins.property
+    def multimap_entries_user_state(self) -> Global___StateKey.MultimapEntriesUserState: ...
+    @_builtins.property
+    def multimap_user_state(self) -> Global___StateKey.MultimapUserState: ...
+    @_builtins.property
+    def ordered_list_user_state(self) -> Global___StateKey.OrderedListUserState: ...
+    def __init__(
+        self,
+        *,
+        runner: Global___StateKey.Runner | None = ...,
+        multimap_side_input: Global___StateKey.MultimapSideInput | None = ...,
+        bag_user_state: Global___StateKey.BagUserState | None = ...,
+        iterable_side_input: Global___StateKey.IterableSideInput | None = ...,
+        multimap_keys_side_input: Global___StateKey.MultimapKeysSideInput | None = ...,
+        multimap_keys_values_side_input: Global___StateKey.MultimapKeysValuesSideInput | None = ...,
+        multimap_keys_user_state: Global___StateKey.MultimapKeysUserState | None = ...,
+        multimap_entries_user_state: Global___StateKey.MultimapEntriesUserState | None = ...,
+        multimap_user_state: Global___StateKey.MultimapUserState | None = ...,
+        ordered_list_user_state: Global___StateKey.OrderedListUserState | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["bag_user_state", b"bag_user_state", "iterable_side_input", b"iterable_side_input", "multimap_entries_user_state", b"multimap_entries_user_state", "multimap_keys_side_input", b"multimap_keys_side_input", "multimap_keys_user_state", b"multimap_keys_user_state", "multimap_keys_values_side_input", b"multimap_keys_values_side_input", "multimap_side_input", b"multimap_side_input", "multimap_user_state", b"multimap_user_state", "ordered_list_user_state", b"ordered_list_user_state", "runner", b"runner", "type", b"type"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["bag_user_state", b"bag_user_state", "iterable_side_input", b"iterable_side_input", "multimap_entries_user_state", b"multimap_entries_user_state", "multimap_keys_side_input", b"multimap_keys_side_input", "multimap_keys_user_state", b"multimap_keys_user_state", "multimap_keys_values_side_input", b"multimap_keys_values_side_input", "multimap_side_input", b"multimap_side_input", "multimap_user_state", b"multimap_user_state", "ordered_list_user_state", b"ordered_list_user_state", "runner", b"runner", "type", b"type"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_type: _TypeAlias = _typing.Literal["runner", "multimap_side_input", "bag_user_state", "iterable_side_input", "multimap_keys_side_input", "multimap_keys_values_side_input", "multimap_keys_user_state", "multimap_entries_user_state", "multimap_user_state", "ordered_list_user_state"]  # noqa: Y015
+    _WhichOneofArgType_type: _TypeAlias = _typing.Literal["type", b"type"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_type) -> _WhichOneofReturnType_type | None: ...
+
+Global___StateKey: _TypeAlias = StateKey  # noqa: Y015
+
+@_typing.final
+class StateGetRequest(_message.Message):
+    """A request to get state."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CONTINUATION_TOKEN_FIELD_NUMBER: _builtins.int
+    continuation_token: _builtins.bytes
+    """(Optional) If specified, signals to the runner that the response
+    should resume from the following continuation token.
+
+    If unspecified, signals to the runner that the response should start
+    from the beginning of the logical continuable stream.
+    """
+    def __init__(
+        self,
+        *,
+        continuation_token: _builtins.bytes | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["continuation_token", b"continuation_token"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___StateGetRequest: _TypeAlias = StateGetRequest  # noqa: Y015
+
+@_typing.final
+class StateGetResponse(_message.Message):
+    """A response to get state representing a logical byte stream which can be
+    continued using the state API.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CONTINUATION_TOKEN_FIELD_NUMBER: _builtins.int
+    DATA_FIELD_NUMBER: _builtins.int
+    continuation_token: _builtins.bytes
+    """(Optional) If specified, represents a token which can be used with the
+    state API to get the next chunk of this logical byte stream. The end of
+    the logical byte stream is signalled by this field being unset.
+    """
+    data: _builtins.bytes
+    """Represents a part of a logical byte stream. Elements within
+    the logical byte stream are encoded in the nested context and
+    concatenated together.
+
+    See also the note about OrderedListState in StateAppendRequest.
+    """
+    def __init__(
+        self,
+        *,
+        continuation_token: _builtins.bytes | None = ...,
+        data: _builtins.bytes | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["continuation_token", b"continuation_token", "data", b"data"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___StateGetResponse: _TypeAlias = StateGetResponse  # noqa: Y015
+
+@_typing.final
+class StateAppendRequest(_message.Message):
+    """A request to append state."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    DATA_FIELD_NUMBER: _builtins.int
+    data: _builtins.bytes
+    """Represents a part of a logical byte stream. Elements within
+    the logical byte stream are encoded in the nested context and
+    multiple append requests are concatenated together.
+
+    For OrderedListState, elements of should be encoded with the
+    beam:coder:kv:v1 coder, where the first (key) component must be a
+    beam:coder:varint:v1 and the second (value) component must be encoded
+    with a beam:coder:length_prefix:v1 coder.
+    """
+    def __init__(
+        self,
+        *,
+        data: _builtins.bytes | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["data", b"data"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___StateAppendRequest: _TypeAlias = StateAppendRequest  # noqa: Y015
+
+@_typing.final
+class StateAppendResponse(_message.Message):
+    """A response to append state."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___StateAppendResponse: _TypeAlias = StateAppendResponse  # noqa: Y015
+
+@_typing.final
+class StateClearRequest(_message.Message):
+    """A request to clear state."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___StateClearRequest: _TypeAlias = StateClearRequest  # noqa: Y015
+
+@_typing.final
+class StateClearResponse(_message.Message):
+    """A response to clear state."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___StateClearResponse: _TypeAlias = StateClearResponse  # noqa: Y015
+
+@_typing.final
+class OrderedListRange(_message.Message):
+    """A message describes a sort key range [start, end)."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    START_FIELD_NUMBER: _builtins.int
+    END_FIELD_NUMBER: _builtins.int
+    start: _builtins.int
+    end: _builtins.int
+    def __init__(
+        self,
+        *,
+        start: _builtins.int | None = ...,
+        end: _builtins.int | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["end", b"end", "start", b"start"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___OrderedListRange: _TypeAlias = OrderedListRange  # noqa: Y015
+
+@_typing.final
+class LogEntry(_message.Message):
+    """
+    Logging API
+
+    This is very stable. There can be some changes to how we define a LogEntry,
+    to increase/decrease the severity types, the way we format an exception/stack
+    trace, or the log site.
+
+    A log entry
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class List(_message.Message):
+        """A list of log entries, enables buffering and batching of multiple
+        log messages using the logging API.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        LOG_ENTRIES_FIELD_NUMBER: _builtins.int
+        @_builtins.property
+        def log_entries(self) -> _containers.RepeatedCompositeFieldContainer[Global___LogEntry]:
+            """(Required) One or or more log messages."""
+
+        def __init__(
+            self,
+            *,
+            log_entries: _abc.Iterable[Global___LogEntry] | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["log_entries", b"log_entries"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    @_typing.final
+    class Severity(_message.Message):
+        """The severity of the event described in a log entry, expressed as one of the
+        severity levels listed below. For your reference, the levels are
+        assigned the listed numeric values. The effect of using numeric values
+        other than those listed is undefined.
+
+        If you are writing log entries, you should map other severity encodings to
+        one of these standard levels. For example, you might map all of
+        Java's FINE, FINER, and FINEST levels to `Severity.DEBUG`.
+
+        This list is intentionally not comprehensive; the intent is to provide a
+        common set of "good enough" severity levels so that logging front ends
+        can provide filtering and searching across log types. Users of the API are
+        free not to use all severity levels in their log messages.
+        """
+
+        DESCRIPTOR: _descriptor.Descriptor
+
+        class _Enum:
+            ValueType = _typing.NewType("ValueType", _builtins.int)
+            V: _TypeAlias = ValueType  # noqa: Y015
+
+        class _EnumEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[LogEntry.Severity._Enum.ValueType], _builtins.type):
+            DESCRIPTOR: _descriptor.EnumDescriptor
+            UNSPECIFIED: LogEntry.Severity._Enum.ValueType  # 0
+            """Unspecified level information. Will be logged at the TRACE level."""
+            TRACE: LogEntry.Severity._Enum.ValueType  # 1
+            DEBUG: LogEntry.Severity._Enum.ValueType  # 2
+            """Debugging information."""
+            INFO: LogEntry.Severity._Enum.ValueType  # 3
+            """Normal events."""
+            NOTICE: LogEntry.Severity._Enum.ValueType  # 4
+            """Normal but significant events, such as start up, shut down, or
+            configuration.
+            """
+            WARN: LogEntry.Severity._Enum.ValueType  # 5
+            """Warning events might cause problems."""
+            ERROR: LogEntry.Severity._Enum.ValueType  # 6
+            """Error events are likely to cause problems."""
+            CRITICAL: LogEntry.Severity._Enum.ValueType  # 7
+            """Critical events cause severe problems or brief outages and may
+            indicate that a person must take action.
+            """
+
+        class Enum(_Enum, metaclass=_EnumEnumTypeWrapper): ...
+        UNSPECIFIED: LogEntry.Severity.Enum.ValueType  # 0
+        """Unspecified level information. Will be logged at the TRACE level."""
+        TRACE: LogEntry.Severity.Enum.ValueType  # 1
+        DEBUG: LogEntry.Severity.Enum.ValueType  # 2
+        """Debugging information."""
+        INFO: LogEntry.Severity.Enum.ValueType  # 3
+        """Normal events."""
+        NOTICE: LogEntry.Severity.Enum.ValueType  # 4
+        """Normal but significant events, such as start up, shut down, or
+        configuration.
+        """
+        WARN: LogEntry.Severity.Enum.ValueType  # 5
+        """Warning events might cause problems."""
+        ERROR: LogEntry.Severity.Enum.ValueType  # 6
+        """Error events are likely to cause problems."""
+        CRITICAL: LogEntry.Severity.Enum.ValueType  # 7
+        """Critical events cause severe problems or brief outages and may
+        indicate that a person must take action.
+        """
+
+        def __init__(
+            self,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    SEVERITY_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    MESSAGE_FIELD_NUMBER: _builtins.int
+    TRACE_FIELD_NUMBER: _builtins.int
+    INSTRUCTION_ID_FIELD_NUMBER: _builtins.int
+    TRANSFORM_ID_FIELD_NUMBER: _builtins.int
+    LOG_LOCATION_FIELD_NUMBER: _builtins.int
+    THREAD_FIELD_NUMBER: _builtins.int
+    CUSTOM_DATA_FIELD_NUMBER: _builtins.int
+    severity: Global___LogEntry.Severity.Enum.ValueType
+    """(Required) The severity of the log statement."""
+    message: _builtins.str
+    """(Required) A human readable message."""
+    trace: _builtins.str
+    """(Optional) An optional trace of the functions involved. For example, in
+    Java this can include multiple causes and multiple suppressed exceptions.
+    """
+    instruction_id: _builtins.str
+    """(Optional) A reference to the instruction this log statement is associated
+    with.
+    """
+    transform_id: _builtins.str
+    """(Optional) A reference to the transform this log statement is
+    associated with.
+    """
+    log_location: _builtins.str
+    """(Optional) Human-readable name of the function or method being invoked,
+    with optional context such as the class or package name. The format can
+    vary by language. For example:
+      qual.if.ied.Class.method (Java)
+      dir/package.func (Go)
+      module.function (Python)
+      file.cc:382 (C++)
+    """
+    thread: _builtins.str
+    """(Optional) The name of the thread this log statement is associated with."""
+    @_builtins.property
+    def timestamp(self) -> _timestamp_pb2.Timestamp:
+        """(Required) The time at which this log statement occurred."""
+
+    @_builtins.property
+    def custom_data(self) -> _struct_pb2.Struct:
+        """(Optional) Additional structured data to log.
+        Keys are limited to these characters: [a-zA-Z_-]
+        """
+
+    def __init__(
+        self,
+        *,
+        severity: Global___LogEntry.Severity.Enum.ValueType | None = ...,
+        timestamp: _timestamp_pb2.Timestamp | None = ...,
+        message: _builtins.str | None = ...,
+        trace: _builtins.str | None = ...,
+        instruction_id: _builtins.str | None = ...,
+        transform_id: _builtins.str | None = ...,
+        log_location: _builtins.str | None = ...,
+        thread: _builtins.str | None = ...,
+        custom_data: _struct_pb2.Struct | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["custom_data", b"custom_data", "timestamp", b"timestamp"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["custom_data", b"custom_data", "instruction_id", b"instruction_id", "log_location", b"log_location", "message", b"message", "severity", b"severity", "thread", b"thread", "timestamp", b"timestamp", "trace", b"trace", "transform_id", b"transform_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___LogEntry: _TypeAlias = LogEntry  # noqa: Y015
+
+@_typing.final
+class LogControl(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___LogControl: _TypeAlias = LogControl  # noqa: Y015
+
+@_typing.final
+class StartWorkerRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class ParamsEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        value: _builtins.str
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: _builtins.str | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    WORKER_ID_FIELD_NUMBER: _builtins.int
+    CONTROL_ENDPOINT_FIELD_NUMBER: _builtins.int
+    LOGGING_ENDPOINT_FIELD_NUMBER: _builtins.int
+    ARTIFACT_ENDPOINT_FIELD_NUMBER: _builtins.int
+    PROVISION_ENDPOINT_FIELD_NUMBER: _builtins.int
+    PARAMS_FIELD_NUMBER: _builtins.int
+    worker_id: _builtins.str
+    @_builtins.property
+    def control_endpoint(self) -> _endpoints_pb2.ApiServiceDescriptor: ...
+    @_builtins.property
+    def logging_endpoint(self) -> _endpoints_pb2.ApiServiceDescriptor: ...
+    @_builtins.property
+    def artifact_endpoint(self) -> _endpoints_pb2.ApiServiceDescriptor: ...
+    @_builtins.property
+    def provision_endpoint(self) -> _endpoints_pb2.ApiServiceDescriptor: ...
+    @_builtins.property
+    def params(self) -> _containers.ScalarMap[_builtins.str, _builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        worker_id: _builtins.str | None = ...,
+        control_endpoint: _endpoints_pb2.ApiServiceDescriptor | None = ...,
+        logging_endpoint: _endpoints_pb2.ApiServiceDescriptor | None = ...,
+        artifact_endpoint: _endpoints_pb2.ApiServiceDescriptor | None = ...,
+        provision_endpoint: _endpoints_pb2.ApiServiceDescriptor | None = ...,
+        params: _abc.Mapping[_builtins.str, _builtins.str] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["artifact_endpoint", b"artifact_endpoint", "control_endpoint", b"control_endpoint", "logging_endpoint", b"logging_endpoint", "provision_endpoint", b"provision_endpoint"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["artifact_endpoint", b"artifact_endpoint", "control_endpoint", b"control_endpoint", "logging_endpoint", b"logging_endpoint", "params", b"params", "provision_endpoint", b"provision_endpoint", "worker_id", b"worker_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___StartWorkerRequest: _TypeAlias = StartWorkerRequest  # noqa: Y015
+
+@_typing.final
+class StartWorkerResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ERROR_FIELD_NUMBER: _builtins.int
+    error: _builtins.str
+    def __init__(
+        self,
+        *,
+        error: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["error", b"error"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___StartWorkerResponse: _TypeAlias = StartWorkerResponse  # noqa: Y015
+
+@_typing.final
+class StopWorkerRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    WORKER_ID_FIELD_NUMBER: _builtins.int
+    worker_id: _builtins.str
+    def __init__(
+        self,
+        *,
+        worker_id: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["worker_id", b"worker_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___StopWorkerRequest: _TypeAlias = StopWorkerRequest  # noqa: Y015
+
+@_typing.final
+class StopWorkerResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ERROR_FIELD_NUMBER: _builtins.int
+    error: _builtins.str
+    def __init__(
+        self,
+        *,
+        error: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["error", b"error"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___StopWorkerResponse: _TypeAlias = StopWorkerResponse  # noqa: Y015
+
+@_typing.final
+class WorkerStatusRequest(_message.Message):
+    """Request from runner to SDK Harness asking for its status. For more details see
+    https://s.apache.org/beam-fn-api-harness-status
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    """(Required) Unique ID identifying this request."""
+    def __init__(
+        self,
+        *,
+        id: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["id", b"id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___WorkerStatusRequest: _TypeAlias = WorkerStatusRequest  # noqa: Y015
+
+@_typing.final
+class WorkerStatusResponse(_message.Message):
+    """Response from SDK Harness to runner containing the debug related status info."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    ERROR_FIELD_NUMBER: _builtins.int
+    STATUS_INFO_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    """(Required) Unique ID from the original request."""
+    error: _builtins.str
+    """(Optional) Error message if exception encountered generating the status response."""
+    status_info: _builtins.str
+    """(Optional) Status debugging info reported by SDK harness worker. Content and
+    format is not strongly enforced but should be print-friendly and
+    appropriate as an HTTP response body for end user. For details of the preferred
+    info to include in the message see
+    https://s.apache.org/beam-fn-api-harness-status
+    """
+    def __init__(
+        self,
+        *,
+        id: _builtins.str | None = ...,
+        error: _builtins.str | None = ...,
+        status_info: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["error", b"error", "id", b"id", "status_info", b"status_info"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___WorkerStatusResponse: _TypeAlias = WorkerStatusResponse  # noqa: Y015
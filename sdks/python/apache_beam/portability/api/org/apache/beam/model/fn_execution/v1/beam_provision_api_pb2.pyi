@@ -0,0 +1,177 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+
+Protocol Buffers describing the Provision API, for communicating with a runner
+for job and environment provisioning information over GRPC.
+"""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf.internal import containers as _containers
+from ...pipeline.v1 import beam_runner_api_pb2 as _beam_runner_api_pb2
+from ...pipeline.v1 import endpoints_pb2 as _endpoints_pb2
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class GetProvisionInfoRequest(_message.Message):
+    """A request to get the provision info of a SDK harness worker instance."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetProvisionInfoRequest: _TypeAlias = GetProvisionInfoRequest  # noqa: Y015
+
+@_typing.final
+class GetProvisionInfoResponse(_message.Message):
+    """A response containing the provision info of a SDK harness worker instance."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    INFO_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def info(self) -> Global___ProvisionInfo: ...
+    def __init__(
+        self,
+        *,
+        info: Global___ProvisionInfo | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["info", b"info"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["info", b"info"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetProvisionInfoResponse: _TypeAlias = GetProvisionInfoResponse  # noqa: Y015
+
+@_typing.final
+class ProvisionInfo(_message.Message):
+    """Runtime provisioning information for a SDK harness worker instance,
+    such as pipeline options, resource constraints and other job metadata
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class MetadataEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        value: _builtins.str
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: _builtins.str | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    PIPELINE_OPTIONS_FIELD_NUMBER: _builtins.int
+    RETRIEVAL_TOKEN_FIELD_NUMBER: _builtins.int
+    STATUS_ENDPOINT_FIELD_NUMBER: _builtins.int
+    LOGGING_ENDPOINT_FIELD_NUMBER: _builtins.int
+    ARTIFACT_ENDPOINT_FIELD_NUMBER: _builtins.int
+    CONTROL_ENDPOINT_FIELD_NUMBER: _builtins.int
+    DEPENDENCIES_FIELD_NUMBER: _builtins.int
+    RUNNER_CAPABILITIES_FIELD_NUMBER: _builtins.int
+    METADATA_FIELD_NUMBER: _builtins.int
+    SIBLING_WORKER_IDS_FIELD_NUMBER: _builtins.int
+    retrieval_token: _builtins.str
+    """(required) The artifact retrieval token produced by
+    LegacyArtifactStagingService.CommitManifestResponse.
+    """
+    @_builtins.property
+    def pipeline_options(self) -> _struct_pb2.Struct:
+        """(required) Pipeline options. For non-template jobs, the options are
+        identical to what is passed to job submission.
+        """
+
+    @_builtins.property
+    def status_endpoint(self) -> _endpoints_pb2.ApiServiceDescriptor:
+        """(optional) The endpoint that the runner is hosting for the SDK to submit
+        status reports to during pipeline execution. This field will only be
+        populated if the runner supports SDK status reports. For more details see
+        https://s.apache.org/beam-fn-api-harness-status
+        """
+
+    @_builtins.property
+    def logging_endpoint(self) -> _endpoints_pb2.ApiServiceDescriptor:
+        """(optional) The logging endpoint this SDK should use."""
+
+    @_builtins.property
+    def artifact_endpoint(self) -> _endpoints_pb2.ApiServiceDescriptor:
+        """(optional) The artifact retrieval endpoint this SDK should use."""
+
+    @_builtins.property
+    def control_endpoint(self) -> _endpoints_pb2.ApiServiceDescriptor:
+        """(optional) The control endpoint this SDK should use."""
+
+    @_builtins.property
+    def dependencies(self) -> _containers.RepeatedCompositeFieldContainer[_beam_runner_api_pb2.ArtifactInformation]:
+        """The set of dependencies that should be staged into this environment."""
+
+    @_builtins.property
+    def runner_capabilities(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """(optional) A set of capabilities that this SDK is allowed to use in its
+        interactions with this runner.
+        """
+
+    @_builtins.property
+    def metadata(self) -> _containers.ScalarMap[_builtins.str, _builtins.str]:
+        """(optional) Runtime environment metadata that are static throughout the
+        pipeline execution.
+        """
+
+    @_builtins.property
+    def sibling_worker_ids(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """(optional) If this environment supports SIBLING_WORKERS, used to indicate
+        the ids of sibling workers, if any, that should be started in addition
+        to this worker (which already has its own worker id).
+        """
+
+    def __init__(
+        self,
+        *,
+        pipeline_options: _struct_pb2.Struct | None = ...,
+        retrieval_token: _builtins.str | None = ...,
+        status_endpoint: _endpoints_pb2.ApiServiceDescriptor | None = ...,
+        logging_endpoint: _endpoints_pb2.ApiServiceDescriptor | None = ...,
+        artifact_endpoint: _endpoints_pb2.ApiServiceDescriptor | None = ...,
+        control_endpoint: _endpoints_pb2.ApiServiceDescriptor | None = ...,
+        dependencies: _abc.Iterable[_beam_runner_api_pb2.ArtifactInformation] | None = ...,
+        runner_capabilities: _abc.Iterable[_builtins.str] | None = ...,
+        metadata: _abc.Mapping[_builtins.str, _builtins.str] | None = ...,
+        sibling_worker_ids: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["artifact_endpoint", b"artifact_endpoint", "control_endpoint", b"control_endpoint", "logging_endpoint", b"logging_endpoint", "pipeline_options", b"pipeline_options", "status_endpoint", b"status_endpoint"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["artifact_endpoint", b"artifact_endpoint", "control_endpoint", b"control_endpoint", "dependencies", b"dependencies", "logging_endpoint", b"logging_endpoint", "metadata", b"metadata", "pipeline_options", b"pipeline_options", "retrieval_token", b"retrieval_token", "runner_capabilities", b"runner_capabilities", "sibling_worker_ids", b"sibling_worker_ids", "status_endpoint", b"status_endpoint"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ProvisionInfo: _TypeAlias = ProvisionInfo  # noqa: Y015
@@ -0,0 +1,107 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from . import beam_provision_api_pb2 as org_dot_apache_dot_beam_dot_model_dot_fn__execution_dot_v1_dot_beam__provision__api__pb2
+
+GRPC_GENERATED_VERSION = '1.75.1'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + f' but the generated code in org/apache/beam/model/fn_execution/v1/beam_provision_api_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class ProvisionServiceStub(object):
+    """A service to provide runtime provisioning information to the SDK harness
+    worker instances -- such as pipeline options, resource constraints and
+    other job metadata -- needed by an SDK harness instance to initialize.
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.GetProvisionInfo = channel.unary_unary(
+                '/org.apache.beam.model.fn_execution.v1.ProvisionService/GetProvisionInfo',
+                request_serializer=org_dot_apache_dot_beam_dot_model_dot_fn__execution_dot_v1_dot_beam__provision__api__pb2.GetProvisionInfoRequest.SerializeToString,
+                response_deserializer=org_dot_apache_dot_beam_dot_model_dot_fn__execution_dot_v1_dot_beam__provision__api__pb2.GetProvisionInfoResponse.FromString,
+                _registered_method=True)
+
+
+class ProvisionServiceServicer(object):
+    """A service to provide runtime provisioning information to the SDK harness
+    worker instances -- such as pipeline options, resource constraints and
+    other job metadata -- needed by an SDK harness instance to initialize.
+    """
+
+    def GetProvisionInfo(self, request, context):
+        """Get provision information for the SDK harness worker instance.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_ProvisionServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'GetProvisionInfo': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetProvisionInfo,
+                    request_deserializer=org_dot_apache_dot_beam_dot_model_dot_fn__execution_dot_v1_dot_beam__provision__api__pb2.GetProvisionInfoRequest.FromString,
+                    response_serializer=org_dot_apache_dot_beam_dot_model_dot_fn__execution_dot_v1_dot_beam__provision__api__pb2.GetProvisionInfoResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'org.apache.beam.model.fn_execution.v1.ProvisionService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('org.apache.beam.model.fn_execution.v1.ProvisionService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class ProvisionService(object):
+    """A service to provide runtime provisioning information to the SDK harness
+    worker instances -- such as pipeline options, resource constraints and
+    other job metadata -- needed by an SDK harness instance to initialize.
+    """
+
+    @staticmethod
+    def GetProvisionInfo(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/org.apache.beam.model.fn_execution.v1.ProvisionService/GetProvisionInfo',
+            org_dot_apache_dot_beam_dot_model_dot_fn__execution_dot_v1_dot_beam__provision__api__pb2.GetProvisionInfoRequest.SerializeToString,
+            org_dot_apache_dot_beam_dot_model_dot_fn__execution_dot_v1_dot_beam__provision__api__pb2.GetProvisionInfoResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: org/apache/beam/model/interactive/v1/beam_interactive_api.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'org/apache/beam/model/interactive/v1/beam_interactive_api.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from ...pipeline.v1 import beam_runner_api_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_beam__runner__api__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n?org/apache/beam/model/interactive/v1/beam_interactive_api.proto\x12$org.apache.beam.model.interactive.v1\x1a\x37org/apache/beam/model/pipeline/v1/beam_runner_api.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"#\n\x14TestStreamFileHeader\x12\x0b\n\x03tag\x18\x01 \x01(\t\"j\n\x14TestStreamFileRecord\x12R\n\x0erecorded_event\x18\x01 \x01(\x0b\x32:.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event\"#\n\rEventsRequest\x12\x12\n\noutput_ids\x18\x01 \x03(\t2\x92\x01\n\x11TestStreamService\x12}\n\x06\x45vents\x12\x33.org.apache.beam.model.interactive.v1.EventsRequest\x1a:.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event\"\x00\x30\x01\x42\x46\n$org.apache.beam.model.interactive.v1B\x0eInteractiveApiZ\x0einteractive_v1b\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'org.apache.beam.model.interactive.v1.beam_interactive_api_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n$org.apache.beam.model.interactive.v1B\016InteractiveApiZ\016interactive_v1'
+  _globals['_TESTSTREAMFILEHEADER']._serialized_start=195
+  _globals['_TESTSTREAMFILEHEADER']._serialized_end=230
+  _globals['_TESTSTREAMFILERECORD']._serialized_start=232
+  _globals['_TESTSTREAMFILERECORD']._serialized_end=338
+  _globals['_EVENTSREQUEST']._serialized_start=340
+  _globals['_EVENTSREQUEST']._serialized_end=375
+  _globals['_TESTSTREAMSERVICE']._serialized_start=378
+  _globals['_TESTSTREAMSERVICE']._serialized_end=524
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,103 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+
+Protocol Buffers describing any Interactive Beam specific protos.
+
+TestStreamFileHeader: A record written at the top of a cached of TestStream
+                      events. This is used as metadata for the entire
+                      stream.
+"""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf.internal import containers as _containers
+from ...pipeline.v1 import beam_runner_api_pb2 as _beam_runner_api_pb2
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class TestStreamFileHeader(_message.Message):
+    """The first record. This contains metadata about the stream and how to
+    properly process it.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    TAG_FIELD_NUMBER: _builtins.int
+    tag: _builtins.str
+    """The PCollection tag this stream is associated with."""
+    def __init__(
+        self,
+        *,
+        tag: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["tag", b"tag"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___TestStreamFileHeader: _TypeAlias = TestStreamFileHeader  # noqa: Y015
+
+@_typing.final
+class TestStreamFileRecord(_message.Message):
+    """A record is a recorded element that a source produced. Its function is to
+    give enough information to create a faithful recreation of the original
+    stream of data.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    RECORDED_EVENT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def recorded_event(self) -> _beam_runner_api_pb2.TestStreamPayload.Event:
+        """The recorded event from an element stream."""
+
+    def __init__(
+        self,
+        *,
+        recorded_event: _beam_runner_api_pb2.TestStreamPayload.Event | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["recorded_event", b"recorded_event"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["recorded_event", b"recorded_event"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___TestStreamFileRecord: _TypeAlias = TestStreamFileRecord  # noqa: Y015
+
+@_typing.final
+class EventsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    OUTPUT_IDS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def output_ids(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """The set of PCollections to read from. These are the PTransform outputs
+        local names. These are a subset of the TestStream's outputs. This allows
+        Interactive Beam to cache many PCollections from a pipeline then replay a
+        subset of them.
+        """
+
+    def __init__(
+        self,
+        *,
+        output_ids: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["output_ids", b"output_ids"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___EventsRequest: _TypeAlias = EventsRequest  # noqa: Y015
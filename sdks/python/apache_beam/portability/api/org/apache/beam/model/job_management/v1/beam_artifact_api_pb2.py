@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: org/apache/beam/model/job_management/v1/beam_artifact_api.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'org/apache/beam/model/job_management/v1/beam_artifact_api.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from ...pipeline.v1 import beam_runner_api_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_beam__runner__api__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n?org/apache/beam/model/job_management/v1/beam_artifact_api.proto\x12\'org.apache.beam.model.job_management.v1\x1a\x37org/apache/beam/model/pipeline/v1/beam_runner_api.proto\"|\n\x17ResolveArtifactsRequest\x12I\n\tartifacts\x18\x01 \x03(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.ArtifactInformation\x12\x16\n\x0epreferred_urns\x18\x02 \x03(\t\"h\n\x18ResolveArtifactsResponse\x12L\n\x0creplacements\x18\x01 \x03(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.ArtifactInformation\"^\n\x12GetArtifactRequest\x12H\n\x08\x61rtifact\x18\x01 \x01(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.ArtifactInformation\"#\n\x13GetArtifactResponse\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\xd8\x01\n\x16\x41rtifactRequestWrapper\x12]\n\x10resolve_artifact\x18\xe8\x07 \x01(\x0b\x32@.org.apache.beam.model.job_management.v1.ResolveArtifactsRequestH\x00\x12T\n\x0cget_artifact\x18\xe9\x07 \x01(\x0b\x32;.org.apache.beam.model.job_management.v1.GetArtifactRequestH\x00\x42\t\n\x07request\"\x96\x02\n\x17\x41rtifactResponseWrapper\x12\x15\n\rstaging_token\x18\x01 \x01(\t\x12\x0f\n\x07is_last\x18\x02 \x01(\x08\x12g\n\x19resolve_artifact_response\x18\xe8\x07 \x01(\x0b\x32\x41.org.apache.beam.model.job_management.v1.ResolveArtifactsResponseH\x00\x12^\n\x15get_artifact_response\x18\xe9\x07 \x01(\x0b\x32<.org.apache.beam.model.job_management.v1.GetArtifactResponseH\x00\x42\n\n\x08response\"E\n\x10\x41rtifactMetadata\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0bpermissions\x18\x02 \x01(\r\x12\x0e\n\x06sha256\x18\x04 \x01(\t\"W\n\x08Manifest\x12K\n\x08\x61rtifact\x18\x01 \x03(\x0b\x32\x39.org.apache.beam.model.job_management.v1.ArtifactMetadata\"\xce\x01\n\rProxyManifest\x12\x43\n\x08manifest\x18\x01 \x01(\x0b\x32\x31.org.apache.beam.model.job_management.v1.Manifest\x12Q\n\x08location\x18\x02 \x03(\x0b\x32?.org.apache.beam.model.job_management.v1.ProxyManifest.Location\x1a%\n\x08Location\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03uri\x18\x02 \x01(\t\"-\n\x12GetManifestRequest\x12\x17\n\x0fretrieval_token\x18\x01 \x01(\t\"Z\n\x13GetManifestResponse\x12\x43\n\x08manifest\x18\x01 \x01(\x0b\x32\x31.org.apache.beam.model.job_management.v1.Manifest\"A\n\x18LegacyGetArtifactRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x17\n\x0fretrieval_token\x18\x02 \x01(\t\"\x1d\n\rArtifactChunk\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"\x81\x01\n\x13PutArtifactMetadata\x12\x1d\n\x15staging_session_token\x18\x01 \x01(\t\x12K\n\x08metadata\x18\x02 \x01(\x0b\x32\x39.org.apache.beam.model.job_management.v1.ArtifactMetadata\"\xb9\x01\n\x12PutArtifactRequest\x12P\n\x08metadata\x18\x01 \x01(\x0b\x32<.org.apache.beam.model.job_management.v1.PutArtifactMetadataH\x00\x12\x46\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32\x36.org.apache.beam.model.job_management.v1.ArtifactChunkH\x00\x42\t\n\x07\x63ontent\"\x15\n\x13PutArtifactResponse\"{\n\x15\x43ommitManifestRequest\x12\x43\n\x08manifest\x18\x01 \x01(\x0b\x32\x31.org.apache.beam.model.job_management.v1.Manifest\x12\x1d\n\x15staging_session_token\x18\x02 \x01(\t\"|\n\x16\x43ommitManifestResponse\x12\x17\n\x0fretrieval_token\x18\x01 \x01(\t\"I\n\tConstants\x12<\n\x19NO_ARTIFACTS_STAGED_TOKEN\x10\x00\x1a\x1d\xaa\xb4\xfa\xc2\x05\x17__no_artifacts_staged__2\xc1\x02\n\x18\x41rtifactRetrievalService\x12\x97\x01\n\x10ResolveArtifacts\x12@.org.apache.beam.model.job_management.v1.ResolveArtifactsRequest\x1a\x41.org.apache.beam.model.job_management.v1.ResolveArtifactsResponse\x12\x8a\x01\n\x0bGetArtifact\x12;.org.apache.beam.model.job_management.v1.GetArtifactRequest\x1a<.org.apache.beam.model.job_management.v1.GetArtifactResponse0\x01\x32\xc3\x01\n\x16\x41rtifactStagingService\x12\xa8\x01\n\x1fReverseArtifactRetrievalService\x12@.org.apache.beam.model.job_management.v1.ArtifactResponseWrapper\x1a?.org.apache.beam.model.job_management.v1.ArtifactRequestWrapper(\x01\x30\x01\x32\xbf\x02\n\x1cLegacyArtifactStagingService\x12\x8a\x01\n\x0bPutArtifact\x12;.org.apache.beam.model.job_management.v1.PutArtifactRequest\x1a<.org.apache.beam.model.job_management.v1.PutArtifactResponse(\x01\x12\x91\x01\n\x0e\x43ommitManifest\x12>.org.apache.beam.model.job_management.v1.CommitManifestRequest\x1a?.org.apache.beam.model.job_management.v1.CommitManifestResponse2\xb8\x02\n\x1eLegacyArtifactRetrievalService\x12\x88\x01\n\x0bGetManifest\x12;.org.apache.beam.model.job_management.v1.GetManifestRequest\x1a<.org.apache.beam.model.job_management.v1.GetManifestResponse\x12\x8a\x01\n\x0bGetArtifact\x12\x41.org.apache.beam.model.job_management.v1.LegacyGetArtifactRequest\x1a\x36.org.apache.beam.model.job_management.v1.ArtifactChunk0\x01\x42\x89\x01\n&org.apache.beam.model.jobmanagement.v1B\x0b\x41rtifactApiZRgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1b\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'org.apache.beam.model.job_management.v1.beam_artifact_api_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n&org.apache.beam.model.jobmanagement.v1B\013ArtifactApiZRgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1'
+  _globals['_COMMITMANIFESTRESPONSE_CONSTANTS'].values_by_name["NO_ARTIFACTS_STAGED_TOKEN"]._loaded_options = None
+  _globals['_COMMITMANIFESTRESPONSE_CONSTANTS'].values_by_name["NO_ARTIFACTS_STAGED_TOKEN"]._serialized_options = b'\252\264\372\302\005\027__no_artifacts_staged__'
+  _globals['_RESOLVEARTIFACTSREQUEST']._serialized_start=165
+  _globals['_RESOLVEARTIFACTSREQUEST']._serialized_end=289
+  _globals['_RESOLVEARTIFACTSRESPONSE']._serialized_start=291
+  _globals['_RESOLVEARTIFACTSRESPONSE']._serialized_end=395
+  _globals['_GETARTIFACTREQUEST']._serialized_start=397
+  _globals['_GETARTIFACTREQUEST']._serialized_end=491
+  _globals['_GETARTIFACTRESPONSE']._serialized_start=493
+  _globals['_GETARTIFACTRESPONSE']._serialized_end=528
+  _globals['_ARTIFACTREQUESTWRAPPER']._serialized_start=531
+  _globals['_ARTIFACTREQUESTWRAPPER']._serialized_end=747
+  _globals['_ARTIFACTRESPONSEWRAPPER']._serialized_start=750
+  _globals['_ARTIFACTRESPONSEWRAPPER']._serialized_end=1028
+  _globals['_ARTIFACTMETADATA']._serialized_start=1030
+  _globals['_ARTIFACTMETADATA']._serialized_end=1099
+  _globals['_MANIFEST']._serialized_start=1101
+  _globals['_MANIFEST']._serialized_end=1188
+  _globals['_PROXYMANIFEST']._serialized_start=1191
+  _globals['_PROXYMANIFEST']._serialized_end=1397
+  _globals['_PROXYMANIFEST_LOCATION']._serialized_start=1360
+  _globals['_PROXYMANIFEST_LOCATION']._serialized_end=1397
+  _globals['_GETMANIFESTREQUEST']._serialized_start=1399
+  _globals['_GETMANIFESTREQUEST']._serialized_end=1444
+  _globals['_GETMANIFESTRESPONSE']._serialized_start=1446
+  _globals['_GETMANIFESTRESPONSE']._serialized_end=1536
+  _globals['_LEGACYGETARTIFACTREQUEST']._serialized_start=1538
+  _globals['_LEGACYGETARTIFACTREQUEST']._serialized_end=1603
+  _globals['_ARTIFACTCHUNK']._serialized_start=1605
+  _globals['_ARTIFACTCHUNK']._serialized_end=1634
+  _globals['_PUTARTIFACTMETADATA']._serialized_start=1637
+  _globals['_PUTARTIFACTMETADATA']._serialized_end=1766
+  _globals['_PUTARTIFACTREQUEST']._serialized_start=1769
+  _globals['_PUTARTIFACTREQUEST']._serialized_end=1954
+  _globals['_PUTARTIFACTRESPONSE']._serialized_start=1956
+  _globals['_PUTARTIFACTRESPONSE']._serialized_end=1977
+  _globals['_COMMITMANIFESTREQUEST']._serialized_start=1979
+  _globals['_COMMITMANIFESTREQUEST']._serialized_end=2102
+  _globals['_COMMITMANIFESTRESPONSE']._serialized_start=2104
+  _globals['_COMMITMANIFESTRESPONSE']._serialized_end=2228
+  _globals['_COMMITMANIFESTRESPONSE_CONSTANTS']._serialized_start=2155
+  _globals['_COMMITMANIFESTRESPONSE_CONSTANTS']._serialized_end=2228
+  _globals['_ARTIFACTRETRIEVALSERVICE']._serialized_start=2231
+  _globals['_ARTIFACTRETRIEVALSERVICE']._serialized_end=2552
+  _globals['_ARTIFACTSTAGINGSERVICE']._serialized_start=2555
+  _globals['_ARTIFACTSTAGINGSERVICE']._serialized_end=2750
+  _globals['_LEGACYARTIFACTSTAGINGSERVICE']._serialized_start=2753
+  _globals['_LEGACYARTIFACTSTAGINGSERVICE']._serialized_end=3072
+  _globals['_LEGACYARTIFACTRETRIEVALSERVICE']._serialized_start=3075
+  _globals['_LEGACYARTIFACTRETRIEVALSERVICE']._serialized_end=3387
+# @@protoc_insertion_point(module_scope)
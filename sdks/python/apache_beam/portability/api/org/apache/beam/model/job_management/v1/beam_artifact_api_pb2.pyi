@@ -0,0 +1,536 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+
+Protocol Buffers describing the Artifact API, for communicating with a runner
+for artifact staging and retrieval over GRPC.
+"""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from ...pipeline.v1 import beam_runner_api_pb2 as _beam_runner_api_pb2
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class ResolveArtifactsRequest(_message.Message):
+    """A request for artifact resolution."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ARTIFACTS_FIELD_NUMBER: _builtins.int
+    PREFERRED_URNS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def artifacts(self) -> _containers.RepeatedCompositeFieldContainer[_beam_runner_api_pb2.ArtifactInformation]:
+        """An (ordered) set of artifacts to (jointly) resolve."""
+
+    @_builtins.property
+    def preferred_urns(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """A set of artifact type urns that are understood by the requester.
+        An attempt should be made to resolve the artifacts in terms of these URNs,
+        but other URNs may be used as well with the understanding that they must
+        be fetch-able as bytes via GetArtifact.
+        """
+
+    def __init__(
+        self,
+        *,
+        artifacts: _abc.Iterable[_beam_runner_api_pb2.ArtifactInformation] | None = ...,
+        preferred_urns: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["artifacts", b"artifacts", "preferred_urns", b"preferred_urns"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ResolveArtifactsRequest: _TypeAlias = ResolveArtifactsRequest  # noqa: Y015
+
+@_typing.final
+class ResolveArtifactsResponse(_message.Message):
+    """A response for artifact resolution."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    REPLACEMENTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def replacements(self) -> _containers.RepeatedCompositeFieldContainer[_beam_runner_api_pb2.ArtifactInformation]:
+        """A full (ordered) set of replacements for the set of requested artifacts,
+        preferably in terms of the requested type URNs.  If there is no better
+        resolution, the original list is returned.
+        """
+
+    def __init__(
+        self,
+        *,
+        replacements: _abc.Iterable[_beam_runner_api_pb2.ArtifactInformation] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["replacements", b"replacements"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ResolveArtifactsResponse: _TypeAlias = ResolveArtifactsResponse  # noqa: Y015
+
+@_typing.final
+class GetArtifactRequest(_message.Message):
+    """A request to get an artifact."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ARTIFACT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def artifact(self) -> _beam_runner_api_pb2.ArtifactInformation: ...
+    def __init__(
+        self,
+        *,
+        artifact: _beam_runner_api_pb2.ArtifactInformation | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["artifact", b"artifact"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["artifact", b"artifact"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetArtifactRequest: _TypeAlias = GetArtifactRequest  # noqa: Y015
+
+@_typing.final
+class GetArtifactResponse(_message.Message):
+    """Part of a response to getting an artifact."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    DATA_FIELD_NUMBER: _builtins.int
+    data: _builtins.bytes
+    def __init__(
+        self,
+        *,
+        data: _builtins.bytes | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["data", b"data"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetArtifactResponse: _TypeAlias = GetArtifactResponse  # noqa: Y015
+
+@_typing.final
+class ArtifactRequestWrapper(_message.Message):
+    """Wraps an ArtifactRetrievalService request for use in ReverseArtifactRetrievalService."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    RESOLVE_ARTIFACT_FIELD_NUMBER: _builtins.int
+    GET_ARTIFACT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def resolve_artifact(self) -> Global___ResolveArtifactsRequest: ...
+    @_builtins.property
+    def get_artifact(self) -> Global___GetArtifactRequest: ...
+    def __init__(
+        self,
+        *,
+        resolve_artifact: Global___ResolveArtifactsRequest | None = ...,
+        get_artifact: Global___GetArtifactRequest | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["get_artifact", b"get_artifact", "request", b"request", "resolve_artifact", b"resolve_artifact"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["get_artifact", b"get_artifact", "request", b"request", "resolve_artifact", b"resolve_artifact"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_request: _TypeAlias = _typing.Literal["resolve_artifact", "get_artifact"]  # noqa: Y015
+    _WhichOneofArgType_request: _TypeAlias = _typing.Literal["request", b"request"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_request) -> _WhichOneofReturnType_request | None: ...
+
+Global___ArtifactRequestWrapper: _TypeAlias = ArtifactRequestWrapper  # noqa: Y015
+
+@_typing.final
+class ArtifactResponseWrapper(_message.Message):
+    """Wraps an ArtifactRetrievalService response for use in ReverseArtifactRetrievalService."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    STAGING_TOKEN_FIELD_NUMBER: _builtins.int
+    IS_LAST_FIELD_NUMBER: _builtins.int
+    RESOLVE_ARTIFACT_RESPONSE_FIELD_NUMBER: _builtins.int
+    GET_ARTIFACT_RESPONSE_FIELD_NUMBER: _builtins.int
+    staging_token: _builtins.str
+    """A token indicating which job these artifacts are being staged for."""
+    is_last: _builtins.bool
+    """Whether this is the last response for this request (for those responses that
+    would typically be terminated by the end of the response stream.)
+    """
+    @_builtins.property
+    def resolve_artifact_response(self) -> Global___ResolveArtifactsResponse: ...
+    @_builtins.property
+    def get_artifact_response(self) -> Global___GetArtifactResponse: ...
+    def __init__(
+        self,
+        *,
+        staging_token: _builtins.str | None = ...,
+        is_last: _builtins.bool | None = ...,
+        resolve_artifact_response: Global___ResolveArtifactsResponse | None = ...,
+        get_artifact_response: Global___GetArtifactResponse | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["get_artifact_response", b"get_artifact_response", "resolve_artifact_response", b"resolve_artifact_response", "response", b"response"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["get_artifact_response", b"get_artifact_response", "is_last", b"is_last", "resolve_artifact_response", b"resolve_artifact_response", "response", b"response", "staging_token", b"staging_token"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_response: _TypeAlias = _typing.Literal["resolve_artifact_response", "get_artifact_response"]  # noqa: Y015
+    _WhichOneofArgType_response: _TypeAlias = _typing.Literal["response", b"response"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_response) -> _WhichOneofReturnType_response | None: ...
+
+Global___ArtifactResponseWrapper: _TypeAlias = ArtifactResponseWrapper  # noqa: Y015
+
+@_typing.final
+class ArtifactMetadata(_message.Message):
+    """An artifact identifier and associated metadata."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: _builtins.int
+    PERMISSIONS_FIELD_NUMBER: _builtins.int
+    SHA256_FIELD_NUMBER: _builtins.int
+    name: _builtins.str
+    """(Required) The name of the artifact."""
+    permissions: _builtins.int
+    """(Optional) The Unix-like permissions of the artifact"""
+    sha256: _builtins.str
+    """(Optional) The hex-encoded sha256 checksum of the artifact. Used, among other things, by
+    harness boot code to validate the integrity of the artifact.
+    """
+    def __init__(
+        self,
+        *,
+        name: _builtins.str | None = ...,
+        permissions: _builtins.int | None = ...,
+        sha256: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["name", b"name", "permissions", b"permissions", "sha256", b"sha256"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ArtifactMetadata: _TypeAlias = ArtifactMetadata  # noqa: Y015
+
+@_typing.final
+class Manifest(_message.Message):
+    """A collection of artifacts."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ARTIFACT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def artifact(self) -> _containers.RepeatedCompositeFieldContainer[Global___ArtifactMetadata]: ...
+    def __init__(
+        self,
+        *,
+        artifact: _abc.Iterable[Global___ArtifactMetadata] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["artifact", b"artifact"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Manifest: _TypeAlias = Manifest  # noqa: Y015
+
+@_typing.final
+class ProxyManifest(_message.Message):
+    """A manifest with location information."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class Location(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        NAME_FIELD_NUMBER: _builtins.int
+        URI_FIELD_NUMBER: _builtins.int
+        name: _builtins.str
+        uri: _builtins.str
+        def __init__(
+            self,
+            *,
+            name: _builtins.str | None = ...,
+            uri: _builtins.str | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["name", b"name", "uri", b"uri"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    MANIFEST_FIELD_NUMBER: _builtins.int
+    LOCATION_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def manifest(self) -> Global___Manifest: ...
+    @_builtins.property
+    def location(self) -> _containers.RepeatedCompositeFieldContainer[Global___ProxyManifest.Location]: ...
+    def __init__(
+        self,
+        *,
+        manifest: Global___Manifest | None = ...,
+        location: _abc.Iterable[Global___ProxyManifest.Location] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["manifest", b"manifest"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["location", b"location", "manifest", b"manifest"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ProxyManifest: _TypeAlias = ProxyManifest  # noqa: Y015
+
+@_typing.final
+class GetManifestRequest(_message.Message):
+    """A request to get the manifest of a Job."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    RETRIEVAL_TOKEN_FIELD_NUMBER: _builtins.int
+    retrieval_token: _builtins.str
+    """(Required) An opaque token representing the entirety of the staged artifacts.
+    Returned in CommitManifestResponse.
+    """
+    def __init__(
+        self,
+        *,
+        retrieval_token: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["retrieval_token", b"retrieval_token"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetManifestRequest: _TypeAlias = GetManifestRequest  # noqa: Y015
+
+@_typing.final
+class GetManifestResponse(_message.Message):
+    """A response containing a job manifest."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    MANIFEST_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def manifest(self) -> Global___Manifest: ...
+    def __init__(
+        self,
+        *,
+        manifest: Global___Manifest | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["manifest", b"manifest"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["manifest", b"manifest"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetManifestResponse: _TypeAlias = GetManifestResponse  # noqa: Y015
+
+@_typing.final
+class LegacyGetArtifactRequest(_message.Message):
+    """A request to get an artifact. The artifact must be present in the manifest for the job."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: _builtins.int
+    RETRIEVAL_TOKEN_FIELD_NUMBER: _builtins.int
+    name: _builtins.str
+    """(Required) The name of the artifact to retrieve."""
+    retrieval_token: _builtins.str
+    """(Required) An opaque token representing the entirety of the staged artifacts.
+    Returned in CommitManifestResponse.
+    """
+    def __init__(
+        self,
+        *,
+        name: _builtins.str | None = ...,
+        retrieval_token: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["name", b"name", "retrieval_token", b"retrieval_token"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___LegacyGetArtifactRequest: _TypeAlias = LegacyGetArtifactRequest  # noqa: Y015
+
+@_typing.final
+class ArtifactChunk(_message.Message):
+    """Part of an artifact."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    DATA_FIELD_NUMBER: _builtins.int
+    data: _builtins.bytes
+    def __init__(
+        self,
+        *,
+        data: _builtins.bytes | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["data", b"data"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ArtifactChunk: _TypeAlias = ArtifactChunk  # noqa: Y015
+
+@_typing.final
+class PutArtifactMetadata(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    STAGING_SESSION_TOKEN_FIELD_NUMBER: _builtins.int
+    METADATA_FIELD_NUMBER: _builtins.int
+    staging_session_token: _builtins.str
+    """(Required) A token for artifact staging session. This token can be obtained
+    from PrepareJob request in JobService
+    """
+    @_builtins.property
+    def metadata(self) -> Global___ArtifactMetadata:
+        """(Required) The Artifact metadata."""
+
+    def __init__(
+        self,
+        *,
+        staging_session_token: _builtins.str | None = ...,
+        metadata: Global___ArtifactMetadata | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["metadata", b"metadata"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["metadata", b"metadata", "staging_session_token", b"staging_session_token"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PutArtifactMetadata: _TypeAlias = PutArtifactMetadata  # noqa: Y015
+
+@_typing.final
+class PutArtifactRequest(_message.Message):
+    """A request to stage an artifact."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    METADATA_FIELD_NUMBER: _builtins.int
+    DATA_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def metadata(self) -> Global___PutArtifactMetadata:
+        """The first message in a PutArtifact call must contain this field."""
+
+    @_builtins.property
+    def data(self) -> Global___ArtifactChunk:
+        """A chunk of the artifact. All messages after the first in a PutArtifact call must contain a
+        chunk.
+        """
+
+    def __init__(
+        self,
+        *,
+        metadata: Global___PutArtifactMetadata | None = ...,
+        data: Global___ArtifactChunk | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["content", b"content", "data", b"data", "metadata", b"metadata"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["content", b"content", "data", b"data", "metadata", b"metadata"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_content: _TypeAlias = _typing.Literal["metadata", "data"]  # noqa: Y015
+    _WhichOneofArgType_content: _TypeAlias = _typing.Literal["content", b"content"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_content) -> _WhichOneofReturnType_content | None: ...
+
+Global___PutArtifactRequest: _TypeAlias = PutArtifactRequest  # noqa: Y015
+
+@_typing.final
+class PutArtifactResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PutArtifactResponse: _TypeAlias = PutArtifactResponse  # noqa: Y015
+
+@_typing.final
+class CommitManifestRequest(_message.Message):
+    """A request to commit the manifest for a Job. All artifacts must have been successfully uploaded
+    before this call is made.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    MANIFEST_FIELD_NUMBER: _builtins.int
+    STAGING_SESSION_TOKEN_FIELD_NUMBER: _builtins.int
+    staging_session_token: _builtins.str
+    """(Required) A token for artifact staging session. This token can be obtained
+    from PrepareJob request in JobService
+    """
+    @_builtins.property
+    def manifest(self) -> Global___Manifest:
+        """(Required) The manifest to commit."""
+
+    def __init__(
+        self,
+        *,
+        manifest: Global___Manifest | None = ...,
+        staging_session_token: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["manifest", b"manifest"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["manifest", b"manifest", "staging_session_token", b"staging_session_token"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CommitManifestRequest: _TypeAlias = CommitManifestRequest  # noqa: Y015
+
+@_typing.final
+class CommitManifestResponse(_message.Message):
+    """The result of committing a manifest."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _Constants:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _ConstantsEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[CommitManifestResponse._Constants.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        NO_ARTIFACTS_STAGED_TOKEN: CommitManifestResponse._Constants.ValueType  # 0
+        """Token indicating that no artifacts were staged and therefore no retrieval attempt is necessary."""
+
+    class Constants(_Constants, metaclass=_ConstantsEnumTypeWrapper): ...
+    NO_ARTIFACTS_STAGED_TOKEN: CommitManifestResponse.Constants.ValueType  # 0
+    """Token indicating that no artifacts were staged and therefore no retrieval attempt is necessary."""
+
+    RETRIEVAL_TOKEN_FIELD_NUMBER: _builtins.int
+    retrieval_token: _builtins.str
+    """(Required) An opaque token representing the entirety of the staged artifacts.
+    This can be used to retrieve the manifest and artifacts from an associated
+    LegacyArtifactRetrievalService.
+    """
+    def __init__(
+        self,
+        *,
+        retrieval_token: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["retrieval_token", b"retrieval_token"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CommitManifestResponse: _TypeAlias = CommitManifestResponse  # noqa: Y015
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: org/apache/beam/model/job_management/v1/beam_expansion_api.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'org/apache/beam/model/job_management/v1/beam_expansion_api.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from ...pipeline.v1 import beam_runner_api_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_beam__runner__api__pb2
+from ...pipeline.v1 import schema_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_schema__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n@org/apache/beam/model/job_management/v1/beam_expansion_api.proto\x12\"org.apache.beam.model.expansion.v1\x1a\x1cgoogle/protobuf/struct.proto\x1a\x37org/apache/beam/model/pipeline/v1/beam_runner_api.proto\x1a.org/apache/beam/model/pipeline/v1/schema.proto\"\x9d\x03\n\x10\x45xpansionRequest\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12@\n\ttransform\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransform\x12\x11\n\tnamespace\x18\x03 \x01(\t\x12l\n\x15output_coder_requests\x18\x04 \x03(\x0b\x32M.org.apache.beam.model.expansion.v1.ExpansionRequest.OutputCoderRequestsEntry\x12\x14\n\x0crequirements\x18\x05 \x03(\t\x12\x31\n\x10pipeline_options\x18\x06 \x01(\x0b\x32\x17.google.protobuf.Struct\x1a:\n\x18OutputCoderRequestsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xbd\x01\n\x11\x45xpansionResponse\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12@\n\ttransform\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransform\x12\x14\n\x0crequirements\x18\x03 \x03(\t\x12\r\n\x05\x65rror\x18\n \x01(\t\" \n\x1e\x44iscoverSchemaTransformRequest\"\xb1\x01\n\x15SchemaTransformConfig\x12@\n\rconfig_schema\x18\x01 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.Schema\x12\x1f\n\x17input_pcollection_names\x18\x02 \x03(\t\x12 \n\x18output_pcollection_names\x18\x03 \x03(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\"\xae\x02\n\x1f\x44iscoverSchemaTransformResponse\x12\x81\x01\n\x18schema_transform_configs\x18\x01 \x03(\x0b\x32_.org.apache.beam.model.expansion.v1.DiscoverSchemaTransformResponse.SchemaTransformConfigsEntry\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x1ax\n\x1bSchemaTransformConfigsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12H\n\x05value\x18\x02 \x01(\x0b\x32\x39.org.apache.beam.model.expansion.v1.SchemaTransformConfig:\x02\x38\x01\x32\xae\x02\n\x10\x45xpansionService\x12u\n\x06\x45xpand\x12\x34.org.apache.beam.model.expansion.v1.ExpansionRequest\x1a\x35.org.apache.beam.model.expansion.v1.ExpansionResponse\x12\xa2\x01\n\x17\x44iscoverSchemaTransform\x12\x42.org.apache.beam.model.expansion.v1.DiscoverSchemaTransformRequest\x1a\x43.org.apache.beam.model.expansion.v1.DiscoverSchemaTransformResponseB\x86\x01\n\"org.apache.beam.model.expansion.v1B\x0c\x45xpansionApiZRgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1b\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'org.apache.beam.model.job_management.v1.beam_expansion_api_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n\"org.apache.beam.model.expansion.v1B\014ExpansionApiZRgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1'
+  _globals['_EXPANSIONREQUEST_OUTPUTCODERREQUESTSENTRY']._loaded_options = None
+  _globals['_EXPANSIONREQUEST_OUTPUTCODERREQUESTSENTRY']._serialized_options = b'8\001'
+  _globals['_DISCOVERSCHEMATRANSFORMRESPONSE_SCHEMATRANSFORMCONFIGSENTRY']._loaded_options = None
+  _globals['_DISCOVERSCHEMATRANSFORMRESPONSE_SCHEMATRANSFORMCONFIGSENTRY']._serialized_options = b'8\001'
+  _globals['_EXPANSIONREQUEST']._serialized_start=240
+  _globals['_EXPANSIONREQUEST']._serialized_end=653
+  _globals['_EXPANSIONREQUEST_OUTPUTCODERREQUESTSENTRY']._serialized_start=595
+  _globals['_EXPANSIONREQUEST_OUTPUTCODERREQUESTSENTRY']._serialized_end=653
+  _globals['_EXPANSIONRESPONSE']._serialized_start=656
+  _globals['_EXPANSIONRESPONSE']._serialized_end=845
+  _globals['_DISCOVERSCHEMATRANSFORMREQUEST']._serialized_start=847
+  _globals['_DISCOVERSCHEMATRANSFORMREQUEST']._serialized_end=879
+  _globals['_SCHEMATRANSFORMCONFIG']._serialized_start=882
+  _globals['_SCHEMATRANSFORMCONFIG']._serialized_end=1059
+  _globals['_DISCOVERSCHEMATRANSFORMRESPONSE']._serialized_start=1062
+  _globals['_DISCOVERSCHEMATRANSFORMRESPONSE']._serialized_end=1364
+  _globals['_DISCOVERSCHEMATRANSFORMRESPONSE_SCHEMATRANSFORMCONFIGSENTRY']._serialized_start=1244
+  _globals['_DISCOVERSCHEMATRANSFORMRESPONSE_SCHEMATRANSFORMCONFIGSENTRY']._serialized_end=1364
+  _globals['_EXPANSIONSERVICE']._serialized_start=1367
+  _globals['_EXPANSIONSERVICE']._serialized_end=1669
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,264 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+
+Protocol Buffers describing the Expansion API, an api for expanding
+transforms in a remote SDK.
+"""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf.internal import containers as _containers
+from ...pipeline.v1 import beam_runner_api_pb2 as _beam_runner_api_pb2
+from ...pipeline.v1 import schema_pb2 as _schema_pb2
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class ExpansionRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class OutputCoderRequestsEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        value: _builtins.str
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: _builtins.str | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    COMPONENTS_FIELD_NUMBER: _builtins.int
+    TRANSFORM_FIELD_NUMBER: _builtins.int
+    NAMESPACE_FIELD_NUMBER: _builtins.int
+    OUTPUT_CODER_REQUESTS_FIELD_NUMBER: _builtins.int
+    REQUIREMENTS_FIELD_NUMBER: _builtins.int
+    PIPELINE_OPTIONS_FIELD_NUMBER: _builtins.int
+    namespace: _builtins.str
+    """A namespace (prefix) to use for the id of any newly created
+    components.
+    """
+    @_builtins.property
+    def components(self) -> _beam_runner_api_pb2.Components:
+        """Set of components needed to interpret the transform, or which
+        may be useful for its expansion.  This includes the input
+        PCollections (if any) to the to-be-expanded transform, along
+        with their coders and windowing strategies.
+        """
+
+    @_builtins.property
+    def transform(self) -> _beam_runner_api_pb2.PTransform:
+        """The actual PTransform to be expaneded according to its spec.
+        Its input should be set, but its subtransforms and outputs
+        should not be.
+        """
+
+    @_builtins.property
+    def output_coder_requests(self) -> _containers.ScalarMap[_builtins.str, _builtins.str]:
+        """(Optional) Map from a local output tag to a coder id.
+        If it is set, asks the expansion service to use the given
+        coders for the output PCollections. Note that the request
+        may not be fulfilled.
+        """
+
+    @_builtins.property
+    def requirements(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """A set of requirements that must be used by the expansion service to
+        interpret the components provided with this request.
+        """
+
+    @_builtins.property
+    def pipeline_options(self) -> _struct_pb2.Struct:
+        """(Optional) A set of Pipeline Options that should be used
+        when expanding this transform.
+        """
+
+    def __init__(
+        self,
+        *,
+        components: _beam_runner_api_pb2.Components | None = ...,
+        transform: _beam_runner_api_pb2.PTransform | None = ...,
+        namespace: _builtins.str | None = ...,
+        output_coder_requests: _abc.Mapping[_builtins.str, _builtins.str] | None = ...,
+        requirements: _abc.Iterable[_builtins.str] | None = ...,
+        pipeline_options: _struct_pb2.Struct | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["components", b"components", "pipeline_options", b"pipeline_options", "transform", b"transform"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["components", b"components", "namespace", b"namespace", "output_coder_requests", b"output_coder_requests", "pipeline_options", b"pipeline_options", "requirements", b"requirements", "transform", b"transform"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ExpansionRequest: _TypeAlias = ExpansionRequest  # noqa: Y015
+
+@_typing.final
+class ExpansionResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    COMPONENTS_FIELD_NUMBER: _builtins.int
+    TRANSFORM_FIELD_NUMBER: _builtins.int
+    REQUIREMENTS_FIELD_NUMBER: _builtins.int
+    ERROR_FIELD_NUMBER: _builtins.int
+    error: _builtins.str
+    """(Optional) An string representation of any error encountered while
+    attempting to expand this transform.
+    """
+    @_builtins.property
+    def components(self) -> _beam_runner_api_pb2.Components:
+        """Set of components needed to execute the expanded transform,
+        including the (original) inputs, outputs, and subtransforms.
+        """
+
+    @_builtins.property
+    def transform(self) -> _beam_runner_api_pb2.PTransform:
+        """The expanded transform itself, with references to its outputs
+        and subtransforms.
+        """
+
+    @_builtins.property
+    def requirements(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """A set of requirements that must be appended to this pipeline's
+        requirements.
+        """
+
+    def __init__(
+        self,
+        *,
+        components: _beam_runner_api_pb2.Components | None = ...,
+        transform: _beam_runner_api_pb2.PTransform | None = ...,
+        requirements: _abc.Iterable[_builtins.str] | None = ...,
+        error: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["components", b"components", "transform", b"transform"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["components", b"components", "error", b"error", "requirements", b"requirements", "transform", b"transform"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ExpansionResponse: _TypeAlias = ExpansionResponse  # noqa: Y015
+
+@_typing.final
+class DiscoverSchemaTransformRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DiscoverSchemaTransformRequest: _TypeAlias = DiscoverSchemaTransformRequest  # noqa: Y015
+
+@_typing.final
+class SchemaTransformConfig(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CONFIG_SCHEMA_FIELD_NUMBER: _builtins.int
+    INPUT_PCOLLECTION_NAMES_FIELD_NUMBER: _builtins.int
+    OUTPUT_PCOLLECTION_NAMES_FIELD_NUMBER: _builtins.int
+    DESCRIPTION_FIELD_NUMBER: _builtins.int
+    description: _builtins.str
+    """Description of this transform and usage used for documentation.
+    May be markdown formatted.
+    Note that configuration parameters may also have documentation attached
+    as part of the config_schema.
+    """
+    @_builtins.property
+    def config_schema(self) -> _schema_pb2.Schema:
+        """Config schema of the SchemaTransform"""
+
+    @_builtins.property
+    def input_pcollection_names(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """Names of input PCollections"""
+
+    @_builtins.property
+    def output_pcollection_names(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """Names of output PCollections"""
+
+    def __init__(
+        self,
+        *,
+        config_schema: _schema_pb2.Schema | None = ...,
+        input_pcollection_names: _abc.Iterable[_builtins.str] | None = ...,
+        output_pcollection_names: _abc.Iterable[_builtins.str] | None = ...,
+        description: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["config_schema", b"config_schema"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["config_schema", b"config_schema", "description", b"description", "input_pcollection_names", b"input_pcollection_names", "output_pcollection_names", b"output_pcollection_names"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SchemaTransformConfig: _TypeAlias = SchemaTransformConfig  # noqa: Y015
+
+@_typing.final
+class DiscoverSchemaTransformResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class SchemaTransformConfigsEntry(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        KEY_FIELD_NUMBER: _builtins.int
+        VALUE_FIELD_NUMBER: _builtins.int
+        key: _builtins.str
+        @_builtins.property
+        def value(self) -> Global___SchemaTransformConfig: ...
+        def __init__(
+            self,
+            *,
+            key: _builtins.str | None = ...,
+            value: Global___SchemaTransformConfig | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    SCHEMA_TRANSFORM_CONFIGS_FIELD_NUMBER: _builtins.int
+    ERROR_FIELD_NUMBER: _builtins.int
+    error: _builtins.str
+    """If list of identifies are empty, this may contain an error."""
+    @_builtins.property
+    def schema_transform_configs(self) -> _containers.MessageMap[_builtins.str, Global___SchemaTransformConfig]:
+        """A mapping from SchemaTransform ID to schema transform config of discovered
+        SchemaTransforms
+        """
+
+    def __init__(
+        self,
+        *,
+        schema_transform_configs: _abc.Mapping[_builtins.str, Global___SchemaTransformConfig] | None = ...,
+        error: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["error", b"error", "schema_transform_configs", b"schema_transform_configs"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DiscoverSchemaTransformResponse: _TypeAlias = DiscoverSchemaTransformResponse  # noqa: Y015
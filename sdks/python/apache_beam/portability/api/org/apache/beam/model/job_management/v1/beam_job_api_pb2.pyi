@@ -0,0 +1,801 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+
+Protocol Buffers describing the Job API, api for communicating with a runner
+for job submission over GRPC.
+"""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import struct_pb2 as _struct_pb2
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from ...pipeline.v1 import beam_runner_api_pb2 as _beam_runner_api_pb2
+from ...pipeline.v1 import endpoints_pb2 as _endpoints_pb2
+from ...pipeline.v1 import metrics_pb2 as _metrics_pb2
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class PrepareJobRequest(_message.Message):
+    """Prepare is a synchronous request that returns a preparationId back
+    Throws error GRPC_STATUS_UNAVAILABLE if server is down
+    Throws error ALREADY_EXISTS if the jobName is reused. Runners are permitted to deduplicate based on the name of the job.
+    Throws error UNKNOWN for all other issues
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PIPELINE_FIELD_NUMBER: _builtins.int
+    PIPELINE_OPTIONS_FIELD_NUMBER: _builtins.int
+    JOB_NAME_FIELD_NUMBER: _builtins.int
+    job_name: _builtins.str
+    """(required)"""
+    @_builtins.property
+    def pipeline(self) -> _beam_runner_api_pb2.Pipeline:
+        """(required)"""
+
+    @_builtins.property
+    def pipeline_options(self) -> _struct_pb2.Struct:
+        """(required)"""
+
+    def __init__(
+        self,
+        *,
+        pipeline: _beam_runner_api_pb2.Pipeline | None = ...,
+        pipeline_options: _struct_pb2.Struct | None = ...,
+        job_name: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["pipeline", b"pipeline", "pipeline_options", b"pipeline_options"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["job_name", b"job_name", "pipeline", b"pipeline", "pipeline_options", b"pipeline_options"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PrepareJobRequest: _TypeAlias = PrepareJobRequest  # noqa: Y015
+
+@_typing.final
+class PrepareJobResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PREPARATION_ID_FIELD_NUMBER: _builtins.int
+    ARTIFACT_STAGING_ENDPOINT_FIELD_NUMBER: _builtins.int
+    STAGING_SESSION_TOKEN_FIELD_NUMBER: _builtins.int
+    preparation_id: _builtins.str
+    """(required) The ID used to associate calls made while preparing the job. preparationId is used
+    to run the job.
+    """
+    staging_session_token: _builtins.str
+    """(required) Token for the artifact staging. This token also represent an artifact
+    staging session with the artifact staging service.
+    """
+    @_builtins.property
+    def artifact_staging_endpoint(self) -> _endpoints_pb2.ApiServiceDescriptor:
+        """An endpoint which exposes the Beam Artifact Staging API. Artifacts used by the job should be
+        staged to this endpoint, and will be available during job execution.
+        """
+
+    def __init__(
+        self,
+        *,
+        preparation_id: _builtins.str | None = ...,
+        artifact_staging_endpoint: _endpoints_pb2.ApiServiceDescriptor | None = ...,
+        staging_session_token: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["artifact_staging_endpoint", b"artifact_staging_endpoint"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["artifact_staging_endpoint", b"artifact_staging_endpoint", "preparation_id", b"preparation_id", "staging_session_token", b"staging_session_token"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PrepareJobResponse: _TypeAlias = PrepareJobResponse  # noqa: Y015
+
+@_typing.final
+class RunJobRequest(_message.Message):
+    """Run is a synchronous request that returns a jobId back.
+    Throws error GRPC_STATUS_UNAVAILABLE if server is down
+    Throws error NOT_FOUND if the preparation ID does not exist
+    Throws error UNKNOWN for all other issues
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PREPARATION_ID_FIELD_NUMBER: _builtins.int
+    RETRIEVAL_TOKEN_FIELD_NUMBER: _builtins.int
+    preparation_id: _builtins.str
+    """(required) The ID provided by an earlier call to prepare. Runs the job. All prerequisite tasks
+    must have been completed.
+    """
+    retrieval_token: _builtins.str
+    """(optional) If any artifacts have been staged for this job, contains the retrieval_token returned
+    from the CommitManifestResponse.
+    """
+    def __init__(
+        self,
+        *,
+        preparation_id: _builtins.str | None = ...,
+        retrieval_token: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["preparation_id", b"preparation_id", "retrieval_token", b"retrieval_token"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RunJobRequest: _TypeAlias = RunJobRequest  # noqa: Y015
+
+@_typing.final
+class RunJobResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    JOB_ID_FIELD_NUMBER: _builtins.int
+    job_id: _builtins.str
+    """(required) The ID for the executing job"""
+    def __init__(
+        self,
+        *,
+        job_id: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["job_id", b"job_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RunJobResponse: _TypeAlias = RunJobResponse  # noqa: Y015
+
+@_typing.final
+class CancelJobRequest(_message.Message):
+    """Cancel is a synchronus request that returns a job state back
+    Throws error GRPC_STATUS_UNAVAILABLE if server is down
+    Throws error NOT_FOUND if the jobId is not found
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    JOB_ID_FIELD_NUMBER: _builtins.int
+    job_id: _builtins.str
+    """(required)"""
+    def __init__(
+        self,
+        *,
+        job_id: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["job_id", b"job_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CancelJobRequest: _TypeAlias = CancelJobRequest  # noqa: Y015
+
+@_typing.final
+class CancelJobResponse(_message.Message):
+    """Valid responses include any terminal state or CANCELLING"""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    STATE_FIELD_NUMBER: _builtins.int
+    state: Global___JobState.Enum.ValueType
+    """(required)"""
+    def __init__(
+        self,
+        *,
+        state: Global___JobState.Enum.ValueType | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["state", b"state"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___CancelJobResponse: _TypeAlias = CancelJobResponse  # noqa: Y015
+
+@_typing.final
+class DrainJobRequest(_message.Message):
+    """Drain is a request to:
+    - stop a pipeline Job from ingesting new data from input sources
+    - process remaining data in the pipeline
+    - truncate Splittable DoFns
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    JOB_ID_FIELD_NUMBER: _builtins.int
+    job_id: _builtins.str
+    """(required)"""
+    def __init__(
+        self,
+        *,
+        job_id: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["job_id", b"job_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DrainJobRequest: _TypeAlias = DrainJobRequest  # noqa: Y015
+
+@_typing.final
+class DrainJobResponse(_message.Message):
+    """Valid responses include any terminal state or DRAINING"""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    STATE_FIELD_NUMBER: _builtins.int
+    state: Global___JobState.Enum.ValueType
+    """(required)"""
+    def __init__(
+        self,
+        *,
+        state: Global___JobState.Enum.ValueType | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["state", b"state"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DrainJobResponse: _TypeAlias = DrainJobResponse  # noqa: Y015
+
+@_typing.final
+class JobInfo(_message.Message):
+    """A subset of info provided by ProvisionApi.ProvisionInfo"""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    JOB_ID_FIELD_NUMBER: _builtins.int
+    JOB_NAME_FIELD_NUMBER: _builtins.int
+    PIPELINE_OPTIONS_FIELD_NUMBER: _builtins.int
+    STATE_FIELD_NUMBER: _builtins.int
+    job_id: _builtins.str
+    """(required)"""
+    job_name: _builtins.str
+    """(required)"""
+    state: Global___JobState.Enum.ValueType
+    """(required)"""
+    @_builtins.property
+    def pipeline_options(self) -> _struct_pb2.Struct:
+        """(required)"""
+
+    def __init__(
+        self,
+        *,
+        job_id: _builtins.str | None = ...,
+        job_name: _builtins.str | None = ...,
+        pipeline_options: _struct_pb2.Struct | None = ...,
+        state: Global___JobState.Enum.ValueType | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["pipeline_options", b"pipeline_options"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["job_id", b"job_id", "job_name", b"job_name", "pipeline_options", b"pipeline_options", "state", b"state"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___JobInfo: _TypeAlias = JobInfo  # noqa: Y015
+
+@_typing.final
+class GetJobsRequest(_message.Message):
+    """GetJobs is a synchronus request that returns a list of invoked jobs back
+    Throws error GRPC_STATUS_UNAVAILABLE if server is down
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetJobsRequest: _TypeAlias = GetJobsRequest  # noqa: Y015
+
+@_typing.final
+class GetJobsResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    JOB_INFO_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def job_info(self) -> _containers.RepeatedCompositeFieldContainer[Global___JobInfo]:
+        """(required)"""
+
+    def __init__(
+        self,
+        *,
+        job_info: _abc.Iterable[Global___JobInfo] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["job_info", b"job_info"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetJobsResponse: _TypeAlias = GetJobsResponse  # noqa: Y015
+
+@_typing.final
+class GetJobStateRequest(_message.Message):
+    """GetState is a synchronus request that returns a job state back
+    Throws error GRPC_STATUS_UNAVAILABLE if server is down
+    Throws error NOT_FOUND if the jobId is not found
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    JOB_ID_FIELD_NUMBER: _builtins.int
+    job_id: _builtins.str
+    """(required)"""
+    def __init__(
+        self,
+        *,
+        job_id: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["job_id", b"job_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetJobStateRequest: _TypeAlias = GetJobStateRequest  # noqa: Y015
+
+@_typing.final
+class JobStateEvent(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    STATE_FIELD_NUMBER: _builtins.int
+    TIMESTAMP_FIELD_NUMBER: _builtins.int
+    state: Global___JobState.Enum.ValueType
+    """(required)"""
+    @_builtins.property
+    def timestamp(self) -> _timestamp_pb2.Timestamp:
+        """(required)"""
+
+    def __init__(
+        self,
+        *,
+        state: Global___JobState.Enum.ValueType | None = ...,
+        timestamp: _timestamp_pb2.Timestamp | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["timestamp", b"timestamp"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["state", b"state", "timestamp", b"timestamp"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___JobStateEvent: _TypeAlias = JobStateEvent  # noqa: Y015
+
+@_typing.final
+class GetJobPipelineRequest(_message.Message):
+    """GetPipeline is a synchronus request that returns a pipeline back
+    Throws error GRPC_STATUS_UNAVAILABLE if server is down
+    Throws error NOT_FOUND if the jobId is not found
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    JOB_ID_FIELD_NUMBER: _builtins.int
+    job_id: _builtins.str
+    """(required)"""
+    def __init__(
+        self,
+        *,
+        job_id: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["job_id", b"job_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetJobPipelineRequest: _TypeAlias = GetJobPipelineRequest  # noqa: Y015
+
+@_typing.final
+class GetJobPipelineResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    PIPELINE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def pipeline(self) -> _beam_runner_api_pb2.Pipeline:
+        """(required)"""
+
+    def __init__(
+        self,
+        *,
+        pipeline: _beam_runner_api_pb2.Pipeline | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["pipeline", b"pipeline"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["pipeline", b"pipeline"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetJobPipelineResponse: _TypeAlias = GetJobPipelineResponse  # noqa: Y015
+
+@_typing.final
+class JobMessagesRequest(_message.Message):
+    """GetJobMessages is a streaming api for streaming job messages from the service
+    One request will connect you to the job and you'll get a stream of job state
+    and job messages back; one is used for logging and the other for detecting
+    the job ended.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    JOB_ID_FIELD_NUMBER: _builtins.int
+    job_id: _builtins.str
+    """(required)"""
+    def __init__(
+        self,
+        *,
+        job_id: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["job_id", b"job_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___JobMessagesRequest: _TypeAlias = JobMessagesRequest  # noqa: Y015
+
+@_typing.final
+class JobMessage(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _MessageImportance:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _MessageImportanceEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[JobMessage._MessageImportance.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        MESSAGE_IMPORTANCE_UNSPECIFIED: JobMessage._MessageImportance.ValueType  # 0
+        JOB_MESSAGE_DEBUG: JobMessage._MessageImportance.ValueType  # 1
+        JOB_MESSAGE_DETAILED: JobMessage._MessageImportance.ValueType  # 2
+        JOB_MESSAGE_BASIC: JobMessage._MessageImportance.ValueType  # 3
+        JOB_MESSAGE_WARNING: JobMessage._MessageImportance.ValueType  # 4
+        JOB_MESSAGE_ERROR: JobMessage._MessageImportance.ValueType  # 5
+
+    class MessageImportance(_MessageImportance, metaclass=_MessageImportanceEnumTypeWrapper): ...
+    MESSAGE_IMPORTANCE_UNSPECIFIED: JobMessage.MessageImportance.ValueType  # 0
+    JOB_MESSAGE_DEBUG: JobMessage.MessageImportance.ValueType  # 1
+    JOB_MESSAGE_DETAILED: JobMessage.MessageImportance.ValueType  # 2
+    JOB_MESSAGE_BASIC: JobMessage.MessageImportance.ValueType  # 3
+    JOB_MESSAGE_WARNING: JobMessage.MessageImportance.ValueType  # 4
+    JOB_MESSAGE_ERROR: JobMessage.MessageImportance.ValueType  # 5
+
+    MESSAGE_ID_FIELD_NUMBER: _builtins.int
+    TIME_FIELD_NUMBER: _builtins.int
+    IMPORTANCE_FIELD_NUMBER: _builtins.int
+    MESSAGE_TEXT_FIELD_NUMBER: _builtins.int
+    message_id: _builtins.str
+    time: _builtins.str
+    importance: Global___JobMessage.MessageImportance.ValueType
+    message_text: _builtins.str
+    def __init__(
+        self,
+        *,
+        message_id: _builtins.str | None = ...,
+        time: _builtins.str | None = ...,
+        importance: Global___JobMessage.MessageImportance.ValueType | None = ...,
+        message_text: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["importance", b"importance", "message_id", b"message_id", "message_text", b"message_text", "time", b"time"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___JobMessage: _TypeAlias = JobMessage  # noqa: Y015
+
+@_typing.final
+class JobMessagesResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    MESSAGE_RESPONSE_FIELD_NUMBER: _builtins.int
+    STATE_RESPONSE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def message_response(self) -> Global___JobMessage: ...
+    @_builtins.property
+    def state_response(self) -> Global___JobStateEvent: ...
+    def __init__(
+        self,
+        *,
+        message_response: Global___JobMessage | None = ...,
+        state_response: Global___JobStateEvent | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["message_response", b"message_response", "response", b"response", "state_response", b"state_response"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["message_response", b"message_response", "response", b"response", "state_response", b"state_response"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_response: _TypeAlias = _typing.Literal["message_response", "state_response"]  # noqa: Y015
+    _WhichOneofArgType_response: _TypeAlias = _typing.Literal["response", b"response"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_response) -> _WhichOneofReturnType_response | None: ...
+
+Global___JobMessagesResponse: _TypeAlias = JobMessagesResponse  # noqa: Y015
+
+@_typing.final
+class JobState(_message.Message):
+    """Enumeration of all JobStates
+
+    The state transition diagram is:
+      STOPPED -> STARTING -> RUNNING -> DONE
+                                     \\> FAILED
+                                     \\> CANCELLING -> CANCELLED
+                                     \\> UPDATING -> UPDATED
+                                     \\> DRAINING -> DRAINED
+
+    Transitions are optional such that a job may go from STOPPED to RUNNING
+    without needing to pass through STARTING.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _Enum:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _EnumEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[JobState._Enum.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        UNSPECIFIED: JobState._Enum.ValueType  # 0
+        """The job state reported by a runner cannot be interpreted by the SDK."""
+        STOPPED: JobState._Enum.ValueType  # 1
+        """The job has not yet started."""
+        RUNNING: JobState._Enum.ValueType  # 2
+        """The job is currently running."""
+        DONE: JobState._Enum.ValueType  # 3
+        """The job has successfully completed. (terminal)"""
+        FAILED: JobState._Enum.ValueType  # 4
+        """The job has failed. (terminal)"""
+        CANCELLED: JobState._Enum.ValueType  # 5
+        """The job has been explicitly cancelled. (terminal)"""
+        UPDATED: JobState._Enum.ValueType  # 6
+        """The job has been updated. (terminal)"""
+        DRAINING: JobState._Enum.ValueType  # 7
+        """The job is draining its data. (optional)"""
+        DRAINED: JobState._Enum.ValueType  # 8
+        """The job has completed draining its data. (terminal)"""
+        STARTING: JobState._Enum.ValueType  # 9
+        """The job is starting up."""
+        CANCELLING: JobState._Enum.ValueType  # 10
+        """The job is cancelling. (optional)"""
+        UPDATING: JobState._Enum.ValueType  # 11
+        """The job is in the process of being updated. (optional)"""
+
+    class Enum(_Enum, metaclass=_EnumEnumTypeWrapper): ...
+    UNSPECIFIED: JobState.Enum.ValueType  # 0
+    """The job state reported by a runner cannot be interpreted by the SDK."""
+    STOPPED: JobState.Enum.ValueType  # 1
+    """The job has not yet started."""
+    RUNNING: JobState.Enum.ValueType  # 2
+    """The job is currently running."""
+    DONE: JobState.Enum.ValueType  # 3
+    """The job has successfully completed. (terminal)"""
+    FAILED: JobState.Enum.ValueType  # 4
+    """The job has failed. (terminal)"""
+    CANCELLED: JobState.Enum.ValueType  # 5
+    """The job has been explicitly cancelled. (terminal)"""
+    UPDATED: JobState.Enum.ValueType  # 6
+    """The job has been updated. (terminal)"""
+    DRAINING: JobState.Enum.ValueType  # 7
+    """The job is draining its data. (optional)"""
+    DRAINED: JobState.Enum.ValueType  # 8
+    """The job has completed draining its data. (terminal)"""
+    STARTING: JobState.Enum.ValueType  # 9
+    """The job is starting up."""
+    CANCELLING: JobState.Enum.ValueType  # 10
+    """The job is cancelling. (optional)"""
+    UPDATING: JobState.Enum.ValueType  # 11
+    """The job is in the process of being updated. (optional)"""
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___JobState: _TypeAlias = JobState  # noqa: Y015
+
+@_typing.final
+class GetJobMetricsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    JOB_ID_FIELD_NUMBER: _builtins.int
+    job_id: _builtins.str
+    """(required)"""
+    def __init__(
+        self,
+        *,
+        job_id: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["job_id", b"job_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetJobMetricsRequest: _TypeAlias = GetJobMetricsRequest  # noqa: Y015
+
+@_typing.final
+class GetJobMetricsResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    METRICS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def metrics(self) -> Global___MetricResults: ...
+    def __init__(
+        self,
+        *,
+        metrics: Global___MetricResults | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["metrics", b"metrics"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["metrics", b"metrics"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GetJobMetricsResponse: _TypeAlias = GetJobMetricsResponse  # noqa: Y015
+
+@_typing.final
+class MetricResults(_message.Message):
+    """All metrics for a given job.  Runners may support one or the other or both."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ATTEMPTED_FIELD_NUMBER: _builtins.int
+    COMMITTED_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def attempted(self) -> _containers.RepeatedCompositeFieldContainer[_metrics_pb2.MonitoringInfo]: ...
+    @_builtins.property
+    def committed(self) -> _containers.RepeatedCompositeFieldContainer[_metrics_pb2.MonitoringInfo]: ...
+    def __init__(
+        self,
+        *,
+        attempted: _abc.Iterable[_metrics_pb2.MonitoringInfo] | None = ...,
+        committed: _abc.Iterable[_metrics_pb2.MonitoringInfo] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["attempted", b"attempted", "committed", b"committed"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MetricResults: _TypeAlias = MetricResults  # noqa: Y015
+
+@_typing.final
+class DescribePipelineOptionsRequest(_message.Message):
+    """DescribePipelineOptions provides metadata about the options supported by a runner.
+    It will be used by the SDK client to validate the options specified by or
+    list available options to the user.
+    Throws error GRPC_STATUS_UNAVAILABLE if server is down
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DescribePipelineOptionsRequest: _TypeAlias = DescribePipelineOptionsRequest  # noqa: Y015
+
+@_typing.final
+class PipelineOptionType(_message.Message):
+    """Type for pipeline options.
+    Types mirror those of JSON, since that's how pipeline options are serialized.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _Enum:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _EnumEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[PipelineOptionType._Enum.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        STRING: PipelineOptionType._Enum.ValueType  # 0
+        BOOLEAN: PipelineOptionType._Enum.ValueType  # 1
+        INTEGER: PipelineOptionType._Enum.ValueType  # 2
+        """whole numbers, see https://json-schema.org/understanding-json-schema/reference/numeric.html"""
+        NUMBER: PipelineOptionType._Enum.ValueType  # 3
+        ARRAY: PipelineOptionType._Enum.ValueType  # 4
+        OBJECT: PipelineOptionType._Enum.ValueType  # 5
+
+    class Enum(_Enum, metaclass=_EnumEnumTypeWrapper): ...
+    STRING: PipelineOptionType.Enum.ValueType  # 0
+    BOOLEAN: PipelineOptionType.Enum.ValueType  # 1
+    INTEGER: PipelineOptionType.Enum.ValueType  # 2
+    """whole numbers, see https://json-schema.org/understanding-json-schema/reference/numeric.html"""
+    NUMBER: PipelineOptionType.Enum.ValueType  # 3
+    ARRAY: PipelineOptionType.Enum.ValueType  # 4
+    OBJECT: PipelineOptionType.Enum.ValueType  # 5
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PipelineOptionType: _TypeAlias = PipelineOptionType  # noqa: Y015
+
+@_typing.final
+class PipelineOptionDescriptor(_message.Message):
+    """Metadata for a pipeline option."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: _builtins.int
+    TYPE_FIELD_NUMBER: _builtins.int
+    DESCRIPTION_FIELD_NUMBER: _builtins.int
+    DEFAULT_VALUE_FIELD_NUMBER: _builtins.int
+    GROUP_FIELD_NUMBER: _builtins.int
+    name: _builtins.str
+    """(Required) The option name."""
+    type: Global___PipelineOptionType.Enum.ValueType
+    """(Required) Type of option."""
+    description: _builtins.str
+    """(Optional) Description suitable for display / help text."""
+    default_value: _builtins.str
+    """(Optional) Default value."""
+    group: _builtins.str
+    """(Required) The group this option belongs to."""
+    def __init__(
+        self,
+        *,
+        name: _builtins.str | None = ...,
+        type: Global___PipelineOptionType.Enum.ValueType | None = ...,
+        description: _builtins.str | None = ...,
+        default_value: _builtins.str | None = ...,
+        group: _builtins.str | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["default_value", b"default_value", "description", b"description", "group", b"group", "name", b"name", "type", b"type"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___PipelineOptionDescriptor: _TypeAlias = PipelineOptionDescriptor  # noqa: Y015
+
+@_typing.final
+class DescribePipelineOptionsResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    OPTIONS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def options(self) -> _containers.RepeatedCompositeFieldContainer[Global___PipelineOptionDescriptor]:
+        """List of pipeline option descriptors."""
+
+    def __init__(
+        self,
+        *,
+        options: _abc.Iterable[Global___PipelineOptionDescriptor] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["options", b"options"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___DescribePipelineOptionsResponse: _TypeAlias = DescribePipelineOptionsResponse  # noqa: Y015
@@ -0,0 +1,523 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: org/apache/beam/model/pipeline/v1/beam_runner_api.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'org/apache/beam/model/pipeline/v1/beam_runner_api.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import endpoints_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_endpoints__pb2
+from google.protobuf import descriptor_pb2 as google_dot_protobuf_dot_descriptor__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7org/apache/beam/model/pipeline/v1/beam_runner_api.proto\x12!org.apache.beam.model.pipeline.v1\x1a\x31org/apache/beam/model/pipeline/v1/endpoints.proto\x1a google/protobuf/descriptor.proto\"\xc2\x01\n\rBeamConstants\"\xb0\x01\n\tConstants\x12\x31\n\x14MIN_TIMESTAMP_MILLIS\x10\x00\x1a\x17\xaa\xb4\xfa\xc2\x05\x11-9223372036854775\x12\x30\n\x14MAX_TIMESTAMP_MILLIS\x10\x01\x1a\x16\xaa\xb4\xfa\xc2\x05\x10\x39\x32\x32\x33\x33\x37\x32\x30\x33\x36\x38\x35\x34\x37\x37\x35\x12>\n\"GLOBAL_WINDOW_MAX_TIMESTAMP_MILLIS\x10\x02\x1a\x16\xaa\xb4\xfa\xc2\x05\x10\x39\x32\x32\x33\x33\x37\x31\x39\x35\x30\x34\x35\x34\x37\x37\x35\"\xb5\x07\n\nComponents\x12Q\n\ntransforms\x18\x01 \x03(\x0b\x32=.org.apache.beam.model.pipeline.v1.Components.TransformsEntry\x12U\n\x0cpcollections\x18\x02 \x03(\x0b\x32?.org.apache.beam.model.pipeline.v1.Components.PcollectionsEntry\x12\x64\n\x14windowing_strategies\x18\x03 \x03(\x0b\x32\x46.org.apache.beam.model.pipeline.v1.Components.WindowingStrategiesEntry\x12I\n\x06\x63oders\x18\x04 \x03(\x0b\x32\x39.org.apache.beam.model.pipeline.v1.Components.CodersEntry\x12U\n\x0c\x65nvironments\x18\x05 \x03(\x0b\x32?.org.apache.beam.model.pipeline.v1.Components.EnvironmentsEntry\x1a`\n\x0fTransformsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12<\n\x05value\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransform:\x02\x38\x01\x1a\x63\n\x11PcollectionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.PCollection:\x02\x38\x01\x1ap\n\x18WindowingStrategiesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x43\n\x05value\x18\x02 \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.WindowingStrategy:\x02\x38\x01\x1aW\n\x0b\x43odersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x37\n\x05value\x18\x02 \x01(\x0b\x32(.org.apache.beam.model.pipeline.v1.Coder:\x02\x38\x01\x1a\x63\n\x11\x45nvironmentsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.Environment:\x02\x38\x01\"\xc5\x01\n\x08Pipeline\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12\x1a\n\x12root_transform_ids\x18\x02 \x03(\t\x12\x44\n\x0c\x64isplay_data\x18\x03 \x03(\x0b\x32..org.apache.beam.model.pipeline.v1.DisplayData\x12\x14\n\x0crequirements\x18\x04 \x03(\t\"\xd5\x04\n\nPTransform\x12\x13\n\x0bunique_name\x18\x05 \x01(\t\x12=\n\x04spec\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x15\n\rsubtransforms\x18\x02 \x03(\t\x12I\n\x06inputs\x18\x03 \x03(\x0b\x32\x39.org.apache.beam.model.pipeline.v1.PTransform.InputsEntry\x12K\n\x07outputs\x18\x04 \x03(\x0b\x32:.org.apache.beam.model.pipeline.v1.PTransform.OutputsEntry\x12\x44\n\x0c\x64isplay_data\x18\x06 \x03(\x0b\x32..org.apache.beam.model.pipeline.v1.DisplayData\x12\x16\n\x0e\x65nvironment_id\x18\x07 \x01(\t\x12S\n\x0b\x61nnotations\x18\x08 \x03(\x0b\x32>.org.apache.beam.model.pipeline.v1.PTransform.AnnotationsEntry\x1a-\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a.\n\x0cOutputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x32\n\x10\x41nnotationsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\"\xdb\x11\n\x13StandardPTransforms\"\xdb\x03\n\nPrimitives\x12)\n\x06PAR_DO\x10\x00\x1a\x1d\xa2\xb4\xfa\xc2\x05\x17\x62\x65\x61m:transform:pardo:v1\x12,\n\x07\x46LATTEN\x10\x01\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:transform:flatten:v1\x12\x36\n\x0cGROUP_BY_KEY\x10\x02\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:transform:group_by_key:v1\x12,\n\x07IMPULSE\x10\x03\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:transform:impulse:v1\x12\x37\n\x0e\x41SSIGN_WINDOWS\x10\x04\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:window_into:v1\x12\x33\n\x0bTEST_STREAM\x10\x05\x1a\"\xa2\xb4\xfa\xc2\x05\x1c\x62\x65\x61m:transform:teststream:v1\x12\x34\n\x0bMAP_WINDOWS\x10\x06\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:map_windows:v1\x12\x38\n\rMERGE_WINDOWS\x10\x07\x1a%\xa2\xb4\xfa\xc2\x05\x1f\x62\x65\x61m:transform:merge_windows:v1\x12\x30\n\tTO_STRING\x10\x08\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:transform:to_string:v1\"t\n\x14\x44\x65precatedPrimitives\x12&\n\x04READ\x10\x00\x1a\x1c\xa2\xb4\xfa\xc2\x05\x16\x62\x65\x61m:transform:read:v1\x12\x34\n\x0b\x43REATE_VIEW\x10\x01\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:create_view:v1\"\x97\x05\n\nComposites\x12<\n\x0f\x43OMBINE_PER_KEY\x10\x00\x1a\'\xa2\xb4\xfa\xc2\x05!beam:transform:combine_per_key:v1\x12>\n\x10\x43OMBINE_GLOBALLY\x10\x01\x1a(\xa2\xb4\xfa\xc2\x05\"beam:transform:combine_globally:v1\x12\x30\n\tRESHUFFLE\x10\x02\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:transform:reshuffle:v1\x12\x34\n\x0bWRITE_FILES\x10\x03\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:write_files:v1\x12\x34\n\x0bPUBSUB_READ\x10\x04\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:pubsub_read:v1\x12\x36\n\x0cPUBSUB_WRITE\x10\x05\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:transform:pubsub_write:v1\x12\x39\n\x0fPUBSUB_WRITE_V2\x10\x07\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:transform:pubsub_write:v2\x12\x64\n#GROUP_INTO_BATCHES_WITH_SHARDED_KEY\x10\x06\x1a;\xa2\xb4\xfa\xc2\x05\x35\x62\x65\x61m:transform:group_into_batches_with_sharded_key:v1\x12\x44\n\x13REDISTRIBUTE_BY_KEY\x10\x08\x1a+\xa2\xb4\xfa\xc2\x05%beam:transform:redistribute_by_key:v1\x12N\n\x18REDISTRIBUTE_ARBITRARILY\x10\t\x1a\x30\xa2\xb4\xfa\xc2\x05*beam:transform:redistribute_arbitrarily:v1\"\xe3\x03\n\x11\x43ombineComponents\x12R\n\x1a\x43OMBINE_PER_KEY_PRECOMBINE\x10\x00\x1a\x32\xa2\xb4\xfa\xc2\x05,beam:transform:combine_per_key_precombine:v1\x12\x62\n\"COMBINE_PER_KEY_MERGE_ACCUMULATORS\x10\x01\x1a:\xa2\xb4\xfa\xc2\x05\x34\x62\x65\x61m:transform:combine_per_key_merge_accumulators:v1\x12\\\n\x1f\x43OMBINE_PER_KEY_EXTRACT_OUTPUTS\x10\x02\x1a\x37\xa2\xb4\xfa\xc2\x05\x31\x62\x65\x61m:transform:combine_per_key_extract_outputs:v1\x12J\n\x16\x43OMBINE_GROUPED_VALUES\x10\x03\x1a.\xa2\xb4\xfa\xc2\x05(beam:transform:combine_grouped_values:v1\x12l\n\'COMBINE_PER_KEY_CONVERT_TO_ACCUMULATORS\x10\x04\x1a?\xa2\xb4\xfa\xc2\x05\x39\x62\x65\x61m:transform:combine_per_key_convert_to_accumulators:v1\"\x8d\x03\n\x19SplittableParDoComponents\x12L\n\x15PAIR_WITH_RESTRICTION\x10\x00\x1a\x31\xa2\xb4\xfa\xc2\x05+beam:transform:sdf_pair_with_restriction:v1\x12X\n\x1bSPLIT_AND_SIZE_RESTRICTIONS\x10\x01\x1a\x37\xa2\xb4\xfa\xc2\x05\x31\x62\x65\x61m:transform:sdf_split_and_size_restrictions:v1\x12o\n\'PROCESS_SIZED_ELEMENTS_AND_RESTRICTIONS\x10\x02\x1a\x42\xa2\xb4\xfa\xc2\x05<beam:transform:sdf_process_sized_element_and_restrictions:v1\x12W\n\x1aTRUNCATE_SIZED_RESTRICTION\x10\x03\x1a\x37\xa2\xb4\xfa\xc2\x05\x31\x62\x65\x61m:transform:sdf_truncate_sized_restrictions:v1\"`\n\x1aGroupIntoBatchesComponents\x12\x42\n\x12GROUP_INTO_BATCHES\x10\x00\x1a*\xa2\xb4\xfa\xc2\x05$beam:transform:group_into_batches:v1\"\x82\x01\n\x16StandardSideInputTypes\"h\n\x04\x45num\x12/\n\x08ITERABLE\x10\x00\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:side_input:iterable:v1\x12/\n\x08MULTIMAP\x10\x01\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:side_input:multimap:v1\"\xb2\x01\n\x16StandardUserStateTypes\"\x97\x01\n\x04\x45num\x12%\n\x03\x42\x41G\x10\x00\x1a\x1c\xa2\xb4\xfa\xc2\x05\x16\x62\x65\x61m:user_state:bag:v1\x12/\n\x08MULTIMAP\x10\x01\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:user_state:multimap:v1\x12\x37\n\x0cORDERED_LIST\x10\x02\x1a%\xa2\xb4\xfa\xc2\x05\x1f\x62\x65\x61m:user_state:ordered_list:v1\"\xe0\x01\n\x0bPCollection\x12\x13\n\x0bunique_name\x18\x01 \x01(\t\x12\x10\n\x08\x63oder_id\x18\x02 \x01(\t\x12\x45\n\nis_bounded\x18\x03 \x01(\x0e\x32\x31.org.apache.beam.model.pipeline.v1.IsBounded.Enum\x12\x1d\n\x15windowing_strategy_id\x18\x04 \x01(\t\x12\x44\n\x0c\x64isplay_data\x18\x05 \x03(\x0b\x32..org.apache.beam.model.pipeline.v1.DisplayData\"\xc2\x06\n\x0cParDoPayload\x12>\n\x05\x64o_fn\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12T\n\x0bside_inputs\x18\x03 \x03(\x0b\x32?.org.apache.beam.model.pipeline.v1.ParDoPayload.SideInputsEntry\x12T\n\x0bstate_specs\x18\x04 \x03(\x0b\x32?.org.apache.beam.model.pipeline.v1.ParDoPayload.StateSpecsEntry\x12\x61\n\x12timer_family_specs\x18\t \x03(\x0b\x32\x45.org.apache.beam.model.pipeline.v1.ParDoPayload.TimerFamilySpecsEntry\x12\x1c\n\x14restriction_coder_id\x18\x07 \x01(\t\x12\x1d\n\x15requests_finalization\x18\x08 \x01(\x08\x12\"\n\x1arequires_time_sorted_input\x18\n \x01(\x08\x12\x1d\n\x15requires_stable_input\x18\x0b \x01(\x08\x12.\n&on_window_expiration_timer_family_spec\x18\x0c \x01(\t\x1a_\n\x0fSideInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.SideInput:\x02\x38\x01\x1a_\n\x0fStateSpecsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.StateSpec:\x02\x38\x01\x1ak\n\x15TimerFamilySpecsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x41\n\x05value\x18\x02 \x01(\x0b\x32\x32.org.apache.beam.model.pipeline.v1.TimerFamilySpec:\x02\x38\x01J\x04\x08\x06\x10\x07\"\xfa\x04\n\tStateSpec\x12]\n\x16read_modify_write_spec\x18\x01 \x01(\x0b\x32;.org.apache.beam.model.pipeline.v1.ReadModifyWriteStateSpecH\x00\x12\x43\n\x08\x62\x61g_spec\x18\x02 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.BagStateSpecH\x00\x12O\n\x0e\x63ombining_spec\x18\x03 \x01(\x0b\x32\x35.org.apache.beam.model.pipeline.v1.CombiningStateSpecH\x00\x12\x43\n\x08map_spec\x18\x04 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.MapStateSpecH\x00\x12\x43\n\x08set_spec\x18\x05 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.SetStateSpecH\x00\x12T\n\x11ordered_list_spec\x18\x06 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.OrderedListStateSpecH\x00\x12M\n\rmultimap_spec\x18\x08 \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.MultimapStateSpecH\x00\x12\x41\n\x08protocol\x18\x07 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpecB\x06\n\x04spec\",\n\x18ReadModifyWriteStateSpec\x12\x10\n\x08\x63oder_id\x18\x01 \x01(\t\"(\n\x0c\x42\x61gStateSpec\x12\x18\n\x10\x65lement_coder_id\x18\x01 \x01(\t\"0\n\x14OrderedListStateSpec\x12\x18\n\x10\x65lement_coder_id\x18\x01 \x01(\t\"w\n\x12\x43ombiningStateSpec\x12\x1c\n\x14\x61\x63\x63umulator_coder_id\x18\x01 \x01(\t\x12\x43\n\ncombine_fn\x18\x02 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\"<\n\x0cMapStateSpec\x12\x14\n\x0ckey_coder_id\x18\x01 \x01(\t\x12\x16\n\x0evalue_coder_id\x18\x02 \x01(\t\"A\n\x11MultimapStateSpec\x12\x14\n\x0ckey_coder_id\x18\x01 \x01(\t\x12\x16\n\x0evalue_coder_id\x18\x02 \x01(\t\"(\n\x0cSetStateSpec\x12\x18\n\x10\x65lement_coder_id\x18\x01 \x01(\t\"y\n\x0fTimerFamilySpec\x12G\n\x0btime_domain\x18\x01 \x01(\x0e\x32\x32.org.apache.beam.model.pipeline.v1.TimeDomain.Enum\x12\x1d\n\x15timer_family_coder_id\x18\x02 \x01(\t\"@\n\tIsBounded\"3\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\r\n\tUNBOUNDED\x10\x01\x12\x0b\n\x07\x42OUNDED\x10\x02\"\x95\x01\n\x0bReadPayload\x12?\n\x06source\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x45\n\nis_bounded\x18\x02 \x01(\x0e\x32\x31.org.apache.beam.model.pipeline.v1.IsBounded.Enum\"W\n\x11WindowIntoPayload\x12\x42\n\twindow_fn\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\"s\n\x0e\x43ombinePayload\x12\x43\n\ncombine_fn\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x1c\n\x14\x61\x63\x63umulator_coder_id\x18\x02 \x01(\t\"\xaf\x06\n\x11TestStreamPayload\x12\x10\n\x08\x63oder_id\x18\x01 \x01(\t\x12J\n\x06\x65vents\x18\x02 \x03(\x0b\x32:.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event\x12I\n\x08\x65ndpoint\x18\x03 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x1a\xae\x04\n\x05\x45vent\x12\x66\n\x0fwatermark_event\x18\x01 \x01(\x0b\x32K.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceWatermarkH\x00\x12q\n\x15processing_time_event\x18\x02 \x01(\x0b\x32P.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceProcessingTimeH\x00\x12_\n\relement_event\x18\x03 \x01(\x0b\x32\x46.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AddElementsH\x00\x1a\x36\n\x10\x41\x64vanceWatermark\x12\x15\n\rnew_watermark\x18\x01 \x01(\x03\x12\x0b\n\x03tag\x18\x02 \x01(\t\x1a\x31\n\x15\x41\x64vanceProcessingTime\x12\x18\n\x10\x61\x64vance_duration\x18\x01 \x01(\x03\x1au\n\x0b\x41\x64\x64\x45lements\x12Y\n\x08\x65lements\x18\x01 \x03(\x0b\x32G.org.apache.beam.model.pipeline.v1.TestStreamPayload.TimestampedElement\x12\x0b\n\x03tag\x18\x03 \x01(\tB\x07\n\x05\x65vent\x1a@\n\x12TimestampedElement\x12\x17\n\x0f\x65ncoded_element\x18\x01 \x01(\x0c\x12\x11\n\ttimestamp\x18\x02 \x01(\x03\"\xab\x03\n\x11WriteFilesPayload\x12=\n\x04sink\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12H\n\x0f\x66ormat_function\x18\x02 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x17\n\x0fwindowed_writes\x18\x03 \x01(\x08\x12\"\n\x1arunner_determined_sharding\x18\x04 \x01(\x08\x12Y\n\x0bside_inputs\x18\x05 \x03(\x0b\x32\x44.org.apache.beam.model.pipeline.v1.WriteFilesPayload.SideInputsEntry\x12\x14\n\x0c\x61uto_sharded\x18\x06 \x01(\x08\x1a_\n\x0fSideInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.SideInput:\x02\x38\x01\"\xcf\x01\n\x11PubSubReadPayload\x12\r\n\x05topic\x18\x01 \x01(\t\x12\x14\n\x0csubscription\x18\x02 \x01(\t\x12\x1b\n\x13timestamp_attribute\x18\x03 \x01(\t\x12\x14\n\x0cid_attribute\x18\x04 \x01(\t\x12\x17\n\x0fwith_attributes\x18\x05 \x01(\x08\x12 \n\x18topic_runtime_overridden\x18\x06 \x01(\t\x12\'\n\x1fsubscription_runtime_overridden\x18\x07 \x01(\t\"x\n\x12PubSubWritePayload\x12\r\n\x05topic\x18\x01 \x01(\t\x12\x1b\n\x13timestamp_attribute\x18\x02 \x01(\t\x12\x14\n\x0cid_attribute\x18\x03 \x01(\t\x12 \n\x18topic_runtime_overridden\x18\x04 \x01(\t\"n\n\x17GroupIntoBatchesPayload\x12\x12\n\nbatch_size\x18\x01 \x01(\x03\x12\x18\n\x10\x62\x61tch_size_bytes\x18\x03 \x01(\x03\x12%\n\x1dmax_buffering_duration_millis\x18\x02 \x01(\x03\"/\n\x13RedistributePayload\x12\x18\n\x10\x61llow_duplicates\x18\x01 \x01(\x08\"c\n\x05\x43oder\x12=\n\x04spec\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x1b\n\x13\x63omponent_coder_ids\x18\x02 \x03(\t\"\x9d\x07\n\x0eStandardCoders\"\x8a\x07\n\x04\x45num\x12$\n\x05\x42YTES\x10\x00\x1a\x19\xa2\xb4\xfa\xc2\x05\x13\x62\x65\x61m:coder:bytes:v1\x12\x30\n\x0bSTRING_UTF8\x10\n\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:coder:string_utf8:v1\x12\x1e\n\x02KV\x10\x01\x1a\x16\xa2\xb4\xfa\xc2\x05\x10\x62\x65\x61m:coder:kv:v1\x12\"\n\x04\x42OOL\x10\x0c\x1a\x18\xa2\xb4\xfa\xc2\x05\x12\x62\x65\x61m:coder:bool:v1\x12&\n\x06VARINT\x10\x02\x1a\x1a\xa2\xb4\xfa\xc2\x05\x14\x62\x65\x61m:coder:varint:v1\x12&\n\x06\x44OUBLE\x10\x0b\x1a\x1a\xa2\xb4\xfa\xc2\x05\x14\x62\x65\x61m:coder:double:v1\x12*\n\x08ITERABLE\x10\x03\x1a\x1c\xa2\xb4\xfa\xc2\x05\x16\x62\x65\x61m:coder:iterable:v1\x12$\n\x05TIMER\x10\x04\x1a\x19\xa2\xb4\xfa\xc2\x05\x13\x62\x65\x61m:coder:timer:v1\x12\x38\n\x0fINTERVAL_WINDOW\x10\x05\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:coder:interval_window:v1\x12\x34\n\rLENGTH_PREFIX\x10\x06\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:coder:length_prefix:v1\x12\x34\n\rGLOBAL_WINDOW\x10\x07\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:coder:global_window:v1\x12\x36\n\x0eWINDOWED_VALUE\x10\x08\x1a\"\xa2\xb4\xfa\xc2\x05\x1c\x62\x65\x61m:coder:windowed_value:v1\x12\x42\n\x14PARAM_WINDOWED_VALUE\x10\x0e\x1a(\xa2\xb4\xfa\xc2\x05\"beam:coder:param_windowed_value:v1\x12\x44\n\x15STATE_BACKED_ITERABLE\x10\t\x1a)\xa2\xb4\xfa\xc2\x05#beam:coder:state_backed_iterable:v1\x12\x34\n\rCUSTOM_WINDOW\x10\x10\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:coder:custom_window:v1\x12 \n\x03ROW\x10\r\x1a\x17\xa2\xb4\xfa\xc2\x05\x11\x62\x65\x61m:coder:row:v1\x12&\n\x06SCHEMA\x10\x12\x1a\x1a\xa2\xb4\xfa\xc2\x05\x14\x62\x65\x61m:coder:schema:v1\x12\x30\n\x0bSHARDED_KEY\x10\x0f\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:coder:sharded_key:v1\x12*\n\x08NULLABLE\x10\x11\x1a\x1c\xa2\xb4\xfa\xc2\x05\x16\x62\x65\x61m:coder:nullable:v1\"\x8c\x05\n\x11WindowingStrategy\x12\x42\n\twindow_fn\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12I\n\x0cmerge_status\x18\x02 \x01(\x0e\x32\x33.org.apache.beam.model.pipeline.v1.MergeStatus.Enum\x12\x17\n\x0fwindow_coder_id\x18\x03 \x01(\t\x12;\n\x07trigger\x18\x04 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x12S\n\x11\x61\x63\x63umulation_mode\x18\x05 \x01(\x0e\x32\x38.org.apache.beam.model.pipeline.v1.AccumulationMode.Enum\x12G\n\x0boutput_time\x18\x06 \x01(\x0e\x32\x32.org.apache.beam.model.pipeline.v1.OutputTime.Enum\x12Q\n\x10\x63losing_behavior\x18\x07 \x01(\x0e\x32\x37.org.apache.beam.model.pipeline.v1.ClosingBehavior.Enum\x12\x18\n\x10\x61llowed_lateness\x18\x08 \x01(\x03\x12P\n\x10on_time_behavior\x18\t \x01(\x0e\x32\x36.org.apache.beam.model.pipeline.v1.OnTimeBehavior.Enum\x12\x1d\n\x15\x61ssigns_to_one_window\x18\n \x01(\x08\x12\x16\n\x0e\x65nvironment_id\x18\x0b \x01(\t\"\\\n\x0bMergeStatus\"M\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0f\n\x0bNON_MERGING\x10\x01\x12\x0f\n\x0bNEEDS_MERGE\x10\x02\x12\x12\n\x0e\x41LREADY_MERGED\x10\x03\"]\n\x10\x41\x63\x63umulationMode\"I\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0e\n\nDISCARDING\x10\x01\x12\x10\n\x0c\x41\x43\x43UMULATING\x10\x02\x12\x0e\n\nRETRACTING\x10\x03\"Q\n\x0f\x43losingBehavior\">\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0f\n\x0b\x45MIT_ALWAYS\x10\x01\x12\x14\n\x10\x45MIT_IF_NONEMPTY\x10\x02\"P\n\x0eOnTimeBehavior\">\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0f\n\x0b\x46IRE_ALWAYS\x10\x01\x12\x14\n\x10\x46IRE_IF_NONEMPTY\x10\x02\"b\n\nOutputTime\"T\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x11\n\rEND_OF_WINDOW\x10\x01\x12\x12\n\x0eLATEST_IN_PANE\x10\x02\x12\x14\n\x10\x45\x41RLIEST_IN_PANE\x10\x03\"n\n\nTimeDomain\"`\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0e\n\nEVENT_TIME\x10\x01\x12\x13\n\x0fPROCESSING_TIME\x10\x02\"\x04\x08\x03\x10\x03*\x1cSYNCHRONIZED_PROCESSING_TIME\"\x82\x0e\n\x07Trigger\x12H\n\tafter_all\x18\x01 \x01(\x0b\x32\x33.org.apache.beam.model.pipeline.v1.Trigger.AfterAllH\x00\x12H\n\tafter_any\x18\x02 \x01(\x0b\x32\x33.org.apache.beam.model.pipeline.v1.Trigger.AfterAnyH\x00\x12J\n\nafter_each\x18\x03 \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.Trigger.AfterEachH\x00\x12Z\n\x13\x61\x66ter_end_of_window\x18\x04 \x01(\x0b\x32;.org.apache.beam.model.pipeline.v1.Trigger.AfterEndOfWindowH\x00\x12_\n\x15\x61\x66ter_processing_time\x18\x05 \x01(\x0b\x32>.org.apache.beam.model.pipeline.v1.Trigger.AfterProcessingTimeH\x00\x12x\n\"after_synchronized_processing_time\x18\x06 \x01(\x0b\x32J.org.apache.beam.model.pipeline.v1.Trigger.AfterSynchronizedProcessingTimeH\x00\x12\x43\n\x06\x61lways\x18\x0c \x01(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.Trigger.AlwaysH\x00\x12\x45\n\x07\x64\x65\x66\x61ult\x18\x07 \x01(\x0b\x32\x32.org.apache.beam.model.pipeline.v1.Trigger.DefaultH\x00\x12P\n\relement_count\x18\x08 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.Trigger.ElementCountH\x00\x12\x41\n\x05never\x18\t \x01(\x0b\x32\x30.org.apache.beam.model.pipeline.v1.Trigger.NeverH\x00\x12J\n\nor_finally\x18\n \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.Trigger.OrFinallyH\x00\x12\x43\n\x06repeat\x18\x0b \x01(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.Trigger.RepeatH\x00\x1aK\n\x08\x41\x66terAll\x12?\n\x0bsubtriggers\x18\x01 \x03(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1aK\n\x08\x41\x66terAny\x12?\n\x0bsubtriggers\x18\x01 \x03(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1aL\n\tAfterEach\x12?\n\x0bsubtriggers\x18\x01 \x03(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1a\x97\x01\n\x10\x41\x66terEndOfWindow\x12\x41\n\rearly_firings\x18\x01 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x12@\n\x0clate_firings\x18\x02 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1aj\n\x13\x41\x66terProcessingTime\x12S\n\x14timestamp_transforms\x18\x01 \x03(\x0b\x32\x35.org.apache.beam.model.pipeline.v1.TimestampTransform\x1a!\n\x1f\x41\x66terSynchronizedProcessingTime\x1a\t\n\x07\x44\x65\x66\x61ult\x1a%\n\x0c\x45lementCount\x12\x15\n\relement_count\x18\x01 \x01(\x05\x1a\x07\n\x05Never\x1a\x08\n\x06\x41lways\x1a\x82\x01\n\tOrFinally\x12\x38\n\x04main\x18\x01 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x12;\n\x07\x66inally\x18\x02 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1aH\n\x06Repeat\x12>\n\nsubtrigger\x18\x01 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.TriggerB\t\n\x07trigger\"\x96\x02\n\x12TimestampTransform\x12L\n\x05\x64\x65lay\x18\x01 \x01(\x0b\x32;.org.apache.beam.model.pipeline.v1.TimestampTransform.DelayH\x00\x12Q\n\x08\x61lign_to\x18\x02 \x01(\x0b\x32=.org.apache.beam.model.pipeline.v1.TimestampTransform.AlignToH\x00\x1a\x1d\n\x05\x44\x65lay\x12\x14\n\x0c\x64\x65lay_millis\x18\x01 \x01(\x03\x1a)\n\x07\x41lignTo\x12\x0e\n\x06period\x18\x03 \x01(\x03\x12\x0e\n\x06offset\x18\x04 \x01(\x03\x42\x15\n\x13timestamp_transform\"\xe2\x01\n\tSideInput\x12G\n\x0e\x61\x63\x63\x65ss_pattern\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12@\n\x07view_fn\x18\x02 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12J\n\x11window_mapping_fn\x18\x03 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\"\x89\x04\n\x11StandardArtifacts\"\x9f\x02\n\x05Types\x12*\n\x04\x46ILE\x10\x00\x1a \xa2\xb4\xfa\xc2\x05\x1a\x62\x65\x61m:artifact:type:file:v1\x12(\n\x03URL\x10\x01\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:artifact:type:url:v1\x12\x32\n\x08\x45MBEDDED\x10\x02\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:artifact:type:embedded:v1\x12*\n\x04PYPI\x10\x03\x1a \xa2\xb4\xfa\xc2\x05\x1a\x62\x65\x61m:artifact:type:pypi:v1\x12,\n\x05MAVEN\x10\x04\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:artifact:type:maven:v1\x12\x32\n\x08\x44\x45\x46\x45RRED\x10\x05\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:artifact:type:deferred:v1\"\xd1\x01\n\x05Roles\x12\x36\n\nSTAGING_TO\x10\x00\x1a&\xa2\xb4\xfa\xc2\x05 beam:artifact:role:staging_to:v1\x12L\n\x15PIP_REQUIREMENTS_FILE\x10\x01\x1a\x31\xa2\xb4\xfa\xc2\x05+beam:artifact:role:pip_requirements_file:v1\x12\x42\n\x10GO_WORKER_BINARY\x10\x02\x1a,\xa2\xb4\xfa\xc2\x05&beam:artifact:role:go_worker_binary:v1\"3\n\x13\x41rtifactFilePayload\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0e\n\x06sha256\x18\x02 \x01(\t\"1\n\x12\x41rtifactUrlPayload\x12\x0b\n\x03url\x18\x01 \x01(\t\x12\x0e\n\x06sha256\x18\x02 \x01(\t\"#\n\x13\x45mbeddedFilePayload\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"3\n\x0bPyPIPayload\x12\x13\n\x0b\x61rtifact_id\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\"8\n\x0cMavenPayload\x12\x10\n\x08\x61rtifact\x18\x01 \x01(\t\x12\x16\n\x0erepository_url\x18\x02 \x01(\t\"4\n\x17\x44\x65\x66\x65rredArtifactPayload\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"3\n\x1c\x41rtifactStagingToRolePayload\x12\x13\n\x0bstaged_name\x18\x01 \x01(\t\"e\n\x13\x41rtifactInformation\x12\x10\n\x08type_urn\x18\x01 \x01(\t\x12\x14\n\x0ctype_payload\x18\x02 \x01(\x0c\x12\x10\n\x08role_urn\x18\x03 \x01(\t\x12\x14\n\x0crole_payload\x18\x04 \x01(\x0c\"\xec\x02\n\x0b\x45nvironment\x12\x0b\n\x03urn\x18\x02 \x01(\t\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\x12\x44\n\x0c\x64isplay_data\x18\x04 \x03(\x0b\x32..org.apache.beam.model.pipeline.v1.DisplayData\x12\x14\n\x0c\x63\x61pabilities\x18\x05 \x03(\t\x12L\n\x0c\x64\x65pendencies\x18\x06 \x03(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.ArtifactInformation\x12Y\n\x0eresource_hints\x18\x07 \x03(\x0b\x32\x41.org.apache.beam.model.pipeline.v1.Environment.ResourceHintsEntry\x1a\x34\n\x12ResourceHintsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01J\x04\x08\x01\x10\x02\"\xeb\x01\n\x14StandardEnvironments\"\xd2\x01\n\x0c\x45nvironments\x12$\n\x06\x44OCKER\x10\x00\x1a\x18\xa2\xb4\xfa\xc2\x05\x12\x62\x65\x61m:env:docker:v1\x12&\n\x07PROCESS\x10\x01\x1a\x19\xa2\xb4\xfa\xc2\x05\x13\x62\x65\x61m:env:process:v1\x12(\n\x08\x45XTERNAL\x10\x02\x1a\x1a\xa2\xb4\xfa\xc2\x05\x14\x62\x65\x61m:env:external:v1\x12&\n\x07\x44\x45\x46\x41ULT\x10\x03\x1a\x19\xa2\xb4\xfa\xc2\x05\x13\x62\x65\x61m:env:default:v1\x12\"\n\x05\x41NYOF\x10\x04\x1a\x17\xa2\xb4\xfa\xc2\x05\x11\x62\x65\x61m:env:anyof:v1\"(\n\rDockerPayload\x12\x17\n\x0f\x63ontainer_image\x18\x01 \x01(\t\"\xb0\x01\n\x0eProcessPayload\x12\n\n\x02os\x18\x01 \x01(\t\x12\x0c\n\x04\x61rch\x18\x02 \x01(\t\x12\x0f\n\x07\x63ommand\x18\x03 \x01(\t\x12G\n\x03\x65nv\x18\x04 \x03(\x0b\x32:.org.apache.beam.model.pipeline.v1.ProcessPayload.EnvEntry\x1a*\n\x08\x45nvEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xdb\x01\n\x0f\x45xternalPayload\x12I\n\x08\x65ndpoint\x18\x01 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12N\n\x06params\x18\x02 \x03(\x0b\x32>.org.apache.beam.model.pipeline.v1.ExternalPayload.ParamsEntry\x1a-\n\x0bParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"_\n\x17\x41nyOfEnvironmentPayload\x12\x44\n\x0c\x65nvironments\x18\x01 \x03(\x0b\x32..org.apache.beam.model.pipeline.v1.Environment\"\xac\x07\n\x11StandardProtocols\"\x96\x07\n\x04\x45num\x12H\n\x19LEGACY_PROGRESS_REPORTING\x10\x00\x1a)\xa2\xb4\xfa\xc2\x05#beam:protocol:progress_reporting:v0\x12\x41\n\x12PROGRESS_REPORTING\x10\x01\x1a)\xa2\xb4\xfa\xc2\x05#beam:protocol:progress_reporting:v1\x12\x37\n\rWORKER_STATUS\x10\x02\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:protocol:worker_status:v1\x12U\n\x1cMULTI_CORE_BUNDLE_PROCESSING\x10\x03\x1a\x33\xa2\xb4\xfa\xc2\x05-beam:protocol:multi_core_bundle_processing:v1\x12;\n\x0fSIBLING_WORKERS\x10\x05\x1a&\xa2\xb4\xfa\xc2\x05 beam:protocol:sibling_workers:v1\x12M\n\x18HARNESS_MONITORING_INFOS\x10\x04\x1a/\xa2\xb4\xfa\xc2\x05)beam:protocol:harness_monitoring_infos:v1\x12\x61\n\"CONTROL_REQUEST_ELEMENTS_EMBEDDING\x10\x06\x1a\x39\xa2\xb4\xfa\xc2\x05\x33\x62\x65\x61m:protocol:control_request_elements_embedding:v1\x12\x37\n\rSTATE_CACHING\x10\x07\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:protocol:state_caching:v1\x12\x37\n\rDATA_SAMPLING\x10\x08\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:protocol:data_sampling:v1\x12S\n\x1bSDK_CONSUMING_RECEIVED_DATA\x10\t\x1a\x32\xa2\xb4\xfa\xc2\x05,beam:protocol:sdk_consuming_received_data:v1\x12\x41\n\x12ORDERED_LIST_STATE\x10\n\x1a)\xa2\xb4\xfa\xc2\x05#beam:protocol:ordered_list_state:v1\x12=\n\x10\x45LEMENT_METADATA\x10\x0b\x1a\'\xa2\xb4\xfa\xc2\x05!beam:protocol:element_metadata:v1\x12\x39\n\x0eMULTIMAP_STATE\x10\x0c\x1a%\xa2\xb4\xfa\xc2\x05\x1f\x62\x65\x61m:protocol:multimap_state:v1\"\xb5\x02\n\x17StandardRunnerProtocols\"\x99\x02\n\x04\x45num\x12O\n\x19MONITORING_INFO_SHORT_IDS\x10\x00\x1a\x30\xa2\xb4\xfa\xc2\x05*beam:protocol:monitoring_info_short_ids:v1\x12\x63\n#CONTROL_RESPONSE_ELEMENTS_EMBEDDING\x10\x06\x1a:\xa2\xb4\xfa\xc2\x05\x34\x62\x65\x61m:protocol:control_response_elements_embedding:v1\x12[\n\x1fMULTIMAP_KEYS_VALUES_SIDE_INPUT\x10\x07\x1a\x36\xa2\xb4\xfa\xc2\x05\x30\x62\x65\x61m:protocol:multimap_keys_values_side_input:v1\"\xff\x03\n\x14StandardRequirements\"\xe6\x03\n\x04\x45num\x12J\n\x1cREQUIRES_STATEFUL_PROCESSING\x10\x00\x1a(\xa2\xb4\xfa\xc2\x05\"beam:requirement:pardo:stateful:v1\x12N\n\x1cREQUIRES_BUNDLE_FINALIZATION\x10\x01\x1a,\xa2\xb4\xfa\xc2\x05&beam:requirement:pardo:finalization:v1\x12G\n\x15REQUIRES_STABLE_INPUT\x10\x02\x1a,\xa2\xb4\xfa\xc2\x05&beam:requirement:pardo:stable_input:v1\x12Q\n\x1aREQUIRES_TIME_SORTED_INPUT\x10\x03\x1a\x31\xa2\xb4\xfa\xc2\x05+beam:requirement:pardo:time_sorted_input:v1\x12M\n\x18REQUIRES_SPLITTABLE_DOFN\x10\x04\x1a/\xa2\xb4\xfa\xc2\x05)beam:requirement:pardo:splittable_dofn:v1\x12W\n\x1dREQUIRES_ON_WINDOW_EXPIRATION\x10\x05\x1a\x34\xa2\xb4\xfa\xc2\x05.beam:requirement:pardo:on_window_expiration:v1\",\n\x0c\x46unctionSpec\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\"W\n\x13StandardDisplayData\"@\n\x0b\x44isplayData\x12\x31\n\x08LABELLED\x10\x00\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:display_data:labelled:v1\"\xa4\x01\n\x0fLabelledPayload\x12\r\n\x05label\x18\x01 \x01(\t\x12\x16\n\x0cstring_value\x18\x02 \x01(\tH\x00\x12\x14\n\nbool_value\x18\x03 \x01(\x08H\x00\x12\x16\n\x0c\x64ouble_value\x18\x04 \x01(\x01H\x00\x12\x13\n\tint_value\x18\x05 \x01(\x03H\x00\x12\x0b\n\x03key\x18\x06 \x01(\t\x12\x11\n\tnamespace\x18\x07 \x01(\tB\x07\n\x05value\"+\n\x0b\x44isplayData\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\"\xc1\x06\n\x15MessageWithComponents\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12\x39\n\x05\x63oder\x18\x02 \x01(\x0b\x32(.org.apache.beam.model.pipeline.v1.CoderH\x00\x12L\n\x0f\x63ombine_payload\x18\x03 \x01(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.CombinePayloadH\x00\x12H\n\rfunction_spec\x18\x04 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpecH\x00\x12I\n\x0epar_do_payload\x18\x06 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.ParDoPayloadH\x00\x12\x43\n\nptransform\x18\x07 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransformH\x00\x12\x45\n\x0bpcollection\x18\x08 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.PCollectionH\x00\x12\x46\n\x0cread_payload\x18\t \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.ReadPayloadH\x00\x12\x42\n\nside_input\x18\x0b \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.SideInputH\x00\x12S\n\x13window_into_payload\x18\x0c \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.WindowIntoPayloadH\x00\x12R\n\x12windowing_strategy\x18\r \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.WindowingStrategyH\x00\x42\x06\n\x04root\"\xb9\x08\n\x16\x45xecutableStagePayload\x12\x43\n\x0b\x65nvironment\x18\x01 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.Environment\x12g\n\x13wire_coder_settings\x18\t \x03(\x0b\x32J.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.WireCoderSetting\x12\r\n\x05input\x18\x02 \x01(\t\x12Z\n\x0bside_inputs\x18\x03 \x03(\x0b\x32\x45.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.SideInputId\x12\x12\n\ntransforms\x18\x04 \x03(\t\x12\x0f\n\x07outputs\x18\x05 \x03(\t\x12\x41\n\ncomponents\x18\x06 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12Z\n\x0buser_states\x18\x07 \x03(\x0b\x32\x45.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.UserStateId\x12Q\n\x06timers\x18\x08 \x03(\x0b\x32\x41.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerId\x12^\n\rtimerFamilies\x18\n \x03(\x0b\x32G.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerFamilyId\x1a\x37\n\x0bSideInputId\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x12\n\nlocal_name\x18\x02 \x01(\t\x1a\x37\n\x0bUserStateId\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x12\n\nlocal_name\x18\x02 \x01(\t\x1a\x33\n\x07TimerId\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x12\n\nlocal_name\x18\x02 \x01(\t\x1a\x39\n\rTimerFamilyId\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x12\n\nlocal_name\x18\x02 \x01(\t\x1a\xac\x01\n\x10WireCoderSetting\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\x12\x1c\n\x12input_or_output_id\x18\x03 \x01(\tH\x00\x12R\n\x05timer\x18\x04 \x01(\x0b\x32\x41.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerIdH\x00\x42\x08\n\x06target\"\x9c\x02\n\x15StandardResourceHints\"\x82\x02\n\x04\x45num\x12\x34\n\x0b\x41\x43\x43\x45LERATOR\x10\x00\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:resources:accelerator:v1\x12\x38\n\rMIN_RAM_BYTES\x10\x01\x1a%\xa2\xb4\xfa\xc2\x05\x1f\x62\x65\x61m:resources:min_ram_bytes:v1\x12\x30\n\tCPU_COUNT\x10\x02\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:resources:cpu_count:v1\x12X\n\x1dMAX_ACTIVE_BUNDLES_PER_WORKER\x10\x03\x1a\x35\xa2\xb4\xfa\xc2\x05/beam:resources:max_active_bundles_per_worker:v1:6\n\x08\x62\x65\x61m_urn\x12!.google.protobuf.EnumValueOptions\x18\xc4\xa6\xafX \x01(\t:;\n\rbeam_constant\x12!.google.protobuf.EnumValueOptions\x18\xc5\xa6\xafX \x01(\tBx\n!org.apache.beam.model.pipeline.v1B\tRunnerApiZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1b\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n!org.apache.beam.model.pipeline.v1B\tRunnerApiZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1'
+  _globals['_BEAMCONSTANTS_CONSTANTS'].values_by_name["MIN_TIMESTAMP_MILLIS"]._loaded_options = None
+  _globals['_BEAMCONSTANTS_CONSTANTS'].values_by_name["MIN_TIMESTAMP_MILLIS"]._serialized_options = b'\252\264\372\302\005\021-9223372036854775'
+  _globals['_BEAMCONSTANTS_CONSTANTS'].values_by_name["MAX_TIMESTAMP_MILLIS"]._loaded_options = None
+  _globals['_BEAMCONSTANTS_CONSTANTS'].values_by_name["MAX_TIMESTAMP_MILLIS"]._serialized_options = b'\252\264\372\302\005\0209223372036854775'
+  _globals['_BEAMCONSTANTS_CONSTANTS'].values_by_name["GLOBAL_WINDOW_MAX_TIMESTAMP_MILLIS"]._loaded_options = None
+  _globals['_BEAMCONSTANTS_CONSTANTS'].values_by_name["GLOBAL_WINDOW_MAX_TIMESTAMP_MILLIS"]._serialized_options = b'\252\264\372\302\005\0209223371950454775'
+  _globals['_COMPONENTS_TRANSFORMSENTRY']._loaded_options = None
+  _globals['_COMPONENTS_TRANSFORMSENTRY']._serialized_options = b'8\001'
+  _globals['_COMPONENTS_PCOLLECTIONSENTRY']._loaded_options = None
+  _globals['_COMPONENTS_PCOLLECTIONSENTRY']._serialized_options = b'8\001'
+  _globals['_COMPONENTS_WINDOWINGSTRATEGIESENTRY']._loaded_options = None
+  _globals['_COMPONENTS_WINDOWINGSTRATEGIESENTRY']._serialized_options = b'8\001'
+  _globals['_COMPONENTS_CODERSENTRY']._loaded_options = None
+  _globals['_COMPONENTS_CODERSENTRY']._serialized_options = b'8\001'
+  _globals['_COMPONENTS_ENVIRONMENTSENTRY']._loaded_options = None
+  _globals['_COMPONENTS_ENVIRONMENTSENTRY']._serialized_options = b'8\001'
+  _globals['_PTRANSFORM_INPUTSENTRY']._loaded_options = None
+  _globals['_PTRANSFORM_INPUTSENTRY']._serialized_options = b'8\001'
+  _globals['_PTRANSFORM_OUTPUTSENTRY']._loaded_options = None
+  _globals['_PTRANSFORM_OUTPUTSENTRY']._serialized_options = b'8\001'
+  _globals['_PTRANSFORM_ANNOTATIONSENTRY']._loaded_options = None
+  _globals['_PTRANSFORM_ANNOTATIONSENTRY']._serialized_options = b'8\001'
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["PAR_DO"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["PAR_DO"]._serialized_options = b'\242\264\372\302\005\027beam:transform:pardo:v1'
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["FLATTEN"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["FLATTEN"]._serialized_options = b'\242\264\372\302\005\031beam:transform:flatten:v1'
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["GROUP_BY_KEY"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["GROUP_BY_KEY"]._serialized_options = b'\242\264\372\302\005\036beam:transform:group_by_key:v1'
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["IMPULSE"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["IMPULSE"]._serialized_options = b'\242\264\372\302\005\031beam:transform:impulse:v1'
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["ASSIGN_WINDOWS"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["ASSIGN_WINDOWS"]._serialized_options = b'\242\264\372\302\005\035beam:transform:window_into:v1'
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["TEST_STREAM"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["TEST_STREAM"]._serialized_options = b'\242\264\372\302\005\034beam:transform:teststream:v1'
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["MAP_WINDOWS"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["MAP_WINDOWS"]._serialized_options = b'\242\264\372\302\005\035beam:transform:map_windows:v1'
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["MERGE_WINDOWS"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["MERGE_WINDOWS"]._serialized_options = b'\242\264\372\302\005\037beam:transform:merge_windows:v1'
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["TO_STRING"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES'].values_by_name["TO_STRING"]._serialized_options = b'\242\264\372\302\005\033beam:transform:to_string:v1'
+  _globals['_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES'].values_by_name["READ"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES'].values_by_name["READ"]._serialized_options = b'\242\264\372\302\005\026beam:transform:read:v1'
+  _globals['_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES'].values_by_name["CREATE_VIEW"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES'].values_by_name["CREATE_VIEW"]._serialized_options = b'\242\264\372\302\005\035beam:transform:create_view:v1'
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["COMBINE_PER_KEY"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["COMBINE_PER_KEY"]._serialized_options = b'\242\264\372\302\005!beam:transform:combine_per_key:v1'
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["COMBINE_GLOBALLY"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["COMBINE_GLOBALLY"]._serialized_options = b'\242\264\372\302\005\"beam:transform:combine_globally:v1'
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["RESHUFFLE"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["RESHUFFLE"]._serialized_options = b'\242\264\372\302\005\033beam:transform:reshuffle:v1'
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["WRITE_FILES"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["WRITE_FILES"]._serialized_options = b'\242\264\372\302\005\035beam:transform:write_files:v1'
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["PUBSUB_READ"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["PUBSUB_READ"]._serialized_options = b'\242\264\372\302\005\035beam:transform:pubsub_read:v1'
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["PUBSUB_WRITE"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["PUBSUB_WRITE"]._serialized_options = b'\242\264\372\302\005\036beam:transform:pubsub_write:v1'
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["PUBSUB_WRITE_V2"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["PUBSUB_WRITE_V2"]._serialized_options = b'\242\264\372\302\005\036beam:transform:pubsub_write:v2'
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["GROUP_INTO_BATCHES_WITH_SHARDED_KEY"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["GROUP_INTO_BATCHES_WITH_SHARDED_KEY"]._serialized_options = b'\242\264\372\302\0055beam:transform:group_into_batches_with_sharded_key:v1'
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["REDISTRIBUTE_BY_KEY"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["REDISTRIBUTE_BY_KEY"]._serialized_options = b'\242\264\372\302\005%beam:transform:redistribute_by_key:v1'
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["REDISTRIBUTE_ARBITRARILY"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES'].values_by_name["REDISTRIBUTE_ARBITRARILY"]._serialized_options = b'\242\264\372\302\005*beam:transform:redistribute_arbitrarily:v1'
+  _globals['_STANDARDPTRANSFORMS_COMBINECOMPONENTS'].values_by_name["COMBINE_PER_KEY_PRECOMBINE"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMBINECOMPONENTS'].values_by_name["COMBINE_PER_KEY_PRECOMBINE"]._serialized_options = b'\242\264\372\302\005,beam:transform:combine_per_key_precombine:v1'
+  _globals['_STANDARDPTRANSFORMS_COMBINECOMPONENTS'].values_by_name["COMBINE_PER_KEY_MERGE_ACCUMULATORS"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMBINECOMPONENTS'].values_by_name["COMBINE_PER_KEY_MERGE_ACCUMULATORS"]._serialized_options = b'\242\264\372\302\0054beam:transform:combine_per_key_merge_accumulators:v1'
+  _globals['_STANDARDPTRANSFORMS_COMBINECOMPONENTS'].values_by_name["COMBINE_PER_KEY_EXTRACT_OUTPUTS"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMBINECOMPONENTS'].values_by_name["COMBINE_PER_KEY_EXTRACT_OUTPUTS"]._serialized_options = b'\242\264\372\302\0051beam:transform:combine_per_key_extract_outputs:v1'
+  _globals['_STANDARDPTRANSFORMS_COMBINECOMPONENTS'].values_by_name["COMBINE_GROUPED_VALUES"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMBINECOMPONENTS'].values_by_name["COMBINE_GROUPED_VALUES"]._serialized_options = b'\242\264\372\302\005(beam:transform:combine_grouped_values:v1'
+  _globals['_STANDARDPTRANSFORMS_COMBINECOMPONENTS'].values_by_name["COMBINE_PER_KEY_CONVERT_TO_ACCUMULATORS"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_COMBINECOMPONENTS'].values_by_name["COMBINE_PER_KEY_CONVERT_TO_ACCUMULATORS"]._serialized_options = b'\242\264\372\302\0059beam:transform:combine_per_key_convert_to_accumulators:v1'
+  _globals['_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS'].values_by_name["PAIR_WITH_RESTRICTION"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS'].values_by_name["PAIR_WITH_RESTRICTION"]._serialized_options = b'\242\264\372\302\005+beam:transform:sdf_pair_with_restriction:v1'
+  _globals['_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS'].values_by_name["SPLIT_AND_SIZE_RESTRICTIONS"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS'].values_by_name["SPLIT_AND_SIZE_RESTRICTIONS"]._serialized_options = b'\242\264\372\302\0051beam:transform:sdf_split_and_size_restrictions:v1'
+  _globals['_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS'].values_by_name["PROCESS_SIZED_ELEMENTS_AND_RESTRICTIONS"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS'].values_by_name["PROCESS_SIZED_ELEMENTS_AND_RESTRICTIONS"]._serialized_options = b'\242\264\372\302\005<beam:transform:sdf_process_sized_element_and_restrictions:v1'
+  _globals['_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS'].values_by_name["TRUNCATE_SIZED_RESTRICTION"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS'].values_by_name["TRUNCATE_SIZED_RESTRICTION"]._serialized_options = b'\242\264\372\302\0051beam:transform:sdf_truncate_sized_restrictions:v1'
+  _globals['_STANDARDPTRANSFORMS_GROUPINTOBATCHESCOMPONENTS'].values_by_name["GROUP_INTO_BATCHES"]._loaded_options = None
+  _globals['_STANDARDPTRANSFORMS_GROUPINTOBATCHESCOMPONENTS'].values_by_name["GROUP_INTO_BATCHES"]._serialized_options = b'\242\264\372\302\005$beam:transform:group_into_batches:v1'
+  _globals['_STANDARDSIDEINPUTTYPES_ENUM'].values_by_name["ITERABLE"]._loaded_options = None
+  _globals['_STANDARDSIDEINPUTTYPES_ENUM'].values_by_name["ITERABLE"]._serialized_options = b'\242\264\372\302\005\033beam:side_input:iterable:v1'
+  _globals['_STANDARDSIDEINPUTTYPES_ENUM'].values_by_name["MULTIMAP"]._loaded_options = None
+  _globals['_STANDARDSIDEINPUTTYPES_ENUM'].values_by_name["MULTIMAP"]._serialized_options = b'\242\264\372\302\005\033beam:side_input:multimap:v1'
+  _globals['_STANDARDUSERSTATETYPES_ENUM'].values_by_name["BAG"]._loaded_options = None
+  _globals['_STANDARDUSERSTATETYPES_ENUM'].values_by_name["BAG"]._serialized_options = b'\242\264\372\302\005\026beam:user_state:bag:v1'
+  _globals['_STANDARDUSERSTATETYPES_ENUM'].values_by_name["MULTIMAP"]._loaded_options = None
+  _globals['_STANDARDUSERSTATETYPES_ENUM'].values_by_name["MULTIMAP"]._serialized_options = b'\242\264\372\302\005\033beam:user_state:multimap:v1'
+  _globals['_STANDARDUSERSTATETYPES_ENUM'].values_by_name["ORDERED_LIST"]._loaded_options = None
+  _globals['_STANDARDUSERSTATETYPES_ENUM'].values_by_name["ORDERED_LIST"]._serialized_options = b'\242\264\372\302\005\037beam:user_state:ordered_list:v1'
+  _globals['_PARDOPAYLOAD_SIDEINPUTSENTRY']._loaded_options = None
+  _globals['_PARDOPAYLOAD_SIDEINPUTSENTRY']._serialized_options = b'8\001'
+  _globals['_PARDOPAYLOAD_STATESPECSENTRY']._loaded_options = None
+  _globals['_PARDOPAYLOAD_STATESPECSENTRY']._serialized_options = b'8\001'
+  _globals['_PARDOPAYLOAD_TIMERFAMILYSPECSENTRY']._loaded_options = None
+  _globals['_PARDOPAYLOAD_TIMERFAMILYSPECSENTRY']._serialized_options = b'8\001'
+  _globals['_WRITEFILESPAYLOAD_SIDEINPUTSENTRY']._loaded_options = None
+  _globals['_WRITEFILESPAYLOAD_SIDEINPUTSENTRY']._serialized_options = b'8\001'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["BYTES"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["BYTES"]._serialized_options = b'\242\264\372\302\005\023beam:coder:bytes:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["STRING_UTF8"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["STRING_UTF8"]._serialized_options = b'\242\264\372\302\005\031beam:coder:string_utf8:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["KV"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["KV"]._serialized_options = b'\242\264\372\302\005\020beam:coder:kv:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["BOOL"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["BOOL"]._serialized_options = b'\242\264\372\302\005\022beam:coder:bool:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["VARINT"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["VARINT"]._serialized_options = b'\242\264\372\302\005\024beam:coder:varint:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["DOUBLE"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["DOUBLE"]._serialized_options = b'\242\264\372\302\005\024beam:coder:double:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["ITERABLE"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["ITERABLE"]._serialized_options = b'\242\264\372\302\005\026beam:coder:iterable:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["TIMER"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["TIMER"]._serialized_options = b'\242\264\372\302\005\023beam:coder:timer:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["INTERVAL_WINDOW"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["INTERVAL_WINDOW"]._serialized_options = b'\242\264\372\302\005\035beam:coder:interval_window:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["LENGTH_PREFIX"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["LENGTH_PREFIX"]._serialized_options = b'\242\264\372\302\005\033beam:coder:length_prefix:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["GLOBAL_WINDOW"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["GLOBAL_WINDOW"]._serialized_options = b'\242\264\372\302\005\033beam:coder:global_window:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["WINDOWED_VALUE"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["WINDOWED_VALUE"]._serialized_options = b'\242\264\372\302\005\034beam:coder:windowed_value:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["PARAM_WINDOWED_VALUE"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["PARAM_WINDOWED_VALUE"]._serialized_options = b'\242\264\372\302\005\"beam:coder:param_windowed_value:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["STATE_BACKED_ITERABLE"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["STATE_BACKED_ITERABLE"]._serialized_options = b'\242\264\372\302\005#beam:coder:state_backed_iterable:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["CUSTOM_WINDOW"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["CUSTOM_WINDOW"]._serialized_options = b'\242\264\372\302\005\033beam:coder:custom_window:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["ROW"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["ROW"]._serialized_options = b'\242\264\372\302\005\021beam:coder:row:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["SCHEMA"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["SCHEMA"]._serialized_options = b'\242\264\372\302\005\024beam:coder:schema:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["SHARDED_KEY"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["SHARDED_KEY"]._serialized_options = b'\242\264\372\302\005\031beam:coder:sharded_key:v1'
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["NULLABLE"]._loaded_options = None
+  _globals['_STANDARDCODERS_ENUM'].values_by_name["NULLABLE"]._serialized_options = b'\242\264\372\302\005\026beam:coder:nullable:v1'
+  _globals['_STANDARDARTIFACTS_TYPES'].values_by_name["FILE"]._loaded_options = None
+  _globals['_STANDARDARTIFACTS_TYPES'].values_by_name["FILE"]._serialized_options = b'\242\264\372\302\005\032beam:artifact:type:file:v1'
+  _globals['_STANDARDARTIFACTS_TYPES'].values_by_name["URL"]._loaded_options = None
+  _globals['_STANDARDARTIFACTS_TYPES'].values_by_name["URL"]._serialized_options = b'\242\264\372\302\005\031beam:artifact:type:url:v1'
+  _globals['_STANDARDARTIFACTS_TYPES'].values_by_name["EMBEDDED"]._loaded_options = None
+  _globals['_STANDARDARTIFACTS_TYPES'].values_by_name["EMBEDDED"]._serialized_options = b'\242\264\372\302\005\036beam:artifact:type:embedded:v1'
+  _globals['_STANDARDARTIFACTS_TYPES'].values_by_name["PYPI"]._loaded_options = None
+  _globals['_STANDARDARTIFACTS_TYPES'].values_by_name["PYPI"]._serialized_options = b'\242\264\372\302\005\032beam:artifact:type:pypi:v1'
+  _globals['_STANDARDARTIFACTS_TYPES'].values_by_name["MAVEN"]._loaded_options = None
+  _globals['_STANDARDARTIFACTS_TYPES'].values_by_name["MAVEN"]._serialized_options = b'\242\264\372\302\005\033beam:artifact:type:maven:v1'
+  _globals['_STANDARDARTIFACTS_TYPES'].values_by_name["DEFERRED"]._loaded_options = None
+  _globals['_STANDARDARTIFACTS_TYPES'].values_by_name["DEFERRED"]._serialized_options = b'\242\264\372\302\005\036beam:artifact:type:deferred:v1'
+  _globals['_STANDARDARTIFACTS_ROLES'].values_by_name["STAGING_TO"]._loaded_options = None
+  _globals['_STANDARDARTIFACTS_ROLES'].values_by_name["STAGING_TO"]._serialized_options = b'\242\264\372\302\005 beam:artifact:role:staging_to:v1'
+  _globals['_STANDARDARTIFACTS_ROLES'].values_by_name["PIP_REQUIREMENTS_FILE"]._loaded_options = None
+  _globals['_STANDARDARTIFACTS_ROLES'].values_by_name["PIP_REQUIREMENTS_FILE"]._serialized_options = b'\242\264\372\302\005+beam:artifact:role:pip_requirements_file:v1'
+  _globals['_STANDARDARTIFACTS_ROLES'].values_by_name["GO_WORKER_BINARY"]._loaded_options = None
+  _globals['_STANDARDARTIFACTS_ROLES'].values_by_name["GO_WORKER_BINARY"]._serialized_options = b'\242\264\372\302\005&beam:artifact:role:go_worker_binary:v1'
+  _globals['_ENVIRONMENT_RESOURCEHINTSENTRY']._loaded_options = None
+  _globals['_ENVIRONMENT_RESOURCEHINTSENTRY']._serialized_options = b'8\001'
+  _globals['_STANDARDENVIRONMENTS_ENVIRONMENTS'].values_by_name["DOCKER"]._loaded_options = None
+  _globals['_STANDARDENVIRONMENTS_ENVIRONMENTS'].values_by_name["DOCKER"]._serialized_options = b'\242\264\372\302\005\022beam:env:docker:v1'
+  _globals['_STANDARDENVIRONMENTS_ENVIRONMENTS'].values_by_name["PROCESS"]._loaded_options = None
+  _globals['_STANDARDENVIRONMENTS_ENVIRONMENTS'].values_by_name["PROCESS"]._serialized_options = b'\242\264\372\302\005\023beam:env:process:v1'
+  _globals['_STANDARDENVIRONMENTS_ENVIRONMENTS'].values_by_name["EXTERNAL"]._loaded_options = None
+  _globals['_STANDARDENVIRONMENTS_ENVIRONMENTS'].values_by_name["EXTERNAL"]._serialized_options = b'\242\264\372\302\005\024beam:env:external:v1'
+  _globals['_STANDARDENVIRONMENTS_ENVIRONMENTS'].values_by_name["DEFAULT"]._loaded_options = None
+  _globals['_STANDARDENVIRONMENTS_ENVIRONMENTS'].values_by_name["DEFAULT"]._serialized_options = b'\242\264\372\302\005\023beam:env:default:v1'
+  _globals['_STANDARDENVIRONMENTS_ENVIRONMENTS'].values_by_name["ANYOF"]._loaded_options = None
+  _globals['_STANDARDENVIRONMENTS_ENVIRONMENTS'].values_by_name["ANYOF"]._serialized_options = b'\242\264\372\302\005\021beam:env:anyof:v1'
+  _globals['_PROCESSPAYLOAD_ENVENTRY']._loaded_options = None
+  _globals['_PROCESSPAYLOAD_ENVENTRY']._serialized_options = b'8\001'
+  _globals['_EXTERNALPAYLOAD_PARAMSENTRY']._loaded_options = None
+  _globals['_EXTERNALPAYLOAD_PARAMSENTRY']._serialized_options = b'8\001'
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["LEGACY_PROGRESS_REPORTING"]._loaded_options = None
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["LEGACY_PROGRESS_REPORTING"]._serialized_options = b'\242\264\372\302\005#beam:protocol:progress_reporting:v0'
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["PROGRESS_REPORTING"]._loaded_options = None
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["PROGRESS_REPORTING"]._serialized_options = b'\242\264\372\302\005#beam:protocol:progress_reporting:v1'
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["WORKER_STATUS"]._loaded_options = None
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["WORKER_STATUS"]._serialized_options = b'\242\264\372\302\005\036beam:protocol:worker_status:v1'
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["MULTI_CORE_BUNDLE_PROCESSING"]._loaded_options = None
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["MULTI_CORE_BUNDLE_PROCESSING"]._serialized_options = b'\242\264\372\302\005-beam:protocol:multi_core_bundle_processing:v1'
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["SIBLING_WORKERS"]._loaded_options = None
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["SIBLING_WORKERS"]._serialized_options = b'\242\264\372\302\005 beam:protocol:sibling_workers:v1'
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["HARNESS_MONITORING_INFOS"]._loaded_options = None
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["HARNESS_MONITORING_INFOS"]._serialized_options = b'\242\264\372\302\005)beam:protocol:harness_monitoring_infos:v1'
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["CONTROL_REQUEST_ELEMENTS_EMBEDDING"]._loaded_options = None
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["CONTROL_REQUEST_ELEMENTS_EMBEDDING"]._serialized_options = b'\242\264\372\302\0053beam:protocol:control_request_elements_embedding:v1'
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["STATE_CACHING"]._loaded_options = None
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["STATE_CACHING"]._serialized_options = b'\242\264\372\302\005\036beam:protocol:state_caching:v1'
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["DATA_SAMPLING"]._loaded_options = None
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["DATA_SAMPLING"]._serialized_options = b'\242\264\372\302\005\036beam:protocol:data_sampling:v1'
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["SDK_CONSUMING_RECEIVED_DATA"]._loaded_options = None
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["SDK_CONSUMING_RECEIVED_DATA"]._serialized_options = b'\242\264\372\302\005,beam:protocol:sdk_consuming_received_data:v1'
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["ORDERED_LIST_STATE"]._loaded_options = None
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["ORDERED_LIST_STATE"]._serialized_options = b'\242\264\372\302\005#beam:protocol:ordered_list_state:v1'
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["ELEMENT_METADATA"]._loaded_options = None
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["ELEMENT_METADATA"]._serialized_options = b'\242\264\372\302\005!beam:protocol:element_metadata:v1'
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["MULTIMAP_STATE"]._loaded_options = None
+  _globals['_STANDARDPROTOCOLS_ENUM'].values_by_name["MULTIMAP_STATE"]._serialized_options = b'\242\264\372\302\005\037beam:protocol:multimap_state:v1'
+  _globals['_STANDARDRUNNERPROTOCOLS_ENUM'].values_by_name["MONITORING_INFO_SHORT_IDS"]._loaded_options = None
+  _globals['_STANDARDRUNNERPROTOCOLS_ENUM'].values_by_name["MONITORING_INFO_SHORT_IDS"]._serialized_options = b'\242\264\372\302\005*beam:protocol:monitoring_info_short_ids:v1'
+  _globals['_STANDARDRUNNERPROTOCOLS_ENUM'].values_by_name["CONTROL_RESPONSE_ELEMENTS_EMBEDDING"]._loaded_options = None
+  _globals['_STANDARDRUNNERPROTOCOLS_ENUM'].values_by_name["CONTROL_RESPONSE_ELEMENTS_EMBEDDING"]._serialized_options = b'\242\264\372\302\0054beam:protocol:control_response_elements_embedding:v1'
+  _globals['_STANDARDRUNNERPROTOCOLS_ENUM'].values_by_name["MULTIMAP_KEYS_VALUES_SIDE_INPUT"]._loaded_options = None
+  _globals['_STANDARDRUNNERPROTOCOLS_ENUM'].values_by_name["MULTIMAP_KEYS_VALUES_SIDE_INPUT"]._serialized_options = b'\242\264\372\302\0050beam:protocol:multimap_keys_values_side_input:v1'
+  _globals['_STANDARDREQUIREMENTS_ENUM'].values_by_name["REQUIRES_STATEFUL_PROCESSING"]._loaded_options = None
+  _globals['_STANDARDREQUIREMENTS_ENUM'].values_by_name["REQUIRES_STATEFUL_PROCESSING"]._serialized_options = b'\242\264\372\302\005\"beam:requirement:pardo:stateful:v1'
+  _globals['_STANDARDREQUIREMENTS_ENUM'].values_by_name["REQUIRES_BUNDLE_FINALIZATION"]._loaded_options = None
+  _globals['_STANDARDREQUIREMENTS_ENUM'].values_by_name["REQUIRES_BUNDLE_FINALIZATION"]._serialized_options = b'\242\264\372\302\005&beam:requirement:pardo:finalization:v1'
+  _globals['_STANDARDREQUIREMENTS_ENUM'].values_by_name["REQUIRES_STABLE_INPUT"]._loaded_options = None
+  _globals['_STANDARDREQUIREMENTS_ENUM'].values_by_name["REQUIRES_STABLE_INPUT"]._serialized_options = b'\242\264\372\302\005&beam:requirement:pardo:stable_input:v1'
+  _globals['_STANDARDREQUIREMENTS_ENUM'].values_by_name["REQUIRES_TIME_SORTED_INPUT"]._loaded_options = None
+  _globals['_STANDARDREQUIREMENTS_ENUM'].values_by_name["REQUIRES_TIME_SORTED_INPUT"]._serialized_options = b'\242\264\372\302\005+beam:requirement:pardo:time_sorted_input:v1'
+  _globals['_STANDARDREQUIREMENTS_ENUM'].values_by_name["REQUIRES_SPLITTABLE_DOFN"]._loaded_options = None
+  _globals['_STANDARDREQUIREMENTS_ENUM'].values_by_name["REQUIRES_SPLITTABLE_DOFN"]._serialized_options = b'\242\264\372\302\005)beam:requirement:pardo:splittable_dofn:v1'
+  _globals['_STANDARDREQUIREMENTS_ENUM'].values_by_name["REQUIRES_ON_WINDOW_EXPIRATION"]._loaded_options = None
+  _globals['_STANDARDREQUIREMENTS_ENUM'].values_by_name["REQUIRES_ON_WINDOW_EXPIRATION"]._serialized_options = b'\242\264\372\302\005.beam:requirement:pardo:on_window_expiration:v1'
+  _globals['_STANDARDDISPLAYDATA_DISPLAYDATA'].values_by_name["LABELLED"]._loaded_options = None
+  _globals['_STANDARDDISPLAYDATA_DISPLAYDATA'].values_by_name["LABELLED"]._serialized_options = b'\242\264\372\302\005\035beam:display_data:labelled:v1'
+  _globals['_STANDARDRESOURCEHINTS_ENUM'].values_by_name["ACCELERATOR"]._loaded_options = None
+  _globals['_STANDARDRESOURCEHINTS_ENUM'].values_by_name["ACCELERATOR"]._serialized_options = b'\242\264\372\302\005\035beam:resources:accelerator:v1'
+  _globals['_STANDARDRESOURCEHINTS_ENUM'].values_by_name["MIN_RAM_BYTES"]._loaded_options = None
+  _globals['_STANDARDRESOURCEHINTS_ENUM'].values_by_name["MIN_RAM_BYTES"]._serialized_options = b'\242\264\372\302\005\037beam:resources:min_ram_bytes:v1'
+  _globals['_STANDARDRESOURCEHINTS_ENUM'].values_by_name["CPU_COUNT"]._loaded_options = None
+  _globals['_STANDARDRESOURCEHINTS_ENUM'].values_by_name["CPU_COUNT"]._serialized_options = b'\242\264\372\302\005\033beam:resources:cpu_count:v1'
+  _globals['_STANDARDRESOURCEHINTS_ENUM'].values_by_name["MAX_ACTIVE_BUNDLES_PER_WORKER"]._loaded_options = None
+  _globals['_STANDARDRESOURCEHINTS_ENUM'].values_by_name["MAX_ACTIVE_BUNDLES_PER_WORKER"]._serialized_options = b'\242\264\372\302\005/beam:resources:max_active_bundles_per_worker:v1'
+  _globals['_BEAMCONSTANTS']._serialized_start=180
+  _globals['_BEAMCONSTANTS']._serialized_end=374
+  _globals['_BEAMCONSTANTS_CONSTANTS']._serialized_start=198
+  _globals['_BEAMCONSTANTS_CONSTANTS']._serialized_end=374
+  _globals['_COMPONENTS']._serialized_start=377
+  _globals['_COMPONENTS']._serialized_end=1326
+  _globals['_COMPONENTS_TRANSFORMSENTRY']._serialized_start=825
+  _globals['_COMPONENTS_TRANSFORMSENTRY']._serialized_end=921
+  _globals['_COMPONENTS_PCOLLECTIONSENTRY']._serialized_start=923
+  _globals['_COMPONENTS_PCOLLECTIONSENTRY']._serialized_end=1022
+  _globals['_COMPONENTS_WINDOWINGSTRATEGIESENTRY']._serialized_start=1024
+  _globals['_COMPONENTS_WINDOWINGSTRATEGIESENTRY']._serialized_end=1136
+  _globals['_COMPONENTS_CODERSENTRY']._serialized_start=1138
+  _globals['_COMPONENTS_CODERSENTRY']._serialized_end=1225
+  _globals['_COMPONENTS_ENVIRONMENTSENTRY']._serialized_start=1227
+  _globals['_COMPONENTS_ENVIRONMENTSENTRY']._serialized_end=1326
+  _globals['_PIPELINE']._serialized_start=1329
+  _globals['_PIPELINE']._serialized_end=1526
+  _globals['_PTRANSFORM']._serialized_start=1529
+  _globals['_PTRANSFORM']._serialized_end=2126
+  _globals['_PTRANSFORM_INPUTSENTRY']._serialized_start=1981
+  _globals['_PTRANSFORM_INPUTSENTRY']._serialized_end=2026
+  _globals['_PTRANSFORM_OUTPUTSENTRY']._serialized_start=2028
+  _globals['_PTRANSFORM_OUTPUTSENTRY']._serialized_end=2074
+  _globals['_PTRANSFORM_ANNOTATIONSENTRY']._serialized_start=2076
+  _globals['_PTRANSFORM_ANNOTATIONSENTRY']._serialized_end=2126
+  _globals['_STANDARDPTRANSFORMS']._serialized_start=2129
+  _globals['_STANDARDPTRANSFORMS']._serialized_end=4396
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES']._serialized_start=2153
+  _globals['_STANDARDPTRANSFORMS_PRIMITIVES']._serialized_end=2628
+  _globals['_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES']._serialized_start=2630
+  _globals['_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES']._serialized_end=2746
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES']._serialized_start=2749
+  _globals['_STANDARDPTRANSFORMS_COMPOSITES']._serialized_end=3412
+  _globals['_STANDARDPTRANSFORMS_COMBINECOMPONENTS']._serialized_start=3415
+  _globals['_STANDARDPTRANSFORMS_COMBINECOMPONENTS']._serialized_end=3898
+  _globals['_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS']._serialized_start=3901
+  _globals['_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS']._serialized_end=4298
+  _globals['_STANDARDPTRANSFORMS_GROUPINTOBATCHESCOMPONENTS']._serialized_start=4300
+  _globals['_STANDARDPTRANSFORMS_GROUPINTOBATCHESCOMPONENTS']._serialized_end=4396
+  _globals['_STANDARDSIDEINPUTTYPES']._serialized_start=4399
+  _globals['_STANDARDSIDEINPUTTYPES']._serialized_end=4529
+  _globals['_STANDARDSIDEINPUTTYPES_ENUM']._serialized_start=4425
+  _globals['_STANDARDSIDEINPUTTYPES_ENUM']._serialized_end=4529
+  _globals['_STANDARDUSERSTATETYPES']._serialized_start=4532
+  _globals['_STANDARDUSERSTATETYPES']._serialized_end=4710
+  _globals['_STANDARDUSERSTATETYPES_ENUM']._serialized_start=4559
+  _globals['_STANDARDUSERSTATETYPES_ENUM']._serialized_end=4710
+  _globals['_PCOLLECTION']._serialized_start=4713
+  _globals['_PCOLLECTION']._serialized_end=4937
+  _globals['_PARDOPAYLOAD']._serialized_start=4940
+  _globals['_PARDOPAYLOAD']._serialized_end=5774
+  _globals['_PARDOPAYLOAD_SIDEINPUTSENTRY']._serialized_start=5467
+  _globals['_PARDOPAYLOAD_SIDEINPUTSENTRY']._serialized_end=5562
+  _globals['_PARDOPAYLOAD_STATESPECSENTRY']._serialized_start=5564
+  _globals['_PARDOPAYLOAD_STATESPECSENTRY']._serialized_end=5659
+  _globals['_PARDOPAYLOAD_TIMERFAMILYSPECSENTRY']._serialized_start=5661
+  _globals['_PARDOPAYLOAD_TIMERFAMILYSPECSENTRY']._serialized_end=5768
+  _globals['_STATESPEC']._serialized_start=5777
+  _globals['_STATESPEC']._serialized_end=6411
+  _globals['_READMODIFYWRITESTATESPEC']._serialized_start=6413
+  _globals['_READMODIFYWRITESTATESPEC']._serialized_end=6457
+  _globals['_BAGSTATESPEC']._serialized_start=6459
+  _globals['_BAGSTATESPEC']._serialized_end=6499
+  _globals['_ORDEREDLISTSTATESPEC']._serialized_start=6501
+  _globals['_ORDEREDLISTSTATESPEC']._serialized_end=6549
+  _globals['_COMBININGSTATESPEC']._serialized_start=6551
+  _globals['_COMBININGSTATESPEC']._serialized_end=6670
+  _globals['_MAPSTATESPEC']._serialized_start=6672
+  _globals['_MAPSTATESPEC']._serialized_end=6732
+  _globals['_MULTIMAPSTATESPEC']._serialized_start=6734
+  _globals['_MULTIMAPSTATESPEC']._serialized_end=6799
+  _globals['_SETSTATESPEC']._serialized_start=6801
+  _globals['_SETSTATESPEC']._serialized_end=6841
+  _globals['_TIMERFAMILYSPEC']._serialized_start=6843
+  _globals['_TIMERFAMILYSPEC']._serialized_end=6964
+  _globals['_ISBOUNDED']._serialized_start=6966
+  _globals['_ISBOUNDED']._serialized_end=7030
+  _globals['_ISBOUNDED_ENUM']._serialized_start=6979
+  _globals['_ISBOUNDED_ENUM']._serialized_end=7030
+  _globals['_READPAYLOAD']._serialized_start=7033
+  _globals['_READPAYLOAD']._serialized_end=7182
+  _globals['_WINDOWINTOPAYLOAD']._serialized_start=7184
+  _globals['_WINDOWINTOPAYLOAD']._serialized_end=7271
+  _globals['_COMBINEPAYLOAD']._serialized_start=7273
+  _globals['_COMBINEPAYLOAD']._serialized_end=7388
+  _globals['_TESTSTREAMPAYLOAD']._serialized_start=7391
+  _globals['_TESTSTREAMPAYLOAD']._serialized_end=8206
+  _globals['_TESTSTREAMPAYLOAD_EVENT']._serialized_start=7582
+  _globals['_TESTSTREAMPAYLOAD_EVENT']._serialized_end=8140
+  _globals['_TESTSTREAMPAYLOAD_EVENT_ADVANCEWATERMARK']._serialized_start=7907
+  _globals['_TESTSTREAMPAYLOAD_EVENT_ADVANCEWATERMARK']._serialized_end=7961
+  _globals['_TESTSTREAMPAYLOAD_EVENT_ADVANCEPROCESSINGTIME']._serialized_start=7963
+  _globals['_TESTSTREAMPAYLOAD_EVENT_ADVANCEPROCESSINGTIME']._serialized_end=8012
+  _globals['_TESTSTREAMPAYLOAD_EVENT_ADDELEMENTS']._serialized_start=8014
+  _globals['_TESTSTREAMPAYLOAD_EVENT_ADDELEMENTS']._serialized_end=8131
+  _globals['_TESTSTREAMPAYLOAD_TIMESTAMPEDELEMENT']._serialized_start=8142
+  _globals['_TESTSTREAMPAYLOAD_TIMESTAMPEDELEMENT']._serialized_end=8206
+  _globals['_WRITEFILESPAYLOAD']._serialized_start=8209
+  _globals['_WRITEFILESPAYLOAD']._serialized_end=8636
+  _globals['_WRITEFILESPAYLOAD_SIDEINPUTSENTRY']._serialized_start=5467
+  _globals['_WRITEFILESPAYLOAD_SIDEINPUTSENTRY']._serialized_end=5562
+  _globals['_PUBSUBREADPAYLOAD']._serialized_start=8639
+  _globals['_PUBSUBREADPAYLOAD']._serialized_end=8846
+  _globals['_PUBSUBWRITEPAYLOAD']._serialized_start=8848
+  _globals['_PUBSUBWRITEPAYLOAD']._serialized_end=8968
+  _globals['_GROUPINTOBATCHESPAYLOAD']._serialized_start=8970
+  _globals['_GROUPINTOBATCHESPAYLOAD']._serialized_end=9080
+  _globals['_REDISTRIBUTEPAYLOAD']._serialized_start=9082
+  _globals['_REDISTRIBUTEPAYLOAD']._serialized_end=9129
+  _globals['_CODER']._serialized_start=9131
+  _globals['_CODER']._serialized_end=9230
+  _globals['_STANDARDCODERS']._serialized_start=9233
+  _globals['_STANDARDCODERS']._serialized_end=10158
+  _globals['_STANDARDCODERS_ENUM']._serialized_start=9252
+  _globals['_STANDARDCODERS_ENUM']._serialized_end=10158
+  _globals['_WINDOWINGSTRATEGY']._serialized_start=10161
+  _globals['_WINDOWINGSTRATEGY']._serialized_end=10813
+  _globals['_MERGESTATUS']._serialized_start=10815
+  _globals['_MERGESTATUS']._serialized_end=10907
+  _globals['_MERGESTATUS_ENUM']._serialized_start=10830
+  _globals['_MERGESTATUS_ENUM']._serialized_end=10907
+  _globals['_ACCUMULATIONMODE']._serialized_start=10909
+  _globals['_ACCUMULATIONMODE']._serialized_end=11002
+  _globals['_ACCUMULATIONMODE_ENUM']._serialized_start=10929
+  _globals['_ACCUMULATIONMODE_ENUM']._serialized_end=11002
+  _globals['_CLOSINGBEHAVIOR']._serialized_start=11004
+  _globals['_CLOSINGBEHAVIOR']._serialized_end=11085
+  _globals['_CLOSINGBEHAVIOR_ENUM']._serialized_start=11023
+  _globals['_CLOSINGBEHAVIOR_ENUM']._serialized_end=11085
+  _globals['_ONTIMEBEHAVIOR']._serialized_start=11087
+  _globals['_ONTIMEBEHAVIOR']._serialized_end=11167
+  _globals['_ONTIMEBEHAVIOR_ENUM']._serialized_start=11105
+  _globals['_ONTIMEBEHAVIOR_ENUM']._serialized_end=11167
+  _globals['_OUTPUTTIME']._serialized_start=11169
+  _globals['_OUTPUTTIME']._serialized_end=11267
+  _globals['_OUTPUTTIME_ENUM']._serialized_start=11183
+  _globals['_OUTPUTTIME_ENUM']._serialized_end=11267
+  _globals['_TIMEDOMAIN']._serialized_start=11269
+  _globals['_TIMEDOMAIN']._serialized_end=11379
+  _globals['_TIMEDOMAIN_ENUM']._serialized_start=11283
+  _globals['_TIMEDOMAIN_ENUM']._serialized_end=11379
+  _globals['_TRIGGER']._serialized_start=11382
+  _globals['_TRIGGER']._serialized_end=13176
+  _globals['_TRIGGER_AFTERALL']._serialized_start=12362
+  _globals['_TRIGGER_AFTERALL']._serialized_end=12437
+  _globals['_TRIGGER_AFTERANY']._serialized_start=12439
+  _globals['_TRIGGER_AFTERANY']._serialized_end=12514
+  _globals['_TRIGGER_AFTEREACH']._serialized_start=12516
+  _globals['_TRIGGER_AFTEREACH']._serialized_end=12592
+  _globals['_TRIGGER_AFTERENDOFWINDOW']._serialized_start=12595
+  _globals['_TRIGGER_AFTERENDOFWINDOW']._serialized_end=12746
+  _globals['_TRIGGER_AFTERPROCESSINGTIME']._serialized_start=12748
+  _globals['_TRIGGER_AFTERPROCESSINGTIME']._serialized_end=12854
+  _globals['_TRIGGER_AFTERSYNCHRONIZEDPROCESSINGTIME']._serialized_start=12856
+  _globals['_TRIGGER_AFTERSYNCHRONIZEDPROCESSINGTIME']._serialized_end=12889
+  _globals['_TRIGGER_DEFAULT']._serialized_start=12891
+  _globals['_TRIGGER_DEFAULT']._serialized_end=12900
+  _globals['_TRIGGER_ELEMENTCOUNT']._serialized_start=12902
+  _globals['_TRIGGER_ELEMENTCOUNT']._serialized_end=12939
+  _globals['_TRIGGER_NEVER']._serialized_start=12941
+  _globals['_TRIGGER_NEVER']._serialized_end=12948
+  _globals['_TRIGGER_ALWAYS']._serialized_start=12950
+  _globals['_TRIGGER_ALWAYS']._serialized_end=12958
+  _globals['_TRIGGER_ORFINALLY']._serialized_start=12961
+  _globals['_TRIGGER_ORFINALLY']._serialized_end=13091
+  _globals['_TRIGGER_REPEAT']._serialized_start=13093
+  _globals['_TRIGGER_REPEAT']._serialized_end=13165
+  _globals['_TIMESTAMPTRANSFORM']._serialized_start=13179
+  _globals['_TIMESTAMPTRANSFORM']._serialized_end=13457
+  _globals['_TIMESTAMPTRANSFORM_DELAY']._serialized_start=13362
+  _globals['_TIMESTAMPTRANSFORM_DELAY']._serialized_end=13391
+  _globals['_TIMESTAMPTRANSFORM_ALIGNTO']._serialized_start=13393
+  _globals['_TIMESTAMPTRANSFORM_ALIGNTO']._serialized_end=13434
+  _globals['_SIDEINPUT']._serialized_start=13460
+  _globals['_SIDEINPUT']._serialized_end=13686
+  _globals['_STANDARDARTIFACTS']._serialized_start=13689
+  _globals['_STANDARDARTIFACTS']._serialized_end=14210
+  _globals['_STANDARDARTIFACTS_TYPES']._serialized_start=13711
+  _globals['_STANDARDARTIFACTS_TYPES']._serialized_end=13998
+  _globals['_STANDARDARTIFACTS_ROLES']._serialized_start=14001
+  _globals['_STANDARDARTIFACTS_ROLES']._serialized_end=14210
+  _globals['_ARTIFACTFILEPAYLOAD']._serialized_start=14212
+  _globals['_ARTIFACTFILEPAYLOAD']._serialized_end=14263
+  _globals['_ARTIFACTURLPAYLOAD']._serialized_start=14265
+  _globals['_ARTIFACTURLPAYLOAD']._serialized_end=14314
+  _globals['_EMBEDDEDFILEPAYLOAD']._serialized_start=14316
+  _globals['_EMBEDDEDFILEPAYLOAD']._serialized_end=14351
+  _globals['_PYPIPAYLOAD']._serialized_start=14353
+  _globals['_PYPIPAYLOAD']._serialized_end=14404
+  _globals['_MAVENPAYLOAD']._serialized_start=14406
+  _globals['_MAVENPAYLOAD']._serialized_end=14462
+  _globals['_DEFERREDARTIFACTPAYLOAD']._serialized_start=14464
+  _globals['_DEFERREDARTIFACTPAYLOAD']._serialized_end=14516
+  _globals['_ARTIFACTSTAGINGTOROLEPAYLOAD']._serialized_start=14518
+  _globals['_ARTIFACTSTAGINGTOROLEPAYLOAD']._serialized_end=14569
+  _globals['_ARTIFACTINFORMATION']._serialized_start=14571
+  _globals['_ARTIFACTINFORMATION']._serialized_end=14672
+  _globals['_ENVIRONMENT']._serialized_start=14675
+  _globals['_ENVIRONMENT']._serialized_end=15039
+  _globals['_ENVIRONMENT_RESOURCEHINTSENTRY']._serialized_start=14981
+  _globals['_ENVIRONMENT_RESOURCEHINTSENTRY']._serialized_end=15033
+  _globals['_STANDARDENVIRONMENTS']._serialized_start=15042
+  _globals['_STANDARDENVIRONMENTS']._serialized_end=15277
+  _globals['_STANDARDENVIRONMENTS_ENVIRONMENTS']._serialized_start=15067
+  _globals['_STANDARDENVIRONMENTS_ENVIRONMENTS']._serialized_end=15277
+  _globals['_DOCKERPAYLOAD']._serialized_start=15279
+  _globals['_DOCKERPAYLOAD']._serialized_end=15319
+  _globals['_PROCESSPAYLOAD']._serialized_start=15322
+  _globals['_PROCESSPAYLOAD']._serialized_end=15498
+  _globals['_PROCESSPAYLOAD_ENVENTRY']._serialized_start=15456
+  _globals['_PROCESSPAYLOAD_ENVENTRY']._serialized_end=15498
+  _globals['_EXTERNALPAYLOAD']._serialized_start=15501
+  _globals['_EXTERNALPAYLOAD']._serialized_end=15720
+  _globals['_EXTERNALPAYLOAD_PARAMSENTRY']._serialized_start=15675
+  _globals['_EXTERNALPAYLOAD_PARAMSENTRY']._serialized_end=15720
+  _globals['_ANYOFENVIRONMENTPAYLOAD']._serialized_start=15722
+  _globals['_ANYOFENVIRONMENTPAYLOAD']._serialized_end=15817
+  _globals['_STANDARDPROTOCOLS']._serialized_start=15820
+  _globals['_STANDARDPROTOCOLS']._serialized_end=16760
+  _globals['_STANDARDPROTOCOLS_ENUM']._serialized_start=15842
+  _globals['_STANDARDPROTOCOLS_ENUM']._serialized_end=16760
+  _globals['_STANDARDRUNNERPROTOCOLS']._serialized_start=16763
+  _globals['_STANDARDRUNNERPROTOCOLS']._serialized_end=17072
+  _globals['_STANDARDRUNNERPROTOCOLS_ENUM']._serialized_start=16791
+  _globals['_STANDARDRUNNERPROTOCOLS_ENUM']._serialized_end=17072
+  _globals['_STANDARDREQUIREMENTS']._serialized_start=17075
+  _globals['_STANDARDREQUIREMENTS']._serialized_end=17586
+  _globals['_STANDARDREQUIREMENTS_ENUM']._serialized_start=17100
+  _globals['_STANDARDREQUIREMENTS_ENUM']._serialized_end=17586
+  _globals['_FUNCTIONSPEC']._serialized_start=17588
+  _globals['_FUNCTIONSPEC']._serialized_end=17632
+  _globals['_STANDARDDISPLAYDATA']._serialized_start=17634
+  _globals['_STANDARDDISPLAYDATA']._serialized_end=17721
+  _globals['_STANDARDDISPLAYDATA_DISPLAYDATA']._serialized_start=17657
+  _globals['_STANDARDDISPLAYDATA_DISPLAYDATA']._serialized_end=17721
+  _globals['_LABELLEDPAYLOAD']._serialized_start=17724
+  _globals['_LABELLEDPAYLOAD']._serialized_end=17888
+  _globals['_DISPLAYDATA']._serialized_start=17890
+  _globals['_DISPLAYDATA']._serialized_end=17933
+  _globals['_MESSAGEWITHCOMPONENTS']._serialized_start=17936
+  _globals['_MESSAGEWITHCOMPONENTS']._serialized_end=18769
+  _globals['_EXECUTABLESTAGEPAYLOAD']._serialized_start=18772
+  _globals['_EXECUTABLESTAGEPAYLOAD']._serialized_end=19853
+  _globals['_EXECUTABLESTAGEPAYLOAD_SIDEINPUTID']._serialized_start=19454
+  _globals['_EXECUTABLESTAGEPAYLOAD_SIDEINPUTID']._serialized_end=19509
+  _globals['_EXECUTABLESTAGEPAYLOAD_USERSTATEID']._serialized_start=19511
+  _globals['_EXECUTABLESTAGEPAYLOAD_USERSTATEID']._serialized_end=19566
+  _globals['_EXECUTABLESTAGEPAYLOAD_TIMERID']._serialized_start=19568
+  _globals['_EXECUTABLESTAGEPAYLOAD_TIMERID']._serialized_end=19619
+  _globals['_EXECUTABLESTAGEPAYLOAD_TIMERFAMILYID']._serialized_start=19621
+  _globals['_EXECUTABLESTAGEPAYLOAD_TIMERFAMILYID']._serialized_end=19678
+  _globals['_EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING']._serialized_start=19681
+  _globals['_EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING']._serialized_end=19853
+  _globals['_STANDARDRESOURCEHINTS']._serialized_start=19856
+  _globals['_STANDARDRESOURCEHINTS']._serialized_end=20140
+  _globals['_STANDARDRESOURCEHINTS_ENUM']._serialized_start=19882
+  _globals['_STANDARDRESOURCEHINTS_ENUM']._serialized_end=20140
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,80 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+
+Protocol Buffers describing endpoints containing a service.
+"""
+
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class ApiServiceDescriptor(_message.Message):
+    """A description of how to connect to a Beam API endpoint."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    URL_FIELD_NUMBER: _builtins.int
+    AUTHENTICATION_FIELD_NUMBER: _builtins.int
+    url: _builtins.str
+    """(Required) The URL to connect to."""
+    @_builtins.property
+    def authentication(self) -> Global___AuthenticationSpec:
+        """(Optional) The method for authentication. If unspecified, access to the
+        url is already being performed in a trusted context (e.g. localhost,
+        private network).
+        """
+
+    def __init__(
+        self,
+        *,
+        url: _builtins.str | None = ...,
+        authentication: Global___AuthenticationSpec | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["authentication", b"authentication"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["authentication", b"authentication", "url", b"url"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ApiServiceDescriptor: _TypeAlias = ApiServiceDescriptor  # noqa: Y015
+
+@_typing.final
+class AuthenticationSpec(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    URN_FIELD_NUMBER: _builtins.int
+    PAYLOAD_FIELD_NUMBER: _builtins.int
+    urn: _builtins.str
+    """(Required) A URN that describes the accompanying payload.
+    For any URN that is not recognized (by whomever is inspecting
+    it) the parameter payload should be treated as opaque and
+    passed as-is.
+    """
+    payload: _builtins.bytes
+    """(Optional) The data specifying any parameters to the URN. If
+    the URN does not require any arguments, this may be omitted.
+    """
+    def __init__(
+        self,
+        *,
+        urn: _builtins.str | None = ...,
+        payload: _builtins.bytes | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["payload", b"payload", "urn", b"urn"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___AuthenticationSpec: _TypeAlias = AuthenticationSpec  # noqa: Y015
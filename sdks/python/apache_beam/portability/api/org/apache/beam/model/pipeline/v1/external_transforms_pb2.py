@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: org/apache/beam/model/pipeline/v1/external_transforms.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'org/apache/beam/model/pipeline/v1/external_transforms.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import schema_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_schema__pb2
+from . import beam_runner_api_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_beam__runner__api__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n;org/apache/beam/model/pipeline/v1/external_transforms.proto\x12!org.apache.beam.model.pipeline.v1\x1a.org/apache/beam/model/pipeline/v1/schema.proto\x1a\x37org/apache/beam/model/pipeline/v1/beam_runner_api.proto\"j\n\x1c\x45xternalConfigurationPayload\x12\x39\n\x06schema\x18\x01 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.Schema\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\"\xac\x01\n\x10\x45xpansionMethods\"\x97\x01\n\x04\x45num\x12H\n\x11JAVA_CLASS_LOOKUP\x10\x00\x1a\x31\xa2\xb4\xfa\xc2\x05+beam:expansion:payload:java_class_lookup:v1\x12\x45\n\x10SCHEMA_TRANSFORM\x10\x01\x1a/\xa2\xb4\xfa\xc2\x05)beam:expansion:payload:schematransform:v1\"\xb2\x08\n\x11ManagedTransforms\"\x9c\x08\n\x04Urns\x12L\n\x0cICEBERG_READ\x10\x00\x1a:\xa2\xb4\xfa\xc2\x05\x34\x62\x65\x61m:schematransform:org.apache.beam:iceberg_read:v1\x12N\n\rICEBERG_WRITE\x10\x01\x1a;\xa2\xb4\xfa\xc2\x05\x35\x62\x65\x61m:schematransform:org.apache.beam:iceberg_write:v1\x12H\n\nKAFKA_READ\x10\x02\x1a\x38\xa2\xb4\xfa\xc2\x05\x32\x62\x65\x61m:schematransform:org.apache.beam:kafka_read:v1\x12J\n\x0bKAFKA_WRITE\x10\x03\x1a\x39\xa2\xb4\xfa\xc2\x05\x33\x62\x65\x61m:schematransform:org.apache.beam:kafka_write:v1\x12V\n\rBIGQUERY_READ\x10\x04\x1a\x43\xa2\xb4\xfa\xc2\x05=beam:schematransform:org.apache.beam:bigquery_storage_read:v1\x12P\n\x0e\x42IGQUERY_WRITE\x10\x05\x1a<\xa2\xb4\xfa\xc2\x05\x36\x62\x65\x61m:schematransform:org.apache.beam:bigquery_write:v1\x12T\n\x10ICEBERG_CDC_READ\x10\x06\x1a>\xa2\xb4\xfa\xc2\x05\x38\x62\x65\x61m:schematransform:org.apache.beam:iceberg_cdc_read:v1\x12N\n\rPOSTGRES_READ\x10\x07\x1a;\xa2\xb4\xfa\xc2\x05\x35\x62\x65\x61m:schematransform:org.apache.beam:postgres_read:v1\x12P\n\x0ePOSTGRES_WRITE\x10\x08\x1a<\xa2\xb4\xfa\xc2\x05\x36\x62\x65\x61m:schematransform:org.apache.beam:postgres_write:v1\x12H\n\nMYSQL_READ\x10\t\x1a\x38\xa2\xb4\xfa\xc2\x05\x32\x62\x65\x61m:schematransform:org.apache.beam:mysql_read:v1\x12J\n\x0bMYSQL_WRITE\x10\n\x1a\x39\xa2\xb4\xfa\xc2\x05\x33\x62\x65\x61m:schematransform:org.apache.beam:mysql_write:v1\x12R\n\x0fSQL_SERVER_READ\x10\x0b\x1a=\xa2\xb4\xfa\xc2\x05\x37\x62\x65\x61m:schematransform:org.apache.beam:sql_server_read:v1\x12T\n\x10SQL_SERVER_WRITE\x10\x0c\x1a>\xa2\xb4\xfa\xc2\x05\x38\x62\x65\x61m:schematransform:org.apache.beam:sql_server_write:v1\"\xf7\x01\n\x16JavaClassLookupPayload\x12\x12\n\nclass_name\x18\x01 \x01(\t\x12\x1a\n\x12\x63onstructor_method\x18\x02 \x01(\t\x12\x45\n\x12\x63onstructor_schema\x18\x03 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.Schema\x12\x1b\n\x13\x63onstructor_payload\x18\x04 \x01(\x0c\x12I\n\x0f\x62uilder_methods\x18\x05 \x03(\x0b\x32\x30.org.apache.beam.model.pipeline.v1.BuilderMethod\"i\n\rBuilderMethod\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x39\n\x06schema\x18\x02 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.Schema\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\"\xfa\x01\n\x0b\x41nnotations\"\xea\x01\n\x04\x45num\x12$\n\x0e\x43ONFIG_ROW_KEY\x10\x00\x1a\x10\xaa\xb4\xfa\xc2\x05\nconfig_row\x12\x32\n\x15\x43ONFIG_ROW_SCHEMA_KEY\x10\x01\x1a\x17\xaa\xb4\xfa\xc2\x05\x11\x63onfig_row_schema\x12\x36\n\x17SCHEMATRANSFORM_URN_KEY\x10\x02\x1a\x19\xaa\xb4\xfa\xc2\x05\x13schematransform_urn\x12P\n$MANAGED_UNDERLYING_TRANSFORM_URN_KEY\x10\x03\x1a&\xaa\xb4\xfa\xc2\x05 managed_underlying_transform_urn\"\x90\x01\n\x16SchemaTransformPayload\x12\x12\n\nidentifier\x18\x01 \x01(\t\x12G\n\x14\x63onfiguration_schema\x18\x02 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.Schema\x12\x19\n\x11\x63onfiguration_row\x18\x03 \x01(\x0c\x42\x81\x01\n!org.apache.beam.model.pipeline.v1B\x12\x45xternalTransformsZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1b\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'org.apache.beam.model.pipeline.v1.external_transforms_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n!org.apache.beam.model.pipeline.v1B\022ExternalTransformsZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1'
+  _globals['_EXPANSIONMETHODS_ENUM'].values_by_name["JAVA_CLASS_LOOKUP"]._loaded_options = None
+  _globals['_EXPANSIONMETHODS_ENUM'].values_by_name["JAVA_CLASS_LOOKUP"]._serialized_options = b'\242\264\372\302\005+beam:expansion:payload:java_class_lookup:v1'
+  _globals['_EXPANSIONMETHODS_ENUM'].values_by_name["SCHEMA_TRANSFORM"]._loaded_options = None
+  _globals['_EXPANSIONMETHODS_ENUM'].values_by_name["SCHEMA_TRANSFORM"]._serialized_options = b'\242\264\372\302\005)beam:expansion:payload:schematransform:v1'
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["ICEBERG_READ"]._loaded_options = None
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["ICEBERG_READ"]._serialized_options = b'\242\264\372\302\0054beam:schematransform:org.apache.beam:iceberg_read:v1'
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["ICEBERG_WRITE"]._loaded_options = None
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["ICEBERG_WRITE"]._serialized_options = b'\242\264\372\302\0055beam:schematransform:org.apache.beam:iceberg_write:v1'
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["KAFKA_READ"]._loaded_options = None
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["KAFKA_READ"]._serialized_options = b'\242\264\372\302\0052beam:schematransform:org.apache.beam:kafka_read:v1'
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["KAFKA_WRITE"]._loaded_options = None
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["KAFKA_WRITE"]._serialized_options = b'\242\264\372\302\0053beam:schematransform:org.apache.beam:kafka_write:v1'
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["BIGQUERY_READ"]._loaded_options = None
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["BIGQUERY_READ"]._serialized_options = b'\242\264\372\302\005=beam:schematransform:org.apache.beam:bigquery_storage_read:v1'
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["BIGQUERY_WRITE"]._loaded_options = None
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["BIGQUERY_WRITE"]._serialized_options = b'\242\264\372\302\0056beam:schematransform:org.apache.beam:bigquery_write:v1'
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["ICEBERG_CDC_READ"]._loaded_options = None
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["ICEBERG_CDC_READ"]._serialized_options = b'\242\264\372\302\0058beam:schematransform:org.apache.beam:iceberg_cdc_read:v1'
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["POSTGRES_READ"]._loaded_options = None
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["POSTGRES_READ"]._serialized_options = b'\242\264\372\302\0055beam:schematransform:org.apache.beam:postgres_read:v1'
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["POSTGRES_WRITE"]._loaded_options = None
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["POSTGRES_WRITE"]._serialized_options = b'\242\264\372\302\0056beam:schematransform:org.apache.beam:postgres_write:v1'
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["MYSQL_READ"]._loaded_options = None
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["MYSQL_READ"]._serialized_options = b'\242\264\372\302\0052beam:schematransform:org.apache.beam:mysql_read:v1'
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["MYSQL_WRITE"]._loaded_options = None
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["MYSQL_WRITE"]._serialized_options = b'\242\264\372\302\0053beam:schematransform:org.apache.beam:mysql_write:v1'
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["SQL_SERVER_READ"]._loaded_options = None
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["SQL_SERVER_READ"]._serialized_options = b'\242\264\372\302\0057beam:schematransform:org.apache.beam:sql_server_read:v1'
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["SQL_SERVER_WRITE"]._loaded_options = None
+  _globals['_MANAGEDTRANSFORMS_URNS'].values_by_name["SQL_SERVER_WRITE"]._serialized_options = b'\242\264\372\302\0058beam:schematransform:org.apache.beam:sql_server_write:v1'
+  _globals['_ANNOTATIONS_ENUM'].values_by_name["CONFIG_ROW_KEY"]._loaded_options = None
+  _globals['_ANNOTATIONS_ENUM'].values_by_name["CONFIG_ROW_KEY"]._serialized_options = b'\252\264\372\302\005\nconfig_row'
+  _globals['_ANNOTATIONS_ENUM'].values_by_name["CONFIG_ROW_SCHEMA_KEY"]._loaded_options = None
+  _globals['_ANNOTATIONS_ENUM'].values_by_name["CONFIG_ROW_SCHEMA_KEY"]._serialized_options = b'\252\264\372\302\005\021config_row_schema'
+  _globals['_ANNOTATIONS_ENUM'].values_by_name["SCHEMATRANSFORM_URN_KEY"]._loaded_options = None
+  _globals['_ANNOTATIONS_ENUM'].values_by_name["SCHEMATRANSFORM_URN_KEY"]._serialized_options = b'\252\264\372\302\005\023schematransform_urn'
+  _globals['_ANNOTATIONS_ENUM'].values_by_name["MANAGED_UNDERLYING_TRANSFORM_URN_KEY"]._loaded_options = None
+  _globals['_ANNOTATIONS_ENUM'].values_by_name["MANAGED_UNDERLYING_TRANSFORM_URN_KEY"]._serialized_options = b'\252\264\372\302\005 managed_underlying_transform_urn'
+  _globals['_EXTERNALCONFIGURATIONPAYLOAD']._serialized_start=203
+  _globals['_EXTERNALCONFIGURATIONPAYLOAD']._serialized_end=309
+  _globals['_EXPANSIONMETHODS']._serialized_start=312
+  _globals['_EXPANSIONMETHODS']._serialized_end=484
+  _globals['_EXPANSIONMETHODS_ENUM']._serialized_start=333
+  _globals['_EXPANSIONMETHODS_ENUM']._serialized_end=484
+  _globals['_MANAGEDTRANSFORMS']._serialized_start=487
+  _globals['_MANAGEDTRANSFORMS']._serialized_end=1561
+  _globals['_MANAGEDTRANSFORMS_URNS']._serialized_start=509
+  _globals['_MANAGEDTRANSFORMS_URNS']._serialized_end=1561
+  _globals['_JAVACLASSLOOKUPPAYLOAD']._serialized_start=1564
+  _globals['_JAVACLASSLOOKUPPAYLOAD']._serialized_end=1811
+  _globals['_BUILDERMETHOD']._serialized_start=1813
+  _globals['_BUILDERMETHOD']._serialized_end=1918
+  _globals['_ANNOTATIONS']._serialized_start=1921
+  _globals['_ANNOTATIONS']._serialized_end=2171
+  _globals['_ANNOTATIONS_ENUM']._serialized_start=1937
+  _globals['_ANNOTATIONS_ENUM']._serialized_end=2171
+  _globals['_SCHEMATRANSFORMPAYLOAD']._serialized_start=2174
+  _globals['_SCHEMATRANSFORMPAYLOAD']._serialized_end=2318
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,336 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+
+Protocol Buffers describing the external transforms available.
+"""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from . import schema_pb2 as _schema_pb2
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class ExternalConfigurationPayload(_message.Message):
+    """A configuration payload for an external transform.
+    Used as the payload of ExternalTransform as part of an ExpansionRequest.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SCHEMA_FIELD_NUMBER: _builtins.int
+    PAYLOAD_FIELD_NUMBER: _builtins.int
+    payload: _builtins.bytes
+    """A payload which can be decoded using beam:coder:row:v1 and the given
+    schema.
+    """
+    @_builtins.property
+    def schema(self) -> _schema_pb2.Schema:
+        """A schema for use in beam:coder:row:v1"""
+
+    def __init__(
+        self,
+        *,
+        schema: _schema_pb2.Schema | None = ...,
+        payload: _builtins.bytes | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["schema", b"schema"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["payload", b"payload", "schema", b"schema"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ExternalConfigurationPayload: _TypeAlias = ExternalConfigurationPayload  # noqa: Y015
+
+@_typing.final
+class ExpansionMethods(_message.Message):
+    """Defines specific expansion methods that may be used to expand cross-language
+    transforms.
+    Has to be set as the URN of the transform of the expansion request.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _Enum:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _EnumEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[ExpansionMethods._Enum.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        JAVA_CLASS_LOOKUP: ExpansionMethods._Enum.ValueType  # 0
+        """Expand a Java transform using specified constructor and builder methods.
+        Transform payload will be of type JavaClassLookupPayload.
+        """
+        SCHEMA_TRANSFORM: ExpansionMethods._Enum.ValueType  # 1
+        """Expanding a SchemaTransform identified by the expansion service.
+        Transform payload will be of type  SchemaTransformPayload.
+        """
+
+    class Enum(_Enum, metaclass=_EnumEnumTypeWrapper): ...
+    JAVA_CLASS_LOOKUP: ExpansionMethods.Enum.ValueType  # 0
+    """Expand a Java transform using specified constructor and builder methods.
+    Transform payload will be of type JavaClassLookupPayload.
+    """
+    SCHEMA_TRANSFORM: ExpansionMethods.Enum.ValueType  # 1
+    """Expanding a SchemaTransform identified by the expansion service.
+    Transform payload will be of type  SchemaTransformPayload.
+    """
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ExpansionMethods: _TypeAlias = ExpansionMethods  # noqa: Y015
+
+@_typing.final
+class ManagedTransforms(_message.Message):
+    """Defines the URNs for managed transforms."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _Urns:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _UrnsEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[ManagedTransforms._Urns.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        ICEBERG_READ: ManagedTransforms._Urns.ValueType  # 0
+        ICEBERG_WRITE: ManagedTransforms._Urns.ValueType  # 1
+        KAFKA_READ: ManagedTransforms._Urns.ValueType  # 2
+        KAFKA_WRITE: ManagedTransforms._Urns.ValueType  # 3
+        BIGQUERY_READ: ManagedTransforms._Urns.ValueType  # 4
+        BIGQUERY_WRITE: ManagedTransforms._Urns.ValueType  # 5
+        ICEBERG_CDC_READ: ManagedTransforms._Urns.ValueType  # 6
+        POSTGRES_READ: ManagedTransforms._Urns.ValueType  # 7
+        POSTGRES_WRITE: ManagedTransforms._Urns.ValueType  # 8
+        MYSQL_READ: ManagedTransforms._Urns.ValueType  # 9
+        MYSQL_WRITE: ManagedTransforms._Urns.ValueType  # 10
+        SQL_SERVER_READ: ManagedTransforms._Urns.ValueType  # 11
+        SQL_SERVER_WRITE: ManagedTransforms._Urns.ValueType  # 12
+
+    class Urns(_Urns, metaclass=_UrnsEnumTypeWrapper): ...
+    ICEBERG_READ: ManagedTransforms.Urns.ValueType  # 0
+    ICEBERG_WRITE: ManagedTransforms.Urns.ValueType  # 1
+    KAFKA_READ: ManagedTransforms.Urns.ValueType  # 2
+    KAFKA_WRITE: ManagedTransforms.Urns.ValueType  # 3
+    BIGQUERY_READ: ManagedTransforms.Urns.ValueType  # 4
+    BIGQUERY_WRITE: ManagedTransforms.Urns.ValueType  # 5
+    ICEBERG_CDC_READ: ManagedTransforms.Urns.ValueType  # 6
+    POSTGRES_READ: ManagedTransforms.Urns.ValueType  # 7
+    POSTGRES_WRITE: ManagedTransforms.Urns.ValueType  # 8
+    MYSQL_READ: ManagedTransforms.Urns.ValueType  # 9
+    MYSQL_WRITE: ManagedTransforms.Urns.ValueType  # 10
+    SQL_SERVER_READ: ManagedTransforms.Urns.ValueType  # 11
+    SQL_SERVER_WRITE: ManagedTransforms.Urns.ValueType  # 12
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ManagedTransforms: _TypeAlias = ManagedTransforms  # noqa: Y015
+
+@_typing.final
+class JavaClassLookupPayload(_message.Message):
+    """A configuration payload for an external transform.
+    Used to define a Java transform that can be directly instantiated by a Java
+    expansion service.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    CLASS_NAME_FIELD_NUMBER: _builtins.int
+    CONSTRUCTOR_METHOD_FIELD_NUMBER: _builtins.int
+    CONSTRUCTOR_SCHEMA_FIELD_NUMBER: _builtins.int
+    CONSTRUCTOR_PAYLOAD_FIELD_NUMBER: _builtins.int
+    BUILDER_METHODS_FIELD_NUMBER: _builtins.int
+    class_name: _builtins.str
+    """Name of the Java transform class."""
+    constructor_method: _builtins.str
+    """A static method to construct the initial instance of the transform.
+    If not provided, the transform should be instantiated using a class
+    constructor.
+    """
+    constructor_payload: _builtins.bytes
+    """A payload which can be decoded using beam:coder:row:v1 and the provided
+    constructor schema.
+    """
+    @_builtins.property
+    def constructor_schema(self) -> _schema_pb2.Schema:
+        """The top level fields of the schema represent the method parameters in
+        order.
+        If able, top level field names are also verified against the method
+        parameters for a match.
+        Any field names in the form 'ignore[0-9]+' will not be used for validation
+        hence that format can be used to represent arbitrary field names.
+        """
+
+    @_builtins.property
+    def builder_methods(self) -> _containers.RepeatedCompositeFieldContainer[Global___BuilderMethod]:
+        """Set of builder methods and corresponding parameters to apply after the
+        transform object is constructed.
+        When constructing the transform object, given builder methods will be
+        applied in order.
+        """
+
+    def __init__(
+        self,
+        *,
+        class_name: _builtins.str | None = ...,
+        constructor_method: _builtins.str | None = ...,
+        constructor_schema: _schema_pb2.Schema | None = ...,
+        constructor_payload: _builtins.bytes | None = ...,
+        builder_methods: _abc.Iterable[Global___BuilderMethod] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["constructor_schema", b"constructor_schema"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["builder_methods", b"builder_methods", "class_name", b"class_name", "constructor_method", b"constructor_method", "constructor_payload", b"constructor_payload", "constructor_schema", b"constructor_schema"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___JavaClassLookupPayload: _TypeAlias = JavaClassLookupPayload  # noqa: Y015
+
+@_typing.final
+class BuilderMethod(_message.Message):
+    """This represents a builder method of the transform class that should be
+    applied in-order after instantiating the initial transform object.
+    Each builder method may take one or more parameters and has to return an
+    instance of the transform object.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: _builtins.int
+    SCHEMA_FIELD_NUMBER: _builtins.int
+    PAYLOAD_FIELD_NUMBER: _builtins.int
+    name: _builtins.str
+    """Name of the builder method"""
+    payload: _builtins.bytes
+    """A payload which can be decoded using beam:coder:row:v1 and the builder
+    method schema.
+    """
+    @_builtins.property
+    def schema(self) -> _schema_pb2.Schema:
+        """The top level fields of the schema represent the method parameters in
+        order.
+        If able, top level field names are also verified against the method
+        parameters for a match.
+        Any field names in the form 'ignore[0-9]+' will not be used for validation
+        hence that format can be used to represent arbitrary field names.
+        """
+
+    def __init__(
+        self,
+        *,
+        name: _builtins.str | None = ...,
+        schema: _schema_pb2.Schema | None = ...,
+        payload: _builtins.bytes | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["schema", b"schema"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["name", b"name", "payload", b"payload", "schema", b"schema"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___BuilderMethod: _TypeAlias = BuilderMethod  # noqa: Y015
+
+@_typing.final
+class Annotations(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _Enum:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _EnumEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[Annotations._Enum.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        CONFIG_ROW_KEY: Annotations._Enum.ValueType  # 0
+        """The annotation key for the encoded configuration Row used to build a transform"""
+        CONFIG_ROW_SCHEMA_KEY: Annotations._Enum.ValueType  # 1
+        """The annotation key for the configuration Schema used to decode the configuration Row"""
+        SCHEMATRANSFORM_URN_KEY: Annotations._Enum.ValueType  # 2
+        """If ths transform is a SchemaTransform, this is the annotation key for the SchemaTransform's URN"""
+        MANAGED_UNDERLYING_TRANSFORM_URN_KEY: Annotations._Enum.ValueType  # 3
+        """If the transform is a ManagedSchemaTransform, this is the annotation key for the underlying SchemaTransform's URN"""
+
+    class Enum(_Enum, metaclass=_EnumEnumTypeWrapper): ...
+    CONFIG_ROW_KEY: Annotations.Enum.ValueType  # 0
+    """The annotation key for the encoded configuration Row used to build a transform"""
+    CONFIG_ROW_SCHEMA_KEY: Annotations.Enum.ValueType  # 1
+    """The annotation key for the configuration Schema used to decode the configuration Row"""
+    SCHEMATRANSFORM_URN_KEY: Annotations.Enum.ValueType  # 2
+    """If ths transform is a SchemaTransform, this is the annotation key for the SchemaTransform's URN"""
+    MANAGED_UNDERLYING_TRANSFORM_URN_KEY: Annotations.Enum.ValueType  # 3
+    """If the transform is a ManagedSchemaTransform, this is the annotation key for the underlying SchemaTransform's URN"""
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Annotations: _TypeAlias = Annotations  # noqa: Y015
+
+@_typing.final
+class SchemaTransformPayload(_message.Message):
+    """Payload for a Schema-aware PTransform.
+    This is a transform that is aware of its input and output PCollection schemas
+    and is configured using Beam Schema-compatible parameters.
+    The information available in the payload can be used to instantiate the schema-aware transform.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    IDENTIFIER_FIELD_NUMBER: _builtins.int
+    CONFIGURATION_SCHEMA_FIELD_NUMBER: _builtins.int
+    CONFIGURATION_ROW_FIELD_NUMBER: _builtins.int
+    identifier: _builtins.str
+    """The identifier of the SchemaTransform (typically a URN)."""
+    configuration_row: _builtins.bytes
+    """The configuration of the SchemaTransform.
+    Should be decodable via beam:coder:row:v1.
+    The schema of the Row should be compatible with the schema of the
+    SchemaTransform.
+    """
+    @_builtins.property
+    def configuration_schema(self) -> _schema_pb2.Schema:
+        """The configuration schema of the SchemaTransform."""
+
+    def __init__(
+        self,
+        *,
+        identifier: _builtins.str | None = ...,
+        configuration_schema: _schema_pb2.Schema | None = ...,
+        configuration_row: _builtins.bytes | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["configuration_schema", b"configuration_schema"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["configuration_row", b"configuration_row", "configuration_schema", b"configuration_schema", "identifier", b"identifier"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SchemaTransformPayload: _TypeAlias = SchemaTransformPayload  # noqa: Y015
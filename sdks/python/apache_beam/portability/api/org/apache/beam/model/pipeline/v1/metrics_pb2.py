@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: org/apache/beam/model/pipeline/v1/metrics.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'org/apache/beam/model/pipeline/v1/metrics.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_beam__runner__api__pb2
+from google.protobuf import descriptor_pb2 as google_dot_protobuf_dot_descriptor__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n/org/apache/beam/model/pipeline/v1/metrics.proto\x12!org.apache.beam.model.pipeline.v1\x1a\x37org/apache/beam/model/pipeline/v1/beam_runner_api.proto\x1a google/protobuf/descriptor.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\x8c\x01\n\x12MonitoringInfoSpec\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x17\n\x0frequired_labels\x18\x03 \x03(\t\x12\x42\n\x0b\x61nnotations\x18\x04 \x03(\x0b\x32-.org.apache.beam.model.pipeline.v1.Annotation\"(\n\nAnnotation\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"\xec\'\n\x13MonitoringInfoSpecs\"\xd4\'\n\x04\x45num\x12\xa7\x01\n\x0eUSER_SUM_INT64\x10\x00\x1a\x92\x01\xd2\xa7\xa7\x96\x06\x8b\x01\n\x1d\x62\x65\x61m:metric:user:sum_int64:v1\x12\x19\x62\x65\x61m:metrics:sum_int64:v1\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"2\n\x0b\x64\x65scription\x12#URN utilized to report user metric.\x12\xaa\x01\n\x0fUSER_SUM_DOUBLE\x10\x01\x1a\x94\x01\xd2\xa7\xa7\x96\x06\x8d\x01\n\x1e\x62\x65\x61m:metric:user:sum_double:v1\x12\x1a\x62\x65\x61m:metrics:sum_double:v1\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"2\n\x0b\x64\x65scription\x12#URN utilized to report user metric.\x12\xc2\x01\n\x17USER_DISTRIBUTION_INT64\x10\x02\x1a\xa4\x01\xd2\xa7\xa7\x96\x06\x9d\x01\n&beam:metric:user:distribution_int64:v1\x12\"beam:metrics:distribution_int64:v1\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"2\n\x0b\x64\x65scription\x12#URN utilized to report user metric.\x12\xc5\x01\n\x18USER_DISTRIBUTION_DOUBLE\x10\x03\x1a\xa6\x01\xd2\xa7\xa7\x96\x06\x9f\x01\n\'beam:metric:user:distribution_double:v1\x12#beam:metrics:distribution_double:v1\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"2\n\x0b\x64\x65scription\x12#URN utilized to report user metric.\x12\xb0\x01\n\x11USER_LATEST_INT64\x10\x04\x1a\x98\x01\xd2\xa7\xa7\x96\x06\x91\x01\n beam:metric:user:latest_int64:v1\x12\x1c\x62\x65\x61m:metrics:latest_int64:v1\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"2\n\x0b\x64\x65scription\x12#URN utilized to report user metric.\x12\xb3\x01\n\x12USER_LATEST_DOUBLE\x10\x05\x1a\x9a\x01\xd2\xa7\xa7\x96\x06\x93\x01\n!beam:metric:user:latest_double:v1\x12\x1d\x62\x65\x61m:metrics:latest_double:v1\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"2\n\x0b\x64\x65scription\x12#URN utilized to report user metric.\x12\xad\x01\n\x10USER_TOP_N_INT64\x10\x06\x1a\x96\x01\xd2\xa7\xa7\x96\x06\x8f\x01\n\x1f\x62\x65\x61m:metric:user:top_n_int64:v1\x12\x1b\x62\x65\x61m:metrics:top_n_int64:v1\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"2\n\x0b\x64\x65scription\x12#URN utilized to report user metric.\x12\xb0\x01\n\x11USER_TOP_N_DOUBLE\x10\x07\x1a\x98\x01\xd2\xa7\xa7\x96\x06\x91\x01\n beam:metric:user:top_n_double:v1\x12\x1c\x62\x65\x61m:metrics:top_n_double:v1\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"2\n\x0b\x64\x65scription\x12#URN utilized to report user metric.\x12\xb6\x01\n\x13USER_BOTTOM_N_INT64\x10\x08\x1a\x9c\x01\xd2\xa7\xa7\x96\x06\x95\x01\n\"beam:metric:user:bottom_n_int64:v1\x12\x1e\x62\x65\x61m:metrics:bottom_n_int64:v1\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"2\n\x0b\x64\x65scription\x12#URN utilized to report user metric.\x12\xb9\x01\n\x14USER_BOTTOM_N_DOUBLE\x10\t\x1a\x9e\x01\xd2\xa7\xa7\x96\x06\x97\x01\n#beam:metric:user:bottom_n_double:v1\x12\x1f\x62\x65\x61m:metrics:bottom_n_double:v1\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"2\n\x0b\x64\x65scription\x12#URN utilized to report user metric.\x12\xaa\x01\n\x0fUSER_SET_STRING\x10\x15\x1a\x94\x01\xd2\xa7\xa7\x96\x06\x8d\x01\n\x1e\x62\x65\x61m:metric:user:set_string:v1\x12\x1a\x62\x65\x61m:metrics:set_string:v1\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"2\n\x0b\x64\x65scription\x12#URN utilized to report user metric.\x12\xb0\x01\n\x11USER_BOUNDED_TRIE\x10\x16\x1a\x98\x01\xd2\xa7\xa7\x96\x06\x91\x01\n beam:metric:user:bounded_trie:v1\x12\x1c\x62\x65\x61m:metrics:bounded_trie:v1\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"2\n\x0b\x64\x65scription\x12#URN utilized to report user metric.\x12\xad\x01\n\rELEMENT_COUNT\x10\n\x1a\x99\x01\xd2\xa7\xa7\x96\x06\x92\x01\n\x1c\x62\x65\x61m:metric:element_count:v1\x12\x19\x62\x65\x61m:metrics:sum_int64:v1\x1a\x0bPCOLLECTION\"J\n\x0b\x64\x65scription\x12;The total elements output to a Pcollection by a PTransform.\x12\xcd\x02\n\x11SAMPLED_BYTE_SIZE\x10\x0b\x1a\xb5\x02\xd2\xa7\xa7\x96\x06\xae\x02\n beam:metric:sampled_byte_size:v1\x12\"beam:metrics:distribution_int64:v1\x1a\x0bPCOLLECTION\"\xd8\x01\n\x0b\x64\x65scription\x12\xc8\x01The total byte size and count of a sampled  set (or all) of elements in the pcollection. Sampling is used  because calculating the byte count involves serializing the  elements which is CPU intensive.\x12\xd9\x01\n\x12START_BUNDLE_MSECS\x10\x0c\x1a\xc0\x01\xd2\xa7\xa7\x96\x06\xb9\x01\n6beam:metric:pardo_execution_time:start_bundle_msecs:v1\x12\x19\x62\x65\x61m:metrics:sum_int64:v1\x1a\nPTRANSFORM\"X\n\x0b\x64\x65scription\x12IThe total estimated execution time of the start bundlefunction in a pardo\x12\xdf\x01\n\x14PROCESS_BUNDLE_MSECS\x10\r\x1a\xc4\x01\xd2\xa7\xa7\x96\x06\xbd\x01\n8beam:metric:pardo_execution_time:process_bundle_msecs:v1\x12\x19\x62\x65\x61m:metrics:sum_int64:v1\x1a\nPTRANSFORM\"Z\n\x0b\x64\x65scription\x12KThe total estimated execution time of the process bundlefunction in a pardo\x12\xdd\x01\n\x13\x46INISH_BUNDLE_MSECS\x10\x0e\x1a\xc3\x01\xd2\xa7\xa7\x96\x06\xbc\x01\n7beam:metric:pardo_execution_time:finish_bundle_msecs:v1\x12\x19\x62\x65\x61m:metrics:sum_int64:v1\x1a\nPTRANSFORM\"Z\n\x0b\x64\x65scription\x12KThe total estimated execution time of the finish bundle function in a pardo\x12\xbb\x01\n\x0bTOTAL_MSECS\x10\x0f\x1a\xa9\x01\xd2\xa7\xa7\x96\x06\xa2\x01\n4beam:metric:ptransform_execution_time:total_msecs:v1\x12\x19\x62\x65\x61m:metrics:sum_int64:v1\x1a\nPTRANSFORM\"C\n\x0b\x64\x65scription\x12\x34The total estimated execution time of the ptransform\x12\x9f\x02\n\x0eWORK_REMAINING\x10\x10\x1a\x8a\x02\xd2\xa7\xa7\x96\x06\x83\x02\n,beam:metric:ptransform_progress:remaining:v1\x12\x18\x62\x65\x61m:metrics:progress:v1\x1a\nPTRANSFORM\"\xac\x01\n\x0b\x64\x65scription\x12\x9c\x01The remaining amount of work for each active element. Each active element represents an independent amount of work not shared with any other active element.\x12\x9f\x02\n\x0eWORK_COMPLETED\x10\x11\x1a\x8a\x02\xd2\xa7\xa7\x96\x06\x83\x02\n,beam:metric:ptransform_progress:completed:v1\x12\x18\x62\x65\x61m:metrics:progress:v1\x1a\nPTRANSFORM\"\xac\x01\n\x0b\x64\x65scription\x12\x9c\x01The remaining amount of work for each active element. Each active element represents an independent amount of work not shared with any other active element.\x12\xa8\x01\n\x17\x44\x41TA_CHANNEL_READ_INDEX\x10\x12\x1a\x8a\x01\xd2\xa7\xa7\x96\x06\x83\x01\n&beam:metric:data_channel:read_index:v1\x12\x19\x62\x65\x61m:metrics:sum_int64:v1\x1a\nPTRANSFORM\"2\n\x0b\x64\x65scription\x12#The read index of the data channel.\x12\x8a\x02\n\x11\x41PI_REQUEST_COUNT\x10\x13\x1a\xf2\x01\xd2\xa7\xa7\x96\x06\xeb\x01\n#beam:metric:io:api_request_count:v1\x12\x19\x62\x65\x61m:metrics:sum_int64:v1\x1a\x07SERVICE\x1a\x06METHOD\x1a\x08RESOURCE\x1a\nPTRANSFORM\x1a\x06STATUS\"b\n\x0b\x64\x65scription\x12SRequest counts with status made to IO service APIs to batch read or write elements.\"\x16\n\x0eprocess_metric\x12\x04true\x12\xb3\x02\n\x15\x41PI_REQUEST_LATENCIES\x10\x14\x1a\x97\x02\xd2\xa7\xa7\x96\x06\x90\x02\n\'beam:metric:io:api_request_latencies:v1\x12\x1f\x62\x65\x61m:metrics:histogram_int64:v1\x1a\x07SERVICE\x1a\x06METHOD\x1a\x08RESOURCE\x1a\nPTRANSFORM\"n\n\x0b\x64\x65scription\x12_Histogram counts for request latencies made to IO service APIs to batch read or write elements.\"\x15\n\x05units\x12\x0cMilliseconds\"\x16\n\x0eprocess_metric\x12\x04true\x12\xb8\x01\n\x0eUSER_HISTOGRAM\x10\x17\x1a\xa3\x01\xd2\xa7\xa7\x96\x06\x9c\x01\n#beam:metric:user:histogram_int64:v1\x12\x1f\x62\x65\x61m:metrics:histogram_int64:v1\x1a\nPTRANSFORM\x1a\tNAMESPACE\x1a\x04NAME\"7\n\x0b\x64\x65scription\x12(URN utilized to report histogram metric.\"(\n\x18MonitoringInfoLabelProps\x12\x0c\n\x04name\x18\x01 \x01(\t\"\xcc\x0b\n\x0eMonitoringInfo\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0c\n\x04type\x18\x02 \x01(\t\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\x12M\n\x06labels\x18\x04 \x03(\x0b\x32=.org.apache.beam.model.pipeline.v1.MonitoringInfo.LabelsEntry\x12.\n\nstart_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a-\n\x0bLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xdf\t\n\x14MonitoringInfoLabels\x12!\n\tTRANSFORM\x10\x00\x1a\x12\xa2\xd4\xe0\xe5\x03\x0c\n\nPTRANSFORM\x12$\n\x0bPCOLLECTION\x10\x01\x1a\x13\xa2\xd4\xe0\xe5\x03\r\n\x0bPCOLLECTION\x12\x32\n\x12WINDOWING_STRATEGY\x10\x02\x1a\x1a\xa2\xd4\xe0\xe5\x03\x14\n\x12WINDOWING_STRATEGY\x12\x18\n\x05\x43ODER\x10\x03\x1a\r\xa2\xd4\xe0\xe5\x03\x07\n\x05\x43ODER\x12$\n\x0b\x45NVIRONMENT\x10\x04\x1a\x13\xa2\xd4\xe0\xe5\x03\r\n\x0b\x45NVIRONMENT\x12 \n\tNAMESPACE\x10\x05\x1a\x11\xa2\xd4\xe0\xe5\x03\x0b\n\tNAMESPACE\x12\x16\n\x04NAME\x10\x06\x1a\x0c\xa2\xd4\xe0\xe5\x03\x06\n\x04NAME\x12\x1c\n\x07SERVICE\x10\x07\x1a\x0f\xa2\xd4\xe0\xe5\x03\t\n\x07SERVICE\x12\x1a\n\x06METHOD\x10\x08\x1a\x0e\xa2\xd4\xe0\xe5\x03\x08\n\x06METHOD\x12\x1e\n\x08RESOURCE\x10\t\x1a\x10\xa2\xd4\xe0\xe5\x03\n\n\x08RESOURCE\x12\x1a\n\x06STATUS\x10\n\x1a\x0e\xa2\xd4\xe0\xe5\x03\x08\n\x06STATUS\x12\x34\n\x13\x42IGQUERY_PROJECT_ID\x10\x0b\x1a\x1b\xa2\xd4\xe0\xe5\x03\x15\n\x13\x42IGQUERY_PROJECT_ID\x12.\n\x10\x42IGQUERY_DATASET\x10\x0c\x1a\x18\xa2\xd4\xe0\xe5\x03\x12\n\x10\x42IGQUERY_DATASET\x12*\n\x0e\x42IGQUERY_TABLE\x10\r\x1a\x16\xa2\xd4\xe0\xe5\x03\x10\n\x0e\x42IGQUERY_TABLE\x12(\n\rBIGQUERY_VIEW\x10\x0e\x1a\x15\xa2\xd4\xe0\xe5\x03\x0f\n\rBIGQUERY_VIEW\x12\x34\n\x13\x42IGQUERY_QUERY_NAME\x10\x0f\x1a\x1b\xa2\xd4\xe0\xe5\x03\x15\n\x13\x42IGQUERY_QUERY_NAME\x12\"\n\nGCS_BUCKET\x10\x10\x1a\x12\xa2\xd4\xe0\xe5\x03\x0c\n\nGCS_BUCKET\x12*\n\x0eGCS_PROJECT_ID\x10\x11\x1a\x16\xa2\xd4\xe0\xe5\x03\x10\n\x0eGCS_PROJECT_ID\x12\x30\n\x11\x44\x41TASTORE_PROJECT\x10\x12\x1a\x19\xa2\xd4\xe0\xe5\x03\x13\n\x11\x44\x41TASTORE_PROJECT\x12\x34\n\x13\x44\x41TASTORE_NAMESPACE\x10\x13\x1a\x1b\xa2\xd4\xe0\xe5\x03\x15\n\x13\x44\x41TASTORE_NAMESPACE\x12\x34\n\x13\x42IGTABLE_PROJECT_ID\x10\x14\x1a\x1b\xa2\xd4\xe0\xe5\x03\x15\n\x13\x42IGTABLE_PROJECT_ID\x12$\n\x0bINSTANCE_ID\x10\x15\x1a\x13\xa2\xd4\xe0\xe5\x03\r\n\x0bINSTANCE_ID\x12\x1e\n\x08TABLE_ID\x10\x16\x1a\x10\xa2\xd4\xe0\xe5\x03\n\n\x08TABLE_ID\x12\x32\n\x12SPANNER_PROJECT_ID\x10\x17\x1a\x1a\xa2\xd4\xe0\xe5\x03\x14\n\x12SPANNER_PROJECT_ID\x12\x34\n\x13SPANNER_DATABASE_ID\x10\x18\x1a\x1b\xa2\xd4\xe0\xe5\x03\x15\n\x13SPANNER_DATABASE_ID\x12.\n\x10SPANNER_TABLE_ID\x10\x19\x1a\x18\xa2\xd4\xe0\xe5\x03\x12\n\x10SPANNER_TABLE_ID\x12\x34\n\x13SPANNER_INSTANCE_ID\x10\x1a\x1a\x1b\xa2\xd4\xe0\xe5\x03\x15\n\x13SPANNER_INSTANCE_ID\x12\x32\n\x12SPANNER_QUERY_NAME\x10\x1b\x1a\x1a\xa2\xd4\xe0\xe5\x03\x14\n\x12SPANNER_QUERY_NAME\x12\x30\n\x11PER_WORKER_METRIC\x10\x1c\x1a\x19\xa2\xd4\xe0\xe5\x03\x13\n\x11PER_WORKER_METRIC\"\xe4\x06\n\x16MonitoringInfoTypeUrns\"\xc9\x06\n\x04\x45num\x12\x33\n\x0eSUM_INT64_TYPE\x10\x00\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:metrics:sum_int64:v1\x12\x35\n\x0fSUM_DOUBLE_TYPE\x10\x01\x1a \xa2\xb4\xfa\xc2\x05\x1a\x62\x65\x61m:metrics:sum_double:v1\x12\x45\n\x17\x44ISTRIBUTION_INT64_TYPE\x10\x02\x1a(\xa2\xb4\xfa\xc2\x05\"beam:metrics:distribution_int64:v1\x12G\n\x18\x44ISTRIBUTION_DOUBLE_TYPE\x10\x03\x1a)\xa2\xb4\xfa\xc2\x05#beam:metrics:distribution_double:v1\x12\x39\n\x11LATEST_INT64_TYPE\x10\x04\x1a\"\xa2\xb4\xfa\xc2\x05\x1c\x62\x65\x61m:metrics:latest_int64:v1\x12;\n\x12LATEST_DOUBLE_TYPE\x10\x05\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:metrics:latest_double:v1\x12\x37\n\x10TOP_N_INT64_TYPE\x10\x06\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:metrics:top_n_int64:v1\x12\x39\n\x11TOP_N_DOUBLE_TYPE\x10\x07\x1a\"\xa2\xb4\xfa\xc2\x05\x1c\x62\x65\x61m:metrics:top_n_double:v1\x12=\n\x13\x42OTTOM_N_INT64_TYPE\x10\x08\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:metrics:bottom_n_int64:v1\x12?\n\x14\x42OTTOM_N_DOUBLE_TYPE\x10\t\x1a%\xa2\xb4\xfa\xc2\x05\x1f\x62\x65\x61m:metrics:bottom_n_double:v1\x12\x31\n\rPROGRESS_TYPE\x10\n\x1a\x1e\xa2\xb4\xfa\xc2\x05\x18\x62\x65\x61m:metrics:progress:v1\x12\x35\n\x0fSET_STRING_TYPE\x10\x0b\x1a \xa2\xb4\xfa\xc2\x05\x1a\x62\x65\x61m:metrics:set_string:v1\x12\x39\n\x11\x42OUNDED_TRIE_TYPE\x10\x0c\x1a\"\xa2\xb4\xfa\xc2\x05\x1c\x62\x65\x61m:metrics:bounded_trie:v1\x12\x34\n\tHISTOGRAM\x10\r\x1a%\xa2\xb4\xfa\xc2\x05\x1f\x62\x65\x61m:metrics:histogram_int64:v1\"\xdd\x01\n\x0f\x42oundedTrieNode\x12\x11\n\ttruncated\x18\x01 \x01(\x08\x12R\n\x08\x63hildren\x18\x02 \x03(\x0b\x32@.org.apache.beam.model.pipeline.v1.BoundedTrieNode.ChildrenEntry\x1a\x63\n\rChildrenEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x41\n\x05value\x18\x02 \x01(\x0b\x32\x32.org.apache.beam.model.pipeline.v1.BoundedTrieNode:\x02\x38\x01\"q\n\x0b\x42oundedTrie\x12\r\n\x05\x62ound\x18\x01 \x01(\x05\x12@\n\x04root\x18\x02 \x01(\x0b\x32\x32.org.apache.beam.model.pipeline.v1.BoundedTrieNode\x12\x11\n\tsingleton\x18\x03 \x03(\t\"\xf8\x04\n\x0eHistogramValue\x12\x12\n\x05\x63ount\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\\\n\x0e\x62ucket_options\x18\x02 \x01(\x0b\x32?.org.apache.beam.model.pipeline.v1.HistogramValue.BucketOptionsH\x01\x88\x01\x01\x12\x15\n\rbucket_counts\x18\x03 \x03(\x03\x1a\xbf\x03\n\rBucketOptions\x12X\n\x06linear\x18\x01 \x01(\x0b\x32\x46.org.apache.beam.model.pipeline.v1.HistogramValue.BucketOptions.LinearH\x00\x12\x64\n\x0b\x65xponential\x18\x02 \x01(\x0b\x32M.org.apache.beam.model.pipeline.v1.HistogramValue.BucketOptions.Base2ExponentH\x00\x1az\n\x06Linear\x12\x1e\n\x11number_of_buckets\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x12\n\x05width\x18\x02 \x01(\x01H\x01\x88\x01\x01\x12\x12\n\x05start\x18\x03 \x01(\x01H\x02\x88\x01\x01\x42\x14\n\x12_number_of_bucketsB\x08\n\x06_widthB\x08\n\x06_start\x1a\x63\n\rBase2Exponent\x12\x1e\n\x11number_of_buckets\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\x12\n\x05scale\x18\x02 \x01(\x05H\x01\x88\x01\x01\x42\x14\n\x12_number_of_bucketsB\x08\n\x06_scaleB\r\n\x0b\x62ucket_typeB\x08\n\x06_countB\x11\n\x0f_bucket_options:v\n\x0blabel_props\x12!.google.protobuf.EnumValueOptions\x18\xc4\x8a\xdc< \x01(\x0b\x32;.org.apache.beam.model.pipeline.v1.MonitoringInfoLabelProps:y\n\x14monitoring_info_spec\x12!.google.protobuf.EnumValueOptions\x18\xfa\xf4\xe4\x62 \x01(\x0b\x32\x35.org.apache.beam.model.pipeline.v1.MonitoringInfoSpecBy\n!org.apache.beam.model.pipeline.v1B\nMetricsApiZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1b\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'org.apache.beam.model.pipeline.v1.metrics_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n!org.apache.beam.model.pipeline.v1B\nMetricsApiZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_SUM_INT64"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_SUM_INT64"]._serialized_options = b'\322\247\247\226\006\213\001\n\035beam:metric:user:sum_int64:v1\022\031beam:metrics:sum_int64:v1\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"2\n\013description\022#URN utilized to report user metric.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_SUM_DOUBLE"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_SUM_DOUBLE"]._serialized_options = b'\322\247\247\226\006\215\001\n\036beam:metric:user:sum_double:v1\022\032beam:metrics:sum_double:v1\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"2\n\013description\022#URN utilized to report user metric.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_DISTRIBUTION_INT64"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_DISTRIBUTION_INT64"]._serialized_options = b'\322\247\247\226\006\235\001\n&beam:metric:user:distribution_int64:v1\022\"beam:metrics:distribution_int64:v1\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"2\n\013description\022#URN utilized to report user metric.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_DISTRIBUTION_DOUBLE"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_DISTRIBUTION_DOUBLE"]._serialized_options = b'\322\247\247\226\006\237\001\n\'beam:metric:user:distribution_double:v1\022#beam:metrics:distribution_double:v1\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"2\n\013description\022#URN utilized to report user metric.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_LATEST_INT64"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_LATEST_INT64"]._serialized_options = b'\322\247\247\226\006\221\001\n beam:metric:user:latest_int64:v1\022\034beam:metrics:latest_int64:v1\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"2\n\013description\022#URN utilized to report user metric.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_LATEST_DOUBLE"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_LATEST_DOUBLE"]._serialized_options = b'\322\247\247\226\006\223\001\n!beam:metric:user:latest_double:v1\022\035beam:metrics:latest_double:v1\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"2\n\013description\022#URN utilized to report user metric.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_TOP_N_INT64"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_TOP_N_INT64"]._serialized_options = b'\322\247\247\226\006\217\001\n\037beam:metric:user:top_n_int64:v1\022\033beam:metrics:top_n_int64:v1\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"2\n\013description\022#URN utilized to report user metric.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_TOP_N_DOUBLE"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_TOP_N_DOUBLE"]._serialized_options = b'\322\247\247\226\006\221\001\n beam:metric:user:top_n_double:v1\022\034beam:metrics:top_n_double:v1\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"2\n\013description\022#URN utilized to report user metric.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_BOTTOM_N_INT64"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_BOTTOM_N_INT64"]._serialized_options = b'\322\247\247\226\006\225\001\n\"beam:metric:user:bottom_n_int64:v1\022\036beam:metrics:bottom_n_int64:v1\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"2\n\013description\022#URN utilized to report user metric.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_BOTTOM_N_DOUBLE"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_BOTTOM_N_DOUBLE"]._serialized_options = b'\322\247\247\226\006\227\001\n#beam:metric:user:bottom_n_double:v1\022\037beam:metrics:bottom_n_double:v1\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"2\n\013description\022#URN utilized to report user metric.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_SET_STRING"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_SET_STRING"]._serialized_options = b'\322\247\247\226\006\215\001\n\036beam:metric:user:set_string:v1\022\032beam:metrics:set_string:v1\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"2\n\013description\022#URN utilized to report user metric.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_BOUNDED_TRIE"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_BOUNDED_TRIE"]._serialized_options = b'\322\247\247\226\006\221\001\n beam:metric:user:bounded_trie:v1\022\034beam:metrics:bounded_trie:v1\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"2\n\013description\022#URN utilized to report user metric.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["ELEMENT_COUNT"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["ELEMENT_COUNT"]._serialized_options = b'\322\247\247\226\006\222\001\n\034beam:metric:element_count:v1\022\031beam:metrics:sum_int64:v1\032\013PCOLLECTION\"J\n\013description\022;The total elements output to a Pcollection by a PTransform.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["SAMPLED_BYTE_SIZE"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["SAMPLED_BYTE_SIZE"]._serialized_options = b'\322\247\247\226\006\256\002\n beam:metric:sampled_byte_size:v1\022\"beam:metrics:distribution_int64:v1\032\013PCOLLECTION\"\330\001\n\013description\022\310\001The total byte size and count of a sampled  set (or all) of elements in the pcollection. Sampling is used  because calculating the byte count involves serializing the  elements which is CPU intensive.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["START_BUNDLE_MSECS"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["START_BUNDLE_MSECS"]._serialized_options = b'\322\247\247\226\006\271\001\n6beam:metric:pardo_execution_time:start_bundle_msecs:v1\022\031beam:metrics:sum_int64:v1\032\nPTRANSFORM\"X\n\013description\022IThe total estimated execution time of the start bundlefunction in a pardo'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["PROCESS_BUNDLE_MSECS"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["PROCESS_BUNDLE_MSECS"]._serialized_options = b'\322\247\247\226\006\275\001\n8beam:metric:pardo_execution_time:process_bundle_msecs:v1\022\031beam:metrics:sum_int64:v1\032\nPTRANSFORM\"Z\n\013description\022KThe total estimated execution time of the process bundlefunction in a pardo'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["FINISH_BUNDLE_MSECS"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["FINISH_BUNDLE_MSECS"]._serialized_options = b'\322\247\247\226\006\274\001\n7beam:metric:pardo_execution_time:finish_bundle_msecs:v1\022\031beam:metrics:sum_int64:v1\032\nPTRANSFORM\"Z\n\013description\022KThe total estimated execution time of the finish bundle function in a pardo'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["TOTAL_MSECS"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["TOTAL_MSECS"]._serialized_options = b'\322\247\247\226\006\242\001\n4beam:metric:ptransform_execution_time:total_msecs:v1\022\031beam:metrics:sum_int64:v1\032\nPTRANSFORM\"C\n\013description\0224The total estimated execution time of the ptransform'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["WORK_REMAINING"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["WORK_REMAINING"]._serialized_options = b'\322\247\247\226\006\203\002\n,beam:metric:ptransform_progress:remaining:v1\022\030beam:metrics:progress:v1\032\nPTRANSFORM\"\254\001\n\013description\022\234\001The remaining amount of work for each active element. Each active element represents an independent amount of work not shared with any other active element.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["WORK_COMPLETED"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["WORK_COMPLETED"]._serialized_options = b'\322\247\247\226\006\203\002\n,beam:metric:ptransform_progress:completed:v1\022\030beam:metrics:progress:v1\032\nPTRANSFORM\"\254\001\n\013description\022\234\001The remaining amount of work for each active element. Each active element represents an independent amount of work not shared with any other active element.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["DATA_CHANNEL_READ_INDEX"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["DATA_CHANNEL_READ_INDEX"]._serialized_options = b'\322\247\247\226\006\203\001\n&beam:metric:data_channel:read_index:v1\022\031beam:metrics:sum_int64:v1\032\nPTRANSFORM\"2\n\013description\022#The read index of the data channel.'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["API_REQUEST_COUNT"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["API_REQUEST_COUNT"]._serialized_options = b'\322\247\247\226\006\353\001\n#beam:metric:io:api_request_count:v1\022\031beam:metrics:sum_int64:v1\032\007SERVICE\032\006METHOD\032\010RESOURCE\032\nPTRANSFORM\032\006STATUS\"b\n\013description\022SRequest counts with status made to IO service APIs to batch read or write elements.\"\026\n\016process_metric\022\004true'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["API_REQUEST_LATENCIES"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["API_REQUEST_LATENCIES"]._serialized_options = b'\322\247\247\226\006\220\002\n\'beam:metric:io:api_request_latencies:v1\022\037beam:metrics:histogram_int64:v1\032\007SERVICE\032\006METHOD\032\010RESOURCE\032\nPTRANSFORM\"n\n\013description\022_Histogram counts for request latencies made to IO service APIs to batch read or write elements.\"\025\n\005units\022\014Milliseconds\"\026\n\016process_metric\022\004true'
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_HISTOGRAM"]._loaded_options = None
+  _globals['_MONITORINGINFOSPECS_ENUM'].values_by_name["USER_HISTOGRAM"]._serialized_options = b'\322\247\247\226\006\234\001\n#beam:metric:user:histogram_int64:v1\022\037beam:metrics:histogram_int64:v1\032\nPTRANSFORM\032\tNAMESPACE\032\004NAME\"7\n\013description\022(URN utilized to report histogram metric.'
+  _globals['_MONITORINGINFO_LABELSENTRY']._loaded_options = None
+  _globals['_MONITORINGINFO_LABELSENTRY']._serialized_options = b'8\001'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["TRANSFORM"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["TRANSFORM"]._serialized_options = b'\242\324\340\345\003\014\n\nPTRANSFORM'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["PCOLLECTION"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["PCOLLECTION"]._serialized_options = b'\242\324\340\345\003\r\n\013PCOLLECTION'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["WINDOWING_STRATEGY"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["WINDOWING_STRATEGY"]._serialized_options = b'\242\324\340\345\003\024\n\022WINDOWING_STRATEGY'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["CODER"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["CODER"]._serialized_options = b'\242\324\340\345\003\007\n\005CODER'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["ENVIRONMENT"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["ENVIRONMENT"]._serialized_options = b'\242\324\340\345\003\r\n\013ENVIRONMENT'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["NAMESPACE"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["NAMESPACE"]._serialized_options = b'\242\324\340\345\003\013\n\tNAMESPACE'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["NAME"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["NAME"]._serialized_options = b'\242\324\340\345\003\006\n\004NAME'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["SERVICE"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["SERVICE"]._serialized_options = b'\242\324\340\345\003\t\n\007SERVICE'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["METHOD"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["METHOD"]._serialized_options = b'\242\324\340\345\003\010\n\006METHOD'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["RESOURCE"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["RESOURCE"]._serialized_options = b'\242\324\340\345\003\n\n\010RESOURCE'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["STATUS"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["STATUS"]._serialized_options = b'\242\324\340\345\003\010\n\006STATUS'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["BIGQUERY_PROJECT_ID"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["BIGQUERY_PROJECT_ID"]._serialized_options = b'\242\324\340\345\003\025\n\023BIGQUERY_PROJECT_ID'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["BIGQUERY_DATASET"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["BIGQUERY_DATASET"]._serialized_options = b'\242\324\340\345\003\022\n\020BIGQUERY_DATASET'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["BIGQUERY_TABLE"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["BIGQUERY_TABLE"]._serialized_options = b'\242\324\340\345\003\020\n\016BIGQUERY_TABLE'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["BIGQUERY_VIEW"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["BIGQUERY_VIEW"]._serialized_options = b'\242\324\340\345\003\017\n\rBIGQUERY_VIEW'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["BIGQUERY_QUERY_NAME"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["BIGQUERY_QUERY_NAME"]._serialized_options = b'\242\324\340\345\003\025\n\023BIGQUERY_QUERY_NAME'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["GCS_BUCKET"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["GCS_BUCKET"]._serialized_options = b'\242\324\340\345\003\014\n\nGCS_BUCKET'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["GCS_PROJECT_ID"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["GCS_PROJECT_ID"]._serialized_options = b'\242\324\340\345\003\020\n\016GCS_PROJECT_ID'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["DATASTORE_PROJECT"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["DATASTORE_PROJECT"]._serialized_options = b'\242\324\340\345\003\023\n\021DATASTORE_PROJECT'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["DATASTORE_NAMESPACE"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["DATASTORE_NAMESPACE"]._serialized_options = b'\242\324\340\345\003\025\n\023DATASTORE_NAMESPACE'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["BIGTABLE_PROJECT_ID"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["BIGTABLE_PROJECT_ID"]._serialized_options = b'\242\324\340\345\003\025\n\023BIGTABLE_PROJECT_ID'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["INSTANCE_ID"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["INSTANCE_ID"]._serialized_options = b'\242\324\340\345\003\r\n\013INSTANCE_ID'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["TABLE_ID"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["TABLE_ID"]._serialized_options = b'\242\324\340\345\003\n\n\010TABLE_ID'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["SPANNER_PROJECT_ID"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["SPANNER_PROJECT_ID"]._serialized_options = b'\242\324\340\345\003\024\n\022SPANNER_PROJECT_ID'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["SPANNER_DATABASE_ID"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["SPANNER_DATABASE_ID"]._serialized_options = b'\242\324\340\345\003\025\n\023SPANNER_DATABASE_ID'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["SPANNER_TABLE_ID"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["SPANNER_TABLE_ID"]._serialized_options = b'\242\324\340\345\003\022\n\020SPANNER_TABLE_ID'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["SPANNER_INSTANCE_ID"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["SPANNER_INSTANCE_ID"]._serialized_options = b'\242\324\340\345\003\025\n\023SPANNER_INSTANCE_ID'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["SPANNER_QUERY_NAME"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["SPANNER_QUERY_NAME"]._serialized_options = b'\242\324\340\345\003\024\n\022SPANNER_QUERY_NAME'
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["PER_WORKER_METRIC"]._loaded_options = None
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS'].values_by_name["PER_WORKER_METRIC"]._serialized_options = b'\242\324\340\345\003\023\n\021PER_WORKER_METRIC'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["SUM_INT64_TYPE"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["SUM_INT64_TYPE"]._serialized_options = b'\242\264\372\302\005\031beam:metrics:sum_int64:v1'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["SUM_DOUBLE_TYPE"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["SUM_DOUBLE_TYPE"]._serialized_options = b'\242\264\372\302\005\032beam:metrics:sum_double:v1'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["DISTRIBUTION_INT64_TYPE"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["DISTRIBUTION_INT64_TYPE"]._serialized_options = b'\242\264\372\302\005\"beam:metrics:distribution_int64:v1'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["DISTRIBUTION_DOUBLE_TYPE"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["DISTRIBUTION_DOUBLE_TYPE"]._serialized_options = b'\242\264\372\302\005#beam:metrics:distribution_double:v1'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["LATEST_INT64_TYPE"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["LATEST_INT64_TYPE"]._serialized_options = b'\242\264\372\302\005\034beam:metrics:latest_int64:v1'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["LATEST_DOUBLE_TYPE"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["LATEST_DOUBLE_TYPE"]._serialized_options = b'\242\264\372\302\005\035beam:metrics:latest_double:v1'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["TOP_N_INT64_TYPE"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["TOP_N_INT64_TYPE"]._serialized_options = b'\242\264\372\302\005\033beam:metrics:top_n_int64:v1'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["TOP_N_DOUBLE_TYPE"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["TOP_N_DOUBLE_TYPE"]._serialized_options = b'\242\264\372\302\005\034beam:metrics:top_n_double:v1'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["BOTTOM_N_INT64_TYPE"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["BOTTOM_N_INT64_TYPE"]._serialized_options = b'\242\264\372\302\005\036beam:metrics:bottom_n_int64:v1'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["BOTTOM_N_DOUBLE_TYPE"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["BOTTOM_N_DOUBLE_TYPE"]._serialized_options = b'\242\264\372\302\005\037beam:metrics:bottom_n_double:v1'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["PROGRESS_TYPE"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["PROGRESS_TYPE"]._serialized_options = b'\242\264\372\302\005\030beam:metrics:progress:v1'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["SET_STRING_TYPE"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["SET_STRING_TYPE"]._serialized_options = b'\242\264\372\302\005\032beam:metrics:set_string:v1'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["BOUNDED_TRIE_TYPE"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["BOUNDED_TRIE_TYPE"]._serialized_options = b'\242\264\372\302\005\034beam:metrics:bounded_trie:v1'
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["HISTOGRAM"]._loaded_options = None
+  _globals['_MONITORINGINFOTYPEURNS_ENUM'].values_by_name["HISTOGRAM"]._serialized_options = b'\242\264\372\302\005\037beam:metrics:histogram_int64:v1'
+  _globals['_BOUNDEDTRIENODE_CHILDRENENTRY']._loaded_options = None
+  _globals['_BOUNDEDTRIENODE_CHILDRENENTRY']._serialized_options = b'8\001'
+  _globals['_MONITORINGINFOSPEC']._serialized_start=211
+  _globals['_MONITORINGINFOSPEC']._serialized_end=351
+  _globals['_ANNOTATION']._serialized_start=353
+  _globals['_ANNOTATION']._serialized_end=393
+  _globals['_MONITORINGINFOSPECS']._serialized_start=396
+  _globals['_MONITORINGINFOSPECS']._serialized_end=5496
+  _globals['_MONITORINGINFOSPECS_ENUM']._serialized_start=420
+  _globals['_MONITORINGINFOSPECS_ENUM']._serialized_end=5496
+  _globals['_MONITORINGINFOLABELPROPS']._serialized_start=5498
+  _globals['_MONITORINGINFOLABELPROPS']._serialized_end=5538
+  _globals['_MONITORINGINFO']._serialized_start=5541
+  _globals['_MONITORINGINFO']._serialized_end=7025
+  _globals['_MONITORINGINFO_LABELSENTRY']._serialized_start=5730
+  _globals['_MONITORINGINFO_LABELSENTRY']._serialized_end=5775
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS']._serialized_start=5778
+  _globals['_MONITORINGINFO_MONITORINGINFOLABELS']._serialized_end=7025
+  _globals['_MONITORINGINFOTYPEURNS']._serialized_start=7028
+  _globals['_MONITORINGINFOTYPEURNS']._serialized_end=7896
+  _globals['_MONITORINGINFOTYPEURNS_ENUM']._serialized_start=7055
+  _globals['_MONITORINGINFOTYPEURNS_ENUM']._serialized_end=7896
+  _globals['_BOUNDEDTRIENODE']._serialized_start=7899
+  _globals['_BOUNDEDTRIENODE']._serialized_end=8120
+  _globals['_BOUNDEDTRIENODE_CHILDRENENTRY']._serialized_start=8021
+  _globals['_BOUNDEDTRIENODE_CHILDRENENTRY']._serialized_end=8120
+  _globals['_BOUNDEDTRIE']._serialized_start=8122
+  _globals['_BOUNDEDTRIE']._serialized_end=8235
+  _globals['_HISTOGRAMVALUE']._serialized_start=8238
+  _globals['_HISTOGRAMVALUE']._serialized_end=8870
+  _globals['_HISTOGRAMVALUE_BUCKETOPTIONS']._serialized_start=8394
+  _globals['_HISTOGRAMVALUE_BUCKETOPTIONS']._serialized_end=8841
+  _globals['_HISTOGRAMVALUE_BUCKETOPTIONS_LINEAR']._serialized_start=8603
+  _globals['_HISTOGRAMVALUE_BUCKETOPTIONS_LINEAR']._serialized_end=8725
+  _globals['_HISTOGRAMVALUE_BUCKETOPTIONS_BASE2EXPONENT']._serialized_start=8727
+  _globals['_HISTOGRAMVALUE_BUCKETOPTIONS_BASE2EXPONENT']._serialized_end=8826
+# @@protoc_insertion_point(module_scope)
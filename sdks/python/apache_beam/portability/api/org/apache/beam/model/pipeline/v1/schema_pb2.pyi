@@ -0,0 +1,737 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+Protocol Buffers describing Beam Schemas, a portable representation for
+complex types.
+
+The primary application of Schema is as the payload for the standard coder
+"beam:coder:row:v1", defined in beam_runner_api.proto
+"""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from . import beam_runner_api_pb2 as _beam_runner_api_pb2
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class _AtomicType:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _AtomicTypeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_AtomicType.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    UNSPECIFIED: _AtomicType.ValueType  # 0
+    BYTE: _AtomicType.ValueType  # 1
+    INT16: _AtomicType.ValueType  # 2
+    INT32: _AtomicType.ValueType  # 3
+    INT64: _AtomicType.ValueType  # 4
+    FLOAT: _AtomicType.ValueType  # 5
+    DOUBLE: _AtomicType.ValueType  # 6
+    STRING: _AtomicType.ValueType  # 7
+    BOOLEAN: _AtomicType.ValueType  # 8
+    BYTES: _AtomicType.ValueType  # 9
+
+class AtomicType(_AtomicType, metaclass=_AtomicTypeEnumTypeWrapper): ...
+
+UNSPECIFIED: AtomicType.ValueType  # 0
+BYTE: AtomicType.ValueType  # 1
+INT16: AtomicType.ValueType  # 2
+INT32: AtomicType.ValueType  # 3
+INT64: AtomicType.ValueType  # 4
+FLOAT: AtomicType.ValueType  # 5
+DOUBLE: AtomicType.ValueType  # 6
+STRING: AtomicType.ValueType  # 7
+BOOLEAN: AtomicType.ValueType  # 8
+BYTES: AtomicType.ValueType  # 9
+Global___AtomicType: _TypeAlias = AtomicType  # noqa: Y015
+
+@_typing.final
+class Schema(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    FIELDS_FIELD_NUMBER: _builtins.int
+    ID_FIELD_NUMBER: _builtins.int
+    OPTIONS_FIELD_NUMBER: _builtins.int
+    ENCODING_POSITIONS_SET_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    """REQUIRED. An RFC 4122 UUID."""
+    encoding_positions_set: _builtins.bool
+    """Indicates that encoding positions have been overridden."""
+    @_builtins.property
+    def fields(self) -> _containers.RepeatedCompositeFieldContainer[Global___Field]:
+        """List of fields for this schema. Two fields may not share a name."""
+
+    @_builtins.property
+    def options(self) -> _containers.RepeatedCompositeFieldContainer[Global___Option]: ...
+    def __init__(
+        self,
+        *,
+        fields: _abc.Iterable[Global___Field] | None = ...,
+        id: _builtins.str | None = ...,
+        options: _abc.Iterable[Global___Option] | None = ...,
+        encoding_positions_set: _builtins.bool | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["encoding_positions_set", b"encoding_positions_set", "fields", b"fields", "id", b"id", "options", b"options"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Schema: _TypeAlias = Schema  # noqa: Y015
+
+@_typing.final
+class Field(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: _builtins.int
+    DESCRIPTION_FIELD_NUMBER: _builtins.int
+    TYPE_FIELD_NUMBER: _builtins.int
+    ID_FIELD_NUMBER: _builtins.int
+    ENCODING_POSITION_FIELD_NUMBER: _builtins.int
+    OPTIONS_FIELD_NUMBER: _builtins.int
+    name: _builtins.str
+    """REQUIRED. Name of this field within the schema."""
+    description: _builtins.str
+    """OPTIONAL. Human readable description of this field, such as the query that generated it."""
+    id: _builtins.int
+    encoding_position: _builtins.int
+    """OPTIONAL. The position of this field's data when encoded, e.g. with beam:coder:row:v1.
+    Either no fields in a given row are have encoding position populated,
+    or all of them are. Used to support backwards compatibility with schema
+    changes.
+    If no fields have encoding position populated the order of encoding is the same as the order in the Schema.
+    If this Field is part of a Schema where encoding_positions_set is True then encoding_position must be
+    defined, otherwise this field is ignored.
+    """
+    @_builtins.property
+    def type(self) -> Global___FieldType: ...
+    @_builtins.property
+    def options(self) -> _containers.RepeatedCompositeFieldContainer[Global___Option]: ...
+    def __init__(
+        self,
+        *,
+        name: _builtins.str | None = ...,
+        description: _builtins.str | None = ...,
+        type: Global___FieldType | None = ...,
+        id: _builtins.int | None = ...,
+        encoding_position: _builtins.int | None = ...,
+        options: _abc.Iterable[Global___Option] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["type", b"type"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["description", b"description", "encoding_position", b"encoding_position", "id", b"id", "name", b"name", "options", b"options", "type", b"type"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Field: _TypeAlias = Field  # noqa: Y015
+
+@_typing.final
+class FieldType(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NULLABLE_FIELD_NUMBER: _builtins.int
+    ATOMIC_TYPE_FIELD_NUMBER: _builtins.int
+    ARRAY_TYPE_FIELD_NUMBER: _builtins.int
+    ITERABLE_TYPE_FIELD_NUMBER: _builtins.int
+    MAP_TYPE_FIELD_NUMBER: _builtins.int
+    ROW_TYPE_FIELD_NUMBER: _builtins.int
+    LOGICAL_TYPE_FIELD_NUMBER: _builtins.int
+    nullable: _builtins.bool
+    atomic_type: Global___AtomicType.ValueType
+    @_builtins.property
+    def array_type(self) -> Global___ArrayType: ...
+    @_builtins.property
+    def iterable_type(self) -> Global___IterableType: ...
+    @_builtins.property
+    def map_type(self) -> Global___MapType: ...
+    @_builtins.property
+    def row_type(self) -> Global___RowType: ...
+    @_builtins.property
+    def logical_type(self) -> Global___LogicalType: ...
+    def __init__(
+        self,
+        *,
+        nullable: _builtins.bool | None = ...,
+        atomic_type: Global___AtomicType.ValueType | None = ...,
+        array_type: Global___ArrayType | None = ...,
+        iterable_type: Global___IterableType | None = ...,
+        map_type: Global___MapType | None = ...,
+        row_type: Global___RowType | None = ...,
+        logical_type: Global___LogicalType | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["array_type", b"array_type", "atomic_type", b"atomic_type", "iterable_type", b"iterable_type", "logical_type", b"logical_type", "map_type", b"map_type", "row_type", b"row_type", "type_info", b"type_info"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["array_type", b"array_type", "atomic_type", b"atomic_type", "iterable_type", b"iterable_type", "logical_type", b"logical_type", "map_type", b"map_type", "nullable", b"nullable", "row_type", b"row_type", "type_info", b"type_info"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_type_info: _TypeAlias = _typing.Literal["atomic_type", "array_type", "iterable_type", "map_type", "row_type", "logical_type"]  # noqa: Y015
+    _WhichOneofArgType_type_info: _TypeAlias = _typing.Literal["type_info", b"type_info"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_type_info) -> _WhichOneofReturnType_type_info | None: ...
+
+Global___FieldType: _TypeAlias = FieldType  # noqa: Y015
+
+@_typing.final
+class ArrayType(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ELEMENT_TYPE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def element_type(self) -> Global___FieldType: ...
+    def __init__(
+        self,
+        *,
+        element_type: Global___FieldType | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["element_type", b"element_type"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["element_type", b"element_type"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ArrayType: _TypeAlias = ArrayType  # noqa: Y015
+
+@_typing.final
+class IterableType(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ELEMENT_TYPE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def element_type(self) -> Global___FieldType: ...
+    def __init__(
+        self,
+        *,
+        element_type: Global___FieldType | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["element_type", b"element_type"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["element_type", b"element_type"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___IterableType: _TypeAlias = IterableType  # noqa: Y015
+
+@_typing.final
+class MapType(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    KEY_TYPE_FIELD_NUMBER: _builtins.int
+    VALUE_TYPE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def key_type(self) -> Global___FieldType: ...
+    @_builtins.property
+    def value_type(self) -> Global___FieldType: ...
+    def __init__(
+        self,
+        *,
+        key_type: Global___FieldType | None = ...,
+        value_type: Global___FieldType | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["key_type", b"key_type", "value_type", b"value_type"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["key_type", b"key_type", "value_type", b"value_type"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MapType: _TypeAlias = MapType  # noqa: Y015
+
+@_typing.final
+class RowType(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    SCHEMA_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def schema(self) -> Global___Schema: ...
+    def __init__(
+        self,
+        *,
+        schema: Global___Schema | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["schema", b"schema"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["schema", b"schema"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___RowType: _TypeAlias = RowType  # noqa: Y015
+
+@_typing.final
+class LogicalType(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    URN_FIELD_NUMBER: _builtins.int
+    PAYLOAD_FIELD_NUMBER: _builtins.int
+    REPRESENTATION_FIELD_NUMBER: _builtins.int
+    ARGUMENT_TYPE_FIELD_NUMBER: _builtins.int
+    ARGUMENT_FIELD_NUMBER: _builtins.int
+    urn: _builtins.str
+    payload: _builtins.bytes
+    @_builtins.property
+    def representation(self) -> Global___FieldType: ...
+    @_builtins.property
+    def argument_type(self) -> Global___FieldType: ...
+    @_builtins.property
+    def argument(self) -> Global___FieldValue: ...
+    def __init__(
+        self,
+        *,
+        urn: _builtins.str | None = ...,
+        payload: _builtins.bytes | None = ...,
+        representation: Global___FieldType | None = ...,
+        argument_type: Global___FieldType | None = ...,
+        argument: Global___FieldValue | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["argument", b"argument", "argument_type", b"argument_type", "representation", b"representation"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["argument", b"argument", "argument_type", b"argument_type", "payload", b"payload", "representation", b"representation", "urn", b"urn"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___LogicalType: _TypeAlias = LogicalType  # noqa: Y015
+
+@_typing.final
+class LogicalTypes(_message.Message):
+    """Universally defined Logical types for Row schemas.
+    These logical types are supposed to be understood by all SDKs.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _Enum:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _EnumEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[LogicalTypes._Enum.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        PYTHON_CALLABLE: LogicalTypes._Enum.ValueType  # 0
+        """A URN for Python Callable logical type
+          - Representation type: STRING
+          - Language type: In Python SDK, PythonCallableWithSource.
+            In any other SDKs, a wrapper object for a string which
+            can be evaluated to a Python Callable object.
+        """
+        MICROS_INSTANT: LogicalTypes._Enum.ValueType  # 1
+        """A URN for MicrosInstant type
+          - Representation type: ROW<seconds: INT64, micros: INT64>
+          - A timestamp without a timezone where seconds + micros represents the
+            amount of time since the epoch.
+        """
+        MILLIS_INSTANT: LogicalTypes._Enum.ValueType  # 2
+        """A URN for MillisInstant type
+          - Representation type: INT64
+          - A timestamp without a timezone represented by the number of
+            milliseconds since the epoch. The INT64 value is encoded with
+            big-endian shifted such that lexicographic ordering of the bytes
+            corresponds to chronological order.
+        """
+        DECIMAL: LogicalTypes._Enum.ValueType  # 3
+        """A URN for Decimal type
+          - Representation type: BYTES
+          - A decimal number with variable scale. Its BYTES
+            representation consists of an integer (INT32) scale followed by a
+            two's complement encoded big integer.
+        """
+        FIXED_BYTES: LogicalTypes._Enum.ValueType  # 4
+        """A URN for FixedLengthBytes type
+          - Representation type: BYTES
+          - Argument type: INT32.
+            A fixed-length bytes with its length as the argument.
+        """
+        VAR_BYTES: LogicalTypes._Enum.ValueType  # 5
+        """A URN for VariableLengthBytes type
+          - Representation type: BYTES
+          - Argument type: INT32.
+            A variable-length bytes with its maximum length as the argument.
+        """
+        FIXED_CHAR: LogicalTypes._Enum.ValueType  # 6
+        """A URN for FixedLengthString type
+          - Representation type: STRING
+          - Argument type: INT32.
+            A fixed-length string with its length as the argument.
+        """
+        VAR_CHAR: LogicalTypes._Enum.ValueType  # 7
+        """A URN for VariableLengthString type
+          - Representation type: STRING
+          - Argument type: INT32.
+            A variable-length string with its maximum length as the argument.
+        """
+
+    class Enum(_Enum, metaclass=_EnumEnumTypeWrapper): ...
+    PYTHON_CALLABLE: LogicalTypes.Enum.ValueType  # 0
+    """A URN for Python Callable logical type
+      - Representation type: STRING
+      - Language type: In Python SDK, PythonCallableWithSource.
+        In any other SDKs, a wrapper object for a string which
+        can be evaluated to a Python Callable object.
+    """
+    MICROS_INSTANT: LogicalTypes.Enum.ValueType  # 1
+    """A URN for MicrosInstant type
+      - Representation type: ROW<seconds: INT64, micros: INT64>
+      - A timestamp without a timezone where seconds + micros represents the
+        amount of time since the epoch.
+    """
+    MILLIS_INSTANT: LogicalTypes.Enum.ValueType  # 2
+    """A URN for MillisInstant type
+      - Representation type: INT64
+      - A timestamp without a timezone represented by the number of
+        milliseconds since the epoch. The INT64 value is encoded with
+        big-endian shifted such that lexicographic ordering of the bytes
+        corresponds to chronological order.
+    """
+    DECIMAL: LogicalTypes.Enum.ValueType  # 3
+    """A URN for Decimal type
+      - Representation type: BYTES
+      - A decimal number with variable scale. Its BYTES
+        representation consists of an integer (INT32) scale followed by a
+        two's complement encoded big integer.
+    """
+    FIXED_BYTES: LogicalTypes.Enum.ValueType  # 4
+    """A URN for FixedLengthBytes type
+      - Representation type: BYTES
+      - Argument type: INT32.
+        A fixed-length bytes with its length as the argument.
+    """
+    VAR_BYTES: LogicalTypes.Enum.ValueType  # 5
+    """A URN for VariableLengthBytes type
+      - Representation type: BYTES
+      - Argument type: INT32.
+        A variable-length bytes with its maximum length as the argument.
+    """
+    FIXED_CHAR: LogicalTypes.Enum.ValueType  # 6
+    """A URN for FixedLengthString type
+      - Representation type: STRING
+      - Argument type: INT32.
+        A fixed-length string with its length as the argument.
+    """
+    VAR_CHAR: LogicalTypes.Enum.ValueType  # 7
+    """A URN for VariableLengthString type
+      - Representation type: STRING
+      - Argument type: INT32.
+        A variable-length string with its maximum length as the argument.
+    """
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___LogicalTypes: _TypeAlias = LogicalTypes  # noqa: Y015
+
+@_typing.final
+class Option(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    NAME_FIELD_NUMBER: _builtins.int
+    TYPE_FIELD_NUMBER: _builtins.int
+    VALUE_FIELD_NUMBER: _builtins.int
+    name: _builtins.str
+    """REQUIRED. Identifier for the option."""
+    @_builtins.property
+    def type(self) -> Global___FieldType:
+        """REQUIRED. Type specifier for the structure of value.
+        Conventionally, options that don't require additional configuration should
+        use a boolean type, with the value set to true.
+        """
+
+    @_builtins.property
+    def value(self) -> Global___FieldValue: ...
+    def __init__(
+        self,
+        *,
+        name: _builtins.str | None = ...,
+        type: Global___FieldType | None = ...,
+        value: Global___FieldValue | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["type", b"type", "value", b"value"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["name", b"name", "type", b"type", "value", b"value"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Option: _TypeAlias = Option  # noqa: Y015
+
+@_typing.final
+class Row(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    VALUES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def values(self) -> _containers.RepeatedCompositeFieldContainer[Global___FieldValue]: ...
+    def __init__(
+        self,
+        *,
+        values: _abc.Iterable[Global___FieldValue] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["values", b"values"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Row: _TypeAlias = Row  # noqa: Y015
+
+@_typing.final
+class FieldValue(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ATOMIC_VALUE_FIELD_NUMBER: _builtins.int
+    ARRAY_VALUE_FIELD_NUMBER: _builtins.int
+    ITERABLE_VALUE_FIELD_NUMBER: _builtins.int
+    MAP_VALUE_FIELD_NUMBER: _builtins.int
+    ROW_VALUE_FIELD_NUMBER: _builtins.int
+    LOGICAL_TYPE_VALUE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def atomic_value(self) -> Global___AtomicTypeValue: ...
+    @_builtins.property
+    def array_value(self) -> Global___ArrayTypeValue: ...
+    @_builtins.property
+    def iterable_value(self) -> Global___IterableTypeValue: ...
+    @_builtins.property
+    def map_value(self) -> Global___MapTypeValue: ...
+    @_builtins.property
+    def row_value(self) -> Global___Row: ...
+    @_builtins.property
+    def logical_type_value(self) -> Global___LogicalTypeValue: ...
+    def __init__(
+        self,
+        *,
+        atomic_value: Global___AtomicTypeValue | None = ...,
+        array_value: Global___ArrayTypeValue | None = ...,
+        iterable_value: Global___IterableTypeValue | None = ...,
+        map_value: Global___MapTypeValue | None = ...,
+        row_value: Global___Row | None = ...,
+        logical_type_value: Global___LogicalTypeValue | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["array_value", b"array_value", "atomic_value", b"atomic_value", "field_value", b"field_value", "iterable_value", b"iterable_value", "logical_type_value", b"logical_type_value", "map_value", b"map_value", "row_value", b"row_value"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["array_value", b"array_value", "atomic_value", b"atomic_value", "field_value", b"field_value", "iterable_value", b"iterable_value", "logical_type_value", b"logical_type_value", "map_value", b"map_value", "row_value", b"row_value"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_field_value: _TypeAlias = _typing.Literal["atomic_value", "array_value", "iterable_value", "map_value", "row_value", "logical_type_value"]  # noqa: Y015
+    _WhichOneofArgType_field_value: _TypeAlias = _typing.Literal["field_value", b"field_value"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_field_value) -> _WhichOneofReturnType_field_value | None: ...
+
+Global___FieldValue: _TypeAlias = FieldValue  # noqa: Y015
+
+@_typing.final
+class AtomicTypeValue(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    BYTE_FIELD_NUMBER: _builtins.int
+    INT16_FIELD_NUMBER: _builtins.int
+    INT32_FIELD_NUMBER: _builtins.int
+    INT64_FIELD_NUMBER: _builtins.int
+    FLOAT_FIELD_NUMBER: _builtins.int
+    DOUBLE_FIELD_NUMBER: _builtins.int
+    STRING_FIELD_NUMBER: _builtins.int
+    BOOLEAN_FIELD_NUMBER: _builtins.int
+    BYTES_FIELD_NUMBER: _builtins.int
+    byte: _builtins.int
+    int16: _builtins.int
+    int32: _builtins.int
+    int64: _builtins.int
+    float: _builtins.float
+    double: _builtins.float
+    string: _builtins.str
+    boolean: _builtins.bool
+    bytes: _builtins.bytes
+    def __init__(
+        self,
+        *,
+        byte: _builtins.int | None = ...,
+        int16: _builtins.int | None = ...,
+        int32: _builtins.int | None = ...,
+        int64: _builtins.int | None = ...,
+        float: _builtins.float | None = ...,
+        double: _builtins.float | None = ...,
+        string: _builtins.str | None = ...,
+        boolean: _builtins.bool | None = ...,
+        bytes: _builtins.bytes | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["boolean", b"boolean", "byte", b"byte", "bytes", b"bytes", "double", b"double", "float", b"float", "int16", b"int16", "int32", b"int32", "int64", b"int64", "string", b"string", "value", b"value"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["boolean", b"boolean", "byte", b"byte", "bytes", b"bytes", "double", b"double", "float", b"float", "int16", b"int16", "int32", b"int32", "int64", b"int64", "string", b"string", "value", b"value"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType_value: _TypeAlias = _typing.Literal["byte", "int16", "int32", "int64", "float", "double", "string", "boolean", "bytes"]  # noqa: Y015
+    _WhichOneofArgType_value: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType_value) -> _WhichOneofReturnType_value | None: ...
+
+Global___AtomicTypeValue: _TypeAlias = AtomicTypeValue  # noqa: Y015
+
+@_typing.final
+class ArrayTypeValue(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ELEMENT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def element(self) -> _containers.RepeatedCompositeFieldContainer[Global___FieldValue]: ...
+    def __init__(
+        self,
+        *,
+        element: _abc.Iterable[Global___FieldValue] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["element", b"element"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ArrayTypeValue: _TypeAlias = ArrayTypeValue  # noqa: Y015
+
+@_typing.final
+class IterableTypeValue(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ELEMENT_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def element(self) -> _containers.RepeatedCompositeFieldContainer[Global___FieldValue]: ...
+    def __init__(
+        self,
+        *,
+        element: _abc.Iterable[Global___FieldValue] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["element", b"element"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___IterableTypeValue: _TypeAlias = IterableTypeValue  # noqa: Y015
+
+@_typing.final
+class MapTypeValue(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ENTRIES_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def entries(self) -> _containers.RepeatedCompositeFieldContainer[Global___MapTypeEntry]: ...
+    def __init__(
+        self,
+        *,
+        entries: _abc.Iterable[Global___MapTypeEntry] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["entries", b"entries"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MapTypeValue: _TypeAlias = MapTypeValue  # noqa: Y015
+
+@_typing.final
+class MapTypeEntry(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    KEY_FIELD_NUMBER: _builtins.int
+    VALUE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def key(self) -> Global___FieldValue: ...
+    @_builtins.property
+    def value(self) -> Global___FieldValue: ...
+    def __init__(
+        self,
+        *,
+        key: Global___FieldValue | None = ...,
+        value: Global___FieldValue | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["key", b"key", "value", b"value"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MapTypeEntry: _TypeAlias = MapTypeEntry  # noqa: Y015
+
+@_typing.final
+class LogicalTypeValue(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    VALUE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def value(self) -> Global___FieldValue: ...
+    def __init__(
+        self,
+        *,
+        value: Global___FieldValue | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["value", b"value"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___LogicalTypeValue: _TypeAlias = LogicalTypeValue  # noqa: Y015
+
+@_typing.final
+class SchemaCoderPayload(_message.Message):
+    """Information needed to represent a Coder of type SCHEMA."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    @_typing.final
+    class AdditionalCoderInfo(_message.Message):
+        DESCRIPTOR: _descriptor.Descriptor
+
+        URN_FIELD_NUMBER: _builtins.int
+        PAYLOAD_FIELD_NUMBER: _builtins.int
+        urn: _builtins.str
+        payload: _builtins.bytes
+        def __init__(
+            self,
+            *,
+            urn: _builtins.str | None = ...,
+            payload: _builtins.bytes | None = ...,
+        ) -> None: ...
+        _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+        def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+        _ClearFieldArgType: _TypeAlias = _typing.Literal["payload", b"payload", "urn", b"urn"]  # noqa: Y015
+        def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+        def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+    SCHEMA_FIELD_NUMBER: _builtins.int
+    TO_ROW_FN_FIELD_NUMBER: _builtins.int
+    FROM_ROW_FN_FIELD_NUMBER: _builtins.int
+    ADDITIONAL_CODER_INFOS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def schema(self) -> Global___Schema:
+        """The schema to use for encoding corresponding Row types."""
+
+    @_builtins.property
+    def to_row_fn(self) -> _beam_runner_api_pb2.FunctionSpec:
+        """Function mapping from underlying object to Row type."""
+
+    @_builtins.property
+    def from_row_fn(self) -> _beam_runner_api_pb2.FunctionSpec:
+        """Function mapping from Row type to underlying object."""
+
+    @_builtins.property
+    def additional_coder_infos(self) -> _containers.RepeatedCompositeFieldContainer[Global___SchemaCoderPayload.AdditionalCoderInfo]:
+        """Any additional information SDKs need to encode/decode elements."""
+
+    def __init__(
+        self,
+        *,
+        schema: Global___Schema | None = ...,
+        to_row_fn: _beam_runner_api_pb2.FunctionSpec | None = ...,
+        from_row_fn: _beam_runner_api_pb2.FunctionSpec | None = ...,
+        additional_coder_infos: _abc.Iterable[Global___SchemaCoderPayload.AdditionalCoderInfo] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["from_row_fn", b"from_row_fn", "schema", b"schema", "to_row_fn", b"to_row_fn"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["additional_coder_infos", b"additional_coder_infos", "from_row_fn", b"from_row_fn", "schema", b"schema", "to_row_fn", b"to_row_fn"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SchemaCoderPayload: _TypeAlias = SchemaCoderPayload  # noqa: Y015
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: org/apache/beam/model/pipeline/v1/standard_window_fns.proto
+# Protobuf Python Version: 6.31.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    6,
+    31,
+    1,
+    '',
+    'org/apache/beam/model/pipeline/v1/standard_window_fns.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import beam_runner_api_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_beam__runner__api__pb2
+from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n;org/apache/beam/model/pipeline/v1/standard_window_fns.proto\x12!org.apache.beam.model.pipeline.v1\x1a\x37org/apache/beam/model/pipeline/v1/beam_runner_api.proto\x1a\x1egoogle/protobuf/duration.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"V\n\x14GlobalWindowsPayload\">\n\x04\x45num\x12\x36\n\nPROPERTIES\x10\x00\x1a&\xa2\xb4\xfa\xc2\x05 beam:window_fn:global_windows:v1\"\xa9\x01\n\x13\x46ixedWindowsPayload\x12\'\n\x04size\x18\x01 \x01(\x0b\x32\x19.google.protobuf.Duration\x12*\n\x06offset\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"=\n\x04\x45num\x12\x35\n\nPROPERTIES\x10\x00\x1a%\xa2\xb4\xfa\xc2\x05\x1f\x62\x65\x61m:window_fn:fixed_windows:v1\"\xd8\x01\n\x15SlidingWindowsPayload\x12\'\n\x04size\x18\x01 \x01(\x0b\x32\x19.google.protobuf.Duration\x12*\n\x06offset\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12)\n\x06period\x18\x03 \x01(\x0b\x32\x19.google.protobuf.Duration\"?\n\x04\x45num\x12\x37\n\nPROPERTIES\x10\x00\x1a\'\xa2\xb4\xfa\xc2\x05!beam:window_fn:sliding_windows:v1\"\x85\x01\n\x15SessionWindowsPayload\x12+\n\x08gap_size\x18\x01 \x01(\x0b\x32\x19.google.protobuf.Duration\"?\n\x04\x45num\x12\x37\n\nPROPERTIES\x10\x00\x1a\'\xa2\xb4\xfa\xc2\x05!beam:window_fn:session_windows:v1B\x80\x01\n!org.apache.beam.model.pipeline.v1B\x11StandardWindowFnsZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1b\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'org.apache.beam.model.pipeline.v1.standard_window_fns_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'\n!org.apache.beam.model.pipeline.v1B\021StandardWindowFnsZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1'
+  _globals['_GLOBALWINDOWSPAYLOAD_ENUM'].values_by_name["PROPERTIES"]._loaded_options = None
+  _globals['_GLOBALWINDOWSPAYLOAD_ENUM'].values_by_name["PROPERTIES"]._serialized_options = b'\242\264\372\302\005 beam:window_fn:global_windows:v1'
+  _globals['_FIXEDWINDOWSPAYLOAD_ENUM'].values_by_name["PROPERTIES"]._loaded_options = None
+  _globals['_FIXEDWINDOWSPAYLOAD_ENUM'].values_by_name["PROPERTIES"]._serialized_options = b'\242\264\372\302\005\037beam:window_fn:fixed_windows:v1'
+  _globals['_SLIDINGWINDOWSPAYLOAD_ENUM'].values_by_name["PROPERTIES"]._loaded_options = None
+  _globals['_SLIDINGWINDOWSPAYLOAD_ENUM'].values_by_name["PROPERTIES"]._serialized_options = b'\242\264\372\302\005!beam:window_fn:sliding_windows:v1'
+  _globals['_SESSIONWINDOWSPAYLOAD_ENUM'].values_by_name["PROPERTIES"]._loaded_options = None
+  _globals['_SESSIONWINDOWSPAYLOAD_ENUM'].values_by_name["PROPERTIES"]._serialized_options = b'\242\264\372\302\005!beam:window_fn:session_windows:v1'
+  _globals['_GLOBALWINDOWSPAYLOAD']._serialized_start=220
+  _globals['_GLOBALWINDOWSPAYLOAD']._serialized_end=306
+  _globals['_GLOBALWINDOWSPAYLOAD_ENUM']._serialized_start=244
+  _globals['_GLOBALWINDOWSPAYLOAD_ENUM']._serialized_end=306
+  _globals['_FIXEDWINDOWSPAYLOAD']._serialized_start=309
+  _globals['_FIXEDWINDOWSPAYLOAD']._serialized_end=478
+  _globals['_FIXEDWINDOWSPAYLOAD_ENUM']._serialized_start=417
+  _globals['_FIXEDWINDOWSPAYLOAD_ENUM']._serialized_end=478
+  _globals['_SLIDINGWINDOWSPAYLOAD']._serialized_start=481
+  _globals['_SLIDINGWINDOWSPAYLOAD']._serialized_end=697
+  _globals['_SLIDINGWINDOWSPAYLOAD_ENUM']._serialized_start=634
+  _globals['_SLIDINGWINDOWSPAYLOAD_ENUM']._serialized_end=697
+  _globals['_SESSIONWINDOWSPAYLOAD']._serialized_start=700
+  _globals['_SESSIONWINDOWSPAYLOAD']._serialized_end=833
+  _globals['_SESSIONWINDOWSPAYLOAD_ENUM']._serialized_start=770
+  _globals['_SESSIONWINDOWSPAYLOAD_ENUM']._serialized_end=833
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,212 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+
+Protocol Buffers describing the Runner API, which is the runner-independent,
+SDK-independent definition of the Beam model.
+"""
+
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import duration_pb2 as _duration_pb2
+from google.protobuf import message as _message
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+@_typing.final
+class GlobalWindowsPayload(_message.Message):
+    """By default, all data in a PCollection is assigned to the single global
+    window. See BeamConstants for the time span this window encompasses.
+
+    See https://beam.apache.org/documentation/programming-guide/#single-global-window
+    for additional details.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _Enum:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _EnumEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[GlobalWindowsPayload._Enum.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        PROPERTIES: GlobalWindowsPayload._Enum.ValueType  # 0
+
+    class Enum(_Enum, metaclass=_EnumEnumTypeWrapper): ...
+    PROPERTIES: GlobalWindowsPayload.Enum.ValueType  # 0
+
+    def __init__(
+        self,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___GlobalWindowsPayload: _TypeAlias = GlobalWindowsPayload  # noqa: Y015
+
+@_typing.final
+class FixedWindowsPayload(_message.Message):
+    """A fixed time window represents a consistent duration size, non overlapping
+    time interval in the data stream.
+
+    See https://beam.apache.org/documentation/programming-guide/#fixed-time-windows
+    for additional details.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _Enum:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _EnumEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[FixedWindowsPayload._Enum.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        PROPERTIES: FixedWindowsPayload._Enum.ValueType  # 0
+
+    class Enum(_Enum, metaclass=_EnumEnumTypeWrapper): ...
+    PROPERTIES: FixedWindowsPayload.Enum.ValueType  # 0
+
+    SIZE_FIELD_NUMBER: _builtins.int
+    OFFSET_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def size(self) -> _duration_pb2.Duration:
+        """(Required) Represents the size of the window."""
+
+    @_builtins.property
+    def offset(self) -> _timestamp_pb2.Timestamp:
+        """(Required) Represents the timestamp of when the first window begins.
+        Window N will start at offset + N * size.
+        """
+
+    def __init__(
+        self,
+        *,
+        size: _duration_pb2.Duration | None = ...,
+        offset: _timestamp_pb2.Timestamp | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["offset", b"offset", "size", b"size"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["offset", b"offset", "size", b"size"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___FixedWindowsPayload: _TypeAlias = FixedWindowsPayload  # noqa: Y015
+
+@_typing.final
+class SlidingWindowsPayload(_message.Message):
+    """A sliding time window represents time intervals in the data stream that can
+    overlap. For example, each window might capture 60 seconds worth of data, but
+    a new window starts every 30 seconds. The frequency with which sliding
+    windows begin is called the period. Therefore, our example would have a
+    window size of 60 seconds and a period of 30 seconds.
+
+    Because multiple windows overlap, most elements in a data set will belong to
+    more than one window. This kind of windowing is useful for taking running
+    averages of data; using sliding time windows, you can compute a running
+    average of the past 60 seconds’ worth of data, updated every 30 seconds, in
+    our example.
+
+    See https://beam.apache.org/documentation/programming-guide/#sliding-time-windows
+    for additional details.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _Enum:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _EnumEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[SlidingWindowsPayload._Enum.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        PROPERTIES: SlidingWindowsPayload._Enum.ValueType  # 0
+
+    class Enum(_Enum, metaclass=_EnumEnumTypeWrapper): ...
+    PROPERTIES: SlidingWindowsPayload.Enum.ValueType  # 0
+
+    SIZE_FIELD_NUMBER: _builtins.int
+    OFFSET_FIELD_NUMBER: _builtins.int
+    PERIOD_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def size(self) -> _duration_pb2.Duration:
+        """(Required) Represents the size of the window."""
+
+    @_builtins.property
+    def offset(self) -> _timestamp_pb2.Timestamp:
+        """(Required) Represents the timestamp of when the first window begins.
+        Window N will start at offset + N * period.
+        """
+
+    @_builtins.property
+    def period(self) -> _duration_pb2.Duration:
+        """(Required) Represents the amount of time between each start of a window."""
+
+    def __init__(
+        self,
+        *,
+        size: _duration_pb2.Duration | None = ...,
+        offset: _timestamp_pb2.Timestamp | None = ...,
+        period: _duration_pb2.Duration | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["offset", b"offset", "period", b"period", "size", b"size"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["offset", b"offset", "period", b"period", "size", b"size"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SlidingWindowsPayload: _TypeAlias = SlidingWindowsPayload  # noqa: Y015
+
+@_typing.final
+class SessionWindowsPayload(_message.Message):
+    """A session window function defines windows that contain elements that are
+    within a certain gap size of another element. Session windowing applies
+    on a per-key basis and is useful for data that is irregularly distributed
+    with respect to time. For example, a data stream representing user mouse
+    activity may have long periods of idle time interspersed with high
+    concentrations of clicks. If data arrives after the minimum specified gap
+    size duration, this initiates the start of a new window.
+
+    See https://beam.apache.org/documentation/programming-guide/#session-windows
+    for additional details.
+    """
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    class _Enum:
+        ValueType = _typing.NewType("ValueType", _builtins.int)
+        V: _TypeAlias = ValueType  # noqa: Y015
+
+    class _EnumEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[SessionWindowsPayload._Enum.ValueType], _builtins.type):
+        DESCRIPTOR: _descriptor.EnumDescriptor
+        PROPERTIES: SessionWindowsPayload._Enum.ValueType  # 0
+
+    class Enum(_Enum, metaclass=_EnumEnumTypeWrapper): ...
+    PROPERTIES: SessionWindowsPayload.Enum.ValueType  # 0
+
+    GAP_SIZE_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def gap_size(self) -> _duration_pb2.Duration:
+        """(Required) Minimum duration of gaps between sessions."""
+
+    def __init__(
+        self,
+        *,
+        gap_size: _duration_pb2.Duration | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["gap_size", b"gap_size"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["gap_size", b"gap_size"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___SessionWindowsPayload: _TypeAlias = SessionWindowsPayload  # noqa: Y015
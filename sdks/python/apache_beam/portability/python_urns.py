@@ -68,3 +68,7 @@ SUBPROCESS_SDK = "beam:env:harness_subprocess_python:v1"
 # of this transform.  This optimization may result in renamed counters and
 # PCollection element counts.
 APPLY_COMBINER_PACKING = "beam:annotation:apply_combiner_packing:v1"
+
+# Annotation on the GroupByKey of a lifted CombinePerKey carrying the
+# CombinePayload, which lets a runner merge accumulators while grouping.
+LIFTED_COMBINE_PAYLOAD = "beam:annotation:lifted_combine_payload:v1"
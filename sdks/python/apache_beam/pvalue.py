@@ -613,6 +613,11 @@ class AsMultiMap(AsSideInput):
   Intended for use in side-argument specification---the same places where
   AsSingleton and AsIter are used, but returns an interface that allows
   key lookup.
+
+  Only on portable runners, which run the DoFn in an SDK harness, does the
+  interface also have a get_all(keys) method, which looks up the values of
+  many keys with a single batch of requests. It is not part of the general
+  API: other runners, e.g. the legacy Dataflow runner, hand out a plain dict.
   """
   @staticmethod
   def _from_runtime_iterable(it, options):
@@ -20,6 +20,8 @@ import typing as t
 import unittest
 
 import apache_beam as beam
+from apache_beam import typehints
+from apache_beam.internal import pickler
 from apache_beam.options.pipeline_options import PipelineOptions
 from apache_beam.testing import test_pipeline
 from apache_beam.testing.util import assert_that
@@ -32,6 +34,9 @@ try:
 
   from apache_beam.runners.dask.dask_runner import DaskOptions  # pylint: disable=ungrouped-imports
   from apache_beam.runners.dask.dask_runner import DaskRunner  # pylint: disable=ungrouped-imports
+  from apache_beam.runners.dask.overrides import _CombinePerKey  # pylint: disable=ungrouped-imports
+  from apache_beam.runners.dask.transform_evaluator import DoFnInstanceCache  # pylint: disable=ungrouped-imports
+  from apache_beam.runners.dask.transform_evaluator import _PartialCombiner  # pylint: disable=ungrouped-imports
 except (ImportError, ModuleNotFoundError):
   raise unittest.SkipTest('Dask must be installed to run tests.')
 
@@ -391,6 +396,33 @@ class DaskRunnerRunPipelineTest(unittest.TestCase):
           | beam.GroupByKey())
       assert_that(pcoll, equal_to([(2, [1, 1]), (4, [2, 2]), (6, [3])]))
 
+  def test_groupby_separates_fixed_windows(self):
+    def add_window_start(element, window=beam.DoFn.WindowParam):
+      k, vs = element
+      return k, sorted(vs), window.start.micros // 1000000
+
+    with self.pipeline as p:
+      pcoll = (
+          p
+          | beam.Create([('a', 1), ('a', 7), ('a', 15), ('b', 12)])
+          | beam.Map(lambda kv: window.TimestampedValue(kv, kv[1]))
+          | beam.WindowInto(window.FixedWindows(10))
+          | beam.GroupByKey()
+          | beam.Map(add_window_start))
+      assert_that(
+          pcoll, equal_to([('a', [1, 7], 0), ('a', [15], 10), ('b', [12], 10)]))
+
+  def test_groupby_merges_session_windows(self):
+    with self.pipeline as p:
+      pcoll = (
+          p
+          | beam.Create([('a', 1), ('a', 3), ('a', 20), ('b', 2)])
+          | beam.Map(lambda kv: window.TimestampedValue(kv, kv[1]))
+          | beam.WindowInto(window.Sessions(5))
+          | beam.GroupByKey()
+          | beam.MapTuple(lambda k, vs: (k, sorted(vs))))
+      assert_that(pcoll, equal_to([('a', [1, 3]), ('a', [20]), ('b', [2])]))
+
   def test_groupby_string_keys(self):
     with self.pipeline as p:
       pcoll = (
@@ -399,6 +431,164 @@ class DaskRunnerRunPipelineTest(unittest.TestCase):
           | beam.GroupByKey())
       assert_that(pcoll, equal_to([('a', [1, 2]), ('b', [3, 4])]))
 
+  def test_groupby_unhashable_keys(self):
+    with self.pipeline as p:
+      pcoll = (
+          p
+          | beam.Create([([1, 2], 1), ([1, 2], 2), ([3], 3)])
+          | beam.GroupByKey()
+          | beam.MapTuple(lambda k, vs: (tuple(k), sorted(vs))))
+      assert_that(pcoll, equal_to([((1, 2), [1, 2]), ((3, ), [3])]))
+
+  def test_combine_per_key(self):
+    with self.pipeline as p:
+      pcoll = (
+          p
+          | beam.Create([('a', 1), ('a', 2), ('b', 3), ('b', 4), ('c', 5)])
+          | beam.CombinePerKey(sum))
+      assert_that(pcoll, equal_to([('a', 3), ('b', 7), ('c', 5)]))
+
+  def test_combine_per_key_many_partitions(self):
+    with self.pipeline as p:
+      pcoll = (
+          p
+          | beam.Create([(i % 3, i) for i in range(1000)])
+          | beam.combiners.Mean.PerKey())
+      assert_that(pcoll, equal_to([(0, 499.5), (1, 499.0), (2, 500.0)]))
+
+  def test_combine_per_key_unhashable_keys(self):
+    with self.pipeline as p:
+      pcoll = (
+          p
+          | beam.Create([([1], 'x'), ([1], 'y'), ([2], 'z')])
+          | beam.combiners.Count.PerKey()
+          | beam.MapTuple(lambda k, count: (tuple(k), count)))
+      assert_that(pcoll, equal_to([((1, ), 2), ((2, ), 1)]))
+
+  def test_combine_per_key_with_side_input(self):
+    with self.pipeline as p:
+      side = p | "side" >> beam.Create([10])
+      pcoll = (
+          p
+          | "main" >> beam.Create([('a', 1), ('a', 20), ('b', 3)])
+          | beam.CombinePerKey(
+              lambda values, floor: max(max(values), floor),
+              beam.pvalue.AsSingleton(side)))
+      assert_that(pcoll, equal_to([('a', 20), ('b', 10)]))
+
+  def test_combine_per_key_output_type(self):
+    p = beam.Pipeline()
+    pcoll = (
+        p
+        | beam.Create([('a', 'x'), ('b', 'y')])
+        | _CombinePerKey(beam.combiners.CountCombineFn()))
+    self.assertEqual(typehints.Tuple[str, int], pcoll.element_type)
+
+
+class DoFnInstanceCacheTest(unittest.TestCase):
+  def test_reuses_set_up_instances(self):
+    cache = DoFnInstanceCache()
+    serialized_fn = pickler.dumps(LifecycleRecordingFn())
+
+    first = cache.acquire(serialized_fn)
+    second = cache.acquire(serialized_fn)
+    self.assertIsNot(first.signature.do_fn, second.signature.do_fn)
+    cache.release(serialized_fn, first)
+    cache.release(serialized_fn, second)
+
+    do_fns = set()
+    for _ in range(10):
+      invoker = cache.acquire(serialized_fn)
+      do_fns.add(invoker.signature.do_fn)
+      cache.release(serialized_fn, invoker)
+    self.assertEqual(1, len(do_fns))
+    self.assertEqual(['setup'], do_fns.pop().calls)
+
+  def test_tears_down_instances_beyond_max_idle(self):
+    cache = DoFnInstanceCache(max_idle_per_fn=1)
+    serialized_fn = pickler.dumps(LifecycleRecordingFn())
+
+    invokers = [cache.acquire(serialized_fn) for _ in range(3)]
+    for invoker in invokers:
+      cache.release(serialized_fn, invoker)
+    self.assertEqual(['setup'], invokers[0].signature.do_fn.calls)
+    self.assertEqual(['setup', 'teardown'], invokers[1].signature.do_fn.calls)
+    self.assertEqual(['setup', 'teardown'], invokers[2].signature.do_fn.calls)
+    self.assertIs(
+        invokers[0].signature.do_fn,
+        cache.acquire(serialized_fn).signature.do_fn)
+
+  def test_teardown_on_discard_and_shutdown(self):
+    cache = DoFnInstanceCache()
+    serialized_fn = pickler.dumps(LifecycleRecordingFn())
+
+    failed = cache.acquire(serialized_fn)
+    cache.discard(failed)
+    self.assertEqual(['setup', 'teardown'], failed.signature.do_fn.calls)
+    # A discarded instance is not handed out again.
+    idle = cache.acquire(serialized_fn)
+    self.assertIsNot(failed.signature.do_fn, idle.signature.do_fn)
+    cache.release(serialized_fn, idle)
+
+    cache.teardown()
+    self.assertEqual(['setup', 'teardown'], idle.signature.do_fn.calls)
+
+
+class PartialCombinerTest(unittest.TestCase):
+  def test_sets_up_and_tears_down_per_task(self):
+    combine_fn = LifecycleRecordingCombineFn()
+    combiner = _PartialCombiner(combine_fn)
+    first = combiner.add_inputs([('a', 1), ('b', 2), ('a', 3)])
+    second = combiner.add_inputs([('b', 4)])
+    merged = combiner.merge_accumulators([first, second])
+    self.assertEqual([('a', 4), ('b', 6)],
+                     sorted(combiner.extract_outputs(merged)))
+    self.assertEqual(['setup', 'teardown'] * 4, combine_fn.calls)
+
+  def test_tears_down_on_failure(self):
+    combine_fn = LifecycleRecordingCombineFn()
+    combiner = _PartialCombiner(combine_fn)
+    with self.assertRaises(TypeError):
+      combiner.add_inputs([('a', 1), ('a', 'x')])
+    self.assertEqual(['setup', 'teardown'], combine_fn.calls)
+
+
+class LifecycleRecordingCombineFn(beam.CombineFn):
+  def __init__(self):
+    self.calls = []
+
+  def setup(self):
+    self.calls.append('setup')
+
+  def create_accumulator(self):
+    return 0
+
+  def add_input(self, accumulator, element):
+    return accumulator + element
+
+  def merge_accumulators(self, accumulators):
+    return sum(accumulators)
+
+  def extract_output(self, accumulator):
+    return accumulator
+
+  def teardown(self):
+    self.calls.append('teardown')
+
+
+class LifecycleRecordingFn(beam.DoFn):
+  def __init__(self):
+    self.calls = []
+
+  def setup(self):
+    self.calls.append('setup')
+
+  def process(self, element):
+    yield element
+
+  def teardown(self):
+    self.calls.append('teardown')
+
 
 class ExpectingSideInputsFn(beam.DoFn):
   def __init__(self, name):
@@ -24,6 +24,7 @@ from apache_beam.pipeline import AppliedPTransform
 from apache_beam.pipeline import PTransformOverride
 from apache_beam.runners.direct.direct_runner import _GroupAlsoByWindowDoFn
 from apache_beam.transforms import ptransform
+from apache_beam.transforms.combiners import curry_combine_fn
 from apache_beam.transforms.window import GlobalWindows
 
 K = t.TypeVar("K")
@@ -92,6 +93,26 @@ class _GroupByKey(beam.PTransform):
         | "GroupByWindow" >> _GroupAlsoByWindow(input_or_inputs.windowing))
 
 
+@dataclasses.dataclass
+class _CombinePerKey(beam.PTransform):
+  """A `CombinePerKey` that the Dask runner folds with partial combining."""
+  combine_fn: beam.CombineFn
+
+  def expand(self, input_or_inputs):
+    return beam.pvalue.PCollection.from_(input_or_inputs)
+
+  def default_type_hints(self):
+    # As for CombinePerKey, the values of each key are combined into the
+    # output type of the CombineFn.
+    hints = self.combine_fn.get_type_hints()
+    k = typehints.TypeVariable('K')
+    input_type = hints.input_types[0][0] if hints.input_types else typehints.Any
+    output_type = hints.simple_output_type(self.label) or typehints.Any
+    return typehints.decorators.IOTypeHints.empty().with_input_types(
+        typehints.Tuple[k, input_type]).with_output_types(
+            typehints.Tuple[k, output_type])
+
+
 class _Flatten(beam.PTransform):
   def expand(self, input_or_inputs):
     if isinstance(input_or_inputs, beam.PCollection):
@@ -138,6 +159,25 @@ def dask_overrides() -> t.List[PTransformOverride]:
         self, applied_ptransform: AppliedPTransform) -> ptransform.PTransform:
       return _GroupByKey()
 
+  class CombinePerKeyOverride(PTransformOverride):
+    def matches(self, applied_ptransform: AppliedPTransform) -> bool:
+      # Windowed combines keep the GroupByKey based expansion, since the
+      # partial combine folds every value of a key into one accumulator. So do
+      # combines with side inputs, which the partial combine does not provide.
+      return (
+          applied_ptransform.transform.__class__ == beam.CombinePerKey and
+          not applied_ptransform.side_inputs and
+          applied_ptransform.inputs[0].windowing.is_default())
+
+    def get_replacement_transform_for_applied_ptransform(
+        self, applied_ptransform: AppliedPTransform) -> ptransform.PTransform:
+      transform = t.cast(beam.CombinePerKey, applied_ptransform.transform)
+      combine_fn = transform.fn
+      if transform.args or transform.kwargs:
+        combine_fn = curry_combine_fn(
+            combine_fn, transform.args, transform.kwargs)
+      return _CombinePerKey(combine_fn)
+
   class FlattenOverride(PTransformOverride):
     def matches(self, applied_ptransform: AppliedPTransform) -> bool:
       return applied_ptransform.transform.__class__ == beam.Flatten
@@ -150,6 +190,8 @@ def dask_overrides() -> t.List[PTransformOverride]:
       CreateOverride(),
       ReshuffleOverride(),
       ReadOverride(),
+      # Replace combines before their inner GroupByKey is overridden.
+      CombinePerKeyOverride(),
       GroupByKeyOverride(),
       FlattenOverride(),
   ]
@@ -21,9 +21,14 @@ A minimum set of operation substitutions, to adap Beam's PTransform model
 to Dask Bag functions.
 """
 import abc
+import atexit
+import collections
+import contextlib
 import dataclasses
 import logging
 import math
+import os
+import threading
 import typing as t
 from dataclasses import field
 
@@ -32,19 +37,29 @@ import dask.bag as db
 import apache_beam
 from apache_beam import DoFn
 from apache_beam import TaggedOutput
+from apache_beam import coders
+from apache_beam import typehints
+from apache_beam.internal import pickler
 from apache_beam.pipeline import AppliedPTransform
 from apache_beam.runners.common import DoFnContext
 from apache_beam.runners.common import DoFnInvoker
 from apache_beam.runners.common import DoFnSignature
 from apache_beam.runners.common import Receiver
 from apache_beam.runners.common import _OutputHandler
+from apache_beam.runners.dask.overrides import _CombinePerKey
 from apache_beam.runners.dask.overrides import _Create
 from apache_beam.runners.dask.overrides import _Flatten
 from apache_beam.runners.dask.overrides import _GroupByKeyOnly
+from apache_beam.transforms.core import CombineFn
+from apache_beam.transforms.core import Windowing
 from apache_beam.transforms.sideinputs import SideInputMap
+from apache_beam.transforms.trigger import DefaultTrigger
+from apache_beam.transforms.trigger import create_trigger_driver
 from apache_beam.transforms.window import GlobalWindow
+from apache_beam.transforms.window import TimestampCombiner
 from apache_beam.transforms.window import TimestampedValue
 from apache_beam.transforms.window import WindowFn
+from apache_beam.utils.timestamp import MIN_TIMESTAMP
 from apache_beam.utils.windowed_value import WindowedValue
 
 # Inputs to DaskOps.
@@ -81,6 +96,37 @@ def defenestrate(x):
   return x
 
 
+def get_key_coder(applied: AppliedPTransform) -> t.Optional[coders.Coder]:
+  """Returns a deterministic coder for the keys of a KV main input.
+
+  Grouping on encoded keys follows Beam's key equality semantics and lets
+  unhashable keys (e.g. lists) be shuffled. Returns `None` if the key type
+  has no deterministic coder, in which case keys are grouped as-is.
+  """
+  main_input = next(iter(applied.main_inputs.values()))
+  key_type, _ = typehints.trivial_inference.key_value_types(
+      main_input.element_type)
+  try:
+    return coders.registry.get_coder(key_type).as_deterministic_coder(
+        applied.full_label)
+  except ValueError:
+    return None
+
+
+def encode_key(item: t.Any, key_coder: t.Optional[coders.Coder]) -> t.Tuple:
+  """Splits an item into its (encoded key, value) pair."""
+  k, v = defenestrate(item)
+  if key_coder is not None:
+    k = key_coder.encode(k)
+  return k, v
+
+
+def decode_key(k: t.Any, key_coder: t.Optional[coders.Coder]) -> t.Any:
+  if key_coder is not None:
+    return key_coder.decode(k)
+  return k
+
+
 @dataclasses.dataclass
 class DaskBagWindowedIterator:
   """Iterator for `apache_beam.transforms.sideinputs.SideInputMap`"""
@@ -182,24 +228,102 @@ class Create(DaskBagOp):
         items, npartitions=npartitions, partition_size=partition_size)
 
 
-def apply_dofn_to_bundle(
-    items, do_fn_invoker_args, do_fn_invoker_kwargs, tagged_receivers):
-  """Invokes a DoFn within a bundle, implemented as a Dask partition."""
+class DoFnInstanceCache:
+  """A per-process pool of set up DoFn instances, keyed by serialized DoFn.
+
+  Instances are reused across the Dask partitions (bundles) that a worker
+  processes, so `DoFn.setup` runs once per instance rather than once per
+  partition. An instance is only used by one partition at a time. At most
+  `max_idle_per_fn` idle instances are kept per DoFn, which is enough for the
+  partitions that a worker runs concurrently; the others are torn down when
+  they are returned, and the kept ones when the worker process exits.
+  """
+  def __init__(self, max_idle_per_fn: t.Optional[int] = None):
+    self._max_idle_per_fn = max_idle_per_fn or os.cpu_count() or 1
+    self._lock = threading.Lock()
+    self._idle: t.DefaultDict[bytes, t.List[DoFnInvoker]] = (
+        collections.defaultdict(list))
+
+  def acquire(self, serialized_fn: bytes) -> DoFnInvoker:
+    """Returns an invoker for the lifecycle methods of a set up DoFn."""
+    with self._lock:
+      idle = self._idle.get(serialized_fn)
+      if idle:
+        return idle.pop()
+    lifecycle_invoker = DoFnInvoker.create_invoker(
+        DoFnSignature(pickler.loads(serialized_fn)),
+        output_handler=None,
+        process_invocation=False)
+    lifecycle_invoker.invoke_setup()
+    return lifecycle_invoker
+
+  def release(self, serialized_fn: bytes, lifecycle_invoker: DoFnInvoker):
+    """Returns a DoFn to the pool, for use by a later partition."""
+    with self._lock:
+      idle = self._idle[serialized_fn]
+      if len(idle) < self._max_idle_per_fn:
+        idle.append(lifecycle_invoker)
+        return
+    self.discard(lifecycle_invoker)
+
+  def discard(self, lifecycle_invoker: DoFnInvoker):
+    """Tears down a DoFn that must not be reused, e.g. after a failure."""
+    try:
+      lifecycle_invoker.invoke_teardown()
+    except Exception:  # pylint: disable=broad-except
+      _LOGGER.warning('Failed to tear down DoFn.', exc_info=True)
+
+  def teardown(self):
+    """Tears down all idle DoFns."""
+    with self._lock:
+      lifecycle_invokers = [
+          invoker for idle in self._idle.values() for invoker in idle
+      ]
+      self._idle.clear()
+    for lifecycle_invoker in lifecycle_invokers:
+      self.discard(lifecycle_invoker)
+
+
+_DOFN_INSTANCE_CACHE = DoFnInstanceCache()
+atexit.register(_DOFN_INSTANCE_CACHE.teardown)
+
 
-  do_fn_invoker = DoFnInvoker.create_invoker(
-      *do_fn_invoker_args, **do_fn_invoker_kwargs)
+def apply_dofn_to_bundle(
+    items,
+    serialized_fn,
+    do_fn_invoker_args,
+    do_fn_invoker_kwargs,
+    tagged_receivers):
+  """Invokes a DoFn within a bundle, implemented as a Dask partition.
+
+  The DoFn is taken from the worker's `DoFnInstanceCache`, so it is only set
+  up by the first partition that uses it.
+  """
+  lifecycle_invoker = _DOFN_INSTANCE_CACHE.acquire(serialized_fn)
+  try:
+    do_fn_invoker = DoFnInvoker.create_invoker(
+        lifecycle_invoker.signature,
+        *do_fn_invoker_args,
+        **do_fn_invoker_kwargs)
 
-  do_fn_invoker.invoke_setup()
-  do_fn_invoker.invoke_start_bundle()
+    do_fn_invoker.invoke_start_bundle()
 
-  for it in items:
-    do_fn_invoker.invoke_process(it)
+    for it in items:
+      do_fn_invoker.invoke_process(it)
 
-  results = [v.value for v in tagged_receivers.values]
+    do_fn_invoker.invoke_finish_bundle()
 
-  do_fn_invoker.invoke_finish_bundle()
-  do_fn_invoker.invoke_teardown()
+    # Outputs keep their windows, so that they reach downstream groupings.
+    # They include those of finish_bundle, e.g. of partial combines.
+    results = [
+        v.value if isinstance(v, TaggedOutput) else v
+        for v in tagged_receivers.values
+    ]
+  except:  # pylint: disable=bare-except
+    _DOFN_INSTANCE_CACHE.discard(lifecycle_invoker)
+    raise
 
+  _DOFN_INSTANCE_CACHE.release(serialized_fn, lifecycle_invoker)
   return results
 
 
@@ -220,7 +344,6 @@ class ParDo(DaskBagOp):
     tagged_receivers = OneReceiver()
 
     do_fn_invoker_args = [
-        DoFnSignature(transform.fn),
         _OutputHandler(
             window_fn=window_fn,
             main_receivers=tagged_receivers[None],
@@ -241,23 +364,165 @@ class ParDo(DaskBagOp):
 
     return input_bag.map(get_windowed_value, window_fn).map_partitions(
         apply_dofn_to_bundle,
+        pickler.dumps(transform.fn),
         do_fn_invoker_args,
         do_fn_invoker_kwargs,
         tagged_receivers,
     )
 
 
+def group_by_window_in_partition(
+    items: t.Iterable[t.Any],
+    key_coder: t.Optional[coders.Coder],
+    windowing: Windowing) -> t.List[t.Tuple]:
+  """Pre-aggregates the reified values of a partition per key and window.
+
+  Returns one `((key, encoded window), (output timestamp, values))` item per
+  key and window, so that a single, already grouped, item per key and window
+  is shuffled for each partition.
+  """
+  window_coder = windowing.windowfn.get_window_coder()
+  timestamp_combiner = TimestampCombiner.get_impl(
+      windowing.timestamp_combiner, windowing.windowfn)
+  groups = {}
+  for item in items:
+    k, wv = encode_key(item, key_coder)
+    for window in wv.windows:
+      output_time = timestamp_combiner.assign_output_time(window, wv.timestamp)
+      group_key = k, window_coder.encode(window)
+      group = groups.get(group_key)
+      if group is None:
+        groups[group_key] = [output_time, [wv.value]]
+      else:
+        group[0] = timestamp_combiner.combine(group[0], output_time)
+        group[1].append(wv.value)
+  return list(groups.items())
+
+
 class GroupByKey(DaskBagOp):
-  """Group a PCollection into a mapping of keys to elements."""
+  """Group a PCollection into a mapping of keys and windows to elements.
+
+  Inputs are the reified `(key, WindowedValue)` pairs of `_GroupByKeyOnly`.
+  For non-merging windows with the default trigger, values are grouped on
+  their (encoded key, encoded window) pairs, after being pre-aggregated
+  within each partition. Other windowing strategies group per key and then
+  apply the windowing strategy's trigger driver to all values of each key.
+  """
   def apply(self, input_bag: db.Bag, side_inputs: OpSide = None) -> db.Bag:
+    key_coder = get_key_coder(self.applied)
+    main_input = next(iter(self.applied.main_inputs.values()))
+    windowing = main_input.windowing
+
     def key(item):
       return item[0]
 
-    def value(item):
-      k, v = item
-      return k, [defenestrate(elm[1]) for elm in v]
+    if (windowing.windowfn.is_merging() or
+        windowing.triggerfn != DefaultTrigger()):
+
+      def group_also_by_window(item):
+        k, v = item
+        driver = create_trigger_driver(windowing, True)
+        outputs = []
+        for wv in driver.process_entire_key(decode_key(k, key_coder),
+                                            [elm[1] for elm in v]):
+          output_key, values = wv.value
+          outputs.append(wv.with_value((output_key, list(values))))
+        return outputs
+
+      return input_bag.map(
+          encode_key,
+          key_coder).groupby(key).map(group_also_by_window).flatten()
+
+    window_coder = windowing.windowfn.get_window_coder()
+    timestamp_combiner = TimestampCombiner.get_impl(
+        windowing.timestamp_combiner, windowing.windowfn)
+
+    def merge_groups(item):
+      (k, window), partition_groups = item
+      output_time = None
+      values = []
+      for _, (group_output_time, group_values) in partition_groups:
+        if output_time is None:
+          output_time = group_output_time
+        else:
+          output_time = timestamp_combiner.combine(
+              output_time, group_output_time)
+        values.extend(group_values)
+      if windowing.is_default():
+        # Matches the batch trigger driver for the global window.
+        output_time = MIN_TIMESTAMP
+      return WindowedValue((decode_key(k, key_coder), values),
+                           output_time, (window_coder.decode(window), ))
+
+    return input_bag.map_partitions(
+        group_by_window_in_partition, key_coder,
+        windowing).groupby(key).map(merge_groups)
+
+
+@dataclasses.dataclass
+class _PartialCombiner:
+  """Folds the values of each key with a `CombineFn`, a partition at a time.
+
+  Dask ships these callables to every task of the reduction, and each task
+  sets up the (deserialized) `CombineFn` for its partition or merge, and tears
+  it down once it is done, even if it fails.
+  """
+  combine_fn: CombineFn
+
+  @contextlib.contextmanager
+  def _set_up(self) -> t.Iterator[CombineFn]:
+    self.combine_fn.setup()
+    try:
+      yield self.combine_fn
+    finally:
+      self.combine_fn.teardown()
+
+  def add_inputs(self, items: t.Iterable[t.Tuple[t.Any, t.Any]]) -> t.List:
+    """Folds a partition of key-value pairs into one accumulator per key."""
+    with self._set_up() as combine_fn:
+      accumulators = {}
+      for key, value in items:
+        if key in accumulators:
+          accumulator = accumulators[key]
+        else:
+          accumulator = combine_fn.create_accumulator()
+        accumulators[key] = combine_fn.add_input(accumulator, value)
+      return list(accumulators.items())
+
+  def merge_accumulators(self, partitions: t.Iterable[t.List]) -> t.List:
+    """Merges the accumulators of each key across folded partitions."""
+    with self._set_up() as combine_fn:
+      accumulators = collections.defaultdict(list)
+      for partition in partitions:
+        for key, accumulator in partition:
+          accumulators[key].append(accumulator)
+      return [(key, combine_fn.merge_accumulators(key_accumulators))
+              for key, key_accumulators in accumulators.items()]
+
+  def extract_outputs(self, items: t.Iterable[t.Tuple[t.Any, t.Any]]) -> t.List:
+    with self._set_up() as combine_fn:
+      return [(key, combine_fn.extract_output(accumulator))
+              for key, accumulator in items]
+
+
+class CombinePerKey(DaskBagOp):
+  """Combine the values of each key, with partial combining.
+
+  Values are folded into one accumulator per key within each partition, so
+  only accumulators are shuffled, and are then merged in a tree reduction.
+  """
+  def apply(self, input_bag: db.Bag, side_inputs: OpSide = None) -> db.Bag:
+    combine_fn = t.cast(_CombinePerKey, self.transform).combine_fn
+    combiner = _PartialCombiner(combine_fn)
+    key_coder = get_key_coder(self.applied)
+
+    def decode(item):
+      k, output = item
+      return decode_key(k, key_coder), output
 
-    return input_bag.groupby(key).map(value)
+    return input_bag.map(encode_key, key_coder).reduction(
+        combiner.add_inputs, combiner.merge_accumulators,
+        out_type=db.Bag).map_partitions(combiner.extract_outputs).map(decode)
 
 
 class Flatten(DaskBagOp):
@@ -271,6 +536,8 @@ class Flatten(DaskBagOp):
 TRANSLATIONS = {
     _Create: Create,
     apache_beam.ParDo: ParDo,
+    apache_beam.WindowInto: ParDo,
     _GroupByKeyOnly: GroupByKey,
+    _CombinePerKey: CombinePerKey,
     _Flatten: Flatten,
 }
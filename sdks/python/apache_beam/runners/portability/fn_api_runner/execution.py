@@ -21,14 +21,18 @@
 
 import collections
 import copy
+import heapq
 import itertools
 import logging
 import struct
+import tempfile
+import threading
 import typing
 import uuid
 import weakref
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import BinaryIO
 from typing import Callable
 from typing import DefaultDict
 from typing import Dict
@@ -43,11 +47,18 @@ from typing import Set
 from typing import Tuple
 from typing import TypeVar
 from typing import Union
+from typing import overload
 
 from typing_extensions import Protocol
 
 from apache_beam import coders
+from apache_beam.coders.coder_impl import BytesCoderImpl
 from apache_beam.coders.coder_impl import CoderImpl
+from apache_beam.coders.coder_impl import IterableCoderImpl
+from apache_beam.coders.coder_impl import LengthPrefixCoderImpl
+from apache_beam.coders.coder_impl import SingletonCoderImpl
+from apache_beam.coders.coder_impl import StreamCoderImpl
+from apache_beam.coders.coder_impl import TupleCoderImpl
 from apache_beam.coders.coder_impl import WindowedValueCoderImpl
 from apache_beam.coders.coder_impl import create_InputStream
 from apache_beam.coders.coder_impl import create_OutputStream
@@ -108,7 +119,7 @@ class PartitionableBuffer(Buffer, Protocol):
   def copy(self) -> 'PartitionableBuffer':
     pass
 
-  def partition(self, n: int) -> List[List[bytes]]:
+  def partition(self, n: int) -> List[Sequence[bytes]]:
     pass
 
   @property
@@ -122,54 +133,177 @@ class PartitionableBuffer(Buffer, Protocol):
     pass
 
 
+def _balance_by_size(sizes: Sequence[int], n: int) -> List[List[int]]:
+  """Assigns the indices of the given item sizes to n parts of balanced size.
+
+  Items are assigned greedily, largest first, to the currently smallest part.
+  The indices within each part are kept in increasing order.
+  """
+  parts: List[List[int]] = [[] for _ in range(n)]
+  part_sizes = [(0, ix) for ix in range(n)]
+  for item in sorted(range(len(sizes)), key=lambda item: -sizes[item]):
+    part_size, ix = heapq.heappop(part_sizes)
+    parts[ix].append(item)
+    heapq.heappush(part_sizes, (part_size + sizes[item], ix))
+  for part in parts:
+    part.sort()
+  return parts
+
+
+def _partition_encoded(data: bytes, offsets: Sequence[int],
+                       n: int) -> List[Sequence[bytes]]:
+  """Partitions the records data[offsets[i]:offsets[i + 1]] into n parts of
+  balanced encoded size, concatenating the records of each part.
+  """
+  if n == 1:
+    return [[data]]
+  view = memoryview(data)
+  sizes = [end - start for start, end in zip(offsets, offsets[1:])]
+  return [[b''.join(view[offsets[i]:offsets[i + 1]] for i in part)]
+          for part in _balance_by_size(sizes, n)]
+
+
+# The grouped output of a GroupingBuffer that spilled to disk is read back in
+# chunks of (whole records amounting to) about this many bytes.
+_SPILLED_OUTPUT_CHUNK_SIZE = 1 << 20
+
+
+def _close_all(files: List[BinaryIO]) -> None:
+  for f in files:
+    f.close()
+
+
+class _SpilledOutput(object):
+  """The encoded grouped output of a GroupingBuffer, held in a temporary file.
+
+  The records ``[offsets[i], offsets[i + 1])`` of the file are only read back
+  when the partitions returned by ``partition()`` are iterated over.
+  """
+  def __init__(self) -> None:
+    self._file = tempfile.TemporaryFile()
+    # The partitions may outlive the buffer, so the file is closed along with
+    # the last of them.
+    weakref.finalize(self, self._file.close)
+    # Partitions may be read concurrently, by the threads of several workers.
+    self._lock = threading.Lock()
+
+  def write(self, data: bytes) -> None:
+    self._file.write(data)
+
+  def read(self, start: int, end: int) -> bytes:
+    with self._lock:
+      self._file.seek(start)
+      return self._file.read(end - start)
+
+  def partition(self, offsets: Sequence[int], n: int) -> List[Sequence[bytes]]:
+    parts: Sequence[Sequence[int]]
+    if n == 1:
+      parts = [range(len(offsets) - 1)]
+    else:
+      sizes = [end - start for start, end in zip(offsets, offsets[1:])]
+      parts = _balance_by_size(sizes, n)
+    result: List[Sequence[bytes]] = []
+    for part in parts:
+      # Consecutive records are read together, up to the chunk size.
+      chunks: List[Tuple[int, int]] = []
+      for i in part:
+        start, end = offsets[i], offsets[i + 1]
+        if chunks and chunks[-1][1] == start and (
+            end - chunks[-1][0] <= _SPILLED_OUTPUT_CHUNK_SIZE):
+          chunks[-1] = chunks[-1][0], end
+        else:
+          chunks.append((start, end))
+      result.append(_SpilledPartition(self, chunks))
+    return result
+
+
+class _SpilledPartition(Sequence[bytes]):
+  """A partition of spilled grouped output, read back one chunk at a time."""
+  def __init__(
+      self, output: _SpilledOutput, chunks: List[Tuple[int, int]]) -> None:
+    self._output = output
+    self._chunks = chunks
+
+  def __len__(self) -> int:
+    return len(self._chunks)
+
+  @overload
+  def __getitem__(self, index: int) -> bytes:
+    pass
+
+  @overload
+  def __getitem__(self, index: slice) -> List[bytes]:
+    pass
+
+  def __getitem__(self, index):
+    if isinstance(index, slice):
+      return [self[i] for i in range(*index.indices(len(self)))]
+    return self._output.read(*self._chunks[index])
+
+
 class ListBuffer:
   """Used to support parititioning of a list."""
   def __init__(self, coder_impl: Optional[CoderImpl]) -> None:
     self._coder_impl = coder_impl or CoderImpl()
+    self._can_split = coder_impl is not None
     self._inputs: List[bytes] = []
-    self._grouped_output: Optional[List[List[bytes]]] = None
+    # Maps the index of an input to the encodings of its individual elements.
+    self._split_inputs: Dict[int, List[bytes]] = {}
     self.cleared = False
 
   def copy(self) -> 'ListBuffer':
-    new = ListBuffer(self._coder_impl)
+    new = ListBuffer(self._coder_impl if self._can_split else None)
     new._inputs = [v for v in self._inputs]
+    new._split_inputs = dict(self._split_inputs)
     return new
 
   def extend(self, extra: 'Buffer') -> None:
     if self.cleared:
       raise RuntimeError('Trying to append to a cleared ListBuffer.')
-    if self._grouped_output:
-      raise RuntimeError('ListBuffer append after read.')
     assert isinstance(extra, ListBuffer)
     self._inputs.extend(extra._inputs)
 
   def append(self, element: bytes) -> None:
     if self.cleared:
       raise RuntimeError('Trying to append to a cleared ListBuffer.')
-    if self._grouped_output:
-      raise RuntimeError('ListBuffer append after read.')
     self._inputs.append(element)
 
-  def partition(self, n: int) -> List[List[bytes]]:
+  def _split_input(self, index: int) -> List[bytes]:
+    """Returns the encodings of the individual elements of the given input."""
+    if not self._can_split:
+      return [self._inputs[index]]
+    if index not in self._split_inputs:
+      data = self._inputs[index]
+      input_stream = create_InputStream(data)
+      elements = []
+      start = 0
+      while input_stream.size() > 0:
+        self._coder_impl.decode_from_stream(input_stream, True)
+        end = len(data) - input_stream.size()
+        elements.append(data[start:end])
+        start = end
+      self._split_inputs[index] = elements
+    return self._split_inputs[index]
+
+  def partition(self, n: int) -> List[Sequence[bytes]]:
+    """Partitions the buffered data into N parts of balanced encoded size.
+
+    Inputs holding more than an even share of the data (or all inputs, if
+    there are fewer inputs than parts) are split into their individual
+    elements first. A buffer may be partitioned any number of times, with
+    different values of N.
+    """
     if self.cleared:
       raise RuntimeError('Trying to partition a cleared ListBuffer.')
-    if len(self._inputs) >= n or len(self._inputs) == 0:
-      return [self._inputs[k::n] for k in range(n)]
-    else:
-      if not self._grouped_output:
-        output_stream_list = [create_OutputStream() for _ in range(n)]
-        idx = 0
-        for input in self._inputs:
-          input_stream = create_InputStream(input)
-          while input_stream.size() > 0:
-            decoded_value = self._coder_impl.decode_from_stream(
-                input_stream, True)
-            self._coder_impl.encode_to_stream(
-                decoded_value, output_stream_list[idx], True)
-            idx = (idx + 1) % n
-        self._grouped_output = [[output_stream.get()]
-                                for output_stream in output_stream_list]
-      return self._grouped_output
+    share = sum(len(input) for input in self._inputs) / n
+    chunks: List[bytes] = []
+    for ix, input in enumerate(self._inputs):
+      if len(input) > share or len(self._inputs) < n:
+        chunks.extend(self._split_input(ix))
+      else:
+        chunks.append(input)
+    return [[chunks[ix] for ix in part]
+            for part in _balance_by_size([len(chunk) for chunk in chunks], n)]
 
   def __iter__(self) -> Iterator[bytes]:
     if self.cleared:
@@ -179,7 +313,7 @@ class ListBuffer:
   def clear(self) -> None:
     self.cleared = True
     self._inputs = []
-    self._grouped_output = None
+    self._split_inputs = {}
 
   def reset(self) -> None:
     """Resets a cleared buffer for reuse."""
@@ -188,19 +322,78 @@ class ListBuffer:
     self.cleared = False
 
 
+class _PreEncodedCoderImpl(StreamCoderImpl):
+  """Writes bytes that already hold a nested encoding to the stream as-is."""
+  def encode_to_stream(self, value: bytes, out: Any, nested: bool) -> None:
+    out.write(value)
+
+  def decode_from_stream(self, in_stream: Any, nested: bool) -> bytes:
+    raise NotImplementedError('%s is only used for encoding.' % self)
+
+
+def _skip_nested(coder_impl: CoderImpl, input_stream: Any) -> None:
+  """Advances the stream past one nested-encoded value of the given coder.
+
+  Values whose encoding carries its own length are skipped without decoding.
+  """
+  if isinstance(coder_impl, (BytesCoderImpl, LengthPrefixCoderImpl)):
+    input_stream.read(input_stream.read_var_int64())
+  else:
+    coder_impl.decode_from_stream(input_stream, True)
+
+
 class GroupingBuffer(object):
-  """Used to accumulate groupded (shuffled) results."""
+  """Used to accumulate groupded (shuffled) results.
+
+  For default windowing, the buffer groups the raw nested-encoded key bytes
+  and keeps each value as its raw nested-encoded bytes, which are written
+  directly into the post-grouped iterable encoding by ``partition()``.
+
+  If a ``memory_limit`` (in bytes) is given, the buffer sorts its in-memory
+  table by encoded key and spills it to a local temporary file whenever the
+  size of the data appended since the last spill exceeds the limit. The
+  sorted runs are merged back together in ``partition()``, one key at a time,
+  into another temporary file, which the partitions then read back in chunks.
+  Only the values of a single key are held in memory while merging.
+  """
   def __init__(
       self,
       pre_grouped_coder: coders.Coder,
       post_grouped_coder: coders.Coder,
-      windowing: core.Windowing) -> None:
+      windowing: core.Windowing,
+      memory_limit: Optional[int] = None,
+      spill_listener: Optional[Callable[[int], None]] = None) -> None:
     self._key_coder = pre_grouped_coder.key_coder()
     self._pre_grouped_coder = pre_grouped_coder
     self._post_grouped_coder = post_grouped_coder
     self._table: DefaultDict[bytes, List[Any]] = collections.defaultdict(list)
     self._windowing = windowing
-    self._grouped_output: Optional[List[List[bytes]]] = None
+    # The encoded grouped output, and the offset at which each key starts.
+    # If any data was spilled, the output is held in _spilled_output instead.
+    self._grouped_data: Optional[bytes] = None
+    self._spilled_output: Optional[_SpilledOutput] = None
+    self._grouped_offsets: List[int] = [0]
+    self._grouped_output: Dict[int, List[Sequence[bytes]]] = {}
+    self._memory_limit = memory_limit
+    self._spill_listener = spill_listener
+    # The approximate (encoded) size of the data currently held in _table.
+    self._table_bytes = 0
+    # This list is only ever modified in place, so that the runs that were
+    # never merged (e.g. if the buffer is never partitioned) are closed once
+    # the buffer is garbage collected.
+    self._spilled_runs: List[BinaryIO] = []
+    weakref.finalize(self, _close_all, self._spilled_runs)
+    self.spilled_bytes = 0
+    self._group_encoded = self._can_group_encoded()
+
+  def _can_group_encoded(self) -> bool:
+    # The post-grouped iterable must be a plain IterableCoder so that we can
+    # write the count followed by the already encoded values.
+    return (
+        self._windowing.is_default() and
+        isinstance(self._pre_grouped_coder, WindowedValueCoder) and
+        isinstance(self._post_grouped_coder, WindowedValueCoder) and
+        type(self._post_grouped_coder.value_coder()) == coders.IterableCoder)
 
   def copy(self) -> 'GroupingBuffer':
     # This is a silly temporary optimization. This class must be removed once
@@ -209,8 +402,16 @@ class GroupingBuffer(object):
     return self
 
   def append(self, elements_data: bytes) -> None:
-    if self._grouped_output:
+    if self._grouped_data is not None or self._spilled_output is not None:
       raise RuntimeError('Grouping table append after read.')
+    if self._group_encoded:
+      self._append_encoded(elements_data)
+    else:
+      self._append_decoded(elements_data)
+    self._table_bytes += len(elements_data)
+    self._maybe_spill()
+
+  def _append_decoded(self, elements_data: bytes) -> None:
     input_stream = create_InputStream(elements_data)
     coder_impl = self._pre_grouped_coder.get_impl()
     key_coder_impl = self._key_coder.get_impl()
@@ -224,6 +425,35 @@ class GroupingBuffer(object):
           value if is_trivial_windowing else windowed_key_value.
           with_value(value))
 
+  def _append_encoded(self, elements_data: bytes) -> None:
+    assert isinstance(self._pre_grouped_coder, WindowedValueCoder)
+    input_stream = create_InputStream(elements_data)
+    # Reads (and drops) the timestamp, windows and pane of each element.
+    header_coder_impl = WindowedValueCoderImpl(
+        SingletonCoderImpl(None),
+        self._pre_grouped_coder.timestamp_coder.get_impl(),
+        self._pre_grouped_coder.window_coder.get_impl())
+    key_coder_impl = self._key_coder.get_impl()
+    value_coder_impl = self._pre_grouped_coder.value_coder().get_impl()
+    end = len(elements_data)
+    while input_stream.size() > 0:
+      header_coder_impl.decode_from_stream(input_stream, True)
+      key_start = end - input_stream.size()
+      _skip_nested(key_coder_impl, input_stream)
+      value_start = end - input_stream.size()
+      _skip_nested(value_coder_impl, input_stream)
+      self._table[elements_data[key_start:value_start]].append(
+          elements_data[value_start:end - input_stream.size()])
+
+  def _encoded_output_coder_impl(self) -> CoderImpl:
+    assert isinstance(self._post_grouped_coder, WindowedValueCoder)
+    return WindowedValueCoderImpl(
+        TupleCoderImpl(
+            [_PreEncodedCoderImpl(),
+             IterableCoderImpl(_PreEncodedCoderImpl())]),
+        self._post_grouped_coder.timestamp_coder.get_impl(),
+        self._post_grouped_coder.window_coder.get_impl())
+
   def extend(self, input_buffer: Buffer) -> None:
     if isinstance(input_buffer, ListBuffer):
       # TODO(pabloem): GroupingBuffer will be removed once shuffling is done
@@ -233,13 +463,108 @@ class GroupingBuffer(object):
       'Input was not GroupingBuffer: %s' % input_buffer
     for key, values in input_buffer._table.items():
       self._table[key].extend(values)
+    self._table_bytes += input_buffer._table_bytes
+    # Sorted runs are independent of each other, so we can simply take
+    # ownership of the ones spilled by the other buffer.
+    self._spilled_runs.extend(input_buffer._spilled_runs)
+    del input_buffer._spilled_runs[:]
+    self._maybe_spill()
+
+  def _spill_value_coder_impl(self) -> CoderImpl:
+    # This must be able to encode the values exactly as they are held in
+    # _table, i.e. with their windowing information for non-trivial windowing.
+    if self._group_encoded:
+      return BytesCoderImpl()
+    value_coder = self._pre_grouped_coder.value_coder()
+    if self._windowing.is_default():
+      return value_coder.get_impl()
+    assert isinstance(self._pre_grouped_coder, WindowedValueCoder)
+    return WindowedValueCoder(
+        value_coder, self._pre_grouped_coder.window_coder).get_impl()
+
+  def _maybe_spill(self) -> None:
+    if self._memory_limit is not None and (self._table_bytes
+                                           > self._memory_limit):
+      self._spill()
+
+  def _spill(self) -> None:
+    """Writes the in-memory table as a run sorted by encoded key to disk.
+
+    Each key is written as a 4-byte length followed by a record holding the
+    nested encoded key, the number of values and the nested encoded values.
+    """
+    if not self._table:
+      return
+    value_coder_impl = self._spill_value_coder_impl()
+    run = tempfile.TemporaryFile()
+    run_bytes = 0
+    for encoded_key in sorted(self._table):
+      values = self._table.pop(encoded_key)
+      out = create_OutputStream()
+      out.write(encoded_key, True)
+      out.write_var_int64(len(values))
+      for value in values:
+        value_coder_impl.encode_to_stream(value, out, True)
+      record = out.get()
+      run.write(struct.pack('>i', len(record)))
+      run.write(record)
+      run_bytes += len(record) + 4
+    run.seek(0)
+    self._table_bytes = 0
+    self._spilled_runs.append(run)
+    self.spilled_bytes += run_bytes
+    if self._spill_listener:
+      self._spill_listener(run_bytes)
+    _LOGGER.debug(
+        'Spilled %d bytes of grouped data to disk (%d runs).',
+        run_bytes,
+        len(self._spilled_runs))
+
+  def _read_spilled_run(self,
+                        run: BinaryIO) -> Iterator[Tuple[bytes, List[Any]]]:
+    value_coder_impl = self._spill_value_coder_impl()
+    try:
+      while True:
+        header = run.read(4)
+        if not header:
+          break
+        input_stream = create_InputStream(
+            run.read(struct.unpack('>i', header)[0]))
+        encoded_key = input_stream.read_all(True)
+        num_values = input_stream.read_var_int64()
+        yield encoded_key, [
+            value_coder_impl.decode_from_stream(input_stream, True)
+            for _ in range(num_values)
+        ]
+    finally:
+      run.close()
+
+  def _grouped_items(self) -> Iterator[Tuple[bytes, List[Any]]]:
+    """Yields every (encoded_key, values) pair held by this buffer.
 
-  def partition(self, n: int) -> List[List[bytes]]:
-    """ It is used to partition _GroupingBuffer to N parts. Once it is
-    partitioned, it would not be re-partitioned with diff N. Re-partition
-    is not supported now.
+    If any data was spilled, the remaining in-memory table is spilled as well
+    and all sorted runs are merged, so that every key is yielded only once.
     """
-    if not self._grouped_output:
+    if not self._spilled_runs:
+      yield from self._table.items()
+      return
+    self._spill()
+    runs = list(self._spilled_runs)
+    del self._spilled_runs[:]
+    merged = heapq.merge(
+        *[self._read_spilled_run(run) for run in runs],
+        key=lambda key_values: key_values[0])
+    for encoded_key, key_values in itertools.groupby(
+        merged, key=lambda key_values: key_values[0]):
+      yield encoded_key, list(
+          itertools.chain.from_iterable(values for _, values in key_values))
+
+  def partition(self, n: int) -> List[Sequence[bytes]]:
+    """ It is used to partition _GroupingBuffer to N parts of balanced
+    encoded size. The grouped output is only computed once, but it may be
+    re-partitioned with a different N.
+    """
+    if self._grouped_data is None and self._spilled_output is None:
       if self._windowing.is_default():
         globally_window = GlobalWindows.windowed_value(
             None,
@@ -261,17 +586,41 @@ class GroupingBuffer(object):
         trigger_driver = trigger.create_trigger_driver(self._windowing, True)
         windowed_key_values = trigger_driver.process_entire_key
       coder_impl = self._post_grouped_coder.get_impl()
-      key_coder_impl = self._key_coder.get_impl()
-      self._grouped_output = [[] for _ in range(n)]
-      output_stream_list = [create_OutputStream() for _ in range(n)]
-      for idx, (encoded_key, windowed_values) in enumerate(self._table.items()):
-        key = key_coder_impl.decode(encoded_key)
+      decode_key = self._key_coder.get_impl().decode
+      if self._group_encoded:
+        # Both the keys and the values are held in their nested encoding.
+        coder_impl = self._encoded_output_coder_impl()
+        decode_key = lambda encoded_key: encoded_key
+      output_stream = create_OutputStream()
+      spilled_output = _SpilledOutput() if self._spilled_runs else None
+      # The number of bytes of output already written to spilled_output.
+      written = 0
+      for encoded_key, windowed_values in self._grouped_items():
+        key = decode_key(encoded_key)
         for wkvs in windowed_key_values(key, windowed_values):
-          coder_impl.encode_to_stream(wkvs, output_stream_list[idx % n], True)
-      for ix, output_stream in enumerate(output_stream_list):
-        self._grouped_output[ix] = [output_stream.get()]
+          coder_impl.encode_to_stream(wkvs, output_stream, True)
+        self._grouped_offsets.append(written + output_stream.size())
+        if spilled_output is not None and (output_stream.size()
+                                           >= _SPILLED_OUTPUT_CHUNK_SIZE):
+          spilled_output.write(output_stream.get())
+          written += output_stream.size()
+          output_stream._clear()
+      if spilled_output is None:
+        self._grouped_data = output_stream.get()
+      else:
+        spilled_output.write(output_stream.get())
+        self._spilled_output = spilled_output
       self._table.clear()
-    return self._grouped_output
+      self._table_bytes = 0
+    if n not in self._grouped_output:
+      if self._spilled_output is not None:
+        self._grouped_output[n] = self._spilled_output.partition(
+            self._grouped_offsets, n)
+      else:
+        assert self._grouped_data is not None
+        self._grouped_output[n] = _partition_encoded(
+            self._grouped_data, self._grouped_offsets, n)
+    return self._grouped_output[n]
 
   def __iter__(self) -> Iterator[bytes]:
     """ Since partition() returns a list of lists, add this __iter__ to return
@@ -291,6 +640,118 @@ class GroupingBuffer(object):
     pass
 
 
+class CombiningGroupingBuffer(object):
+  """Used to accumulate the grouped accumulators of a lifted combiner.
+
+  Rather than holding every accumulator produced by the precombine stage, it
+  holds a single accumulator per key, merging incoming accumulators as they
+  are appended. Each key is then emitted with a single-element iterable of
+  accumulators, which the downstream merge stage handles as usual.
+
+  This requires the CombineFn to be executable by the runner and is only
+  used with default windowing.
+  """
+  def __init__(
+      self,
+      pre_grouped_coder: coders.Coder,
+      post_grouped_coder: coders.Coder,
+      combine_fn: core.CombineFn) -> None:
+    self._key_coder = pre_grouped_coder.key_coder()
+    self._pre_grouped_coder = pre_grouped_coder
+    self._post_grouped_coder = post_grouped_coder
+    self._combine_fn = combine_fn
+    # The CombineFn is set up on the first merge, and torn down once the
+    # accumulators are all merged, or the buffer is cleared.
+    self._combine_fn_set_up = False
+    self._table: Dict[bytes, Any] = {}
+    # See GroupingBuffer.
+    self._grouped_data: Optional[bytes] = None
+    self._grouped_offsets: List[int] = [0]
+    self._grouped_output: Dict[int, List[Sequence[bytes]]] = {}
+
+  def copy(self) -> 'CombiningGroupingBuffer':
+    # See GroupingBuffer.copy().
+    return self
+
+  def _add_accumulator(self, encoded_key: bytes, accumulator: Any) -> None:
+    if encoded_key in self._table:
+      if not self._combine_fn_set_up:
+        self._combine_fn.setup()
+        self._combine_fn_set_up = True
+      self._table[encoded_key] = self._combine_fn.merge_accumulators(
+          [self._table[encoded_key], accumulator])
+    else:
+      self._table[encoded_key] = accumulator
+
+  def append(self, elements_data: bytes) -> None:
+    if self._grouped_data is not None:
+      raise RuntimeError('Grouping table append after read.')
+    input_stream = create_InputStream(elements_data)
+    coder_impl = self._pre_grouped_coder.get_impl()
+    key_coder_impl = self._key_coder.get_impl()
+    while input_stream.size() > 0:
+      key, accumulator = coder_impl.decode_from_stream(input_stream, True).value
+      self._add_accumulator(key_coder_impl.encode(key), accumulator)
+
+  def extend(self, input_buffer: Buffer) -> None:
+    if isinstance(input_buffer, ListBuffer):
+      # See GroupingBuffer.extend().
+      return
+    assert isinstance(input_buffer, CombiningGroupingBuffer), \
+      'Input was not CombiningGroupingBuffer: %s' % input_buffer
+    for encoded_key, accumulator in input_buffer._table.items():
+      self._add_accumulator(encoded_key, accumulator)
+
+  def partition(self, n: int) -> List[Sequence[bytes]]:
+    """Partitions the merged accumulators into N parts of balanced encoded
+    size. As with ``GroupingBuffer``, it may be re-partitioned with a
+    different N.
+    """
+    if self._grouped_data is None:
+      globally_window = GlobalWindows.windowed_value(
+          None,
+          timestamp=GlobalWindow().max_timestamp(),
+          pane_info=windowed_value.PaneInfo(
+              is_first=True,
+              is_last=True,
+              timing=windowed_value.PaneInfoTiming.ON_TIME,
+              index=0,
+              nonspeculative_index=0)).with_value
+      coder_impl = self._post_grouped_coder.get_impl()
+      key_coder_impl = self._key_coder.get_impl()
+      output_stream = create_OutputStream()
+      for encoded_key, accumulator in self._table.items():
+        key = key_coder_impl.decode(encoded_key)
+        coder_impl.encode_to_stream(
+            globally_window((key, [accumulator])), output_stream, True)
+        self._grouped_offsets.append(output_stream.size())
+      self._grouped_data = output_stream.get()
+      self._table.clear()
+      self._teardown_combine_fn()
+    if n not in self._grouped_output:
+      self._grouped_output[n] = _partition_encoded(
+          self._grouped_data, self._grouped_offsets, n)
+    return self._grouped_output[n]
+
+  def __iter__(self) -> Iterator[bytes]:
+    return itertools.chain(*self.partition(1))
+
+  def _teardown_combine_fn(self) -> None:
+    if self._combine_fn_set_up:
+      self._combine_fn.teardown()
+      self._combine_fn_set_up = False
+
+  # See GroupingBuffer.
+  cleared = False
+
+  def clear(self) -> None:
+    self._table.clear()
+    self._teardown_combine_fn()
+
+  def reset(self) -> None:
+    pass
+
+
 class WindowGroupingBuffer(object):
   """Used to partition windowed side inputs."""
   def __init__(
@@ -672,8 +1133,8 @@ class FnApiRunnerExecutionContext(object):
       num_workers: int,
       uses_teststream: bool = False,
       split_managers: Sequence[Tuple[str, Callable[[int],
-                                                   Iterable[float]]]] = ()
-  ) -> None:
+                                                   Iterable[float]]]] = (),
+      grouping_buffer_memory_limit: Optional[int] = None) -> None:
     """
     :param worker_handler_manager: This class manages the set of worker
         handlers, and the communication with state / control APIs.
@@ -681,6 +1142,9 @@ class FnApiRunnerExecutionContext(object):
     :param safe_coders: A map from Coder ID to Safe Coder ID.
     :param data_channel_coders: A map from PCollection ID to the ID of the Coder
         for that PCollection.
+    :param grouping_buffer_memory_limit: The number of bytes each
+        ``GroupingBuffer`` may hold in memory before spilling to disk, or None
+        to keep all grouped data in memory.
     """
     self.stages = {s.name: s for s in stages}
     self.side_input_descriptors_by_stage = (
@@ -693,6 +1157,9 @@ class FnApiRunnerExecutionContext(object):
     self.data_channel_coders = data_channel_coders
     self.num_workers = num_workers
     self.split_managers = split_managers
+    self.grouping_buffer_memory_limit = grouping_buffer_memory_limit
+    # The total number of bytes spilled to disk by all GroupingBuffers.
+    self.grouping_buffer_spilled_bytes = 0
     # TODO(pabloem): Move Clock classes out of DirectRunner and into FnApiRnr
     self.clock: Union[TestClock, RealClock] = (
         TestClock() if uses_teststream else RealClock())
@@ -918,6 +1385,9 @@ class FnApiRunnerExecutionContext(object):
     self._last_uid += 1
     return str(self._last_uid)
 
+  def record_grouping_buffer_spill(self, num_bytes: int) -> None:
+    self.grouping_buffer_spilled_bytes += num_bytes
+
   def _iterable_state_write(
       self, values: Iterable, element_coder_impl: CoderImpl) -> bytes:
     token = unique_name(None, 'iter').encode('ascii')
@@ -1152,14 +1622,44 @@ class BundleContextManager(object):
                 self.execution_context.safe_windowing_strategies[
                     self.execution_context.pipeline_components.
                     pcollections[input_pcoll].windowing_strategy_id]])
+        if (python_urns.LIFTED_COMBINE_PAYLOAD in transform_proto.annotations
+            and windowing_strategy.is_default()):
+          self.execution_context.pcoll_buffers[buffer_id] = (
+              self._create_combining_buffer(
+                  transform_proto, input_pcoll, output_pcoll))
+          return self.execution_context.pcoll_buffers[buffer_id]
         self.execution_context.pcoll_buffers[buffer_id] = GroupingBuffer(
-            pre_gbk_coder, post_gbk_coder, windowing_strategy)
+            pre_gbk_coder,
+            post_gbk_coder,
+            windowing_strategy,
+            memory_limit=self.execution_context.grouping_buffer_memory_limit,
+            spill_listener=(
+                self.execution_context.record_grouping_buffer_spill))
     else:
       # These should be the only two identifiers we produce for now,
       # but special side input writes may go here.
       raise NotImplementedError(buffer_id)
     return self.execution_context.pcoll_buffers[buffer_id]
 
+  def _create_combining_buffer(
+      self,
+      transform_proto: beam_runner_api_pb2.PTransform,
+      input_pcoll: str,
+      output_pcoll: str) -> CombiningGroupingBuffer:
+    # The accumulators must be decoded to be merged, so we use the actual
+    # (rather than the runner-safe) coders here. This is possible as the
+    # combine was only annotated if it runs in an embedded Python environment.
+    pipeline_context = self.execution_context.pipeline_context
+    data_channel_coders = self.execution_context.data_channel_coders
+    combine_payload = proto_utils.parse_Bytes(
+        transform_proto.annotations[python_urns.LIFTED_COMBINE_PAYLOAD],
+        beam_runner_api_pb2.CombinePayload)
+    return CombiningGroupingBuffer(
+        pipeline_context.coders[data_channel_coders[input_pcoll]],
+        pipeline_context.coders[data_channel_coders[output_pcoll]],
+        core.CombineFn.from_runner_api(
+            combine_payload.combine_fn, pipeline_context))
+
   def input_for(self, transform_id: str, input_id: str) -> str:
     """Returns the name of the transform producing the given PCollection."""
     input_pcoll = self.process_bundle_descriptor.transforms[
@@ -0,0 +1,337 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# pytype: skip-file
+
+import gc
+import logging
+import tracemalloc
+import unittest
+
+import mock
+
+from apache_beam.coders import coders
+from apache_beam.coders.coder_impl import create_InputStream
+from apache_beam.runners.portability.fn_api_runner import execution
+from apache_beam.transforms import combiners
+from apache_beam.transforms import core
+from apache_beam.transforms import window
+from apache_beam.utils import windowed_value
+
+
+class ListBufferTest(unittest.TestCase):
+  def _encode(self, coder, values):
+    return b''.join(coder.get_impl().encode_nested(v) for v in values)
+
+  def _decode(self, coder, parts):
+    result = []
+    for part in parts:
+      values = []
+      for data in part:
+        input_stream = create_InputStream(data)
+        while input_stream.size() > 0:
+          values.append(coder.get_impl().decode_from_stream(input_stream, True))
+      result.append(values)
+    return result
+
+  def test_partition_balances_by_size(self):
+    coder = coders.BytesCoder()
+    buffer = execution.ListBuffer(coder.get_impl())
+    # A single large chunk, followed by many small ones.
+    buffer.append(self._encode(coder, [b'x' * 1000, b'y' * 1000]))
+    for i in range(20):
+      buffer.append(self._encode(coder, [b'%d' % i]))
+    parts = buffer.partition(2)
+    sizes = [sum(len(data) for data in part) for part in parts]
+    self.assertLess(abs(sizes[0] - sizes[1]), 1000)
+    values = self._decode(coder, parts)
+    self.assertEqual(
+        sorted([b'x' * 1000, b'y' * 1000] + [b'%d' % i for i in range(20)]),
+        sorted(values[0] + values[1]))
+
+  def test_repartition(self):
+    coder = coders.VarIntCoder()
+    buffer = execution.ListBuffer(coder.get_impl())
+    buffer.append(self._encode(coder, range(10)))
+    for n in (3, 5, 2):
+      values = self._decode(coder, buffer.partition(n))
+      self.assertEqual(n, len(values))
+      self.assertTrue(all(values))
+      self.assertEqual(list(range(10)), sorted(sum(values, [])))
+
+  def test_partition_empty(self):
+    buffer = execution.ListBuffer(None)
+    self.assertEqual([[], [], []], buffer.partition(3))
+
+
+class GroupingBufferTest(unittest.TestCase):
+  def _make_buffer(self, windowing, memory_limit=None):
+    if windowing.is_default():
+      window_coder = coders.GlobalWindowCoder()
+    else:
+      window_coder = coders.IntervalWindowCoder()
+    pre_grouped_coder = coders.WindowedValueCoder(
+        coders.TupleCoder([coders.StrUtf8Coder(), coders.VarIntCoder()]),
+        window_coder)
+    post_grouped_coder = coders.WindowedValueCoder(
+        coders.TupleCoder(
+            [coders.StrUtf8Coder(),
+             coders.IterableCoder(coders.VarIntCoder())]),
+        window_coder)
+    return pre_grouped_coder, post_grouped_coder, execution.GroupingBuffer(
+        pre_grouped_coder,
+        post_grouped_coder,
+        windowing,
+        memory_limit=memory_limit)
+
+  def _append(self, buffer, pre_grouped_coder, elements):
+    buffer.append(
+        b''.join(
+            pre_grouped_coder.get_impl().encode_nested(element)
+            for element in elements))
+
+  def _decode(self, post_grouped_coder, partitions):
+    result = []
+    for partition in partitions:
+      for data in partition:
+        input_stream = create_InputStream(data)
+        while input_stream.size() > 0:
+          wv = post_grouped_coder.get_impl().decode_from_stream(
+              input_stream, True)
+          key, values = wv.value
+          result.append((key, sorted(values), tuple(wv.windows)))
+    return sorted(result)
+
+  def _group(self, windowing, batches, memory_limit=None, n=1):
+    pre, post, buffer = self._make_buffer(windowing, memory_limit)
+    for batch in batches:
+      self._append(buffer, pre, batch)
+    return buffer, self._decode(post, buffer.partition(n))
+
+  def test_spill_global_window(self):
+    windowing = core.Windowing(window.GlobalWindows())
+    batches = [[
+        window.GlobalWindows.windowed_value(('k%d' % (i % 7), i * j))
+        for i in range(50)
+    ] for j in range(10)]
+    in_memory, expected = self._group(windowing, batches)
+    spilling, actual = self._group(windowing, batches, memory_limit=1, n=3)
+    self.assertEqual(in_memory.spilled_bytes, 0)
+    self.assertGreater(spilling.spilled_bytes, 0)
+    self.assertEqual(expected, actual)
+    self.assertEqual(7, len(actual))
+
+  def test_spill_fixed_windows(self):
+    windowing = core.Windowing(window.FixedWindows(10))
+    batches = [[
+        windowed_value.WindowedValue(
+            ('k%d' % (i % 3), i + j),
+            i, [window.IntervalWindow(i - i % 10, i - i % 10 + 10)])
+        for i in range(40)
+    ] for j in range(5)]
+    _, expected = self._group(windowing, batches)
+    spilling, actual = self._group(windowing, batches, memory_limit=1)
+    self.assertGreater(spilling.spilled_bytes, 0)
+    self.assertEqual(expected, actual)
+
+  def test_repartition(self):
+    windowing = core.Windowing(window.GlobalWindows())
+    _, post, buffer = self._make_buffer(windowing)
+    self._append(
+        buffer,
+        self._make_buffer(windowing)[0],
+        [window.GlobalWindows.windowed_value(('k%d' % i, i)) for i in range(9)])
+    expected = self._decode(post, buffer.partition(1))
+    for n in (2, 4):
+      parts = buffer.partition(n)
+      self.assertEqual(n, len(parts))
+      self.assertEqual(expected, self._decode(post, parts))
+    self.assertIs(buffer.partition(2), buffer.partition(2))
+
+  def test_group_encoded_length_prefixed_values(self):
+    value_coder = coders.LengthPrefixCoder(coders.PickleCoder())
+    pre_grouped_coder = coders.WindowedValueCoder(
+        coders.TupleCoder([coders.BytesCoder(), value_coder]))
+    post_grouped_coder = coders.WindowedValueCoder(
+        coders.TupleCoder(
+            [coders.BytesCoder(), coders.IterableCoder(value_coder)]))
+    buffer = execution.GroupingBuffer(
+        pre_grouped_coder,
+        post_grouped_coder,
+        core.Windowing(window.GlobalWindows()))
+    self.assertTrue(buffer._group_encoded)
+    self._append(
+        buffer,
+        pre_grouped_coder,
+        [
+            window.GlobalWindows.windowed_value((b'a', ('x', 1))),
+            window.GlobalWindows.windowed_value((b'b', ('y', 2))),
+            window.GlobalWindows.windowed_value((b'a', ('z', 3))),
+        ])
+    self.assertEqual(
+        [(b'a', [('x', 1), ('z', 3)]), (b'b', [('y', 2)])],
+        [(k, v)
+         for k, v, _ in self._decode(post_grouped_coder, buffer.partition(1))])
+
+  def test_group_decoded_for_non_default_windowing(self):
+    _, _, buffer = self._make_buffer(core.Windowing(window.FixedWindows(10)))
+    self.assertFalse(buffer._group_encoded)
+
+  def test_extend_takes_spilled_runs(self):
+    windowing = core.Windowing(window.GlobalWindows())
+    pre, post, first = self._make_buffer(windowing, memory_limit=1)
+    _, _, second = self._make_buffer(windowing, memory_limit=1)
+    self._append(first, pre, [window.GlobalWindows.windowed_value(('a', 1))])
+    self._append(second, pre, [window.GlobalWindows.windowed_value(('a', 2))])
+    self._append(second, pre, [window.GlobalWindows.windowed_value(('b', 3))])
+    first.extend(second)
+    self.assertEqual([('a', [1, 2], [window.GlobalWindow()]),
+                      ('b', [3], [window.GlobalWindow()])],
+                     [(k, v, list(w))
+                      for k, v, w in self._decode(post, first.partition(2))])
+
+  def test_spilled_output_is_streamed(self):
+    windowing = core.Windowing(window.GlobalWindows())
+    pre, post, buffer = self._make_buffer(windowing, memory_limit=1 << 16)
+    num_keys, num_values = 800, 10
+    for j in range(num_values):
+      self._append(
+          buffer,
+          pre,
+          [
+              window.GlobalWindows.windowed_value(('k%d' % i + 'x' * 5000, j))
+              for i in range(num_keys)
+          ])
+    self.assertGreater(buffer.spilled_bytes, 0)
+
+    with mock.patch.object(execution, '_SPILLED_OUTPUT_CHUNK_SIZE', 1 << 14):
+      tracemalloc.start()
+      try:
+        total_size = 0
+        num_records = 0
+        max_chunk_size = 0
+        for part in buffer.partition(2):
+          for data in part:
+            total_size += len(data)
+            max_chunk_size = max(max_chunk_size, len(data))
+            num_records += len(self._decode(post, [[data]]))
+        _, peak = tracemalloc.get_traced_memory()
+      finally:
+        tracemalloc.stop()
+    self.assertEqual(num_keys, num_records)
+    self.assertLess(max_chunk_size, 1 << 15)
+    # Neither the merged runs nor the grouped output are held in memory.
+    self.assertLess(peak, total_size / 10)
+
+  def test_unmerged_runs_are_closed(self):
+    windowing = core.Windowing(window.GlobalWindows())
+    pre, _, buffer = self._make_buffer(windowing, memory_limit=1)
+    self._append(buffer, pre, [window.GlobalWindows.windowed_value(('a', 1))])
+    runs = list(buffer._spilled_runs)
+    self.assertTrue(runs)
+    del buffer
+    gc.collect()
+    self.assertTrue(all(run.closed for run in runs))
+
+
+class CombiningGroupingBufferTest(unittest.TestCase):
+  def test_merges_accumulators_per_key(self):
+    combine_fn = combiners.MeanCombineFn()
+    accumulator_coder = coders.TupleCoder(
+        [coders.VarIntCoder(), coders.VarIntCoder()])
+    pre_grouped_coder = coders.WindowedValueCoder(
+        coders.TupleCoder([coders.StrUtf8Coder(), accumulator_coder]))
+    post_grouped_coder = coders.WindowedValueCoder(
+        coders.TupleCoder(
+            [coders.StrUtf8Coder(), coders.IterableCoder(accumulator_coder)]))
+    first = execution.CombiningGroupingBuffer(
+        pre_grouped_coder, post_grouped_coder, combine_fn)
+    second = execution.CombiningGroupingBuffer(
+        pre_grouped_coder, post_grouped_coder, combine_fn)
+
+    def append(buffer, key_values):
+      buffer.append(
+          b''.join(
+              pre_grouped_coder.get_impl().encode_nested(
+                  window.GlobalWindows.windowed_value((
+                      key,
+                      combine_fn.add_input(
+                          combine_fn.create_accumulator(), value))))
+              for key, value in key_values))
+
+    append(first, [('a', 1), ('b', 10), ('a', 2)])
+    append(first, [('a', 3)])
+    append(second, [('b', 20), ('c', 5)])
+    first.extend(second)
+    self.assertEqual(3, len(first._table))
+
+    result = {}
+    for partition in first.partition(2):
+      for data in partition:
+        input_stream = create_InputStream(data)
+        while input_stream.size() > 0:
+          key, accumulators = post_grouped_coder.get_impl().decode_from_stream(
+              input_stream, True).value
+          self.assertEqual(1, len(accumulators))
+          result[key] = combine_fn.extract_output(accumulators[0])
+    self.assertEqual({'a': 2, 'b': 15, 'c': 5}, result)
+
+  def test_sets_up_and_tears_down_combine_fn_once(self):
+    calls = []
+
+    class LifecycleCombineFn(combiners.CountCombineFn):
+      def setup(self):
+        calls.append('setup')
+
+      def teardown(self):
+        calls.append('teardown')
+
+    accumulator_coder = coders.VarIntCoder()
+    pre_grouped_coder = coders.WindowedValueCoder(
+        coders.TupleCoder([coders.StrUtf8Coder(), accumulator_coder]))
+    post_grouped_coder = coders.WindowedValueCoder(
+        coders.TupleCoder(
+            [coders.StrUtf8Coder(), coders.IterableCoder(accumulator_coder)]))
+
+    def new_buffer(key_values):
+      buffer = execution.CombiningGroupingBuffer(
+          pre_grouped_coder, post_grouped_coder, LifecycleCombineFn())
+      buffer.append(
+          b''.join(
+              pre_grouped_coder.get_impl().encode_nested(
+                  window.GlobalWindows.windowed_value(kv))
+              for kv in key_values))
+      return buffer
+
+    # Nothing to merge, so the CombineFn is never set up.
+    new_buffer([('a', 1), ('b', 1)]).partition(1)
+    self.assertEqual([], calls)
+
+    buffer = new_buffer([('a', 1), ('a', 2), ('a', 3)])
+    self.assertEqual(['setup'], calls)
+    buffer.partition(1)
+    buffer.partition(2)
+    self.assertEqual(['setup', 'teardown'], calls)
+
+    # A buffer that is never partitioned is torn down when cleared.
+    del calls[:]
+    new_buffer([('a', 1), ('a', 2)]).clear()
+    self.assertEqual(['setup', 'teardown'], calls)
+
+
+if __name__ == '__main__':
+  logging.getLogger().setLevel(logging.INFO)
+  unittest.main()
@@ -39,6 +39,7 @@ from typing import List
 from typing import Mapping
 from typing import MutableMapping
 from typing import Optional
+from typing import Sequence
 from typing import Set
 from typing import Tuple
 from typing import Type
@@ -97,6 +98,7 @@ T = TypeVar('T')
 class FnApiRunner(runner.PipelineRunner):
 
   NUM_FUSED_STAGES_COUNTER = "__num_fused_stages"
+  GROUPING_BUFFER_SPILLED_BYTES_COUNTER = "__grouping_buffer_spilled_bytes"
 
   def __init__(
       self,
@@ -124,6 +126,7 @@ class FnApiRunner(runner.PipelineRunner):
         default_environment or environments.EmbeddedPythonEnvironment.default())
     self._bundle_repeat = bundle_repeat
     self._num_workers = 1
+    self._grouping_buffer_memory_limit: Optional[int] = None
     self._progress_frequency = progress_request_frequency
     self._profiler_factory: Optional[Callable[..., Profile]] = None
     self._use_state_iterables = use_state_iterables
@@ -151,6 +154,10 @@ class FnApiRunner(runner.PipelineRunner):
     if not 'beam_fn_api' in experiments:
       experiments.append('beam_fn_api')
     options.view_as(pipeline_options.DebugOptions).experiments = experiments
+    if 'use_shared_memory_data_plane' in experiments:
+      self._provision_info.use_shared_memory_data_plane = True
+    if 'fuse_simple_pardos' in experiments:
+      self._provision_info.fuse_simple_pardos = True
 
     # This is sometimes needed if type checking is disabled
     # to enforce that the inputs (and outputs) of GroupByKey operations
@@ -167,6 +174,10 @@ class FnApiRunner(runner.PipelineRunner):
       self._num_workers = multiprocessing.cpu_count()
     else:
       self._num_workers = pipeline_direct_num_workers or self._num_workers
+    grouping_buffer_memory_mb = options.view_as(
+        pipeline_options.DirectOptions).direct_grouping_buffer_memory_mb
+    if grouping_buffer_memory_mb:
+      self._grouping_buffer_memory_limit = grouping_buffer_memory_mb << 20
 
     # set direct workers running mode if it is defined with pipeline options.
     running_mode = \
@@ -435,7 +446,8 @@ class FnApiRunner(runner.PipelineRunner):
         stage_context.safe_coders,
         stage_context.data_channel_coders,
         self._num_workers,
-        split_managers=self._split_managers)
+        split_managers=self._split_managers,
+        grouping_buffer_memory_limit=self._grouping_buffer_memory_limit)
 
     try:
       with self.maybe_profile():
@@ -500,6 +512,20 @@ class FnApiRunner(runner.PipelineRunner):
           if len(runner_execution_context.queues.ready_inputs) == 0:
             self._schedule_ready_bundles(runner_execution_context)
 
+        if runner_execution_context.grouping_buffer_spilled_bytes:
+          spill_metrics = MetricsContainer('')
+          spill_metrics.get_counter(
+              MetricName(
+                  str(type(self)),
+                  self.GROUPING_BUFFER_SPILLED_BYTES_COUNTER,
+                  urn='internal:' +
+                  self.GROUPING_BUFFER_SPILLED_BYTES_COUNTER)).update(
+                      runner_execution_context.grouping_buffer_spilled_bytes)
+          monitoring_infos_by_stage[''] = list(
+              itertools.chain(
+                  spill_metrics.to_runner_api_monitoring_infos('').values(),
+                  monitoring_infos_by_stage.get('', [])))
+
       assert len(runner_execution_context.queues.ready_inputs) == 0, (
               'A total of %d ready bundles did not execute.'
               % len(runner_execution_context.queues.ready_inputs))
@@ -1123,18 +1149,29 @@ class ExtendedProvisionInfo(object):
       provision_info: Optional[beam_provision_api_pb2.ProvisionInfo] = None,
       artifact_staging_dir: Optional[str] = None,
       job_name: str = '',
+      use_shared_memory_data_plane: bool = False,
+      fuse_simple_pardos: bool = False,
   ) -> None:
     self.provision_info = (
         provision_info or beam_provision_api_pb2.ProvisionInfo())
     self.artifact_staging_dir = artifact_staging_dir
     self.job_name = job_name
+    # Whether workers on the same host exchange data through shared memory,
+    # rather than through the gRPC data plane.
+    self.use_shared_memory_data_plane = use_shared_memory_data_plane
+    # Whether embedded workers fuse chains of simple ParDo transforms.
+    self.fuse_simple_pardos = fuse_simple_pardos
 
   def for_environment(self, env) -> 'ExtendedProvisionInfo':
     if env.dependencies:
       provision_info_with_deps = copy.deepcopy(self.provision_info)
       provision_info_with_deps.dependencies.extend(env.dependencies)
       return ExtendedProvisionInfo(
-          provision_info_with_deps, self.artifact_staging_dir, self.job_name)
+          provision_info_with_deps,
+          self.artifact_staging_dir,
+          self.job_name,
+          self.use_shared_memory_data_plane,
+          self.fuse_simple_pardos)
     else:
       return self
 
@@ -1202,16 +1239,19 @@ class BundleManager(object):
       bundle_context_manager: execution.BundleContextManager,
       progress_frequency: Optional[float] = None,
       cache_token_generator=FnApiRunner.get_cache_token_generator(),
-      split_managers=()
-  ) -> None:
+      split_managers=(),
+      worker_handler: Optional[WorkerHandler] = None) -> None:
     """Set up a bundle manager.
 
     Args:
       progress_frequency
+      worker_handler: the worker to process bundles on. If not given, bundles
+        are assigned to the stage's workers in a round-robin fashion.
     """
     self.bundle_context_manager: execution.BundleContextManager = (
         bundle_context_manager)
     self._progress_frequency = progress_frequency
+    self._fixed_worker_handler = worker_handler
     self._worker_handler: Optional[WorkerHandler] = None
     self._cache_token_generator = cache_token_generator
     self.split_managers = split_managers
@@ -1330,9 +1370,11 @@ class BundleManager(object):
     with BundleManager._lock:
       BundleManager._uid_counter += 1
       process_bundle_id = 'bundle_%s' % BundleManager._uid_counter
-      self._worker_handler = self.bundle_context_manager.worker_handlers[
-          BundleManager._uid_counter %
-          len(self.bundle_context_manager.worker_handlers)]
+      self._worker_handler = (
+          self._fixed_worker_handler or
+          self.bundle_context_manager.worker_handlers[
+              BundleManager._uid_counter %
+              len(self.bundle_context_manager.worker_handlers)])
 
     split_manager = self._select_split_manager()
     if split_manager:
@@ -1433,9 +1475,9 @@ class ParallelBundleManager(BundleManager):
       expected_output_timers: OutputTimers,
       dry_run: bool = False,
   ) -> BundleProcessResult:
-    part_inputs: List[Dict[str,
-                           List[bytes]]] = [{}
-                                            for _ in range(self._num_workers)]
+    part_inputs: List[Dict[str, Sequence[bytes]]] = [
+        {} for _ in range(self._num_workers)
+    ]
     # Timers are only executed on the first worker
     # TODO(BEAM-9741): Split timers to multiple workers
     timer_inputs = [
@@ -1445,15 +1487,28 @@ class ParallelBundleManager(BundleManager):
       for ix, part in enumerate(input.partition(self._num_workers)):
         part_inputs[ix][name] = part
 
+    # Each partition is processed by its own worker, so that the partitions
+    # of a stage run concurrently on all of the stage's (e.g. subprocess)
+    # workers. Partitions without any input are not worth a bundle, but we
+    # always process the first one, which also receives the timers.
+    worker_handlers = self.bundle_context_manager.worker_handlers
+    part_work = []
+    for ix, (part_map, input_timers) in enumerate(zip(part_inputs,
+                                                      timer_inputs)):
+      if ix == 0 or any(part_map.values()):
+        part_work.append((
+            worker_handlers[ix % len(worker_handlers)], part_map, input_timers))
+
     merged_result: Optional[beam_fn_api_pb2.InstructionResponse] = None
     split_result_list: List[beam_fn_api_pb2.ProcessBundleSplitResponse] = []
 
-    def execute(part_map_input_timers) -> BundleProcessResult:
-      part_map, input_timers = part_map_input_timers
+    def execute(worker_part_map_input_timers) -> BundleProcessResult:
+      worker_handler, part_map, input_timers = worker_part_map_input_timers
       bundle_manager = BundleManager(
           self.bundle_context_manager,
           self._progress_frequency,
-          cache_token_generator=self._cache_token_generator)
+          cache_token_generator=self._cache_token_generator,
+          worker_handler=worker_handler)
       return bundle_manager.process_bundle(
           part_map,
           expected_outputs,
@@ -1462,8 +1517,7 @@ class ParallelBundleManager(BundleManager):
           dry_run)
 
     with thread_pool_executor.shared_unbounded_instance() as executor:
-      for result, split_result in executor.map(execute, zip(part_inputs,  # pylint: disable=bad-option-value
-                                                            timer_inputs)):
+      for result, split_result in executor.map(execute, part_work):
         split_result_list += split_result
         if merged_result is None:
           merged_result = result
@@ -23,6 +23,7 @@ import os
 import random
 import re
 import shutil
+import sys
 import tempfile
 import threading
 import time
@@ -38,6 +39,7 @@ from typing import Tuple
 from typing import no_type_check
 
 import hamcrest  # pylint: disable=ungrouped-imports
+import mock
 import numpy as np
 import pytest
 from hamcrest.core.matcher import Matcher
@@ -59,6 +61,7 @@ from apache_beam.options.pipeline_options import PipelineOptions
 from apache_beam.options.pipeline_options import StandardOptions
 from apache_beam.options.value_provider import RuntimeValueProvider
 from apache_beam.portability import python_urns
+from apache_beam.portability.api import beam_fn_api_pb2
 from apache_beam.runners.portability import fn_api_runner
 from apache_beam.runners.portability.fn_api_runner import fn_runner
 from apache_beam.runners.sdf_utils import RestrictionTrackerView
@@ -2010,6 +2013,90 @@ class FnApiRunnerTestWithGrpc(FnApiRunnerTest):
             is_drain=is_drain))
 
 
+class FnApiRunnerSharedMemoryDataPlaneTest(unittest.TestCase):
+  def test_subprocess_worker(self):
+    options = PipelineOptions(experiments=['use_shared_memory_data_plane'])
+    runner = fn_api_runner.FnApiRunner(
+        default_environment=environments.SubprocessSDKEnvironment(
+            command_string='%s -m apache_beam.runners.worker.sdk_worker_main' %
+            sys.executable))
+    with mock.patch.object(data_plane.BeamFnDataServicer,
+                           'get_conn_by_worker_id') as get_conn_by_worker_id:
+      with beam.Pipeline(runner=runner, options=options) as p:
+        res = (
+            p
+            | beam.Create(range(100))
+            | beam.Map(lambda x: (x % 3, x))
+            | beam.GroupByKey()
+            | beam.MapTuple(lambda k, vs: (k, sum(vs))))
+        assert_that(res, equal_to([(0, 1683), (1, 1617), (2, 1650)]))
+    # No gRPC data channel is opened for the worker.
+    get_conn_by_worker_id.assert_not_called()
+
+
+class FnApiRunnerFusedSimpleParDoTest(unittest.TestCase):
+  def run_chain(self, experiments):
+    p = beam.Pipeline(
+        runner=fn_api_runner.FnApiRunner(),
+        options=PipelineOptions(experiments=experiments))
+    res = (
+        p
+        | beam.Create(range(10), reshuffle=False)
+        | 'Stamp' >> beam.Map(lambda x: window.TimestampedValue(x, x))
+        | 'Duplicate' >> beam.FlatMap(lambda x: [x, x + 10])
+        | 'Odd' >> beam.Filter(lambda x: x % 2)
+        | 'Format' >> beam.Map(str)
+        | 'WithTimestamp' >>
+        beam.Map(lambda x, ts=beam.DoFn.TimestampParam: (x, ts)))
+    assert_that(
+        res,
+        equal_to([(str(x), x % 10) for x in range(20) if x % 2]),
+        reify_windows=False)
+    result = p.run()
+    result.wait_until_finish()
+    return result.monitoring_metrics().monitoring_infos()
+
+  def test_fused_chain(self):
+    fused_infos = self.run_chain(['fuse_simple_pardos'])
+    unfused_infos = self.run_chain([])
+
+    def element_counts(infos):
+      return {(
+          info.labels[monitoring_infos.PCOLLECTION_LABEL],
+          monitoring_infos.extract_counter_value(info))
+              for info in infos
+              if info.urn == monitoring_infos.ELEMENT_COUNT_URN}
+
+    def timed_transforms(infos):
+      return {
+          info.labels[monitoring_infos.PTRANSFORM_LABEL]
+          for info in infos if info.urn == monitoring_infos.TOTAL_MSECS_URN
+      }
+
+    self.assertEqual(element_counts(unfused_infos), element_counts(fused_infos))
+    # The stages fused into the Format transform are not timed separately.
+    for label in ('Stamp', 'Duplicate', 'Odd'):
+      self.assertTrue(
+          any(
+              label in transform
+              for transform in timed_transforms(unfused_infos)))
+      self.assertFalse(
+          any(
+              label in transform
+              for transform in timed_transforms(fused_infos)))
+
+  def test_fused_stage_error(self):
+    with self.assertRaisesRegex(Exception, "while running 'Divide'"):
+      with beam.Pipeline(
+          runner=fn_api_runner.FnApiRunner(),
+          options=PipelineOptions(experiments=['fuse_simple_pardos'])) as p:
+        _ = (
+            p
+            | beam.Create([0])
+            | 'Divide' >> beam.Map(lambda x: 1 / x)
+            | beam.Map(str))
+
+
 class FnApiRunnerTestWithDisabledCaching(FnApiRunnerTest):
   def create_pipeline(self, is_drain=False):
     return beam.Pipeline(
@@ -2054,6 +2141,38 @@ class FnApiRunnerTestWithMultiWorkers(FnApiRunnerTest):
     raise unittest.SkipTest("This test is for a single worker only.")
 
 
+class ParallelBundleManagerTest(unittest.TestCase):
+  def test_partitions_run_on_distinct_workers(self):
+    worker_handlers = [mock.Mock(name='worker%d' % ix) for ix in range(4)]
+    bundle_manager = fn_runner.ParallelBundleManager(
+        mock.Mock(num_workers=4, worker_handlers=worker_handlers))
+    input_buffer = mock.Mock()
+    input_buffer.partition.return_value = [[b'a'], [], [b'c'], [b'd']]
+
+    processed = []
+    lock = threading.Lock()
+
+    def create_bundle_manager(*args, worker_handler, **kwargs):
+      def process_bundle(inputs, *args):
+        with lock:
+          processed.append((worker_handler, inputs['input']))
+        return beam_fn_api_pb2.InstructionResponse(), []
+
+      return mock.Mock(process_bundle=process_bundle)
+
+    with mock.patch.object(fn_runner,
+                           'BundleManager',
+                           side_effect=create_bundle_manager):
+      bundle_manager.process_bundle({'input': input_buffer}, {}, {}, {})
+
+    input_buffer.partition.assert_called_once_with(4)
+    # The empty partition is skipped, and the others run on their own workers.
+    self.assertCountEqual([(worker_handlers[0], [b'a']),
+                           (worker_handlers[2], [b'c']),
+                           (worker_handlers[3], [b'd'])],
+                          processed)
+
+
 class FnApiRunnerTestWithGrpcAndMultiWorkers(FnApiRunnerTest):
   def create_pipeline(self, is_drain=False):
     pipeline_options = PipelineOptions(
@@ -1317,6 +1317,21 @@ def lift_combiners(stages, context):
         )].windowing_strategy_id]
     return is_compatible_with_combiner_lifting(windowing.trigger)
 
+  def can_merge_in_runner(combine_per_key_transform, combine_payload):
+    # type: (beam_runner_api_pb2.PTransform, beam_runner_api_pb2.CombinePayload) -> bool
+
+    """Returns whether the runner itself can merge the lifted accumulators.
+
+    This is the case for Python CombineFns executed in the runner's process,
+    which the runner can then use to merge accumulators as they are grouped.
+    """
+    environment_id = combine_per_key_transform.environment_id
+    return (
+        combine_payload.combine_fn.urn == python_urns.PICKLED_COMBINE_FN and
+        environment_id in context.components.environments and
+        context.components.environments[environment_id].urn
+        in (python_urns.EMBEDDED_PYTHON, python_urns.EMBEDDED_PYTHON_GRPC))
+
   def make_stage(base_stage, transform):
     # type: (Stage, beam_runner_api_pb2.PTransform) -> Stage
     return Stage(
@@ -1400,6 +1415,11 @@ def lift_combiners(stages, context):
             annotations=transform.annotations,
             environment_id=transform.environment_id))
 
+    group_annotations = dict(transform.annotations)
+    if can_merge_in_runner(transform, combine_payload):
+      group_annotations[python_urns.LIFTED_COMBINE_PAYLOAD] = (
+          transform.spec.payload)
+
     yield make_stage(
         stage,
         beam_runner_api_pb2.PTransform(
@@ -1407,7 +1427,7 @@ def lift_combiners(stages, context):
             spec=beam_runner_api_pb2.FunctionSpec(
                 urn=common_urns.primitives.GROUP_BY_KEY.urn),
             inputs={'in': precombined_pcoll_id},
-            annotations=transform.annotations,
+            annotations=group_annotations,
             outputs={'out': grouped_pcoll_id}))
 
     yield make_stage(
@@ -414,6 +414,31 @@ class TranslationsTest(unittest.TestCase):
           "my_annotation"
           in optimized.components.transforms[transform_id].annotations)
 
+  def test_lifted_combine_payload_annotation(self):
+    def optimize(environment):
+      pipeline = beam.Pipeline()
+      _ = pipeline | beam.Create([(1, 2)]) | 'CPK' >> beam.CombinePerKey(min)
+      proto = pipeline.to_runner_api(default_environment=environment)
+      return translations.optimize_pipeline(
+          proto,
+          phases=[translations.lift_combiners],
+          known_runner_urns=frozenset(),
+          partial=True).components.transforms
+
+    transforms = optimize(
+        environments.EmbeddedPythonEnvironment(
+            capabilities=environments.python_sdk_capabilities()))
+    self.assertIn(
+        python_urns.LIFTED_COMBINE_PAYLOAD, transforms['CPK/Group'].annotations)
+    self.assertNotIn(
+        python_urns.LIFTED_COMBINE_PAYLOAD, transforms['CPK/Merge'].annotations)
+
+    transforms = optimize(
+        environments.DockerEnvironment.from_options(
+            pipeline_options.PortableOptions(sdk_location='container')))
+    self.assertNotIn(
+        python_urns.LIFTED_COMBINE_PAYLOAD, transforms['CPK/Group'].annotations)
+
   def test_conditionally_packed_combiners(self):
     class RecursiveCombine(beam.PTransform):
       def __init__(self, labels):
@@ -66,6 +66,7 @@ from apache_beam.runners.portability import artifact_service
 from apache_beam.runners.portability.fn_api_runner.execution import Buffer
 from apache_beam.runners.worker import data_plane
 from apache_beam.runners.worker import sdk_worker
+from apache_beam.runners.worker import shared_memory_data_plane
 from apache_beam.runners.worker.channel_factory import GRPCChannelFactory
 from apache_beam.runners.worker.log_handler import LOGENTRY_TO_LOG_LEVEL_MAP
 from apache_beam.runners.worker.sdk_worker import _Future
@@ -263,7 +264,7 @@ class WorkerHandler(object):
   _lock = threading.Lock()
 
   control_conn = None  # type: ControlConnection
-  data_conn = None  # type: data_plane._GrpcDataChannel
+  data_conn = None  # type: data_plane.DataChannel
 
   def __init__(
       self,
@@ -379,7 +380,8 @@ class EmbeddedWorkerHandler(WorkerHandler):
             sdk_worker.GlobalCachingStateHandler(state_cache, state)),
         data_plane.InMemoryDataChannelFactory(
             self.data_plane_handler.inverse()),
-        worker_manager._process_bundle_descriptors)
+        worker_manager._process_bundle_descriptors,
+        fuse_simple_pardos=provision_info.fuse_simple_pardos)
     self.worker = sdk_worker.SdkWorker(self.bundle_processor_cache)
     self._uid_counter = 0
 
@@ -514,8 +516,7 @@ class GrpcServer(object):
 
     self.data_plane_handler = data_plane.BeamFnDataServicer(
         DATA_BUFFER_TIME_LIMIT_MS)
-    beam_fn_api_pb2_grpc.add_BeamFnDataServicer_to_server(
-        self.data_plane_handler, self.data_server)
+    self.data_plane_handler.add_to_server(self.data_server)
 
     beam_fn_api_pb2_grpc.add_BeamFnStateServicer_to_server(
         GrpcStateServicer(state), self.state_server)
@@ -569,7 +570,13 @@ class GrpcWorkerHandler(WorkerHandler):
     self.control_conn = self._grpc_server.control_handler.get_conn_by_worker_id(
         self.worker_id)
 
-    self.data_conn = self._grpc_server.data_plane_handler.get_conn_by_worker_id(
+    self.data_conn = self.create_data_conn()
+
+  def create_data_conn(self):
+    # type: () -> data_plane.DataChannel
+
+    """Returns the channel to exchange data with the worker over."""
+    return self._grpc_server.data_plane_handler.get_conn_by_worker_id(
         self.worker_id)
 
   def control_api_service_descriptor(self):
@@ -715,6 +722,25 @@ class SubprocessSdkWorkerHandler(GrpcWorkerHandler):
     super().__init__(state, provision_info, grpc_server)
     self._worker_command_line = worker_command_line
 
+  def create_data_conn(self):
+    # type: () -> data_plane.DataChannel
+    if self.provision_info.use_shared_memory_data_plane:
+      if shared_memory_data_plane.is_supported():
+        # The worker runs on this host, so data can skip the gRPC data plane.
+        return shared_memory_data_plane.SharedMemoryDataChannel.create(
+            data_buffer_time_limit_ms=DATA_BUFFER_TIME_LIMIT_MS)
+      _LOGGER.warning(
+          'The shared memory data plane is not supported on this host, '
+          'using the gRPC data plane instead.')
+    return super().create_data_conn()
+
+  def data_api_service_descriptor(self):
+    # type: () -> endpoints_pb2.ApiServiceDescriptor
+    if isinstance(self.data_conn,
+                  shared_memory_data_plane.SharedMemoryDataChannel):
+      return endpoints_pb2.ApiServiceDescriptor(url=self.data_conn.url)
+    return super().data_api_service_descriptor()
+
   def start_worker(self):
     # type: () -> None
     from apache_beam.runners.portability import local_job_service
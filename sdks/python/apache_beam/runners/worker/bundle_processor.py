@@ -26,12 +26,14 @@ import bisect
 import collections
 import concurrent.futures
 import copy
+import functools
 import heapq
 import itertools
 import json
 import logging
 import random
 import threading
+import traceback
 from dataclasses import dataclass
 from dataclasses import field
 from itertools import chain
@@ -47,6 +49,7 @@ from typing import Iterator
 from typing import List
 from typing import Mapping
 from typing import MutableMapping
+from typing import NamedTuple
 from typing import Optional
 from typing import Set
 from typing import Tuple
@@ -67,6 +70,7 @@ from apache_beam.coders import coder_impl
 from apache_beam.internal import pickler
 from apache_beam.io import iobase
 from apache_beam.metrics import monitoring_infos
+from apache_beam.metrics.metric import Metrics
 from apache_beam.portability import common_urns
 from apache_beam.portability import python_urns
 from apache_beam.portability.api import beam_fn_api_pb2
@@ -76,6 +80,7 @@ from apache_beam.runners import pipeline_context
 from apache_beam.runners.worker import data_sampler
 from apache_beam.runners.worker import operation_specs
 from apache_beam.runners.worker import operations
+from apache_beam.runners.worker import statecache
 from apache_beam.runners.worker import statesampler
 from apache_beam.runners.worker.worker_status import thread_dump
 from apache_beam.transforms import TimeDomain
@@ -87,6 +92,7 @@ from apache_beam.transforms import window
 from apache_beam.utils import counters
 from apache_beam.utils import proto_utils
 from apache_beam.utils import timestamp
+from apache_beam.utils.sentinel import Sentinel
 from apache_beam.utils.windowed_value import WindowedValue
 
 if TYPE_CHECKING:
@@ -184,7 +190,7 @@ class DataInputOperation(RunnerIOOperation):
       state_sampler: statesampler.StateSampler,
       windowed_coder: coders.Coder,
       transform_id,
-      data_channel: data_plane.GrpcClientDataChannel) -> None:
+      data_channel: data_plane.DataChannel) -> None:
     super().__init__(
         operation_name,
         step_name,
@@ -360,7 +366,133 @@ class DataInputOperation(RunnerIOOperation):
     super().reset()
 
 
-class _StateBackedIterable(object):
+class FusedStage(NamedTuple):
+  """A Map, FlatMap or Filter transform fused into a FusedDoOperation."""
+  transform_id: str
+  step_name: str
+  # The process method of the transform's CallableWrapperDoFn.
+  process: Callable[[Any], Optional[Iterable[Any]]]
+  # The PCollection the transform outputs to the next fused transform.
+  pcollection_id: str
+
+
+class FusedChain(NamedTuple):
+  """The transforms fused into the operation of the last transform of a
+  chain."""
+  stages: List[FusedStage]
+  # The unpickled DoFn data of the last transform, which is not unpickled again
+  # to create its operation.
+  dofn_data: Tuple[Any, ...]
+
+
+class FusedDoOperation(operations.DoOperation):
+  """A DoOperation that first applies a chain of fused transforms inline.
+
+  The fused stages are simple Map, FlatMap and Filter transforms upstream of
+  the transform of this operation. Their callables are invoked directly on the
+  values of each element, rather than through an operation, receivers and
+  counters of their own. Only the element counts of the PCollections between
+  the fused stages are reported; their execution time and user metrics are
+  attributed to the transform of this operation.
+  """
+  def __init__(self, *args, **kwargs) -> None:
+    super().__init__(*args, **kwargs)
+    self.fused_stages: List[FusedStage] = []
+    self.fused_element_counts: List[int] = []
+    self.window_fn: Optional[window.WindowFn] = None
+
+  def set_fused_stages(
+      self, fused_stages: List[FusedStage], window_fn: window.WindowFn) -> None:
+    self.fused_stages = fused_stages
+    self.fused_element_counts = [0] * len(fused_stages)
+    self.window_fn = window_fn
+
+  def process(self, o: windowed_value.WindowedValue) -> None:
+    with self.scoped_process_state:
+      elements = [o]
+      for index, stage in enumerate(self.fused_stages):
+        outputs = []
+        for element in elements:
+          try:
+            results = stage.process(element.value)
+            if results is None:
+              continue
+            for result in results:
+              if isinstance(result, _WINDOWING_OUTPUT_TYPES):
+                result = self._propagate_windowing_info(element, result)
+                if result is not None:
+                  outputs.append(result)
+              else:
+                outputs.append(element.with_value(result))
+          except Exception as exn:  # pylint: disable=broad-except
+            _reraise_augmented(exn, stage.step_name)
+        self.fused_element_counts[index] += len(outputs)
+        elements = outputs
+      for element in elements:
+        super().process(element)
+
+  def _propagate_windowing_info(
+      self, windowed_input: windowed_value.WindowedValue,
+      result: Any) -> Optional[windowed_value.WindowedValue]:
+    """Mirrors how a DoFnRunner outputs a TaggedOutput, TimestampedValue or
+    WindowedValue returned by the callable of a fused stage."""
+    if isinstance(result, beam.pvalue.TaggedOutput):
+      # A fused stage has a single output, and a DoFnRunner drops outputs to
+      # undeclared tags.
+      return None
+    if isinstance(result, WindowedValue):
+      output = result
+    else:
+      assert self.window_fn is not None
+      output = WindowedValue(
+          result.value,
+          result.timestamp,
+          self.window_fn.assign(
+              window.WindowFn.AssignContext(result.timestamp, result.value)))
+    if len(windowed_input.windows) != 1:
+      output.windows *= len(windowed_input.windows)
+    return output
+
+  def pcollection_count_monitoring_infos(
+      self, tag_to_pcollection_id: Dict[str, str]
+  ) -> Dict[FrozenSet, metrics_pb2.MonitoringInfo]:
+    infos = super().pcollection_count_monitoring_infos(tag_to_pcollection_id)
+    for stage, count in zip(self.fused_stages, self.fused_element_counts):
+      mi = monitoring_infos.int64_counter(
+          monitoring_infos.ELEMENT_COUNT_URN,
+          count,
+          pcollection=stage.pcollection_id)
+      infos[monitoring_infos.to_key(mi)] = mi
+    return infos
+
+  def reset(self) -> None:
+    super().reset()
+    self.fused_element_counts = [0] * len(self.fused_stages)
+
+
+# Outputs of a fused stage that carry their own timestamp, windows or tag.
+_WINDOWING_OUTPUT_TYPES = (
+    WindowedValue, window.TimestampedValue, beam.pvalue.TaggedOutput)
+
+
+def _reraise_augmented(exn: Exception, step_name: str) -> None:
+  """Re-raises an exception of a fused stage annotated with the stage's name,
+  as common.DoFnRunner does for the exceptions of the DoFns it runs."""
+  if getattr(exn, '_tagged_with_step', False):
+    raise exn
+  step_annotation = " [while running '%s']" % step_name
+  try:
+    new_exn = type(exn)(exn.args[0] + step_annotation, *exn.args[1:])
+    new_exn._tagged_with_step = True  # type: ignore[attr-defined]
+  except:  # pylint: disable=bare-except
+    new_exn = RuntimeError(
+        traceback.format_exception_only(type(exn), exn)[-1].strip() +
+        step_annotation)
+    new_exn._tagged_with_step = True  # type: ignore[attr-defined]
+  raise new_exn.with_traceback(exn.__traceback__)
+
+
+class _StateBackedIterable(statecache.CacheAware):
   def __init__(
       self,
       state_handler: sdk_worker.CachingStateHandler,
@@ -381,14 +513,34 @@ class _StateBackedIterable(object):
   def __reduce__(self):
     return list, (list(self), )
 
+  def get_referents_for_cache(self) -> List[Any]:
+    # The elements are held, and accounted for, by the state cache.
+    return []
+
 
 coder_impl.FastPrimitivesCoderImpl.register_iterable_like_type(
     _StateBackedIterable)
 
 
 class StateBackedSideInputMap(object):
+  """The views of a side input, by window.
+
+  The views of recently accessed windows are kept in a least recently used
+  cache. Views are weighed when they are first cached, and the least recently
+  used ones are evicted once the total weight exceeds max_cache_weight bytes,
+  although the most recently used view is always kept.
+
+  Multimap side inputs are bulk read into an index of the values by encoded
+  key, for as long as the index fits into max_cache_weight bytes (or a default
+  budget if unbounded). Keys beyond it are looked up with state requests. The
+  values that are read into the index after the view was cached are added to
+  its weight, evicting other views as needed.
 
-  _BULK_READ_LIMIT = 100
+  Cache hits, misses and evictions are counted per bundle, and published as
+  metrics when the bundle finishes.
+  """
+
+  _BULK_READ_MAX_WEIGHT = 64 << 20
   _BULK_READ_FULLY = "fully"
   _BULK_READ_PARTIALLY = "partially"
 
@@ -400,6 +552,7 @@ class StateBackedSideInputMap(object):
       side_input_data: pvalue.SideInputData,
       coder: WindowedValueCoder,
       use_bulk_read: bool = False,
+      max_cache_weight: Optional[int] = None,
   ) -> None:
     self._state_handler = state_handler
     self._transform_id = transform_id
@@ -407,13 +560,25 @@ class StateBackedSideInputMap(object):
     self._side_input_data = side_input_data
     self._element_coder = coder.wrapped_value_coder
     self._target_window_coder = coder.window_coder
-    # TODO(robertwb): Limit the cache size.
-    self._cache: Dict[BoundedWindow, Any] = {}
+    self._cache: collections.OrderedDict[
+        BoundedWindow, statecache.WeightedValue] = collections.OrderedDict()
+    self._cache_weight = 0
+    self._max_cache_weight = max_cache_weight
+    self._cache_hits = Metrics.counter(
+        StateBackedSideInputMap, 'side_input_cache_hits')
+    self._cache_misses = Metrics.counter(
+        StateBackedSideInputMap, 'side_input_cache_misses')
+    self._cache_evictions = Metrics.counter(
+        StateBackedSideInputMap, 'side_input_cache_evictions')
+    self._num_cache_hits = 0
+    self._num_cache_misses = 0
+    self._num_cache_evictions = 0
     self._use_bulk_read = use_bulk_read
 
   def __getitem__(self, window):
     target_window = self._side_input_data.window_mapping_fn(window)
     if target_window not in self._cache:
+      self._num_cache_misses += 1
       state_handler = self._state_handler
       access_pattern = self._side_input_data.access_pattern
 
@@ -423,8 +588,15 @@ class StateBackedSideInputMap(object):
                 transform_id=self._transform_id,
                 side_input_id=self._tag,
                 window=self._target_window_coder.encode(target_window)))
-        raw_view = _StateBackedIterable(
-            state_handler, state_key, self._element_coder)
+        view = state_handler.get_cached_side_input_view(state_key)
+        if view is Sentinel.sentinel:
+          raw_view = _StateBackedIterable(
+              state_handler, state_key, self._element_coder)
+          view = self._side_input_data.view_fn(raw_view)
+          # Views that merely wrap the lazy iterable, e.g. AsIter, are cheap
+          # to rebuild, and only materialized ones are worth caching.
+          if view is not raw_view:
+            state_handler.cache_side_input_view(state_key, view)
 
       elif access_pattern == common_urns.side_inputs.MULTIMAP.urn:
         state_key = beam_fn_api_pb2.StateKey(
@@ -439,32 +611,47 @@ class StateBackedSideInputMap(object):
                 transform_id=self._transform_id,
                 side_input_id=self._tag,
                 window=self._target_window_coder.encode(target_window)))
-        cache = {}
+        # The values of keys, by their nested encoding.
+        cache: Dict[bytes, Iterable[Any]] = {}
         key_coder = self._element_coder.key_coder()
         key_coder_impl = key_coder.get_impl()
         value_coder = self._element_coder.value_coder()
+        value_coder_impl = value_coder.get_impl()
         use_bulk_read = self._use_bulk_read
+        bulk_read_max_weight = (
+            self._max_cache_weight if self._max_cache_weight is not None else
+            StateBackedSideInputMap._BULK_READ_MAX_WEIGHT)
+        add_weight = functools.partial(self._add_weight, target_window)
+
+        def keyed_state_key(encoded_key):
+          result = beam_fn_api_pb2.StateKey()
+          result.CopyFrom(state_key)
+          result.multimap_side_input.key = encoded_key
+          return result
 
         class MultiMap(object):
           _bulk_read = None
           _lock = threading.Lock()
 
-          def __getitem__(self, key):
+          def _lookup(self, encoded_key):
             if use_bulk_read:
               if self._bulk_read is None:
                 with self._lock:
                   if self._bulk_read is None:
+                    weight = 0
                     try:
                       # Attempt to bulk read the key-values over the iterable
                       # protocol which, if supported, can be much more efficient
                       # than point lookups if it fits into memory.
-                      for ix, (k, vs) in enumerate(_StateBackedIterable(
+                      for k, vs in _StateBackedIterable(
                           state_handler,
                           kv_iter_state_key,
                           coders.TupleCoder(
-                              (key_coder, coders.IterableCoder(value_coder))))):
-                        cache[k] = vs
-                        if ix > StateBackedSideInputMap._BULK_READ_LIMIT:
+                              (key_coder, coders.IterableCoder(value_coder)))):
+                        encoded_k = key_coder_impl.encode_nested(k)
+                        cache[encoded_k] = vs
+                        weight += len(encoded_k) + statecache.estimate_size(vs)
+                        if weight > bulk_read_max_weight:
                           self._bulk_read = (
                               StateBackedSideInputMap._BULK_READ_PARTIALLY)
                           break
@@ -478,31 +665,103 @@ class StateBackedSideInputMap(object):
                           exc_info=True)
                       self._bulk_read = (
                           StateBackedSideInputMap._BULK_READ_PARTIALLY)
+                    add_weight(weight)
 
               if (self._bulk_read == StateBackedSideInputMap._BULK_READ_FULLY):
-                return cache.get(key, [])
+                return cache.get(encoded_key, [])
 
-            if key not in cache:
-              keyed_state_key = beam_fn_api_pb2.StateKey()
-              keyed_state_key.CopyFrom(state_key)
-              keyed_state_key.multimap_side_input.key = (
-                  key_coder_impl.encode_nested(key))
-              cache[key] = _StateBackedIterable(
-                  state_handler, keyed_state_key, value_coder)
+            return cache.get(encoded_key)
 
-            return cache[key]
+          def __getitem__(self, key):
+            encoded_key = key_coder_impl.encode_nested(key)
+            values = self._lookup(encoded_key)
+            if values is None:
+              values = cache[encoded_key] = _StateBackedIterable(
+                  state_handler, keyed_state_key(encoded_key), value_coder)
+            return values
+
+          def get_all(self, keys):
+            """Returns the values of each of the keys.
+
+            The values of keys that were not bulk read are fetched with a
+            single batch of state requests.
+            """
+            encoded_keys = [key_coder_impl.encode_nested(key) for key in keys]
+            results = [
+                self._lookup(encoded_key) for encoded_key in encoded_keys
+            ]
+            missing = list(
+                dict.fromkeys(
+                    encoded_key
+                    for encoded_key, values in zip(encoded_keys, results)
+                    if values is None))
+            if missing:
+              fetched = state_handler.blocking_get_many(
+                  [keyed_state_key(encoded_key) for encoded_key in missing],
+                  value_coder_impl)
+              cache.update(zip(missing, fetched))
+              add_weight(
+                  sum(
+                      len(encoded_key) + statecache.estimate_size(values)
+                      for encoded_key, values in zip(missing, fetched)))
+              results = [
+                  cache[encoded_key] if values is None else values
+                  for encoded_key, values in zip(encoded_keys, results)
+              ]
+            return results
 
           def __reduce__(self):
             # TODO(robertwb): Figure out how to support this.
             raise TypeError(common_urns.side_inputs.MULTIMAP.urn)
 
-        raw_view = MultiMap()
+        view = self._side_input_data.view_fn(MultiMap())
 
       else:
         raise ValueError("Unknown access pattern: '%s'" % access_pattern)
 
-      self._cache[target_window] = self._side_input_data.view_fn(raw_view)
-    return self._cache[target_window]
+      self._put_in_cache(target_window, view)
+    else:
+      self._num_cache_hits += 1
+      self._cache.move_to_end(target_window)
+    return self._cache[target_window].value()
+
+  def _put_in_cache(self, target_window: BoundedWindow, view: Any) -> None:
+    weight = max(statecache.estimate_size(view), 1)
+    self._cache[target_window] = statecache.WeightedValue(view, weight)
+    self._cache_weight += weight
+    self._evict_to_max_weight()
+
+  def _add_weight(self, target_window: BoundedWindow, weight: int) -> None:
+    """Adds to the weight of a cached view that has grown, e.g. by reading
+    multimap values into it."""
+    cached = self._cache.get(target_window)
+    if cached is None or weight <= 0:
+      return
+    self._cache[target_window] = statecache.WeightedValue(
+        cached.value(), cached.weight() + weight)
+    self._cache_weight += weight
+    self._evict_to_max_weight()
+
+  def _evict_to_max_weight(self) -> None:
+    if self._max_cache_weight is None:
+      return
+    while (self._cache_weight > self._max_cache_weight and
+           len(self._cache) > 1):
+      _, evicted = self._cache.popitem(last=False)
+      self._cache_weight -= evicted.weight()
+      self._num_cache_evictions += 1
+
+  def finish(self) -> None:
+    """Publishes the cache metrics of the bundle."""
+    if self._num_cache_hits:
+      self._cache_hits.inc(self._num_cache_hits)
+    if self._num_cache_misses:
+      self._cache_misses.inc(self._num_cache_misses)
+    if self._num_cache_evictions:
+      self._cache_evictions.inc(self._num_cache_evictions)
+    self._num_cache_hits = 0
+    self._num_cache_misses = 0
+    self._num_cache_evictions = 0
 
   def is_globally_windowed(self) -> bool:
     return (
@@ -510,8 +769,13 @@ class StateBackedSideInputMap(object):
         sideinputs._global_window_mapping_fn)
 
   def reset(self) -> None:
-    # TODO(BEAM-5428): Cross-bundle caching respecting cache tokens.
-    self._cache = {}
+    # Materialized iterable views outlive the bundle in the state cache for as
+    # long as the runner's cache token for the side input stays valid.
+    self._cache = collections.OrderedDict()
+    self._cache_weight = 0
+    self._num_cache_hits = 0
+    self._num_cache_misses = 0
+    self._num_cache_evictions = 0
 
 
 class ReadModifyWriteRuntimeState(userstate.ReadModifyWriteRuntimeState):
@@ -1091,6 +1355,8 @@ class BundleProcessor(object):
       state_handler: sdk_worker.CachingStateHandler,
       data_channel_factory: data_plane.DataChannelFactory,
       data_sampler: Optional[data_sampler.DataSampler] = None,
+      side_input_cache_size: Optional[int] = None,
+      fuse_simple_pardos: bool = False,
   ) -> None:
     """Initialize a bundle processor.
 
@@ -1101,12 +1367,19 @@ class BundleProcessor(object):
         a description of the stage that this ``BundleProcessor``is to execute.
       state_handler (CachingStateHandler).
       data_channel_factory (``data_plane.DataChannelFactory``).
+      side_input_cache_size (``int``): The maximum size in bytes of the
+        views of each side input that are cached during a bundle, or None if
+        unbounded.
+      fuse_simple_pardos (``bool``): Whether to run chains of simple Map,
+        FlatMap and Filter transforms as a single ``FusedDoOperation``.
     """
     self.runner_capabilities = runner_capabilities
     self.process_bundle_descriptor = process_bundle_descriptor
     self.state_handler = state_handler
     self.data_channel_factory = data_channel_factory
     self.data_sampler = data_sampler
+    self.side_input_cache_size = side_input_cache_size
+    self.fuse_simple_pardos = fuse_simple_pardos
     self.current_instruction_id: Optional[str] = None
     # Represents whether the SDK is consuming received data.
     self.consuming_received_data = False
@@ -1174,6 +1447,7 @@ class BundleProcessor(object):
         self.state_sampler,
         self.state_handler,
         self.data_sampler,
+        self.side_input_cache_size,
     )
 
     self.timers_info = transform_factory.extract_timers_info()
@@ -1190,8 +1464,25 @@ class BundleProcessor(object):
         if not is_side_input(transform_proto, tag):
           pcoll_consumers[pcoll_id].append(transform_id)
 
+    # Chains of simple transforms are fused into the operation of the last
+    # transform of each chain. The samplers of the data sampler need the
+    # outputs of each transform, so nothing is fused while sampling.
+    if self.fuse_simple_pardos and not self.data_sampler:
+      fused_chains = _fusable_par_do_chains(
+          transform_factory, descriptor, pcoll_consumers)
+    else:
+      fused_chains = {}
+    fused_into = {
+        stage.transform_id: transform_id
+        for transform_id, chain in fused_chains.items()
+        for stage in chain.stages
+    }
+
     @memoize
     def get_operation(transform_id: str) -> operations.Operation:
+      if transform_id in fused_into:
+        return get_operation(fused_into[transform_id])
+
       transform_consumers = {
           tag: [get_operation(op) for op in pcoll_consumers[pcoll_id]]
           for tag, pcoll_id in
@@ -1203,6 +1494,12 @@ class BundleProcessor(object):
         self.data_sampler.initialize_samplers(
             transform_id, descriptor, transform_factory.get_coder)
 
+      if transform_id in fused_chains:
+        return create_fused_par_do(
+            transform_factory,
+            transform_id,
+            transform_consumers,
+            fused_chains[transform_id])
       return transform_factory.create_operation(
           transform_id, transform_consumers)
 
@@ -1215,11 +1512,16 @@ class BundleProcessor(object):
           for consumer in pcoll_consumers[pcoll]
       ])
 
+    # Fused transforms have no operations of their own.
+    transform_ids = [
+        transform_id for transform_id in descriptor.transforms
+        if transform_id not in fused_into
+    ]
     return collections.OrderedDict([(
         transform_id,
         cast(operations.DoOperation,
              get_operation(transform_id))) for transform_id in sorted(
-                 descriptor.transforms, key=topological_height, reverse=True)])
+                 transform_ids, key=topological_height, reverse=True)])
 
   def reset(self) -> None:
     self.counter_factory.reset()
@@ -1464,6 +1766,7 @@ class BeamTransformFactory(object):
       state_sampler: statesampler.StateSampler,
       state_handler: sdk_worker.CachingStateHandler,
       data_sampler: Optional[data_sampler.DataSampler],
+      side_input_cache_size: Optional[int] = None,
   ):
     self.runner_capabilities = runner_capabilities
     self.descriptor = descriptor
@@ -1479,6 +1782,7 @@ class BeamTransformFactory(object):
                 runner=beam_fn_api_pb2.StateKey.Runner(key=token)),
             element_coder_impl))
     self.data_sampler = data_sampler
+    self.side_input_cache_size = side_input_cache_size
 
   _known_urns: Dict[str,
                     Tuple[ConstructorFn,
@@ -1863,6 +2167,136 @@ def create_par_do(
       parameter)
 
 
+def create_fused_par_do(
+    factory: BeamTransformFactory,
+    transform_id: str,
+    consumers: Dict[str, List[operations.Operation]],
+    fused_chain: FusedChain) -> FusedDoOperation:
+  """Creates the operation of a simple ParDo transform that also applies the
+  given chain of upstream transforms to its input elements."""
+  transform_proto = factory.descriptor.transforms[transform_id]
+  parameter = proto_utils.parse_Bytes(
+      transform_proto.spec.payload, beam_runner_api_pb2.ParDoPayload)
+  result = cast(
+      FusedDoOperation,
+      _create_pardo_operation(
+          factory,
+          transform_id,
+          transform_proto,
+          consumers,
+          core.DoFnInfo.from_runner_api(parameter.do_fn,
+                                        factory.context).serialized_dofn_data(),
+          parameter,
+          operation_cls=FusedDoOperation,
+          dofn_data=fused_chain.dofn_data))
+  pcoll_id = only_element(transform_proto.inputs.values())
+  windowing = factory.context.windowing_strategies.get_by_id(
+      factory.descriptor.pcollections[pcoll_id].windowing_strategy_id)
+  result.set_fused_stages(fused_chain.stages, windowing.windowfn)
+  return result
+
+
+def _fusable_par_do_payload(
+    transform_proto: beam_runner_api_pb2.PTransform
+) -> Optional[beam_runner_api_pb2.ParDoPayload]:
+  """Returns the payload of a ParDo transform that may be fused with its
+  neighbours, as far as can be told without unpickling its DoFn.
+
+  These are the ParDo transforms of pickled DoFns without side inputs, state,
+  timers or other features, which have a single main input and output. Returns
+  None for any other transform.
+  """
+  if (transform_proto.spec.urn != common_urns.primitives.PAR_DO.urn or
+      len(transform_proto.inputs) != 1 or len(transform_proto.outputs) != 1):
+    return None
+  payload = proto_utils.parse_Bytes(
+      transform_proto.spec.payload, beam_runner_api_pb2.ParDoPayload)
+  if (payload.do_fn.urn != python_urns.PICKLED_DOFN_INFO or
+      payload.side_inputs or payload.state_specs or
+      payload.timer_family_specs or payload.restriction_coder_id or
+      payload.requests_finalization or payload.requires_stable_input or
+      payload.requires_time_sorted_input):
+    return None
+  return payload
+
+
+def _load_fusable_dofn(
+    factory: BeamTransformFactory,
+    payload: beam_runner_api_pb2.ParDoPayload) -> Optional[Tuple[Any, ...]]:
+  """Returns the unpickled DoFn data of a ParDo transform if it can be fused
+  with its neighbours.
+
+  These are the Map, FlatMap and Filter transforms without extra arguments or
+  DoFn parameters, whose payload passed _fusable_par_do_payload. Returns None
+  for any other transform.
+  """
+  dofn_data = pickler.loads(
+      core.DoFnInfo.from_runner_api(payload.do_fn,
+                                    factory.context).serialized_dofn_data())
+  dofn, args, kwargs, _, _ = dofn_data
+  if (type(dofn) is not core.CallableWrapperDoFn or args or kwargs or
+      common.DoFnSignature(dofn).process_method.defaults):
+    return None
+  return dofn_data
+
+
+def _fusable_par_do_chains(
+    factory: BeamTransformFactory,
+    descriptor: beam_fn_api_pb2.ProcessBundleDescriptor,
+    pcoll_consumers: Mapping[str, List[str]]) -> Dict[str, FusedChain]:
+  """Finds the chains of simple ParDo transforms that can be fused.
+
+  A transform is fused into the next transform of a chain when the next
+  transform is the only consumer of its output. Only the DoFns of transforms
+  that would be linked to another one are unpickled to check that they are
+  simple.
+
+  Returns:
+    A mapping from the id of the last transform of each chain to the stages
+    that are fused into its operation, in the order they are applied.
+  """
+  payloads = {}
+  for transform_id, transform_proto in descriptor.transforms.items():
+    payload = _fusable_par_do_payload(transform_proto)
+    if payload is not None:
+      payloads[transform_id] = payload
+
+  candidate_links = {}
+  for transform_id in payloads:
+    pcoll_id = only_element(
+        descriptor.transforms[transform_id].outputs.values())
+    consumers = pcoll_consumers.get(pcoll_id, [])
+    if len(consumers) == 1 and consumers[0] in payloads:
+      candidate_links[transform_id] = consumers[0]
+
+  dofn_data = {}
+  for transform_id in set(candidate_links) | set(candidate_links.values()):
+    data = _load_fusable_dofn(factory, payloads[transform_id])
+    if data is not None:
+      dofn_data[transform_id] = data
+  next_transforms = {
+      transform_id: next_transform_id
+      for transform_id, next_transform_id in candidate_links.items()
+      if transform_id in dofn_data and next_transform_id in dofn_data
+  }
+
+  fused_chains = {}
+  chain_heads = set(next_transforms) - set(next_transforms.values())
+  for transform_id in chain_heads:
+    stages = []
+    while transform_id in next_transforms:
+      transform_proto = descriptor.transforms[transform_id]
+      stages.append(
+          FusedStage(
+              transform_id,
+              transform_proto.unique_name or transform_id,
+              dofn_data[transform_id][0].process,
+              only_element(transform_proto.outputs.values())))
+      transform_id = next_transforms[transform_id]
+    fused_chains[transform_id] = FusedChain(stages, dofn_data[transform_id])
+  return fused_chains
+
+
 def _create_pardo_operation(
     factory: BeamTransformFactory,
     transform_id: str,
@@ -1870,7 +2304,8 @@ def _create_pardo_operation(
     consumers,
     serialized_fn,
     pardo_proto: Optional[beam_runner_api_pb2.ParDoPayload] = None,
-    operation_cls=operations.DoOperation):
+    operation_cls=operations.DoOperation,
+    dofn_data: Optional[Tuple[Any, ...]] = None):
 
   if pardo_proto and pardo_proto.side_inputs:
     input_tags_to_coders = factory.get_input_coders(transform_proto)
@@ -1889,7 +2324,8 @@ def _create_pardo_operation(
             input_tags_to_coders[tag],
             use_bulk_read=(
                 common_urns.runner_protocols.MULTIMAP_KEYS_VALUES_SIDE_INPUT.urn
-                in factory.runner_capabilities))
+                in factory.runner_capabilities),
+            max_cache_weight=factory.side_input_cache_size)
         for (tag, si) in tagged_side_inputs
     ]
   else:
@@ -1897,7 +2333,8 @@ def _create_pardo_operation(
 
   output_tags = list(transform_proto.outputs.keys())
 
-  dofn_data = pickler.loads(serialized_fn)
+  if dofn_data is None:
+    dofn_data = pickler.loads(serialized_fn)
   if not dofn_data[-1]:
     # Windowing not set.
     if pardo_proto:
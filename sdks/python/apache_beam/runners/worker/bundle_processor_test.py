@@ -21,27 +21,45 @@
 import random
 import unittest
 
+import mock
+
 import apache_beam as beam
 from apache_beam.coders import StrUtf8Coder
 from apache_beam.coders.coders import FastPrimitivesCoder
+from apache_beam.coders.coders import GlobalWindowCoder
+from apache_beam.coders.coders import IntervalWindowCoder
+from apache_beam.coders.coders import IterableCoder
+from apache_beam.coders.coders import TupleCoder
+from apache_beam.coders.coders import VarIntCoder
+from apache_beam.coders.coders import WindowedValueCoder
+from apache_beam.metrics.execution import MetricsContainer
+from apache_beam.metrics.metric import Metrics
+from apache_beam.metrics.metricbase import MetricName
 from apache_beam.portability import common_urns
 from apache_beam.portability.api import beam_fn_api_pb2
+from apache_beam.portability.api import beam_runner_api_pb2
 from apache_beam.runners import common
+from apache_beam.runners import pipeline_context
 from apache_beam.runners.portability.fn_api_runner.worker_handlers import StateServicer
 from apache_beam.runners.worker import bundle_processor
 from apache_beam.runners.worker import operations
+from apache_beam.runners.worker import statesampler
 from apache_beam.runners.worker.bundle_processor import BeamTransformFactory
 from apache_beam.runners.worker.bundle_processor import BundleProcessor
 from apache_beam.runners.worker.bundle_processor import DataInputOperation
 from apache_beam.runners.worker.bundle_processor import FnApiUserStateContext
+from apache_beam.runners.worker.bundle_processor import StateBackedSideInputMap
 from apache_beam.runners.worker.bundle_processor import SynchronousOrderedListRuntimeState
 from apache_beam.runners.worker.bundle_processor import TimerInfo
 from apache_beam.runners.worker.data_plane import SizeBasedBufferingClosableOutputStream
 from apache_beam.runners.worker.data_sampler import DataSampler
 from apache_beam.runners.worker.sdk_worker import GlobalCachingStateHandler
 from apache_beam.runners.worker.statecache import StateCache
+from apache_beam.runners.worker.statecache import estimate_size
 from apache_beam.transforms import userstate
 from apache_beam.transforms.window import GlobalWindow
+from apache_beam.transforms.window import IntervalWindow
+from apache_beam.utils import counters
 from apache_beam.utils import timestamp
 from apache_beam.utils.windowed_value import WindowedValue
 
@@ -736,5 +754,229 @@ class OrderedListStateTest(unittest.TestCase):
     self.assertEqual([A1, A2, A7, B7, A8], list(self.state.read()))
 
 
+class StateBackedSideInputMapTest(unittest.TestCase):
+  def _create_side_input_map(self, windows, max_cache_weight=None):
+    state_servicer = StateServicer()
+    window_coder = IntervalWindowCoder()
+    for ix, window in enumerate(windows):
+      state_servicer.append_raw(
+          beam_fn_api_pb2.StateKey(
+              iterable_side_input=beam_fn_api_pb2.StateKey.IterableSideInput(
+                  transform_id='transform',
+                  side_input_id='side',
+                  window=window_coder.encode(window))),
+          b''.join(VarIntCoder().encode(ix) for _ in range(100)))
+    return StateBackedSideInputMap(
+        GlobalCachingStateHandler(StateCache(0), state_servicer),
+        'transform',
+        'side',
+        beam.pvalue.SideInputData(
+            common_urns.side_inputs.ITERABLE.urn, lambda window: window, list),
+        WindowedValueCoder(VarIntCoder(), window_coder),
+        max_cache_weight=max_cache_weight)
+
+  def test_evicts_least_recently_used_windows(self):
+    windows = [IntervalWindow(10 * i, 10 * i + 10) for i in range(3)]
+    view_weight = estimate_size([0] * 100)
+    side_input_map = self._create_side_input_map(
+        windows, max_cache_weight=view_weight * 5 // 2)
+
+    sampler = statesampler.StateSampler('', counters.CounterFactory())
+    statesampler.set_current_tracker(sampler)
+    metrics_container = MetricsContainer('step')
+    state = sampler.scoped_state(
+        'step', 'process', metrics_container=metrics_container)
+    try:
+      sampler.start()
+      with state:
+        self.assertEqual([0] * 100, side_input_map[windows[0]])
+        self.assertEqual([1] * 100, side_input_map[windows[1]])
+        self.assertEqual([0] * 100, side_input_map[windows[0]])
+        self.assertEqual([2] * 100, side_input_map[windows[2]])
+        # The metrics are only published when the bundle finishes.
+        self.assertEqual(
+            0,
+            metrics_container.get_counter(
+                MetricName(
+                    Metrics.get_namespace(StateBackedSideInputMap),
+                    'side_input_cache_misses')).get_cumulative())
+        side_input_map.finish()
+    finally:
+      sampler.stop()
+      statesampler.set_current_tracker(None)
+
+    self.assertEqual([windows[0], windows[2]], list(side_input_map._cache))
+
+    def counter(name):
+      return metrics_container.get_counter(
+          MetricName(Metrics.get_namespace(StateBackedSideInputMap),
+                     name)).get_cumulative()
+
+    self.assertEqual(1, counter('side_input_cache_hits'))
+    self.assertEqual(3, counter('side_input_cache_misses'))
+    self.assertEqual(1, counter('side_input_cache_evictions'))
+
+  def test_keeps_most_recently_used_window(self):
+    windows = [IntervalWindow(10 * i, 10 * i + 10) for i in range(3)]
+    side_input_map = self._create_side_input_map(windows, max_cache_weight=1)
+    for window in windows:
+      side_input_map[window]
+      self.assertEqual([window], list(side_input_map._cache))
+
+  def test_unbounded_by_default(self):
+    windows = [IntervalWindow(10 * i, 10 * i + 10) for i in range(3)]
+    side_input_map = self._create_side_input_map(windows)
+    for window in windows:
+      side_input_map[window]
+    self.assertEqual(windows, list(side_input_map._cache))
+    side_input_map.reset()
+    self.assertEqual([], list(side_input_map._cache))
+
+
+class MultimapSideInputTest(unittest.TestCase):
+  class CountingStateServicer(StateServicer):
+    def __init__(self):
+      super().__init__()
+      self.get_raw_calls = 0
+      self.get_raw_many_calls = 0
+
+    def get_raw(self, state_key, continuation_token=None):
+      self.get_raw_calls += 1
+      return super().get_raw(state_key, continuation_token)
+
+    def get_raw_many(self, state_keys):
+      self.get_raw_many_calls += 1
+      return super().get_raw_many(state_keys)
+
+  def _create_side_input_map(
+      self, key_values, windows, window_coder, max_cache_weight=None):
+    state_servicer = self.CountingStateServicer()
+    key_coder = StrUtf8Coder()
+    values_coder = IterableCoder(VarIntCoder())
+    for window in map(window_coder.encode, windows):
+      for key, values in key_values.items():
+        state_servicer.append_raw(
+            beam_fn_api_pb2.StateKey(
+                multimap_keys_values_side_input=beam_fn_api_pb2.StateKey.
+                MultimapKeysValuesSideInput(
+                    transform_id='transform',
+                    side_input_id='side',
+                    window=window)),
+            TupleCoder([key_coder, values_coder]).get_impl().encode_nested(
+                (key, values)))
+        state_servicer.append_raw(
+            beam_fn_api_pb2.StateKey(
+                multimap_side_input=beam_fn_api_pb2.StateKey.MultimapSideInput(
+                    transform_id='transform',
+                    side_input_id='side',
+                    window=window,
+                    key=key_coder.get_impl().encode_nested(key))),
+            b''.join(VarIntCoder().encode(value) for value in values))
+    side_input_map = StateBackedSideInputMap(
+        GlobalCachingStateHandler(StateCache(0), state_servicer),
+        'transform',
+        'side',
+        beam.pvalue.SideInputData(
+            common_urns.side_inputs.MULTIMAP.urn, lambda window: window,
+            lambda multimap: multimap),
+        WindowedValueCoder(
+            TupleCoder([key_coder, VarIntCoder()]), window_coder),
+        use_bulk_read=True,
+        max_cache_weight=max_cache_weight)
+    return state_servicer, side_input_map
+
+  def _create_multimap(self, key_values, max_cache_weight=None):
+    state_servicer, side_input_map = self._create_side_input_map(
+        key_values, [GlobalWindow()], GlobalWindowCoder(), max_cache_weight)
+    return state_servicer, side_input_map[GlobalWindow()]
+
+  def test_bulk_read_fully(self):
+    key_values = {'k%d' % i: list(range(i)) for i in range(500)}
+    state_servicer, multimap = self._create_multimap(key_values)
+    for key, values in key_values.items():
+      self.assertEqual(values, list(multimap[key]))
+    self.assertEqual([], list(multimap['missing']))
+    self.assertEqual(1, state_servicer.get_raw_calls)
+
+  def test_bulk_read_partially_within_budget(self):
+    key_values = {'k%d' % i: list(range(100)) for i in range(100)}
+    state_servicer, multimap = self._create_multimap(
+        key_values, max_cache_weight=10 * estimate_size(list(range(100))))
+    self.assertEqual(list(range(100)), list(multimap['k0']))
+    self.assertEqual(1, state_servicer.get_raw_calls)
+    self.assertEqual(list(range(100)), list(multimap['k99']))
+    self.assertEqual(2, state_servicer.get_raw_calls)
+    self.assertEqual([], list(multimap['missing']))
+
+  def test_bulk_read_is_weighed(self):
+    key_values = {'k%d' % i: list(range(100)) for i in range(100)}
+    max_cache_weight = 10 * estimate_size(list(range(100)))
+    windows = [IntervalWindow(10 * i, 10 * i + 10) for i in range(3)]
+    _, side_input_map = self._create_side_input_map(
+        key_values, windows, IntervalWindowCoder(), max_cache_weight)
+    for window in windows:
+      multimap = side_input_map[window]
+      self.assertEqual(list(range(100)), list(multimap['k0']))
+      # The views stay within the budget as the bulk reads fill them.
+      self.assertLessEqual(side_input_map._cache_weight, 2 * max_cache_weight)
+      self.assertEqual([window], list(side_input_map._cache))
+
+  def test_get_all_batches_lookups(self):
+    key_values = {'k%d' % i: [i, i + 1] for i in range(100)}
+    state_servicer, multimap = self._create_multimap(
+        key_values, max_cache_weight=1)
+    keys = ['k0', 'k50', 'k99', 'k50', 'missing']
+    self.assertEqual([[0, 1], [50, 51], [99, 100], [50, 51], []],
+                     [list(values) for values in multimap.get_all(keys)])
+    self.assertEqual(1, state_servicer.get_raw_many_calls)
+    # Keys that were fetched before are not fetched again.
+    self.assertEqual([[50, 51]],
+                     [list(values) for values in multimap.get_all(['k50'])])
+    self.assertEqual(1, state_servicer.get_raw_many_calls)
+
+
+class FusableParDoChainsTest(unittest.TestCase):
+  def test_fusable_par_do_chains(self):
+    context = pipeline_context.PipelineContext()
+    descriptor = beam_fn_api_pb2.ProcessBundleDescriptor()
+    pcoll_consumers = {}
+
+    def add_transform(transform_id, transform, input_pcoll, output_pcoll):
+      urn, payload = transform.to_runner_api_parameter(context)
+      descriptor.transforms[transform_id].CopyFrom(
+          beam_runner_api_pb2.PTransform(
+              unique_name=transform_id,
+              spec=beam_runner_api_pb2.FunctionSpec(
+                  urn=urn, payload=payload.SerializeToString()),
+              inputs={'input': input_pcoll},
+              outputs={'output': output_pcoll}))
+      pcoll_consumers.setdefault(input_pcoll, []).append(transform_id)
+
+    add_transform('a', beam.Map(str), 'p0', 'p1')
+    add_transform('b', beam.Filter(bool), 'p1', 'p2')
+    add_transform('c', beam.FlatMap(lambda x: [x]), 'p2', 'p3')
+    # The output of c has two consumers, so d and e are not unpickled.
+    add_transform('d', beam.Map(len), 'p3', 'p4')
+    add_transform('e', beam.Map(len), 'p3', 'p5')
+    # DoFn parameters prevent fusing x into y.
+    add_transform(
+        'x', beam.Map(lambda x, ts=beam.DoFn.TimestampParam: x), 'p8', 'p6')
+    add_transform('y', beam.Map(str), 'p6', 'p7')
+
+    with mock.patch.object(bundle_processor.pickler,
+                           'loads',
+                           wraps=bundle_processor.pickler.loads) as loads:
+      fused_chains = bundle_processor._fusable_par_do_chains(
+          mock.Mock(context=context), descriptor, pcoll_consumers)
+
+    self.assertEqual(['c'], list(fused_chains))
+    self.assertEqual(['a', 'b'],
+                     [stage.transform_id for stage in fused_chains['c'].stages])
+    self.assertIsInstance(
+        fused_chains['c'].dofn_data[0], beam.core.CallableWrapperDoFn)
+    # Only the DoFns of the transforms that could be linked are unpickled.
+    self.assertEqual(5, loads.call_count)
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -22,6 +22,7 @@
 
 import abc
 import collections
+import itertools
 import json
 import logging
 import queue
@@ -62,12 +63,21 @@ else:
 _LOGGER = logging.getLogger(__name__)
 
 _DEFAULT_SIZE_FLUSH_THRESHOLD = 10 << 20  # 10MB
+# The smallest size flush threshold that AdaptiveFlushThreshold shrinks to.
+_MIN_ADAPTIVE_SIZE_FLUSH_THRESHOLD = 1 << 20  # 1MB
+# AdaptiveFlushThreshold shrinks while sends take less than this on average.
+_TARGET_SEND_LATENCY_SECS = 0.01
 _DEFAULT_TIME_FLUSH_THRESHOLD_MS = 0  # disable time-based flush by default
 _FLUSH_MAX_SIZE = (2 << 30) - 100  # 2GB less some overhead, protobuf/grpc limit
 # Keep a set of completed instructions to discard late received data. The set
-# can have up to _MAX_CLEANED_INSTRUCTIONS items. See _GrpcDataChannel.
+# can have up to _MAX_CLEANED_INSTRUCTIONS items. See QueuingDataChannel.
 _MAX_CLEANED_INSTRUCTIONS = 10000
 
+# The names of the BeamFnData service and of its Data method, for sending
+# pre-encoded Elements.
+_DATA_SERVICE = 'org.apache.beam.model.fn_execution.v1.BeamFnData'
+_DATA_METHOD = '/%s/Data' % _DATA_SERVICE
+
 # retry on transient UNAVAILABLE grpc error from data channels.
 _GRPC_SERVICE_CONFIG = json.dumps({
     "methodConfig": [{
@@ -85,6 +95,85 @@ _GRPC_SERVICE_CONFIG = json.dumps({
 })
 
 
+def _encode_varint(value):
+  # type: (int) -> bytes
+  result = bytearray()
+  while value > 0x7f:
+    result.append((value & 0x7f) | 0x80)
+    value >>= 7
+  result.append(value)
+  return bytes(result)
+
+
+def _encode_string_field(tag, value):
+  # type: (bytes, str) -> bytes
+  if not value:
+    # Like protobuf, leave out fields with the default value.
+    return b''
+  encoded = value.encode('utf-8')
+  return tag + _encode_varint(len(encoded)) + encoded
+
+
+class _ElementsEncoder(object):
+  """Encodes the Data or Timers of one stream as fields of an Elements message.
+
+  The encoded fields of any number of streams concatenate to a serialized
+  Elements message, so buffered bytes are sent without building protobuf
+  messages. The ids of the stream are encoded only once.
+  """
+
+  # Tags of the length delimited fields of Elements, Data and Timers.
+  _ELEMENTS_DATA_TAG = b'\x0a'
+  _ELEMENTS_TIMERS_TAG = b'\x12'
+  _INSTRUCTION_ID_TAG = b'\x0a'
+  _TRANSFORM_ID_TAG = b'\x12'
+  _TIMER_FAMILY_ID_TAG = b'\x1a'
+  _DATA_TAG = b'\x1a'
+  _TIMERS_TAG = b'\x22'
+  # Data.is_last and Timers.is_last set to true.
+  _DATA_IS_LAST = b'\x20\x01'
+  _TIMERS_IS_LAST = b'\x28\x01'
+
+  def __init__(
+      self,
+      instruction_id,  # type: str
+      transform_id,  # type: str
+      timer_family_id=None  # type: Optional[str]
+  ):
+    # type: (...) -> None
+    ids = (
+        _encode_string_field(self._INSTRUCTION_ID_TAG, instruction_id) +
+        _encode_string_field(self._TRANSFORM_ID_TAG, transform_id))
+    if timer_family_id is None:
+      self._field_tag = self._ELEMENTS_DATA_TAG
+      self._payload_tag = self._DATA_TAG
+      self._is_last = self._DATA_IS_LAST
+    else:
+      ids += _encode_string_field(self._TIMER_FAMILY_ID_TAG, timer_family_id)
+      self._field_tag = self._ELEMENTS_TIMERS_TAG
+      self._payload_tag = self._TIMERS_TAG
+      self._is_last = self._TIMERS_IS_LAST
+    self._ids = ids
+
+  def encode(self, payload):
+    # type: (bytes) -> Tuple[bytes, bytes]
+
+    """Returns the encoded field as a header to send ahead of the payload."""
+    payload_header = self._payload_tag + _encode_varint(len(payload))
+    return (
+        self._field_tag +
+        _encode_varint(len(self._ids) + len(payload_header) + len(payload)) +
+        self._ids + payload_header,
+        payload)
+
+  def encode_last(self):
+    # type: () -> Tuple[bytes, bytes]
+
+    """Returns the encoded field marking the end of the stream."""
+    message = self._ids + self._is_last
+    return self._field_tag + _encode_varint(len(message)), message
+
+
 class ClosableOutputStream(OutputStream):
   """A Outputstream for use with CoderImpls that has a close() method."""
   def __init__(
@@ -112,17 +201,74 @@ class ClosableOutputStream(OutputStream):
   def create(
       close_callback,  # type: Optional[Callable[[bytes], None]]
       flush_callback,  # type: Optional[Callable[[bytes], None]]
-      data_buffer_time_limit_ms  # type: int
+      data_buffer_time_limit_ms,  # type: int
+      flusher=None,  # type: Optional[PeriodicFlusher]
+      adaptive_threshold=None  # type: Optional[AdaptiveFlushThreshold]
   ):
     # type: (...) -> ClosableOutputStream
     if data_buffer_time_limit_ms > 0:
       return TimeBasedBufferingClosableOutputStream(
           close_callback,
           flush_callback=flush_callback,
-          time_flush_threshold_ms=data_buffer_time_limit_ms)
+          time_flush_threshold_ms=data_buffer_time_limit_ms,
+          flusher=flusher,
+          adaptive_threshold=adaptive_threshold)
     else:
       return SizeBasedBufferingClosableOutputStream(
-          close_callback, flush_callback=flush_callback)
+          close_callback,
+          flush_callback=flush_callback,
+          adaptive_threshold=adaptive_threshold)
+
+
+class AdaptiveFlushThreshold(object):
+  """The size at which the output streams of a data channel are flushed,
+  adapted to how the channel keeps up with sending their data.
+
+  While data is still waiting to be sent when a message has been taken off the
+  send queue, the threshold grows, so that fewer and larger messages amortize
+  the per-message overhead of gRPC. While messages are sent quickly and
+  nothing is waiting, it shrinks, so that data is sent sooner and less of it
+  is buffered.
+
+  This is a heuristic. The send latency is not timed on the wire, but is the
+  time until the gRPC stream pulls the next message from the channel after it
+  was given a message. gRPC pulls a request only once the previous one was
+  accepted by its transport, subject to flow control, so this grows when the
+  receiver or network falls behind. It also includes the time that gRPC takes
+  to get to the next pull, and so never measures less than the stream's own
+  overhead per message.
+  """
+  def __init__(
+      self,
+      min_threshold=_MIN_ADAPTIVE_SIZE_FLUSH_THRESHOLD,  # type: int
+      max_threshold=_DEFAULT_SIZE_FLUSH_THRESHOLD,  # type: int
+      target_send_latency_secs=_TARGET_SEND_LATENCY_SECS  # type: float
+  ):
+    # type: (...) -> None
+    self._min_threshold = min_threshold
+    self._max_threshold = max_threshold
+    self._target_send_latency_secs = target_send_latency_secs
+    self._send_latency_secs = 0.0
+    # Streams read this without locking; it is only updated by the thread
+    # sending the data of the channel.
+    self.value = max_threshold
+
+  def record_send(self, latency_secs, backlogged):
+    # type: (float, bool) -> None
+
+    """Adapts the threshold to a sent message.
+
+    Args:
+      latency_secs: the time until the stream pulled the next message after
+        this one, see the class docstring.
+      backlogged: whether more data was waiting to be sent.
+    """
+    self._send_latency_secs = (
+        0.8 * self._send_latency_secs + 0.2 * latency_secs)
+    if backlogged:
+      self.value = min(self.value * 2, self._max_threshold)
+    elif self._send_latency_secs < self._target_send_latency_secs:
+      self.value = max(self.value * 3 // 4, self._min_threshold)
 
 
 class SizeBasedBufferingClosableOutputStream(ClosableOutputStream):
@@ -135,10 +281,16 @@ class SizeBasedBufferingClosableOutputStream(ClosableOutputStream):
       close_callback=None,  # type: Optional[Callable[[bytes], None]]
       flush_callback=None,  # type: Optional[Callable[[bytes], None]]
       size_flush_threshold=_DEFAULT_SIZE_FLUSH_THRESHOLD,  # type: int
-      large_buffer_warn_threshold_bytes=512 << 20  # type: int
+      large_buffer_warn_threshold_bytes=512 << 20,  # type: int
+      adaptive_threshold=None  # type: Optional[AdaptiveFlushThreshold]
   ):
     super().__init__(close_callback)
     self._flush_callback = flush_callback
+    # If set, the size flush threshold follows the adaptive threshold, which
+    # is read again after each flush.
+    self._adaptive_threshold = adaptive_threshold
+    if adaptive_threshold is not None:
+      size_flush_threshold = adaptive_threshold.value
     self._size_flush_threshold = size_flush_threshold
     self._large_buffer_warn_threshold_bytes = large_buffer_warn_threshold_bytes
 
@@ -180,11 +332,17 @@ class SizeBasedBufferingClosableOutputStream(ClosableOutputStream):
 
       self._flush_callback(self.get())
       self._clear()
+      if self._adaptive_threshold is not None:
+        self._size_flush_threshold = self._adaptive_threshold.value
 
 
 class TimeBasedBufferingClosableOutputStream(
     SizeBasedBufferingClosableOutputStream):
-  """A buffering OutputStream with both time-based and size-based."""
+  """A buffering OutputStream with both time-based and size-based.
+
+  The stream is flushed periodically by the given PeriodicFlusher, which is
+  shared by the streams of a data channel, or else by a thread of its own.
+  """
   _periodic_flusher = None  # type: Optional[PeriodicThread]
 
   def __init__(
@@ -192,16 +350,26 @@ class TimeBasedBufferingClosableOutputStream(
       close_callback=None,  # type: Optional[Callable[[bytes], None]]
       flush_callback=None,  # type: Optional[Callable[[bytes], None]]
       size_flush_threshold=_DEFAULT_SIZE_FLUSH_THRESHOLD,  # type: int
-      time_flush_threshold_ms=_DEFAULT_TIME_FLUSH_THRESHOLD_MS  # type: int
+      time_flush_threshold_ms=_DEFAULT_TIME_FLUSH_THRESHOLD_MS,  # type: int
+      flusher=None,  # type: Optional[PeriodicFlusher]
+      adaptive_threshold=None  # type: Optional[AdaptiveFlushThreshold]
   ):
     # type: (...) -> None
-    super().__init__(close_callback, flush_callback, size_flush_threshold)
+    super().__init__(
+        close_callback,
+        flush_callback,
+        size_flush_threshold,
+        adaptive_threshold=adaptive_threshold)
     assert time_flush_threshold_ms > 0
     self._time_flush_threshold_ms = time_flush_threshold_ms
     self._flush_lock = threading.Lock()
     self._schedule_lock = threading.Lock()
     self._closed = False
-    self._schedule_periodic_flush()
+    self._flusher = flusher
+    if flusher is not None:
+      flusher.register(self)
+    else:
+      self._schedule_periodic_flush()
 
   def flush(self):
     # type: () -> None
@@ -215,22 +383,78 @@ class TimeBasedBufferingClosableOutputStream(
       if self._periodic_flusher:
         self._periodic_flusher.cancel()
         self._periodic_flusher = None
+    if self._flusher is not None:
+      self._flusher.unregister(self)
     super().close()
 
-  def _schedule_periodic_flush(self):
+  def periodic_flush(self):
     # type: () -> None
-    def _flush():
-      # type: () -> None
-      with self._schedule_lock:
-        if not self._closed:
-          self.flush()
 
+    """Flushes the stream, unless it is closed already."""
+    with self._schedule_lock:
+      if not self._closed:
+        self.flush()
+
+  def _schedule_periodic_flush(self):
+    # type: () -> None
     self._periodic_flusher = PeriodicThread(
-        self._time_flush_threshold_ms / 1000.0, _flush)
+        self._time_flush_threshold_ms / 1000.0, self.periodic_flush)
     self._periodic_flusher.daemon = True
     self._periodic_flusher.start()
 
 
+class PeriodicFlusher(object):
+  """Periodically flushes a set of time-based buffering output streams.
+
+  A data channel shares one flusher, and thus one thread, among all of its
+  output streams, rather than starting a thread for each stream. The thread
+  is started once the first stream is registered.
+  """
+  def __init__(self, time_flush_threshold_ms):
+    # type: (int) -> None
+    assert time_flush_threshold_ms > 0
+    self._interval = time_flush_threshold_ms / 1000.0
+    self._lock = threading.Lock()
+    self._streams = set()  # type: Set[TimeBasedBufferingClosableOutputStream]
+    self._thread = None  # type: Optional[PeriodicThread]
+    self._stopped = False
+
+  def register(self, stream):
+    # type: (TimeBasedBufferingClosableOutputStream) -> None
+    with self._lock:
+      self._streams.add(stream)
+      if self._thread is None and not self._stopped:
+        self._thread = PeriodicThread(self._interval, self._flush_all)
+        self._thread.name = 'periodic_data_flusher'
+        self._thread.daemon = True
+        self._thread.start()
+
+  def unregister(self, stream):
+    # type: (TimeBasedBufferingClosableOutputStream) -> None
+    with self._lock:
+      self._streams.discard(stream)
+
+  def _flush_all(self):
+    # type: () -> None
+    with self._lock:
+      streams = list(self._streams)
+    for stream in streams:
+      try:
+        stream.periodic_flush()
+      except Exception:  # pylint: disable=broad-except
+        # Keep flushing the other streams. The failure surfaces again when
+        # the stream is flushed or closed by its writer.
+        _LOGGER.exception('Failed to flush data output stream.')
+
+  def stop(self):
+    # type: () -> None
+    with self._lock:
+      self._stopped = True
+      if self._thread is not None:
+        self._thread.cancel()
+        self._thread = None
+
+
 class PeriodicThread(threading.Thread):
   """Call a function periodically with the specified number of seconds"""
   def __init__(
@@ -370,6 +594,9 @@ class InMemoryDataChannel(DataChannel):
     # type: (Optional[InMemoryDataChannel], int) -> None
     self._inputs = []  # type: List[DataOrTimers]
     self._data_buffer_time_limit_ms = data_buffer_time_limit_ms
+    self._flusher = (
+        PeriodicFlusher(data_buffer_time_limit_ms)
+        if data_buffer_time_limit_ms > 0 else None)
     self._inverse = inverse or InMemoryDataChannel(
         self, data_buffer_time_limit_ms=data_buffer_time_limit_ms)
 
@@ -426,7 +653,10 @@ class InMemoryDataChannel(DataChannel):
               is_last=True))
 
     return ClosableOutputStream.create(
-        add_to_inverse_output, close_stream, self._data_buffer_time_limit_ms)
+        add_to_inverse_output,
+        close_stream,
+        self._data_buffer_time_limit_ms,
+        flusher=self._flusher)
 
   def output_stream(self, instruction_id, transform_id):
     # type: (str, str) -> ClosableOutputStream
@@ -441,22 +671,28 @@ class InMemoryDataChannel(DataChannel):
     return ClosableOutputStream.create(
         add_to_inverse_output,
         add_to_inverse_output,
-        self._data_buffer_time_limit_ms)
+        self._data_buffer_time_limit_ms,
+        flusher=self._flusher)
 
   def close(self):
     # type: () -> None
-    pass
+    if self._flusher is not None:
+      self._flusher.stop()
 
 
-class _GrpcDataChannel(DataChannel):
-  """Base class for implementing a BeamFnData-based DataChannel."""
-
-  _WRITES_FINISHED = beam_fn_api_pb2.Elements.Data()
+class QueuingDataChannel(DataChannel):
+  """Base class for DataChannels that queue their inputs per instruction.
 
+  Subclasses receive the data and timers on a thread of their own, and pass
+  them to ``_read_data_and_timers``, which puts them to the queue of their
+  instruction, for ``input_elements`` to read.
+  """
   def __init__(self, data_buffer_time_limit_ms=0):
     # type: (int) -> None
     self._data_buffer_time_limit_ms = data_buffer_time_limit_ms
-    self._to_send = queue.Queue()  # type: queue.Queue[DataOrTimers]
+    self._flusher = (
+        PeriodicFlusher(data_buffer_time_limit_ms)
+        if data_buffer_time_limit_ms > 0 else None)
     self._received = collections.defaultdict(
         lambda: queue.Queue(maxsize=5)
     )  # type: DefaultDict[str, queue.Queue[DataOrTimers]]
@@ -472,11 +708,6 @@ class _GrpcDataChannel(DataChannel):
     self._closed = False
     self._exception = None  # type: Optional[Exception]
 
-  def close(self):
-    # type: () -> None
-    self._to_send.put(self._WRITES_FINISHED)
-    self._closed = True
-
   def wait(self, timeout=None):
     # type: (Optional[int]) -> None
     self._reads_finished.wait(timeout)
@@ -580,94 +811,11 @@ class _GrpcDataChannel(DataChannel):
       #  an instruction_id
       self._clean_receiving_queue(instruction_id)
 
-  def output_stream(self, instruction_id, transform_id):
-    # type: (str, str) -> ClosableOutputStream
-    def add_to_send_queue(data):
-      # type: (bytes) -> None
-      if data:
-        self._to_send.put(
-            beam_fn_api_pb2.Elements.Data(
-                instruction_id=instruction_id,
-                transform_id=transform_id,
-                data=data))
-
-    def close_callback(data):
-      # type: (bytes) -> None
-      add_to_send_queue(data)
-      # End of stream marker.
-      self._to_send.put(
-          beam_fn_api_pb2.Elements.Data(
-              instruction_id=instruction_id,
-              transform_id=transform_id,
-              is_last=True))
-
-    return ClosableOutputStream.create(
-        close_callback, add_to_send_queue, self._data_buffer_time_limit_ms)
-
-  def output_timer_stream(
-      self,
-      instruction_id,  # type: str
-      transform_id,  # type: str
-      timer_family_id  # type: str
-  ):
-    # type: (...) -> ClosableOutputStream
-    def add_to_send_queue(timer):
-      # type: (bytes) -> None
-      if timer:
-        self._to_send.put(
-            beam_fn_api_pb2.Elements.Timers(
-                instruction_id=instruction_id,
-                transform_id=transform_id,
-                timer_family_id=timer_family_id,
-                timers=timer,
-                is_last=False))
-
-    def close_callback(timer):
-      # type: (bytes) -> None
-      add_to_send_queue(timer)
-      self._to_send.put(
-          beam_fn_api_pb2.Elements.Timers(
-              instruction_id=instruction_id,
-              transform_id=transform_id,
-              timer_family_id=timer_family_id,
-              is_last=True))
-
-    return ClosableOutputStream.create(
-        close_callback, add_to_send_queue, self._data_buffer_time_limit_ms)
-
-  def _write_outputs(self):
-    # type: () -> Iterator[beam_fn_api_pb2.Elements]
-    stream_done = False
-    while not stream_done:
-      streams = [self._to_send.get()]
-      try:
-        # Coalesce up to 100 other items.
-        total_size_bytes = streams[0].ByteSize()
-        while (total_size_bytes < _DEFAULT_SIZE_FLUSH_THRESHOLD and
-               len(streams) <= 100):
-          data_or_timer = self._to_send.get_nowait()
-          total_size_bytes += data_or_timer.ByteSize()
-          streams.append(data_or_timer)
-      except queue.Empty:
-        pass
-      if streams[-1] is self._WRITES_FINISHED:
-        stream_done = True
-        streams.pop()
-      if streams:
-        data_stream = []
-        timer_stream = []
-        for stream in streams:
-          if isinstance(stream, beam_fn_api_pb2.Elements.Timers):
-            timer_stream.append(stream)
-          elif isinstance(stream, beam_fn_api_pb2.Elements.Data):
-            data_stream.append(stream)
-          else:
-            raise ValueError('Unexpected output element type %s' % type(stream))
-        yield beam_fn_api_pb2.Elements(data=data_stream, timers=timer_stream)
-
-  def _read_inputs(self, elements_iterator):
-    # type: (Iterable[beam_fn_api_pb2.Elements]) -> None
+  def _read_data_and_timers(self, data_and_timers):
+    # type: (Iterable[DataOrTimers]) -> None
 
+    """Puts each of the received data and timers to the queue of its
+    instruction, until the iterable is exhausted."""
     next_discard_log_time = 0  # type: float
 
     def _put_queue(instruction_id, element):
@@ -704,11 +852,8 @@ class _GrpcDataChannel(DataChannel):
             next_waiting_log_time = current_time + 300
 
     try:
-      for elements in elements_iterator:
-        for timer in elements.timers:
-          _put_queue(timer.instruction_id, timer)
-        for data in elements.data:
-          _put_queue(data.instruction_id, data)
+      for element in data_and_timers:
+        _put_queue(element.instruction_id, element)
     except Exception as e:
       if not self._closed:
         _LOGGER.exception('Failed to read inputs in the data plane.')
@@ -718,6 +863,124 @@ class _GrpcDataChannel(DataChannel):
       self._closed = True
       self._reads_finished.set()
 
+
+class _GrpcDataChannel(QueuingDataChannel):
+  """Base class for implementing a BeamFnData-based DataChannel."""
+
+  # Marks the end of the outputs in the send queue.
+  _WRITES_FINISHED = (b'', b'')
+
+  def __init__(self, data_buffer_time_limit_ms=0):
+    # type: (int) -> None
+    super().__init__(data_buffer_time_limit_ms)
+    self._adaptive_threshold = AdaptiveFlushThreshold()
+    # Holds the outputs as pairs of a header and a payload, which encode a
+    # Data or Timers field of an Elements message. See _ElementsEncoder.
+    self._to_send = queue.Queue()  # type: queue.Queue[Tuple[bytes, bytes]]
+
+  def close(self):
+    # type: () -> None
+    if self._flusher is not None:
+      self._flusher.stop()
+    self._to_send.put(self._WRITES_FINISHED)
+    self._closed = True
+
+  def output_stream(self, instruction_id, transform_id):
+    # type: (str, str) -> ClosableOutputStream
+    encoder = _ElementsEncoder(instruction_id, transform_id)
+
+    def add_to_send_queue(data):
+      # type: (bytes) -> None
+      if data:
+        self._to_send.put(encoder.encode(data))
+
+    def close_callback(data):
+      # type: (bytes) -> None
+      add_to_send_queue(data)
+      # End of stream marker.
+      self._to_send.put(encoder.encode_last())
+
+    return ClosableOutputStream.create(
+        close_callback,
+        add_to_send_queue,
+        self._data_buffer_time_limit_ms,
+        flusher=self._flusher,
+        adaptive_threshold=self._adaptive_threshold)
+
+  def output_timer_stream(
+      self,
+      instruction_id,  # type: str
+      transform_id,  # type: str
+      timer_family_id  # type: str
+  ):
+    # type: (...) -> ClosableOutputStream
+    encoder = _ElementsEncoder(instruction_id, transform_id, timer_family_id)
+
+    def add_to_send_queue(timer):
+      # type: (bytes) -> None
+      if timer:
+        self._to_send.put(encoder.encode(timer))
+
+    def close_callback(timer):
+      # type: (bytes) -> None
+      add_to_send_queue(timer)
+      self._to_send.put(encoder.encode_last())
+
+    return ClosableOutputStream.create(
+        close_callback,
+        add_to_send_queue,
+        self._data_buffer_time_limit_ms,
+        flusher=self._flusher,
+        adaptive_threshold=self._adaptive_threshold)
+
+  def _write_outputs(self):
+    # type: () -> Iterator[bytes]
+
+    """Yields serialized Elements messages, coalescing the queued outputs."""
+    stream_done = False
+    while not stream_done:
+      output = self._to_send.get()
+      parts = []  # type: List[bytes]
+      try:
+        # Coalesce up to 100 other items.
+        num_outputs = 0
+        total_size_bytes = 0
+        while True:
+          if output is self._WRITES_FINISHED:
+            stream_done = True
+            break
+          parts.extend(output)
+          num_outputs += 1
+          total_size_bytes += len(output[0]) + len(output[1])
+          if (total_size_bytes >= _DEFAULT_SIZE_FLUSH_THRESHOLD or
+              num_outputs > 100):
+            break
+          output = self._to_send.get_nowait()
+      except queue.Empty:
+        pass
+      if parts:
+        backlogged = not stream_done and not self._to_send.empty()
+        start_time = time.time()
+        yield b''.join(parts)
+        # The stream resumes once gRPC has accepted the message and pulls the
+        # next one, which stands in for the latency of the send.
+        self._adaptive_threshold.record_send(
+            time.time() - start_time, backlogged)
+
+  def _write_output_messages(self):
+    # type: () -> Iterator[beam_fn_api_pb2.Elements]
+
+    """Yields the outputs as Elements messages, for stubs and servicers that
+    serialize the messages themselves."""
+    for encoded in self._write_outputs():
+      yield beam_fn_api_pb2.Elements.FromString(encoded)
+
+  def _read_inputs(self, elements_iterator):
+    # type: (Iterable[beam_fn_api_pb2.Elements]) -> None
+    self._read_data_and_timers(
+        element for elements in elements_iterator
+        for element in itertools.chain(elements.timers, elements.data))
+
   def set_inputs(self, elements_iterator):
     # type: (Iterable[beam_fn_api_pb2.Elements]) -> None
     reader = threading.Thread(
@@ -731,12 +994,30 @@ class GrpcClientDataChannel(_GrpcDataChannel):
   """A DataChannel wrapping the client side of a BeamFnData connection."""
   def __init__(
       self,
-      data_stub,  # type: beam_fn_api_pb2_grpc.BeamFnDataStub
+      data_stub,  # type: Union[beam_fn_api_pb2_grpc.BeamFnDataStub, PreEncodedBeamFnDataStub]
       data_buffer_time_limit_ms=0  # type: int
   ):
     # type: (...) -> None
     super().__init__(data_buffer_time_limit_ms)
-    self.set_inputs(data_stub.Data(self._write_outputs()))
+    if isinstance(data_stub, PreEncodedBeamFnDataStub):
+      self.set_inputs(data_stub.Data(self._write_outputs()))
+    else:
+      self.set_inputs(data_stub.Data(self._write_output_messages()))
+
+
+class PreEncodedBeamFnDataStub(object):
+  """A BeamFnData stub that sends serialized Elements messages as they are.
+
+  Unlike ``beam_fn_api_pb2_grpc.BeamFnDataStub``, requests are bytes rather
+  than messages, which lets ``GrpcClientDataChannel`` send its buffered
+  outputs without building and serializing protobuf messages.
+  """
+  def __init__(self, channel):
+    # type: (grpc.Channel) -> None
+    self.Data = channel.stream_stream(
+        _DATA_METHOD,
+        request_serializer=None,
+        response_deserializer=beam_fn_api_pb2.Elements.FromString)
 
 
 class BeamFnDataServicer(beam_fn_api_pb2_grpc.BeamFnDataServicer):
@@ -755,31 +1036,66 @@ class BeamFnDataServicer(beam_fn_api_pb2_grpc.BeamFnDataServicer):
     with self._lock:
       return self._connections_by_worker_id[worker_id]
 
-  def Data(
+  def add_to_server(self, server):
+    # type: (grpc.Server) -> None
+
+    """Adds this servicer to a server.
+
+    Unlike ``beam_fn_api_pb2_grpc.add_BeamFnDataServicer_to_server``, the
+    outputs are sent as the serialized Elements messages that the channels
+    buffer, rather than parsed into messages for gRPC to serialize again.
+    """
+    server.add_generic_rpc_handlers((
+        grpc.method_handlers_generic_handler(
+            _DATA_SERVICE,
+            {
+                'Data': grpc.stream_stream_rpc_method_handler(
+                    self._pre_encoded_data,
+                    request_deserializer=beam_fn_api_pb2.Elements.FromString,
+                    response_serializer=None)
+            }), ))
+
+  def _connect(
       self,
       elements_iterator,  # type: Iterable[beam_fn_api_pb2.Elements]
       context  # type: Any
   ):
-    # type: (...) -> Iterator[beam_fn_api_pb2.Elements]
+    # type: (...) -> _GrpcDataChannel
     worker_id = dict(context.invocation_metadata())['worker_id']
     data_conn = self.get_conn_by_worker_id(worker_id)
     data_conn.set_inputs(elements_iterator)
-    for elements in data_conn._write_outputs():
-      yield elements
+    return data_conn
+
+  def Data(
+      self,
+      elements_iterator,  # type: Iterable[beam_fn_api_pb2.Elements]
+      context  # type: Any
+  ):
+    # type: (...) -> Iterator[beam_fn_api_pb2.Elements]
+    yield from self._connect(elements_iterator,
+                             context)._write_output_messages()
+
+  def _pre_encoded_data(
+      self,
+      elements_iterator,  # type: Iterable[beam_fn_api_pb2.Elements]
+      context  # type: Any
+  ):
+    # type: (...) -> Iterator[bytes]
+    yield from self._connect(elements_iterator, context)._write_outputs()
 
 
 class DataChannelFactory(metaclass=abc.ABCMeta):
   """An abstract factory for creating ``DataChannel``."""
   @abc.abstractmethod
   def create_data_channel(self, remote_grpc_port):
-    # type: (beam_fn_api_pb2.RemoteGrpcPort) -> GrpcClientDataChannel
+    # type: (beam_fn_api_pb2.RemoteGrpcPort) -> DataChannel
 
     """Returns a ``DataChannel`` from the given RemoteGrpcPort."""
     raise NotImplementedError(type(self))
 
   @abc.abstractmethod
   def create_data_channel_from_url(self, url):
-    # type: (str) -> Optional[GrpcClientDataChannel]
+    # type: (str) -> Optional[DataChannel]
 
     """Returns a ``DataChannel`` from the given url."""
     raise NotImplementedError(type(self))
@@ -845,7 +1161,7 @@ class GrpcClientDataChannelFactory(DataChannelFactory):
           grpc_channel = grpc.intercept_channel(
               grpc_channel, WorkerIdInterceptor(self._worker_id))
           self._data_channel_cache[url] = GrpcClientDataChannel(
-              beam_fn_api_pb2_grpc.BeamFnDataStub(grpc_channel),
+              PreEncodedBeamFnDataStub(grpc_channel),
               self._data_buffer_time_limit_ms)
 
     return self._data_channel_cache[url]
@@ -21,6 +21,7 @@
 
 import itertools
 import logging
+import threading
 import time
 import unittest
 
@@ -40,7 +41,10 @@ class DataChannelTest(unittest.TestCase):
   def test_time_based_flush_grpc_data_channel(self):
     self._grpc_data_channel_test(True)
 
-  def _grpc_data_channel_test(self, time_based_flush=False):
+  def test_pre_encoded_grpc_data_channel(self):
+    self._grpc_data_channel_test(pre_encoded=True)
+
+  def _grpc_data_channel_test(self, time_based_flush=False, pre_encoded=False):
     if time_based_flush:
       data_servicer = data_plane.BeamFnDataServicer(
           data_buffer_time_limit_ms=100)
@@ -51,7 +55,11 @@ class DataChannelTest(unittest.TestCase):
       data_servicer.get_conn_by_worker_id(worker_id)
 
     server = grpc.server(thread_pool_executor.shared_unbounded_instance())
-    beam_fn_api_pb2_grpc.add_BeamFnDataServicer_to_server(data_servicer, server)
+    if pre_encoded:
+      data_servicer.add_to_server(server)
+    else:
+      beam_fn_api_pb2_grpc.add_BeamFnDataServicer_to_server(
+          data_servicer, server)
     test_port = server.add_insecure_port('[::]:0')
     server.start()
 
@@ -59,7 +67,10 @@ class DataChannelTest(unittest.TestCase):
     # Add workerId to the grpc channel
     grpc_channel = grpc.intercept_channel(
         grpc_channel, WorkerIdInterceptor(worker_id))
-    data_channel_stub = beam_fn_api_pb2_grpc.BeamFnDataStub(grpc_channel)
+    if pre_encoded:
+      data_channel_stub = data_plane.PreEncodedBeamFnDataStub(grpc_channel)
+    else:
+      data_channel_stub = beam_fn_api_pb2_grpc.BeamFnDataStub(grpc_channel)
     if time_based_flush:
       data_channel_client = data_plane.GrpcClientDataChannel(
           data_channel_stub, data_buffer_time_limit_ms=100)
@@ -138,6 +149,150 @@ class DataChannelTest(unittest.TestCase):
                 instruction_id='2', transform_id=transform_2, data=b'ghi')
         ])
 
+  def test_time_based_flush_shares_thread(self):
+    channel = data_plane.InMemoryDataChannel(data_buffer_time_limit_ms=10)
+    threads_before = threading.active_count()
+    streams = [channel.output_stream('0', str(i)) for i in range(50)]
+    self.assertLessEqual(threading.active_count(), threads_before + 1)
+    for i, stream in enumerate(streams):
+      stream.write(b'%d' % i)
+
+    def flushed():
+      # Streams may be flushed empty before they are written to.
+      return [element for element in channel.inverse()._inputs if element.data]
+
+    deadline = time.time() + 10
+    while len(flushed()) < len(streams) and time.time() < deadline:
+      time.sleep(0.01)
+    self.assertEqual(
+        {str(i): b'%d' % i
+         for i in range(len(streams))},
+        {element.transform_id: element.data
+         for element in flushed()})
+    for stream in streams:
+      stream.close()
+    self.assertFalse(channel._flusher._streams)
+    channel.close()
+
+
+class ElementsEncoderTest(unittest.TestCase):
+  def test_encodes_like_protobuf(self):
+    data_encoder = data_plane._ElementsEncoder('inst', 'transform')
+    timers_encoder = data_plane._ElementsEncoder('', 'tr\u00e4nsform', 'timers')
+    large = b'x' * 1000
+    encoded = b''.join(
+        data_encoder.encode(b'abc') + timers_encoder.encode(large) +
+        data_encoder.encode_last() + timers_encoder.encode_last())
+    self.assertEqual(
+        beam_fn_api_pb2.Elements(
+            data=[
+                beam_fn_api_pb2.Elements.Data(
+                    instruction_id='inst',
+                    transform_id='transform',
+                    data=b'abc'),
+                beam_fn_api_pb2.Elements.Data(
+                    instruction_id='inst',
+                    transform_id='transform',
+                    is_last=True),
+            ],
+            timers=[
+                beam_fn_api_pb2.Elements.Timers(
+                    transform_id='tr\u00e4nsform',
+                    timer_family_id='timers',
+                    timers=large),
+                beam_fn_api_pb2.Elements.Timers(
+                    transform_id='tr\u00e4nsform',
+                    timer_family_id='timers',
+                    is_last=True),
+            ]),
+        beam_fn_api_pb2.Elements.FromString(encoded))
+    self.assertEqual(
+        beam_fn_api_pb2.Elements(
+            data=[
+                beam_fn_api_pb2.Elements.Data(
+                    instruction_id='inst', transform_id='transform', data=large)
+            ]).SerializeToString(),
+        b''.join(data_encoder.encode(large)))
+
+
+class AdaptiveFlushThresholdTest(unittest.TestCase):
+  def test_grows_when_backlogged(self):
+    threshold = data_plane.AdaptiveFlushThreshold(
+        min_threshold=100, max_threshold=1000)
+    threshold.value = 100
+    threshold.record_send(0.0, backlogged=True)
+    self.assertEqual(200, threshold.value)
+    for _ in range(10):
+      threshold.record_send(1.0, backlogged=True)
+    self.assertEqual(1000, threshold.value)
+
+  def test_shrinks_when_sends_are_fast(self):
+    threshold = data_plane.AdaptiveFlushThreshold(
+        min_threshold=100, max_threshold=1000, target_send_latency_secs=0.1)
+    self.assertEqual(1000, threshold.value)
+    threshold.record_send(0.0, backlogged=False)
+    self.assertEqual(750, threshold.value)
+    for _ in range(20):
+      threshold.record_send(0.0, backlogged=False)
+    self.assertEqual(100, threshold.value)
+
+  def test_holds_when_sends_are_slow(self):
+    threshold = data_plane.AdaptiveFlushThreshold(
+        min_threshold=100, max_threshold=1000, target_send_latency_secs=0.1)
+    for _ in range(5):
+      threshold.record_send(1.0, backlogged=False)
+    self.assertEqual(1000, threshold.value)
+
+  def test_streams_follow_threshold(self):
+    threshold = data_plane.AdaptiveFlushThreshold(
+        min_threshold=100, max_threshold=1000)
+    flushed = []
+    stream = data_plane.SizeBasedBufferingClosableOutputStream(
+        flush_callback=flushed.append, adaptive_threshold=threshold)
+    stream.write(b'x' * 500)
+    stream.maybe_flush()
+    self.assertEqual([], flushed)
+    threshold.value = 100
+    stream.flush()
+    stream.write(b'x' * 500)
+    stream.maybe_flush()
+    self.assertEqual([b'x' * 500] * 2, flushed)
+
+  def test_channel_adapts_to_how_fast_messages_are_pulled(self):
+    class Stub(data_plane.PreEncodedBeamFnDataStub):
+      def __init__(self):
+        pass
+
+      def Data(self, requests):
+        self.requests = requests
+        return iter([])
+
+    stub = Stub()
+    channel = data_plane.GrpcClientDataChannel(stub)
+    threshold = channel._adaptive_threshold = data_plane.AdaptiveFlushThreshold(
+        min_threshold=100, max_threshold=1000, target_send_latency_secs=0.05)
+
+    def send(num_outputs=1):
+      for _ in range(num_outputs):
+        channel._to_send.put((b'', b'x'))
+      return next(stub.requests)
+
+    # The stream pulls the messages slowly.
+    send()
+    for _ in range(3):
+      time.sleep(0.3)
+      send()
+    self.assertEqual(1000, threshold.value)
+    # The stream pulls the messages as soon as they are available.
+    for _ in range(20):
+      send()
+    self.assertEqual(100, threshold.value)
+    # More outputs are queued than are coalesced into one message.
+    send(102)
+    send()
+    self.assertEqual(200, threshold.value)
+    channel.close()
+
 
 if __name__ == '__main__':
   logging.getLogger().setLevel(logging.INFO)
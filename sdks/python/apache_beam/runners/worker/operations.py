@@ -991,6 +991,8 @@ class DoOperation(Operation):
       self.dofn_runner.finish()
       if self.user_state_context:
         self.user_state_context.commit()
+      for side_input_map in self.side_input_maps or ():
+        side_input_map.finish()
 
   def teardown(self):
     # type: () -> None
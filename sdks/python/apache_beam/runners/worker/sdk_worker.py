@@ -44,6 +44,7 @@ from typing import Iterator
 from typing import List
 from typing import MutableMapping
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import TypeVar
 from typing import Union
@@ -59,10 +60,13 @@ from apache_beam.portability.api import metrics_pb2
 from apache_beam.runners.worker import bundle_processor
 from apache_beam.runners.worker import data_plane
 from apache_beam.runners.worker import data_sampler
+from apache_beam.runners.worker import shared_memory_data_plane
+from apache_beam.runners.worker import statecache
 from apache_beam.runners.worker import statesampler
 from apache_beam.runners.worker.channel_factory import GRPCChannelFactory
 from apache_beam.runners.worker.data_plane import PeriodicThread
 from apache_beam.runners.worker.statecache import CacheAware
+from apache_beam.runners.worker.statecache import ShardedStateCache
 from apache_beam.runners.worker.statecache import StateCache
 from apache_beam.runners.worker.worker_id_interceptor import WorkerIdInterceptor
 from apache_beam.runners.worker.worker_status import FnApiWorkerStatusHandler
@@ -87,6 +91,9 @@ MAX_KNOWN_NOT_RUNNING_INSTRUCTIONS = 1000
 # The number of ProcessBundleRequest instruction ids that BundleProcessorCache
 # will remember for failed instructions.
 MAX_FAILED_INSTRUCTIONS = 10000
+# Distinguishes the materialized views of side inputs in the state cache from
+# the state they are built from.
+_SIDE_INPUT_VIEW_CACHE_KEY_PREFIX = 'side_input_view'
 
 # retry on transient UNAVAILABLE grpc error from state channels.
 _GRPC_SERVICE_CONFIG = json.dumps({
@@ -165,6 +172,17 @@ class SdkHarness(object):
       worker_id=None,  # type: Optional[str]
       # Caching is disabled by default
       state_cache_size=0,  # type: int
+      state_cache_shards=1,  # type: int
+      # Cache entries are weighed by their deep size by default
+      estimate_state_cache_weights=False,  # type: bool
+      # The side input cache is unbounded by default
+      side_input_cache_size=None,  # type: Optional[int]
+      # Bundle processors are created on first use by default
+      prewarm_bundle_processors=0,  # type: int
+      # The bundle processor cache is unbounded by default
+      max_cached_bundle_processors_size=None,  # type: Optional[int]
+      # Chains of simple transforms are not fused by default
+      fuse_simple_pardos=False,  # type: bool
       # time-based data buffering is disabled by default
       data_buffer_time_limit_ms=0,  # type: int
       profiler_factory=None,  # type: Optional[Callable[..., Profile]]
@@ -182,7 +200,15 @@ class SdkHarness(object):
     self._alive = True
     self._worker_index = 0
     self._worker_id = worker_id
-    self._state_cache = StateCache(state_cache_size)
+    weight_estimator = (
+        statecache.estimate_size
+        if estimate_state_cache_weights else statecache.get_deep_size)
+    if state_cache_shards > 1:
+      self._state_cache = ShardedStateCache(
+          state_cache_size, state_cache_shards,
+          weight_estimator)  # type: StateCache
+    else:
+      self._state_cache = StateCache(state_cache_size, weight_estimator)
     self._deferred_exception = deferred_exception
     options = [('grpc.max_receive_message_length', -1),
                ('grpc.max_send_message_length', -1)]
@@ -199,8 +225,12 @@ class SdkHarness(object):
 
     self._control_channel = grpc.intercept_channel(
         self._control_channel, WorkerIdInterceptor(self._worker_id))
-    self._data_channel_factory = data_plane.GrpcClientDataChannelFactory(
-        credentials, self._worker_id, data_buffer_time_limit_ms)
+    # Runners on the same host may pass shared memory data channels.
+    self._data_channel_factory = (
+        shared_memory_data_plane.SharedMemoryDataChannelFactory(
+            data_plane.GrpcClientDataChannelFactory(
+                credentials, self._worker_id, data_buffer_time_limit_ms),
+            data_buffer_time_limit_ms))
     self._state_handler_factory = GrpcStateHandlerFactory(
         state_cache=self._state_cache,
         credentials=credentials,
@@ -225,6 +255,10 @@ class SdkHarness(object):
         data_channel_factory=self._data_channel_factory,
         fns=self._fns,
         data_sampler=self.data_sampler,
+        side_input_cache_size=side_input_cache_size,
+        prewarm_bundle_processors=prewarm_bundle_processors,
+        max_cached_bundle_processors_size=max_cached_bundle_processors_size,
+        fuse_simple_pardos=fuse_simple_pardos,
     )
     self._status_handler = None  # type: Optional[FnApiWorkerStatusHandler]
     if status_address:
@@ -426,6 +460,17 @@ class BundleProcessorCache(object):
       handlers to be used by a ``bundle_processor.BundleProcessor`` during
       processing.
     data_channel_factory (``data_plane.DataChannelFactory``)
+    side_input_cache_size (int): The maximum size in bytes of the views of
+      each side input that are cached during a bundle, or None if unbounded.
+    prewarm_bundle_processors (int): The number of ``BundleProcessor``s to
+      create in the background for each descriptor, once it is registered or
+      first used.
+    max_cached_bundle_processors_size (int): The maximum estimated size in
+      bytes of the cached ``BundleProcessor``s, or None if unbounded. If the
+      cache is full, the processors of the least recently used descriptors are
+      shut down.
+    fuse_simple_pardos (bool): Whether the ``BundleProcessor``s run chains of
+      simple Map, FlatMap and Filter transforms as a single operation.
     active_bundle_processors (dict): A dictionary, indexed by instruction IDs,
       containing ``bundle_processor.BundleProcessor`` objects that are currently
       active processing the corresponding instruction.
@@ -442,12 +487,20 @@ class BundleProcessorCache(object):
       data_channel_factory,  # type: data_plane.DataChannelFactory
       fns,  # type: MutableMapping[str, beam_fn_api_pb2.ProcessBundleDescriptor]
       data_sampler=None,  # type: Optional[data_sampler.DataSampler]
+      side_input_cache_size=None,  # type: Optional[int]
+      prewarm_bundle_processors=0,  # type: int
+      max_cached_bundle_processors_size=None,  # type: Optional[int]
+      fuse_simple_pardos=False,  # type: bool
   ):
     # type: (...) -> None
     self.runner_capabilities = runner_capabilities
     self.fns = fns
     self.state_handler_factory = state_handler_factory
     self.data_channel_factory = data_channel_factory
+    self.side_input_cache_size = side_input_cache_size
+    self.prewarm_bundle_processors = prewarm_bundle_processors
+    self.max_cached_bundle_processors_size = max_cached_bundle_processors_size
+    self.fuse_simple_pardos = fuse_simple_pardos
     self.known_not_running_instruction_ids = collections.OrderedDict(
     )  # type: collections.OrderedDict[str, bool]
     self.failed_instruction_ids = collections.OrderedDict(
@@ -460,6 +513,11 @@ class BundleProcessorCache(object):
         list)  # type: DefaultDict[str, List[bundle_processor.BundleProcessor]]
     self.last_access_times = collections.defaultdict(
         float)  # type: DefaultDict[str, float]
+    # The estimated size of a processor of each descriptor, once one of them
+    # was cached while max_cached_bundle_processors_size is set.
+    self._processor_sizes = {}  # type: Dict[str, int]
+    self._prewarmed_descriptor_ids = set()  # type: Set[str]
+    self._is_shutdown = False
     self._schedule_periodic_shutdown()
     self._lock = threading.Lock()
     self.data_sampler = data_sampler
@@ -469,6 +527,7 @@ class BundleProcessorCache(object):
 
     """Register a ``beam_fn_api_pb2.ProcessBundleDescriptor`` by its id."""
     self.fns[bundle_descriptor.id] = bundle_descriptor
+    self._maybe_prewarm(bundle_descriptor.id)
 
   def activate(self, instruction_id):
     # type: (str) -> None
@@ -507,20 +566,10 @@ class BundleProcessorCache(object):
             bundle_descriptor_id, threading.current_thread(), time.time())
 
     # Make sure we instantiate the processor while not holding the lock.
-
-    # Reduce risks of concurrent modifications of the same protos
-    # captured in bundle descriptor when the same bundle descriptor is used
-    # in different instructions.
-    pbd = beam_fn_api_pb2.ProcessBundleDescriptor()
-    pbd.MergeFrom(self.fns[bundle_descriptor_id])
-
-    processor = bundle_processor.BundleProcessor(
-        self.runner_capabilities,
-        pbd,
-        self.state_handler_factory.create_state_handler(
-            pbd.state_api_service_descriptor),
-        self.data_channel_factory,
-        self.data_sampler)
+    processor = self._create_processor(bundle_descriptor_id)
+    # More bundles of a descriptor that was not registered beforehand may
+    # follow, e.g. after the runner scaled up the job.
+    self._maybe_prewarm(bundle_descriptor_id)
     with self._lock:
       self.active_bundle_processors[
         instruction_id] = bundle_descriptor_id, processor
@@ -595,9 +644,116 @@ class BundleProcessorCache(object):
 
     # Make sure that we reset the processor while not holding the lock.
     processor.reset()
+    self._cache_processor(descriptor_id, processor)
+
+  def _create_processor(self, bundle_descriptor_id):
+    # type: (str) -> bundle_processor.BundleProcessor
+    # Reduce risks of concurrent modifications of the same protos
+    # captured in bundle descriptor when the same bundle descriptor is used
+    # in different instructions.
+    pbd = beam_fn_api_pb2.ProcessBundleDescriptor()
+    pbd.MergeFrom(self.fns[bundle_descriptor_id])
+
+    return bundle_processor.BundleProcessor(
+        self.runner_capabilities,
+        pbd,
+        self.state_handler_factory.create_state_handler(
+            pbd.state_api_service_descriptor),
+        self.data_channel_factory,
+        self.data_sampler,
+        side_input_cache_size=self.side_input_cache_size,
+        fuse_simple_pardos=self.fuse_simple_pardos)
+
+  def _cache_processor(self, descriptor_id, processor):
+    # type: (str, bundle_processor.BundleProcessor) -> None
+
+    """Adds an inactive ``BundleProcessor`` to the cache, and shuts down the
+    processors of the least recently used descriptors while the cache exceeds
+    ``max_cached_bundle_processors_size``."""
+    if (self.max_cached_bundle_processors_size is not None and
+        descriptor_id not in self._processor_sizes):
+      # Weighing traverses the processor, so do it once per descriptor and
+      # while not holding the lock.
+      self._processor_sizes[descriptor_id] = self._estimate_size(processor)
+    evicted = []
     with self._lock:
-      self.last_access_times[descriptor_id] = time.time()
-      self.cached_bundle_processors[descriptor_id].append(processor)
+      if self._is_shutdown:
+        evicted.append(processor)
+      else:
+        self.last_access_times[descriptor_id] = time.time()
+        self.cached_bundle_processors[descriptor_id].append(processor)
+        if self.max_cached_bundle_processors_size is not None:
+          evicted.extend(self._evict_least_recently_used())
+
+    # Shutdown can be expensive, keep out of lock
+    for processor in evicted:
+      processor.shutdown()
+
+  def _evict_least_recently_used(self):
+    # type: () -> List[bundle_processor.BundleProcessor]
+    assert self.max_cached_bundle_processors_size is not None
+    total_size = sum(
+        len(processors) * self._processor_sizes.get(descriptor_id, 0)
+        for descriptor_id, processors in self.cached_bundle_processors.items())
+    evicted = []
+    for descriptor_id in sorted(self.cached_bundle_processors,
+                                key=self.last_access_times.__getitem__):
+      processors = self.cached_bundle_processors[descriptor_id]
+      while processors and total_size > self.max_cached_bundle_processors_size:
+        # The processors at the front were released the longest time ago.
+        evicted.append(processors.pop(0))
+        total_size -= self._processor_sizes.get(descriptor_id, 0)
+    return evicted
+
+  def _estimate_size(self, processor):
+    # type: (bundle_processor.BundleProcessor) -> int
+
+    """Estimates the size of a ``BundleProcessor``, without the objects that
+    it shares with other processors, such as state handlers and channels."""
+    shared = [
+        processor.state_handler,
+        processor.data_channel_factory,
+        processor.data_sampler,
+        processor.timer_data_channel,
+        self.runner_capabilities,
+    ]
+    shared.extend(
+        getattr(op, 'data_channel', None) for op in processor.ops.values())
+    return statecache.get_deep_size(
+        processor, exclude=[obj for obj in shared if obj is not None])
+
+  def _maybe_prewarm(self, bundle_descriptor_id):
+    # type: (str) -> None
+
+    """Creates ``prewarm_bundle_processors`` processors in the background,
+    unless that was done for the descriptor already."""
+    with self._lock:
+      if (self.prewarm_bundle_processors <= 0 or
+          bundle_descriptor_id in self._prewarmed_descriptor_ids):
+        return
+      self._prewarmed_descriptor_ids.add(bundle_descriptor_id)
+
+    def create_processors():
+      # type: () -> None
+      for _ in range(self.prewarm_bundle_processors):
+        if self._is_shutdown:
+          return
+        try:
+          processor = self._create_processor(bundle_descriptor_id)
+        except Exception:  # pylint: disable=broad-except
+          # The failure surfaces again once a bundle uses the descriptor.
+          _LOGGER.warning(
+              'Failed to pre-create a bundle processor for %s.',
+              bundle_descriptor_id,
+              exc_info=True)
+          return
+        self._cache_processor(bundle_descriptor_id, processor)
+
+    prewarm_thread = threading.Thread(
+        target=create_processors,
+        name='prewarm_bundle_processors_%s' % bundle_descriptor_id)
+    prewarm_thread.daemon = True
+    prewarm_thread.start()
 
   def shutdown(self):
     # type: () -> None
@@ -609,6 +765,9 @@ class BundleProcessorCache(object):
       self.periodic_shutdown.cancel()
       self.periodic_shutdown.join()
       self.periodic_shutdown = None
+    with self._lock:
+      # Processors that are pre-created from now on are shut down right away.
+      self._is_shutdown = True
 
     for instruction_id in list(self.active_bundle_processors.keys()):
       self.discard(instruction_id, RuntimeError('Shutdown invoked'))
@@ -834,6 +993,19 @@ class StateHandler(metaclass=abc.ABCMeta):
     """
     raise NotImplementedError(type(self))
 
+  def get_raw_many(
+      self,
+      state_keys,  # type: List[beam_fn_api_pb2.StateKey]
+  ):
+    # type: (...) -> List[Tuple[bytes, Optional[bytes]]]
+
+    """Gets the first page of the contents of state for each state key.
+
+    Implementations may issue the requests concurrently, rather than waiting
+    for the response to each of them in turn.
+    """
+    return [self.get_raw(state_key) for state_key in state_keys]
+
   @abc.abstractmethod
   def append_raw(
       self,
@@ -956,6 +1128,24 @@ class GrpcStateHandlerFactory(StateHandlerFactory):
     self._state_cache.invalidate_all()
 
 
+class _CachedSideInputView(object):
+  """A materialized side input view that is shared between bundles.
+
+  The same view is handed out to every bundle, without copying it, just as a
+  side input map hands out the same view to every element of a bundle. Side
+  inputs are read-only: a DoFn must not modify e.g. the list of an AsList or
+  the dict of an AsDict side input, as other bundles would see its changes.
+
+  This wraps the view so that a cached None view can be told apart from a
+  cache miss.
+  """
+  __slots__ = ('view', )
+
+  def __init__(self, view):
+    # type: (Any) -> None
+    self.view = view
+
+
 class CachingStateHandler(metaclass=abc.ABCMeta):
   @abc.abstractmethod
   @contextlib.contextmanager
@@ -972,6 +1162,18 @@ class CachingStateHandler(metaclass=abc.ABCMeta):
     # type: (...) -> Iterable[Any]
     raise NotImplementedError(type(self))
 
+  def blocking_get_many(
+      self,
+      state_keys,  # type: List[beam_fn_api_pb2.StateKey]
+      coder,  # type: coder_impl.CoderImpl
+  ):
+    # type: (...) -> List[Iterable[Any]]
+
+    """Gets the contents of state for each of the state keys, fetching them
+    in a single batch where possible.
+    """
+    return [self.blocking_get(state_key, coder) for state_key in state_keys]
+
   @abc.abstractmethod
   def extend(
       self,
@@ -992,6 +1194,23 @@ class CachingStateHandler(metaclass=abc.ABCMeta):
     # type: () -> None
     raise NotImplementedError(type(self))
 
+  def get_cached_side_input_view(self, state_key):
+    # type: (beam_fn_api_pb2.StateKey) -> Any
+
+    """Returns the materialized view of a side input that was cached by an
+    earlier bundle, or Sentinel.sentinel if there is none.
+
+    The view is shared with other bundles, and must not be modified.
+    """
+    return Sentinel.sentinel
+
+  def cache_side_input_view(self, state_key, view):
+    # type: (beam_fn_api_pb2.StateKey, Any) -> None
+
+    """Offers the materialized view of a side input for use by later bundles.
+    """
+    pass
+
 
 class ThrowingStateHandler(CachingStateHandler):
   """A caching state handler that errors on any requests."""
@@ -1112,6 +1331,23 @@ class GrpcStateHandler(StateHandler):
                 continuation_token=continuation_token)))
     return response.get.data, response.get.continuation_token
 
+  def get_raw_many(
+      self,
+      state_keys,  # type: List[beam_fn_api_pb2.StateKey]
+  ):
+    # type: (...) -> List[Tuple[bytes, Optional[bytes]]]
+    # Send all requests before waiting for any response, so that their round
+    # trips overlap.
+    futures = [
+        self._request(
+            beam_fn_api_pb2.StateRequest(
+                state_key=state_key, get=beam_fn_api_pb2.StateGetRequest()))
+        for state_key in state_keys
+    ]
+    responses = [self._wait_for_response(future) for future in futures]
+    return [(response.get.data, response.get.continuation_token)
+            for response in responses]
+
   def append_raw(
       self,
       state_key,  # type: Optional[beam_fn_api_pb2.StateKey]
@@ -1142,7 +1378,10 @@ class GrpcStateHandler(StateHandler):
 
   def _blocking_request(self, request):
     # type: (beam_fn_api_pb2.StateRequest) -> beam_fn_api_pb2.StateResponse
-    req_future = self._request(request)
+    return self._wait_for_response(self._request(request))
+
+  def _wait_for_response(self, req_future):
+    # type: (_Future[beam_fn_api_pb2.StateResponse]) -> beam_fn_api_pb2.StateResponse
     while not req_future.wait(timeout=1):
       if self._exception:
         raise self._exception
@@ -1235,6 +1474,34 @@ class GlobalCachingStateHandler(CachingStateHandler):
         (cache_state_key, cache_token),
         lambda key: self._partially_cached_iterable(state_key, coder))
 
+  def blocking_get_many(
+      self,
+      state_keys,  # type: List[beam_fn_api_pb2.StateKey]
+      coder,  # type: coder_impl.CoderImpl
+  ):
+    # type: (...) -> List[Iterable[Any]]
+    results = [None] * len(state_keys)  # type: List[Any]
+    cache_keys = []  # type: List[Optional[Tuple[bytes, bytes]]]
+    for ix, state_key in enumerate(state_keys):
+      cache_token = self._get_cache_token(state_key)
+      if cache_token:
+        cache_key = self._convert_to_cache_key(state_key), cache_token
+        results[ix] = self._state_cache.peek(cache_key)
+        cache_keys.append(cache_key)
+      else:
+        cache_keys.append(None)
+
+    missing = [ix for ix, result in enumerate(results) if result is None]
+    if missing:
+      first_pages = self._get_raw_many([state_keys[ix] for ix in missing])
+      for ix, (input_stream, continuation_token) in zip(missing, first_pages):
+        results[ix] = self._materialize_first_page(
+            state_keys[ix], coder, input_stream, continuation_token)
+        cache_key = cache_keys[ix]
+        if cache_key is not None:
+          self._state_cache.put(cache_key, results[ix])
+    return results
+
   def extend(
       self,
       state_key,  # type: beam_fn_api_pb2.StateKey
@@ -1323,8 +1590,30 @@ class GlobalCachingStateHandler(CachingStateHandler):
 
     input_stream = coder_impl.create_InputStream(data)
 
+    self._record_retrieval(start_time, 1)
+    return input_stream, continuation_token
+
+  def _get_raw_many(
+      self,
+      state_keys,  # type: List[beam_fn_api_pb2.StateKey]
+  ):
+    # type: (...) -> List[Tuple[coder_impl.create_InputStream, Optional[bytes]]]
+
+    """Call underlying get_raw_many with performance statistics and detection.
+    """
+    start_time = time.time()
+
+    first_pages = [(coder_impl.create_InputStream(data), continuation_token)
+                   for data, continuation_token in
+                   self._underlying.get_raw_many(state_keys)]
+
+    self._record_retrieval(start_time, len(state_keys))
+    return first_pages
+
+  def _record_retrieval(self, start_time, num_calls):
+    # type: (float, int) -> None
     self._retrieval_time += time.time() - start_time
-    self._get_raw_called += 1
+    self._get_raw_called += num_calls
 
     if self._retrieval_time > self._warn_interval:
       _LOGGER.warning(
@@ -1339,7 +1628,45 @@ class GlobalCachingStateHandler(CachingStateHandler):
       self._get_raw_called = 0
       self._warn_interval *= 2
 
-    return input_stream, continuation_token
+  def get_cached_side_input_view(self, state_key):
+    # type: (beam_fn_api_pb2.StateKey) -> Any
+    cache_token = self._get_side_input_cache_token(state_key)
+    if not cache_token:
+      return Sentinel.sentinel
+    cached_view = self._state_cache.peek(
+        (self._convert_to_side_input_view_cache_key(state_key), cache_token))
+    if cached_view is None:
+      return Sentinel.sentinel
+    return cached_view.view
+
+  def cache_side_input_view(self, state_key, view):
+    # type: (beam_fn_api_pb2.StateKey, Any) -> None
+    cache_token = self._get_side_input_cache_token(state_key)
+    if not cache_token:
+      return
+    # The view supersedes the cached state it was built from.
+    self._state_cache.invalidate(
+        (self._convert_to_cache_key(state_key), cache_token))
+    self._state_cache.put(
+        (self._convert_to_side_input_view_cache_key(state_key), cache_token),
+        statecache.WeightedValue(
+            _CachedSideInputView(view),
+            max(self._state_cache.estimate_weight(view), 1)))
+
+  def _get_side_input_cache_token(self, state_key):
+    # type: (beam_fn_api_pb2.StateKey) -> Optional[bytes]
+
+    """Returns the runner supplied cache token of a side input, if any.
+
+    Unlike _get_cache_token this does not fall back to the bundle cache token,
+    since views are already cached for the duration of a bundle by their
+    side input map.
+    """
+    if not self._state_cache.is_cache_enabled():
+      return None
+    side_input = getattr(state_key, state_key.WhichOneof('type'))  # type: ignore[arg-type]
+    return self._context.side_input_cache_tokens.get(
+        (side_input.transform_id, side_input.side_input_id))
 
   def _get_cache_token(self, state_key):
     # type: (beam_fn_api_pb2.StateKey) -> Optional[bytes]
@@ -1368,6 +1695,17 @@ class GlobalCachingStateHandler(CachingStateHandler):
     of the rest, if any.
     """
     input_stream, continuation_token = self._get_raw(state_key, None)
+    return self._materialize_first_page(
+        state_key, coder, input_stream, continuation_token)
+
+  def _materialize_first_page(
+      self,
+      state_key,  # type: beam_fn_api_pb2.StateKey
+      coder,  # type: coder_impl.CoderImpl
+      input_stream,  # type: coder_impl.create_InputStream
+      continuation_token  # type: Optional[bytes]
+  ):
+    # type: (...) -> Iterable[Any]
     head = []
     while input_stream.size() > 0:
       head.append(coder.decode_from_stream(input_stream, True))
@@ -1405,6 +1743,11 @@ class GlobalCachingStateHandler(CachingStateHandler):
     # type: (beam_fn_api_pb2.StateKey) -> bytes
     return state_key.SerializeToString()
 
+  @staticmethod
+  def _convert_to_side_input_view_cache_key(state_key):
+    # type: (beam_fn_api_pb2.StateKey) -> Tuple[str, bytes]
+    return _SIDE_INPUT_VIEW_CACHE_KEY_PREFIX, state_key.SerializeToString()
+
 
 class _Future(Generic[T]):
   """A simple future object to implement blocking requests.
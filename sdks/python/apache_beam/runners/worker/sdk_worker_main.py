@@ -168,6 +168,7 @@ def create_harness(environment, dry_run=False):
 
   experiments = sdk_pipeline_options.view_as(DebugOptions).experiments or []
   enable_heap_dump = 'enable_heap_dump' in experiments
+  fuse_simple_pardos = 'fuse_simple_pardos' in experiments
 
   beam_plugins = sdk_pipeline_options.view_as(SetupOptions).beam_plugins or []
   _import_beam_plugins(beam_plugins)
@@ -183,6 +184,17 @@ def create_harness(environment, dry_run=False):
       worker_id=_worker_id,
       state_cache_size=_get_state_cache_size_bytes(
           options=sdk_pipeline_options),
+      state_cache_shards=sdk_pipeline_options.view_as(
+          WorkerOptions).state_cache_shards,
+      estimate_state_cache_weights=sdk_pipeline_options.view_as(
+          WorkerOptions).estimate_state_cache_weights,
+      side_input_cache_size=sdk_pipeline_options.view_as(
+          WorkerOptions).max_side_input_cache_memory_usage_mb << 20,
+      prewarm_bundle_processors=sdk_pipeline_options.view_as(
+          WorkerOptions).prewarm_bundle_processors,
+      max_cached_bundle_processors_size=_get_bundle_processor_cache_size_bytes(
+          sdk_pipeline_options),
+      fuse_simple_pardos=fuse_simple_pardos,
       data_buffer_time_limit_ms=_get_data_buffer_time_limit_ms(experiments),
       profiler_factory=profiler.Profile.factory_from_options(
           sdk_pipeline_options.view_as(ProfilingOptions)),
@@ -306,6 +318,20 @@ def _get_state_cache_size_bytes(options):
   return max_cache_memory_usage_mb << 20
 
 
+def _get_bundle_processor_cache_size_bytes(options):
+  """Return the maximum size of the bundle processor cache in bytes.
+
+  Returns:
+    an int indicating the maximum number of bytes to cache, or None if the
+    cache is unbounded.
+  """
+  max_cache_memory_usage_mb = options.view_as(
+      WorkerOptions).max_bundle_processor_cache_memory_usage_mb
+  if max_cache_memory_usage_mb is None:
+    return None
+  return max_cache_memory_usage_mb << 20
+
+
 def _get_data_buffer_time_limit_ms(experiments):
   """Defines the time limt of the outbound data buffering.
 
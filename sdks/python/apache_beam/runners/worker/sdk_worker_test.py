@@ -21,6 +21,7 @@
 
 import contextlib
 import logging
+import time
 import unittest
 from collections import namedtuple
 
@@ -44,6 +45,7 @@ from apache_beam.runners.worker.sdk_worker import BundleProcessorCache
 from apache_beam.runners.worker.sdk_worker import GlobalCachingStateHandler
 from apache_beam.runners.worker.sdk_worker import SdkWorker
 from apache_beam.utils import thread_pool_executor
+from apache_beam.utils.sentinel import Sentinel
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -375,6 +377,58 @@ class SdkWorkerTest(unittest.TestCase):
     self.assertIn(instruction_id, channel._cleaned_instruction_ids)
 
 
+class BundleProcessorCacheTest(unittest.TestCase):
+  def _create_cache(self, **kwargs):
+    bundle_processor_cache = BundleProcessorCache(
+        frozenset(),
+        mock.create_autospec(sdk_worker.GrpcStateHandlerFactory),
+        mock.create_autospec(data_plane.GrpcClientDataChannelFactory),
+        {
+            descriptor_id: beam_fn_api_pb2.ProcessBundleDescriptor(
+                id=descriptor_id)
+            for descriptor_id in ('a', 'b')
+        },
+        **kwargs)
+    self.addCleanup(bundle_processor_cache.shutdown)
+    return bundle_processor_cache
+
+  @mock.patch('apache_beam.runners.worker.bundle_processor.BundleProcessor')
+  def test_prewarm_bundle_processors(self, bundle_processor_cls):
+    bundle_processor_cache = self._create_cache(prewarm_bundle_processors=2)
+    bundle_processor_cache.register(
+        beam_fn_api_pb2.ProcessBundleDescriptor(id='a'))
+    deadline = time.time() + 10
+    while (len(bundle_processor_cache.cached_bundle_processors['a']) < 2 and
+           time.time() < deadline):
+      time.sleep(0.01)
+    self.assertEqual(2, bundle_processor_cls.call_count)
+    bundle_processor_cache.get('instruction_1', 'a')
+    bundle_processor_cache.get('instruction_2', 'a')
+    self.assertEqual(2, bundle_processor_cls.call_count)
+    # Registering the descriptor again does not create more processors.
+    bundle_processor_cache.register(
+        beam_fn_api_pb2.ProcessBundleDescriptor(id='a'))
+    self.assertEqual(2, bundle_processor_cls.call_count)
+
+  @mock.patch('apache_beam.runners.worker.bundle_processor.BundleProcessor')
+  def test_evicts_least_recently_used_descriptors(self, bundle_processor_cls):
+    bundle_processor_cls.side_effect = lambda *args, **kwargs: mock.MagicMock()
+    bundle_processor_cache = self._create_cache(
+        max_cached_bundle_processors_size=250)
+    bundle_processor_cache._estimate_size = lambda processor: 100
+    processor_a = bundle_processor_cache.get('instruction_1', 'a')
+    processor_b1 = bundle_processor_cache.get('instruction_2', 'b')
+    processor_b2 = bundle_processor_cache.get('instruction_3', 'b')
+    bundle_processor_cache.release('instruction_1')
+    bundle_processor_cache.release('instruction_2')
+    self.assertFalse(processor_a.shutdown.called)
+    bundle_processor_cache.release('instruction_3')
+    processor_a.shutdown.assert_called_once_with()
+    self.assertEqual([], bundle_processor_cache.cached_bundle_processors['a'])
+    self.assertEqual([processor_b1, processor_b2],
+                     bundle_processor_cache.cached_bundle_processors['b'])
+
+
 class CachingStateHandlerTest(unittest.TestCase):
   def test_caching(self):
 
@@ -489,6 +543,7 @@ class CachingStateHandlerTest(unittest.TestCase):
     def __init__(self):
       self._encoded_values = []
       self._continuations = False
+      self.get_raw_many_calls = 0
 
     def set_value(self, value, coder):
       self._encoded_values = [coder.encode(value)]
@@ -510,6 +565,10 @@ class CachingStateHandlerTest(unittest.TestCase):
       else:
         return b''.join(self._encoded_values), None
 
+    def get_raw_many(self, state_keys):
+      self.get_raw_many_calls += 1
+      return [self.get_raw(state_key) for state_key in state_keys]
+
     def append_raw(self, _key, bytes):
       self._encoded_values.append(bytes)
 
@@ -611,6 +670,82 @@ class CachingStateHandlerTest(unittest.TestCase):
       self.assertEqual(get_type(), list)
       self.assertEqual(get(), [i for i in range(1000)])
 
+  def test_blocking_get_many(self):
+    underlying_state_handler = self.UnderlyingStateHandler()
+    state_cache = statecache.StateCache(100 << 20)
+    handler = GlobalCachingStateHandler(state_cache, underlying_state_handler)
+
+    coder = VarIntCoder()
+
+    states = [
+        beam_fn_api_pb2.StateKey(
+            bag_user_state=beam_fn_api_pb2.StateKey.BagUserState(
+                user_state_id='state%d' % i)) for i in range(3)
+    ]
+    cache_token = beam_fn_api_pb2.ProcessBundleRequest.CacheToken(
+        token=b'state_token1',
+        user_state=beam_fn_api_pb2.ProcessBundleRequest.CacheToken.UserState())
+
+    def get_many():
+      return [
+          list(values)
+          for values in handler.blocking_get_many(states, coder.get_impl())
+      ]
+
+    underlying_state_handler.set_values([1, 2], coder)
+    with handler.process_instruction_id('bundle', [cache_token]):
+      self.assertEqual([1, 2],
+                       list(handler.blocking_get(states[0], coder.get_impl())))
+      # Only the states that are not cached yet are fetched, in one batch.
+      self.assertEqual([[1, 2]] * 3, get_many())
+      self.assertEqual(1, underlying_state_handler.get_raw_many_calls)
+      self.assertEqual(3, state_cache.size())
+      self.assertEqual([[1, 2]] * 3, get_many())
+      self.assertEqual(1, underlying_state_handler.get_raw_many_calls)
+
+  def test_side_input_view_caching(self):
+    underlying_state_handler = self.UnderlyingStateHandler()
+    state_cache = statecache.StateCache(100 << 20)
+    handler = GlobalCachingStateHandler(state_cache, underlying_state_handler)
+
+    coder = VarIntCoder()
+
+    side = beam_fn_api_pb2.StateKey(
+        iterable_side_input=beam_fn_api_pb2.StateKey.IterableSideInput(
+            transform_id='transform', side_input_id='side'))
+    side_token = beam_fn_api_pb2.ProcessBundleRequest.CacheToken(
+        token=b'side_token',
+        side_input=beam_fn_api_pb2.ProcessBundleRequest.CacheToken.SideInput(
+            transform_id='transform', side_input_id='side'))
+
+    underlying_state_handler.set_values([1, 2, 3], coder)
+    with handler.process_instruction_id('bundle1', []):
+      # Without a side input cache token views are not cached.
+      handler.cache_side_input_view(side, {'view': 1})
+      self.assertIs(Sentinel.sentinel, handler.get_cached_side_input_view(side))
+
+    with handler.process_instruction_id('bundle2', [side_token]):
+      self.assertEqual(
+          list(handler.blocking_get(side, coder.get_impl())), [1, 2, 3])
+      self.assertEqual(1, state_cache.size())
+      handler.cache_side_input_view(side, {'view': 2})
+      # The view replaces the state it was built from.
+      self.assertEqual(1, state_cache.size())
+      self.assertEqual({'view': 2}, handler.get_cached_side_input_view(side))
+
+    with handler.process_instruction_id('bundle3', [side_token]):
+      view = handler.get_cached_side_input_view(side)
+      self.assertEqual({'view': 2}, view)
+      # The view is shared, rather than copied for each bundle.
+      self.assertIs(view, handler.get_cached_side_input_view(side))
+
+    side_token.token = b'side_token2'
+    with handler.process_instruction_id('bundle4', [side_token]):
+      self.assertIs(Sentinel.sentinel, handler.get_cached_side_input_view(side))
+      # None is a legal view, e.g. of an AsSingleton side input.
+      handler.cache_side_input_view(side, None)
+      self.assertIsNone(handler.get_cached_side_input_view(side))
+
 
 class ShortIdCacheTest(unittest.TestCase):
   def testShortIdAssignment(self):
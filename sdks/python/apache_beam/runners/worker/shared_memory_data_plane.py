@@ -0,0 +1,475 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A ``DataChannel`` over shared memory, for workers on the same host.
+
+Each direction of a channel is a ring buffer in a shared memory segment, with
+a single writer and a single reader. Data and timers are written to it as
+frames holding their ids and encoded payload, so that they are neither
+serialized as protobuf messages nor sent through a socket.
+
+The runner creates the channel, and passes its url to the worker as the url of
+the data api service descriptor::
+
+  channel = SharedMemoryDataChannel.create()
+  descriptor = endpoints_pb2.ApiServiceDescriptor(url=channel.url)
+
+The worker connects to the channel through a SharedMemoryDataChannelFactory.
+
+The rings rely on the host ordering memory stores as they are issued, so that
+the reader never sees a write position before the bytes written ahead of it.
+Python offers no fences or atomics to enforce this, and the two processes
+share no lock, so the channel is only supported on x86 hosts, whose total
+store order guarantees it. Rings refuse to be created on any other host, see
+is_supported().
+"""
+
+# pytype: skip-file
+# mypy: disallow-untyped-defs
+
+import logging
+import platform
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from typing import Set
+from typing import Union
+
+from apache_beam.coders import coder_impl
+from apache_beam.portability.api import beam_fn_api_pb2
+from apache_beam.runners.worker import data_plane
+
+_LOGGER = logging.getLogger(__name__)
+
+SHARED_MEMORY_URL_PREFIX = 'shm://'
+
+_DEFAULT_RING_CAPACITY = 64 << 20  # 64MB
+# The header of a ring holds its write position, read position and capacity.
+_HEADER_SIZE = 64
+_WRITE_POS = 0
+_READ_POS = 1
+_CAPACITY = 2
+# The time to wait for the peer to make room for the end of stream marker.
+_CLOSE_TIMEOUT_SECS = 5
+# The longest time to sleep between polls of the peer. The sleeps grow to it
+# over the first seconds in which the peer makes no progress, so that idle
+# channels wake up rarely, at the cost of some latency for the first data
+# after a pause.
+_MAX_POLL_INTERVAL_SECS = 0.01
+# The machines with total store order, see is_supported().
+_TOTAL_STORE_ORDER_MACHINES = frozenset(
+    ['x86_64', 'amd64', 'x86', 'i386', 'i486', 'i586', 'i686'])
+
+_FRAME_HEADER_LENGTH = struct.Struct('>I')
+_DATA = 0
+_DATA_LAST = 1
+_TIMERS = 2
+_TIMERS_LAST = 3
+_WRITES_FINISHED = 4
+
+# The names of the segments created by this process.
+_created_segment_names = set()  # type: Set[str]
+
+
+def is_supported():
+  # type: () -> bool
+
+  """Returns whether shared memory data channels can be used on this host."""
+  return platform.machine().lower() in _TOTAL_STORE_ORDER_MACHINES
+
+
+def _check_supported():
+  # type: () -> None
+  if not is_supported():
+    raise NotImplementedError(
+        'Shared memory data channels are not supported on %s hosts, which '
+        'may reorder memory stores.' % platform.machine())
+
+
+def _attach(name):
+  # type: (str) -> shared_memory.SharedMemory
+
+  """Attaches to a segment, which the process that created it unlinks."""
+  try:
+    return shared_memory.SharedMemory(  # type: ignore[call-arg]
+        name=name, track=False)
+  except TypeError:
+    # Before Python 3.13, attached segments are tracked as if they were
+    # created by this process, and would be unlinked when it exits.
+    # pylint: disable=wrong-import-order, wrong-import-position
+    from multiprocessing import resource_tracker
+    segment = shared_memory.SharedMemory(name=name)
+    if name not in _created_segment_names:
+      resource_tracker.unregister(
+          segment._name, 'shared_memory')  # type: ignore[attr-defined]
+    return segment
+
+
+class _SharedMemoryRing(object):
+  """A byte ring buffer in shared memory, with one writer and one reader.
+
+  The writer and the reader poll the positions of each other, which only grow,
+  backing off to sleeps of up to _MAX_POLL_INTERVAL_SECS while they cannot make
+  progress.
+
+  The writer copies bytes into the ring before it stores the write position
+  that publishes them, and the reader copies bytes out before it stores the
+  read position that frees them. Each position is an aligned 8 byte store, so
+  the peer never sees a torn value. The copy and the store are separate calls
+  into the interpreter, which the compiler cannot reorder, and total store
+  order keeps the peer from seeing the store before the copied bytes. Without
+  it, the peer could read stale bytes, so rings can only be used on hosts
+  with total store order.
+  """
+  def __init__(self, segment):
+    # type: (shared_memory.SharedMemory) -> None
+    _check_supported()
+    self._header = segment.buf[:_HEADER_SIZE].cast('Q')
+    self._capacity = self._header[_CAPACITY]
+    self._data = segment.buf[_HEADER_SIZE:_HEADER_SIZE + self._capacity]
+
+  @staticmethod
+  def initialize(segment, capacity):
+    # type: (shared_memory.SharedMemory, int) -> None
+    header = segment.buf[:_HEADER_SIZE].cast('Q')
+    header[_WRITE_POS] = 0
+    header[_READ_POS] = 0
+    header[_CAPACITY] = capacity
+    header.release()
+
+  def release(self):
+    # type: () -> None
+    self._header.release()
+    self._data.release()
+
+  @staticmethod
+  def _wait(attempt, should_abort):
+    # type: (int, Callable[[], bool]) -> None
+    if should_abort():
+      raise RuntimeError('Shared memory data channel closed.')
+    time.sleep(
+        0 if attempt < 100 else min(1e-5 * attempt, _MAX_POLL_INTERVAL_SECS))
+
+  def write(self, data, should_abort):
+    # type: (bytes, Callable[[], bool]) -> None
+    view = memoryview(data)
+    write_pos = self._header[_WRITE_POS]
+    pos = attempt = 0
+    while pos < len(view):
+      free = self._capacity - (write_pos - self._header[_READ_POS])
+      if not free:
+        attempt += 1
+        self._wait(attempt, should_abort)
+        continue
+      attempt = 0
+      offset = write_pos % self._capacity
+      n = min(free, len(view) - pos, self._capacity - offset)
+      self._data[offset:offset + n] = view[pos:pos + n]
+      pos += n
+      write_pos += n
+      # Publish the written bytes to the reader. This relies on total store
+      # order, see the class docstring.
+      self._header[_WRITE_POS] = write_pos
+
+  def read(self, size, should_abort):
+    # type: (int, Callable[[], bool]) -> bytes
+    read_pos = self._header[_READ_POS]
+    offset = read_pos % self._capacity
+    if (self._header[_WRITE_POS] - read_pos >= size and
+        offset + size <= self._capacity):
+      # Copy contiguous, available bytes at once.
+      result = bytes(self._data[offset:offset + size])
+      self._header[_READ_POS] = read_pos + size
+      return result
+    buffer = bytearray(size)
+    pos = attempt = 0
+    while pos < size:
+      available = self._header[_WRITE_POS] - read_pos
+      if not available:
+        attempt += 1
+        self._wait(attempt, should_abort)
+        continue
+      attempt = 0
+      offset = read_pos % self._capacity
+      n = min(available, size - pos, self._capacity - offset)
+      buffer[pos:pos + n] = self._data[offset:offset + n]
+      pos += n
+      read_pos += n
+      # Free the read bytes for the writer. This relies on total store order,
+      # see the class docstring.
+      self._header[_READ_POS] = read_pos
+    return bytes(buffer)
+
+
+class SharedMemoryDataChannel(data_plane.QueuingDataChannel):
+  """A DataChannel between two processes on the same host.
+
+  It reads from one shared memory ring buffer, and writes to another. Received
+  data and timers are queued per instruction, as by the gRPC data channels.
+  Unlike them, the channel stops reading once it is closed.
+  """
+  def __init__(
+      self,
+      outbound,  # type: shared_memory.SharedMemory
+      inbound,  # type: shared_memory.SharedMemory
+      data_buffer_time_limit_ms=0,  # type: int
+      owner=False  # type: bool
+  ):
+    # type: (...) -> None
+    super().__init__(data_buffer_time_limit_ms)
+    self._segments = (outbound, inbound)
+    self._owner = owner
+    self._outbound = _SharedMemoryRing(outbound)
+    self._inbound = _SharedMemoryRing(inbound)
+    self._write_lock = threading.Lock()
+    self._stopped = threading.Event()
+    self._reader = threading.Thread(
+        target=lambda: self._read_data_and_timers(self._read_frames()),
+        name='read_shared_memory_inputs')
+    self._reader.daemon = True
+    self._reader.start()
+
+  @classmethod
+  def create(
+      cls,
+      capacity=_DEFAULT_RING_CAPACITY,  # type: int
+      data_buffer_time_limit_ms=0  # type: int
+  ):
+    # type: (...) -> SharedMemoryDataChannel
+
+    """Creates a channel, and the shared memory segments it owns."""
+    _check_supported()
+    segments = []
+    for _ in range(2):
+      segment = shared_memory.SharedMemory(
+          create=True, size=_HEADER_SIZE + capacity)
+      _SharedMemoryRing.initialize(segment, capacity)
+      _created_segment_names.add(segment.name)
+      segments.append(segment)
+    return cls(
+        segments[0],
+        segments[1],
+        data_buffer_time_limit_ms=data_buffer_time_limit_ms,
+        owner=True)
+
+  @classmethod
+  def connect(cls, url, data_buffer_time_limit_ms=0):
+    # type: (str, int) -> SharedMemoryDataChannel
+
+    """Connects to the other end of the channel with the given url."""
+    assert url.startswith(SHARED_MEMORY_URL_PREFIX), url
+    inbound_name, outbound_name = url[len(SHARED_MEMORY_URL_PREFIX):].split(',')
+    return cls(
+        _attach(outbound_name),
+        _attach(inbound_name),
+        data_buffer_time_limit_ms=data_buffer_time_limit_ms)
+
+  @property
+  def url(self):
+    # type: () -> str
+    outbound, inbound = self._segments
+    return '%s%s,%s' % (SHARED_MEMORY_URL_PREFIX, outbound.name, inbound.name)
+
+  def _write_frame(
+      self,
+      kind,  # type: int
+      instruction_id='',  # type: str
+      transform_id='',  # type: str
+      timer_family_id='',  # type: str
+      payload=b'',  # type: bytes
+      should_abort=None  # type: Optional[Callable[[], bool]]
+  ):
+    # type: (...) -> None
+    out = coder_impl.create_OutputStream()
+    out.write_byte(kind)
+    out.write(instruction_id.encode('utf-8'), True)
+    out.write(transform_id.encode('utf-8'), True)
+    out.write(timer_family_id.encode('utf-8'), True)
+    out.write_var_int64(len(payload))
+    header = out.get()
+    with self._write_lock:
+      should_abort = should_abort or self._stopped.is_set
+      self._outbound.write(
+          _FRAME_HEADER_LENGTH.pack(len(header)) + header, should_abort)
+      if payload:
+        self._outbound.write(payload, should_abort)
+
+  def _read_frames(self):
+    # type: () -> Iterator[Union[beam_fn_api_pb2.Elements.Data, beam_fn_api_pb2.Elements.Timers]]
+    should_abort = self._stopped.is_set
+    while True:
+      header_length, = _FRAME_HEADER_LENGTH.unpack(
+          self._inbound.read(_FRAME_HEADER_LENGTH.size, should_abort))
+      header = coder_impl.create_InputStream(
+          self._inbound.read(header_length, should_abort))
+      kind = header.read_byte()
+      instruction_id = header.read_all(True).decode('utf-8')
+      transform_id = header.read_all(True).decode('utf-8')
+      timer_family_id = header.read_all(True).decode('utf-8')
+      payload_length = header.read_var_int64()
+      payload = (
+          self._inbound.read(payload_length, should_abort)
+          if payload_length else b'')
+      if kind == _WRITES_FINISHED:
+        return
+      elif kind in (_DATA, _DATA_LAST):
+        yield beam_fn_api_pb2.Elements.Data(
+            instruction_id=instruction_id,
+            transform_id=transform_id,
+            data=payload,
+            is_last=kind == _DATA_LAST)
+      elif kind in (_TIMERS, _TIMERS_LAST):
+        yield beam_fn_api_pb2.Elements.Timers(
+            instruction_id=instruction_id,
+            transform_id=transform_id,
+            timer_family_id=timer_family_id,
+            timers=payload,
+            is_last=kind == _TIMERS_LAST)
+      else:
+        raise ValueError('Unexpected frame kind %s' % kind)
+
+  def output_stream(self, instruction_id, transform_id):
+    # type: (str, str) -> data_plane.ClosableOutputStream
+    def write_data(data):
+      # type: (bytes) -> None
+      if data:
+        self._write_frame(_DATA, instruction_id, transform_id, payload=data)
+
+    def close_callback(data):
+      # type: (bytes) -> None
+      write_data(data)
+      self._write_frame(_DATA_LAST, instruction_id, transform_id)
+
+    return data_plane.ClosableOutputStream.create(
+        close_callback,
+        write_data,
+        self._data_buffer_time_limit_ms,
+        flusher=self._flusher)
+
+  def output_timer_stream(
+      self,
+      instruction_id,  # type: str
+      transform_id,  # type: str
+      timer_family_id  # type: str
+  ):
+    # type: (...) -> data_plane.ClosableOutputStream
+    def write_timers(timers):
+      # type: (bytes) -> None
+      if timers:
+        self._write_frame(
+            _TIMERS,
+            instruction_id,
+            transform_id,
+            timer_family_id,
+            payload=timers)
+
+    def close_callback(timers):
+      # type: (bytes) -> None
+      write_timers(timers)
+      self._write_frame(
+          _TIMERS_LAST, instruction_id, transform_id, timer_family_id)
+
+    return data_plane.ClosableOutputStream.create(
+        close_callback,
+        write_timers,
+        self._data_buffer_time_limit_ms,
+        flusher=self._flusher)
+
+  def close(self):
+    # type: () -> None
+    if self._stopped.is_set():
+      return
+    if self._flusher is not None:
+      self._flusher.stop()
+    deadline = time.time() + _CLOSE_TIMEOUT_SECS
+    try:
+      self._write_frame(
+          _WRITES_FINISHED, should_abort=lambda: time.time() > deadline)
+    except RuntimeError:
+      _LOGGER.warning(
+          'Timed out writing the end of the shared memory data channel.')
+    self._closed = True
+    self._stopped.set()
+    self._reader.join(_CLOSE_TIMEOUT_SECS)
+    self._outbound.release()
+    self._inbound.release()
+    for segment in self._segments:
+      segment.close()
+      if self._owner:
+        # The peer keeps its mapping of the segment until it closes it.
+        segment.unlink()
+        _created_segment_names.discard(segment.name)
+
+
+class SharedMemoryDataChannelFactory(data_plane.DataChannelFactory):
+  """A factory for ``SharedMemoryDataChannel``.
+
+  Connects to the channels with shared memory urls, caching them by url, and
+  creates the channels for any other url with the given factory.
+  """
+  def __init__(
+      self,
+      fallback_factory,  # type: data_plane.DataChannelFactory
+      data_buffer_time_limit_ms=0  # type: int
+  ):
+    # type: (...) -> None
+    self._fallback_factory = fallback_factory
+    self._data_buffer_time_limit_ms = data_buffer_time_limit_ms
+    self._data_channel_cache = {}  # type: Dict[str, SharedMemoryDataChannel]
+    self._lock = threading.Lock()
+
+  def _connect(self, url):
+    # type: (str) -> SharedMemoryDataChannel
+    with self._lock:
+      if url not in self._data_channel_cache:
+        _LOGGER.info('Connecting to shared memory data channel %s', url)
+        self._data_channel_cache[url] = SharedMemoryDataChannel.connect(
+            url, self._data_buffer_time_limit_ms)
+      return self._data_channel_cache[url]
+
+  def create_data_channel_from_url(self, url):
+    # type: (str) -> Optional[data_plane.DataChannel]
+    if not url.startswith(SHARED_MEMORY_URL_PREFIX):
+      return self._fallback_factory.create_data_channel_from_url(url)
+    return self._connect(url)
+
+  def create_data_channel(self, remote_grpc_port):
+    # type: (beam_fn_api_pb2.RemoteGrpcPort) -> data_plane.DataChannel
+    url = remote_grpc_port.api_service_descriptor.url
+    if not url.startswith(SHARED_MEMORY_URL_PREFIX):
+      return self._fallback_factory.create_data_channel(remote_grpc_port)
+    return self._connect(url)
+
+  def close(self):
+    # type: () -> None
+    with self._lock:
+      channels = list(self._data_channel_cache.values())
+      self._data_channel_cache.clear()
+    for channel in channels:
+      channel.close()
+    self._fallback_factory.close()
+
+  def cleanup(self, instruction_id):
+    # type: (str) -> None
+    for channel in list(self._data_channel_cache.values()):
+      channel._clean_receiving_queue(instruction_id)
+    self._fallback_factory.cleanup(instruction_id)
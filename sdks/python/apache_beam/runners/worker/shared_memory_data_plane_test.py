@@ -0,0 +1,151 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for apache_beam.runners.worker.shared_memory_data_plane."""
+
+# pytype: skip-file
+
+import logging
+import threading
+import unittest
+
+import mock
+
+from apache_beam.portability.api import beam_fn_api_pb2
+from apache_beam.portability.api import endpoints_pb2
+from apache_beam.runners.worker import data_plane
+from apache_beam.runners.worker import shared_memory_data_plane
+from apache_beam.runners.worker.shared_memory_data_plane import SharedMemoryDataChannel
+
+
+@unittest.skipIf(
+    not shared_memory_data_plane.is_supported(),
+    'Shared memory data channels are not supported on this host.')
+class SharedMemoryDataChannelTest(unittest.TestCase):
+  def setUp(self):
+    # A small ring exercises writes that wait for the reader, and reads and
+    # writes that wrap around.
+    self.runner_channel = SharedMemoryDataChannel.create(capacity=1000)
+    self.worker_channel = SharedMemoryDataChannel.connect(
+        self.runner_channel.url)
+
+  def tearDown(self):
+    self.worker_channel.close()
+    self.runner_channel.close()
+
+  def _test_one_direction(self, from_channel, to_channel):
+    def write():
+      stream1 = from_channel.output_stream('0', 'a')
+      stream2 = from_channel.output_stream('0', 'b')
+      stream1.write(b'abc')
+      stream1.flush()
+      stream2.write(b'x' * 3000)
+      stream2.close()
+      stream1.write(b'def')
+      stream1.close()
+      timer_stream = from_channel.output_timer_stream('0', 'a', 'timers')
+      timer_stream.write(b'timer')
+      timer_stream.close()
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    elements = list(to_channel.input_elements('0', ['a', 'b', ('a', 'timers')]))
+    writer.join()
+
+    self.assertEqual([
+        beam_fn_api_pb2.Elements.Data(
+            instruction_id='0', transform_id='a', data=b'abc'),
+        beam_fn_api_pb2.Elements.Data(
+            instruction_id='0', transform_id='b', data=b'x' * 3000),
+        beam_fn_api_pb2.Elements.Data(
+            instruction_id='0', transform_id='a', data=b'def'),
+        beam_fn_api_pb2.Elements.Timers(
+            instruction_id='0',
+            transform_id='a',
+            timer_family_id='timers',
+            timers=b'timer'),
+    ],
+                     elements)
+
+  def test_runner_to_worker(self):
+    self._test_one_direction(self.runner_channel, self.worker_channel)
+
+  def test_worker_to_runner(self):
+    self._test_one_direction(self.worker_channel, self.runner_channel)
+
+  def test_close_ends_reads_of_peer(self):
+    self.worker_channel.close()
+    self.assertTrue(self.runner_channel._reads_finished.wait(10))
+
+
+class SharedMemoryRingTest(unittest.TestCase):
+  def test_polling_backs_off_while_idle(self):
+    with mock.patch('time.sleep') as sleep:
+      for attempt in (1, 99, 100, 500, 1000, 100000):
+        shared_memory_data_plane._SharedMemoryRing._wait(attempt, lambda: False)
+    self.assertEqual([0, 0, 1e-3, 5e-3, 1e-2, 1e-2],
+                     [call[0][0] for call in sleep.call_args_list])
+
+  def test_wait_aborts(self):
+    with self.assertRaises(RuntimeError):
+      shared_memory_data_plane._SharedMemoryRing._wait(1, lambda: True)
+
+  def test_supported_machines(self):
+    with mock.patch('platform.machine', return_value='x86_64'):
+      self.assertTrue(shared_memory_data_plane.is_supported())
+    with mock.patch('platform.machine', return_value='aarch64'):
+      self.assertFalse(shared_memory_data_plane.is_supported())
+      with self.assertRaises(NotImplementedError):
+        SharedMemoryDataChannel.create()
+      # The rings themselves rely on total store order, see _SharedMemoryRing.
+      with self.assertRaises(NotImplementedError):
+        shared_memory_data_plane._SharedMemoryRing(mock.Mock())
+
+
+@unittest.skipIf(
+    not shared_memory_data_plane.is_supported(),
+    'Shared memory data channels are not supported on this host.')
+class SharedMemoryDataChannelFactoryTest(unittest.TestCase):
+  def test_create_data_channel(self):
+    runner_channel = SharedMemoryDataChannel.create(capacity=1000)
+    fallback_channel = data_plane.InMemoryDataChannel()
+    factory = shared_memory_data_plane.SharedMemoryDataChannelFactory(
+        data_plane.InMemoryDataChannelFactory(fallback_channel))
+    try:
+      channel = factory.create_data_channel(
+          beam_fn_api_pb2.RemoteGrpcPort(
+              api_service_descriptor=endpoints_pb2.ApiServiceDescriptor(
+                  url=runner_channel.url)))
+      self.assertIsInstance(channel, SharedMemoryDataChannel)
+      self.assertIs(
+          channel, factory.create_data_channel_from_url(runner_channel.url))
+      self.assertIs(
+          fallback_channel, factory.create_data_channel_from_url('fake'))
+      self.assertIs(
+          fallback_channel,
+          factory.create_data_channel(
+              beam_fn_api_pb2.RemoteGrpcPort(
+                  api_service_descriptor=endpoints_pb2.ApiServiceDescriptor(
+                      url='fake'))))
+    finally:
+      factory.close()
+      runner_channel.close()
+
+
+if __name__ == '__main__':
+  logging.getLogger().setLevel(logging.INFO)
+  unittest.main()
@@ -21,6 +21,7 @@
 
 import collections
 import gc
+import itertools
 import logging
 import sys
 import threading
@@ -29,7 +30,10 @@ import types
 import weakref
 from typing import Any
 from typing import Callable
+from typing import Iterable
 from typing import List
+from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Union
 
@@ -49,6 +53,12 @@ _TYPES_TO_NOT_MEASURE = (
     # Do not measure weak references as they will be deleted and not counted
     *weakref.ProxyTypes,
     weakref.ReferenceType)
+# Types that are sized without traversing their referents.
+_PRIMITIVE_TYPES = frozenset(
+    (bytes, bytearray, str, int, float, bool, complex, type(None)))
+# Lists and tuples with more elements are sized from a sample of them.
+_SAMPLING_THRESHOLD = 1000
+_SAMPLE_SIZE = 100
 
 
 class WeightedValue(object):
@@ -157,15 +167,57 @@ def _filter_func(o: Any) -> bool:
   return not _safe_isinstance(o, _TYPES_TO_NOT_MEASURE)
 
 
-def get_deep_size(*objs: Any) -> int:
-  """Calculates the deep size of all the arguments in bytes."""
+def get_deep_size(*objs: Any, exclude: Optional[Iterable[Any]] = None) -> int:
+  """Calculates the deep size of all the arguments in bytes.
+
+  Objects in exclude, and the objects only reachable through them, are not
+  measured.
+  """
   return objsize.get_deep_size(
       *objs,
+      exclude=exclude,
       get_size_func=_size_func,
       get_referents_func=_get_referents_func,
       filter_func=_filter_func)
 
 
+def _sample_elements(values: Sequence[Any]) -> Tuple[Sequence[Any], float]:
+  """Returns evenly spaced elements, and the factor scaling their size to all
+  elements."""
+  if len(values) <= _SAMPLING_THRESHOLD:
+    return values, 1.0
+  step = len(values) / _SAMPLE_SIZE
+  return [values[int(i * step)] for i in range(_SAMPLE_SIZE)], step
+
+
+def estimate_size(obj: Any) -> int:
+  """Estimates the deep size of an object in bytes, cheaper than get_deep_size.
+
+  Primitives and lists or tuples of primitives are sized without traversing
+  the object graph, and long lists, tuples or dicts are sized from a sample of
+  their elements. Other objects are sized with get_deep_size. Objects shared
+  between elements, such as small ints, may be counted more than once.
+  """
+  obj_type = type(obj)
+  if obj_type in _PRIMITIVE_TYPES:
+    # Like get_deep_size, do not count the None singleton.
+    return 0 if obj is None else _size_func(obj)
+  if obj_type is list or obj_type is tuple:
+    elements, scale = _sample_elements(obj)
+    if scale == 1.0 and not all(type(element) in _PRIMITIVE_TYPES
+                                for element in elements):
+      return get_deep_size(obj)
+    return _size_func(obj) + int(
+        scale * sum(estimate_size(element) for element in elements))
+  if obj_type is dict and len(obj) > _SAMPLING_THRESHOLD:
+    # Dicts can not be indexed, so their first items are sampled.
+    return _size_func(obj) + int(
+        len(obj) / _SAMPLE_SIZE * sum(
+            estimate_size(key) + estimate_size(value)
+            for key, value in itertools.islice(obj.items(), _SAMPLE_SIZE)))
+  return get_deep_size(obj)
+
+
 class _LoadingValue(WeightedValue):
   """Allows concurrent users of the cache to wait for a value to be loaded."""
   def __init__(self) -> None:
@@ -188,6 +240,32 @@ class _LoadingValue(WeightedValue):
     return self._value
 
 
+class _ContentionTrackingLock(object):
+  """A reentrant lock that counts how many acquisitions had to wait."""
+  def __init__(self) -> None:
+    self._lock = threading.RLock()
+    self.acquire_count = 0
+    self.contended_count = 0
+
+  def acquire(self, blocking: bool = True) -> bool:
+    if not self._lock.acquire(blocking=False):
+      if not blocking:
+        return False
+      self._lock.acquire()
+      self.contended_count += 1
+    self.acquire_count += 1
+    return True
+
+  def release(self) -> None:
+    self._lock.release()
+
+  def __enter__(self) -> bool:
+    return self.acquire()
+
+  def __exit__(self, *unused_exc_info: Any) -> None:
+    self.release()
+
+
 class StateCache(object):
   """LRU cache for Beam state access, scoped by state key and cache_token.
      Assumes a bag state implementation.
@@ -209,10 +287,16 @@ class StateCache(object):
   The operations on the cache are thread-safe for use by multiple workers.
 
   :arg max_weight The maximum weight of entries to store in the cache in bytes.
+  :arg weight_estimator Returns the weight of values that are not a
+  WeightedValue. Defaults to get_deep_size, estimate_size is cheaper.
   """
-  def __init__(self, max_weight: int) -> None:
+  def __init__(
+      self,
+      max_weight: int,
+      weight_estimator: Callable[[Any], int] = get_deep_size) -> None:
     _LOGGER.info('Creating state cache with size %s', max_weight)
     self._max_weight = max_weight
+    self._weight_estimator = weight_estimator
     self._current_weight = 0
     self._cache: collections.OrderedDict[
         Any, WeightedValue] = collections.OrderedDict()
@@ -221,7 +305,7 @@ class StateCache(object):
     self._evict_count = 0
     self._load_time_ns = 0
     self._load_count = 0
-    self._lock = threading.RLock()
+    self._lock = _ContentionTrackingLock()
 
   def peek(self, key: Any) -> Any:
     assert self.is_cache_enabled()
@@ -282,7 +366,7 @@ class StateCache(object):
 
     # Replace the value in the cache with a weighted value now that the
     # loading has completed successfully.
-    weight = get_deep_size(value)
+    weight = self._weight_estimator(value)
     if weight <= 0:
       _LOGGER.warning(
           'Expected object size to be >= 0 for %s but received %d.',
@@ -311,10 +395,14 @@ class StateCache(object):
 
     return value.value()
 
+  def estimate_weight(self, value: Any) -> int:
+    """Returns the weight of a value, as estimated by the weight_estimator."""
+    return self._weight_estimator(value)
+
   def put(self, key: Any, value: Any) -> None:
     assert self.is_cache_enabled()
     if not _safe_isinstance(value, WeightedValue):
-      weight = get_deep_size(value)
+      weight = self._weight_estimator(value)
       if weight <= 0:
         _LOGGER.warning(
             'Expected object size to be >= 0 for %s but received %d.',
@@ -370,3 +458,97 @@ class StateCache(object):
   def size(self) -> int:
     with self._lock:
       return len(self._cache)
+
+
+class ShardedStateCache(StateCache):
+  """A StateCache striped over shards that each have their own lock and LRU.
+
+  Keys are assigned to shards by hash, so that concurrent bundle threads
+  mostly contend on different locks. The max_weight budget is split evenly
+  across the shards, which evict their own least recently used entries once
+  they exceed their share, without any lock shared between shards. Eviction
+  is thus least recently used within a shard, but only approximately so
+  across shards, and an entry that weighs more than a shard's share of the
+  budget is not cached.
+
+  :arg max_weight The maximum weight of entries to store in the cache in bytes.
+  :arg num_shards The number of independently locked shards.
+  :arg weight_estimator Returns the weight of values that are not a
+  WeightedValue. Defaults to get_deep_size, estimate_size is cheaper.
+  """
+  def __init__(
+      self,
+      max_weight: int,
+      num_shards: int,
+      weight_estimator: Callable[[Any], int] = get_deep_size) -> None:
+    if num_shards < 1:
+      raise ValueError(
+          'Expected num_shards to be >= 1 but received %d' % num_shards)
+    super().__init__(max_weight, weight_estimator)
+    shard_weight, remainder = divmod(max_weight, num_shards)
+    self._shards = [
+        StateCache(shard_weight + (i < remainder), weight_estimator)
+        for i in range(num_shards)
+    ]
+
+  def _shard(self, key: Any) -> StateCache:
+    return self._shards[hash(key) % len(self._shards)]
+
+  def peek(self, key: Any) -> Any:
+    assert self.is_cache_enabled()
+    return self._shard(key).peek(key)
+
+  def get(self, key: Any, loading_fn: Callable[[Any], Any]) -> Any:
+    assert self.is_cache_enabled() and callable(loading_fn)
+    return self._shard(key).get(key, loading_fn)
+
+  def put(self, key: Any, value: Any) -> None:
+    assert self.is_cache_enabled()
+    self._shard(key).put(key, value)
+
+  def invalidate(self, key: Any) -> None:
+    assert self.is_cache_enabled()
+    self._shard(key).invalidate(key)
+
+  def invalidate_all(self) -> None:
+    for shard in self._shards:
+      shard.invalidate_all()
+
+  def describe_stats(self) -> str:
+    hit_count = miss_count = evict_count = load_count = load_time_ns = 0
+    current_weight = acquire_count = contended_count = 0
+    for shard in self._shards:
+      with shard._lock:
+        hit_count += shard._hit_count
+        miss_count += shard._miss_count
+        evict_count += shard._evict_count
+        load_count += shard._load_count
+        load_time_ns += shard._load_time_ns
+        current_weight += shard._current_weight
+        acquire_count += shard._lock.acquire_count
+        contended_count += shard._lock.contended_count
+    request_count = hit_count + miss_count
+    if request_count > 0:
+      hit_ratio = 100.0 * hit_count / request_count
+    else:
+      hit_ratio = 100.0
+    if acquire_count > 0:
+      contention_ratio = 100.0 * contended_count / acquire_count
+    else:
+      contention_ratio = 0.0
+    return (
+        'used/max %d/%d MB, hit %.2f%%, lookups %d, '
+        'avg load time %.0f ns, loads %d, evictions %d, '
+        'shards %d, lock contention %.2f%%') % (
+            current_weight >> 20,
+            self._max_weight >> 20,
+            hit_ratio,
+            request_count,
+            load_time_ns / load_count if load_count > 0 else 0,
+            load_count,
+            evict_count,
+            len(self._shards),
+            contention_ratio)
+
+  def size(self) -> int:
+    return sum(shard.size() for shard in self._shards)
@@ -31,9 +31,11 @@ from hamcrest import assert_that
 from hamcrest import contains_string
 
 from apache_beam.runners.worker.statecache import CacheAware
+from apache_beam.runners.worker.statecache import ShardedStateCache
 from apache_beam.runners.worker.statecache import StateCache
 from apache_beam.runners.worker.statecache import WeightedValue
 from apache_beam.runners.worker.statecache import _LoadingValue
+from apache_beam.runners.worker.statecache import estimate_size
 from apache_beam.runners.worker.statecache import get_deep_size
 
 
@@ -412,6 +414,129 @@ class StateCacheTest(unittest.TestCase):
 
     self.assertEqual(get_cache._current_weight, put_cache._current_weight)
 
+  def test_default_weight_estimator(self):
+    values = [{'key': i} for i in range(2000)]
+    cache = StateCache(100 << 20)
+    cache.put("key", values)
+    self.assertEqual(cache._current_weight, get_deep_size(values))
+    self.assertEqual(cache.estimate_weight(values), get_deep_size(values))
+
+  def test_custom_weight_estimator(self):
+    cache = StateCache(5 << 20, weight_estimator=lambda value: 2 << 20)
+    cache.put("key", "value")
+    cache.get("key2", lambda key: "value2")
+    assert_that(cache.describe_stats(), contains_string('used/max 4/5 MB'))
+    # Explicitly weighted values are not estimated.
+    cache.put("key3", WeightedValue("value3", 1 << 20))
+    self.assertEqual(cache.size(), 3)
+
+
+class WeightEstimatorTest(unittest.TestCase):
+  def test_estimate_size_primitives(self):
+    for obj in [1, 2.0, 1 + 1j, True, None, 'hello', b'\00\01', bytearray(8)]:
+      self.assertEqual(
+          estimate_size(obj),
+          get_deep_size(obj),
+          f'different size for obj: `{obj}`, type: {type(obj)}')
+
+  def test_estimate_size_list_of_primitives(self):
+    values = ['value%d' % i for i in range(100)]
+    self.assertEqual(estimate_size(values), get_deep_size(values))
+    self.assertEqual(estimate_size(tuple(values)), get_deep_size(tuple(values)))
+
+  def test_estimate_size_nested_objects(self):
+    values = [{'k%d' % i: [i]} for i in range(10)]
+    self.assertEqual(estimate_size(values), get_deep_size(values))
+
+  def test_estimate_size_samples_large_lists(self):
+    values = [('%08d' % i).encode() for i in range(100000)]
+    self.assertAlmostEqual(
+        estimate_size(values) / get_deep_size(values), 1.0, places=2)
+    values = [{'key': 'value%08d' % i} for i in range(10000)]
+    self.assertAlmostEqual(
+        estimate_size(values) / get_deep_size(values), 1.0, places=1)
+
+  def test_estimate_size_samples_large_dicts(self):
+    values = {b'key%08d' % i: 'value%08d' % i for i in range(100000)}
+    self.assertAlmostEqual(
+        estimate_size(values) / get_deep_size(values), 1.0, places=2)
+
+
+class ShardedStateCacheTest(unittest.TestCase):
+  def test_put_peek_invalidate(self):
+    cache = ShardedStateCache(5 << 20, 4)
+    for i in range(4):
+      cache.put("key%d" % i, WeightedValue("value%d" % i, 1 << 10))
+    self.assertEqual(cache.size(), 4)
+    for i in range(4):
+      self.assertEqual(cache.peek("key%d" % i), "value%d" % i)
+    cache.invalidate("key0")
+    self.assertEqual(cache.peek("key0"), None)
+    self.assertEqual(cache.size(), 3)
+    cache.invalidate_all()
+    self.assertEqual(cache.size(), 0)
+
+  def test_get(self):
+    cache = ShardedStateCache(5 << 20, 4)
+    self.assertEqual(cache.get("key", lambda key: key + "value"), "keyvalue")
+    self.assertEqual(cache.get("key", lambda key: "other"), "keyvalue")
+    self.assertEqual(cache.peek("key"), "keyvalue")
+
+  def test_max_weight_is_split_across_shards(self):
+    cache = ShardedStateCache(4 << 20, 4)
+    self.assertEqual([1 << 20] * 4,
+                     [shard._max_weight for shard in cache._shards])
+    for i in range(20):
+      cache.put("key%d" % i, WeightedValue(i, 1 << 20))
+      self.assertLessEqual(
+          sum(shard._current_weight for shard in cache._shards), 4 << 20)
+    self.assertLessEqual(cache.size(), 4)
+    # The most recent write is never evicted by its own put.
+    self.assertEqual(cache.peek("key19"), 19)
+    assert_that(cache.describe_stats(), contains_string('used/max'))
+    # Entries heavier than the share of a shard are not cached.
+    cache.put("heavy", WeightedValue("heavy", 2 << 20))
+    self.assertEqual(cache.peek("heavy"), None)
+
+  def test_uneven_split(self):
+    cache = ShardedStateCache(10, 4)
+    self.assertEqual([3, 3, 2, 2],
+                     [shard._max_weight for shard in cache._shards])
+
+  def test_single_shard_is_lru(self):
+    cache = ShardedStateCache(2 << 20, 1)
+    cache.put("key", WeightedValue("value", 1 << 20))
+    cache.put("key2", WeightedValue("value2", 1 << 20))
+    cache.peek("key")
+    cache.put("key3", WeightedValue("value3", 1 << 20))
+    self.assertEqual(cache.peek("key2"), None)
+    self.assertEqual(cache.peek("key"), "value")
+
+  def test_concurrent_access(self):
+    cache = ShardedStateCache(1 << 20, 8)
+
+    def access(thread_index):
+      for i in range(1000):
+        key = (thread_index, i % 50)
+        cache.put(key, WeightedValue(i, 100))
+        cache.peek(key)
+
+    threads = [threading.Thread(target=access, args=(i, )) for i in range(8)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+    self.assertEqual(cache.size(), 400)
+    assert_that(
+        cache.describe_stats(),
+        contains_string(
+            'lookups 8000, avg load time 0 ns, loads 0, '
+            'evictions 0, shards 8, lock contention'))
+
+  def test_invalid_num_shards(self):
+    with self.assertRaises(ValueError):
+      ShardedStateCache(1 << 20, 0)
+
 
 if __name__ == '__main__':
   logging.getLogger().setLevel(logging.INFO)
@@ -74,6 +74,34 @@ def coder_benchmark_factory(coder, generate_fn):
   return CoderBenchmark
 
 
+def decode_benchmark_factory(coder, generate_fn):
+  """Creates a benchmark that decodes a stream of nested encoded elements.
+
+  This approximates the data plane receive path, which decodes the elements of
+  each received payload from one input stream.
+
+  Args:
+    coder: coder to use to decode an element.
+    generate_fn: a callable that generates an element.
+  """
+  class DecodeBenchmark(object):
+    def __init__(self, num_elements_per_benchmark):
+      self._coder_impl = coder.get_impl()
+      self._encoded = b''.join(
+          self._coder_impl.encode_nested(generate_fn())
+          for _ in range(num_elements_per_benchmark))
+
+    def __call__(self):
+      input_stream = coder_impl.create_InputStream(self._encoded)
+      while input_stream.size() > 0:
+        self._coder_impl.decode_from_stream(input_stream, True)
+
+  DecodeBenchmark.__name__ = "%s, %s, decode" % (
+      generate_fn.__name__, str(coder))
+
+  return DecodeBenchmark
+
+
 def batch_row_coder_benchmark_factory(generate_fn, use_batch):
   """Creates a benchmark that encodes and decodes a list of elements.
 
@@ -140,6 +168,14 @@ def large_string():
   return random_string(100)
 
 
+def large_bytes():
+  return random.getrandbits(8 << 16).to_bytes(1 << 16, 'little')
+
+
+def large_payload():
+  return {'id': small_int(), 'payload': large_bytes()}
+
+
 def list_int(size):
   return [small_int() for _ in range(size)]
 
@@ -197,6 +233,10 @@ def large_message_with_map():
   return random_message_with_map(20)
 
 
+def windowed_large_payload():
+  return window.GlobalWindows.windowed_value(large_payload())
+
+
 def globally_windowed_value():
   return windowed_value.WindowedValue(
       value=small_int(), timestamp=12345678, windows=(window.GlobalWindow(), ))
@@ -303,6 +343,17 @@ def run_coder_benchmarks(
           globally_windowed_value),
       coder_benchmark_factory(
           coders.LengthPrefixCoder(coders.FastPrimitivesCoder()), small_int),
+      decode_benchmark_factory(coders.BytesCoder(), large_bytes),
+      decode_benchmark_factory(
+          coders.LengthPrefixCoder(coders.BytesCoder()), large_bytes),
+      decode_benchmark_factory(
+          coders.LengthPrefixCoder(coders.FastPrimitivesCoder()),
+          large_payload),
+      decode_benchmark_factory(
+          coders.WindowedValueCoder(
+              coders.LengthPrefixCoder(coders.PickleCoder()),
+              coders.GlobalWindowCoder()),
+          windowed_large_payload),
       row_coder_benchmark_factory(tiny_row),
       row_coder_benchmark_factory(large_row),
       row_coder_benchmark_factory(nullable_row),
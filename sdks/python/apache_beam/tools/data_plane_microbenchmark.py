@@ -0,0 +1,160 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A microbenchmark for measuring the throughput of the gRPC data plane.
+
+This sends elements from a GrpcClientDataChannel to a BeamFnDataServicer
+running on a local port, as an SDK harness sends the outputs of a bundle to
+the runner, and reads them back on the runner side. The channel either sends
+pre-encoded Elements messages or lets the generated stub serialize them.
+Besides the per element timings, the median throughput in elements per
+second is printed.
+
+Run as:
+  python -m apache_beam.tools.data_plane_microbenchmark
+"""
+
+# pytype: skip-file
+
+import argparse
+import itertools
+import logging
+import re
+
+import grpc
+import numpy
+
+from apache_beam.portability.api import beam_fn_api_pb2_grpc
+from apache_beam.runners.worker import data_plane
+from apache_beam.runners.worker.worker_id_interceptor import WorkerIdInterceptor
+from apache_beam.tools import utils
+from apache_beam.utils import thread_pool_executor
+
+_WORKER_ID = 'worker'
+# Each run of a benchmark sends the elements of a new instruction.
+_INSTRUCTION_IDS = itertools.count()
+# Like the runner and the SDK harness, do not limit the size of messages.
+_GRPC_OPTIONS = [("grpc.max_receive_message_length", -1),
+                 ("grpc.max_send_message_length", -1)]
+
+
+class LocalDataPlane(object):
+  """A data servicer on a local port and a client channel connected to it."""
+  def __init__(self, pre_encoded):
+    self.servicer = data_plane.BeamFnDataServicer()
+    self.server = grpc.server(
+        thread_pool_executor.shared_unbounded_instance(), options=_GRPC_OPTIONS)
+    if pre_encoded:
+      self.servicer.add_to_server(self.server)
+    else:
+      beam_fn_api_pb2_grpc.add_BeamFnDataServicer_to_server(
+          self.servicer, self.server)
+    port = self.server.add_insecure_port('localhost:0')
+    self.server.start()
+    self._grpc_channel = grpc.intercept_channel(
+        grpc.insecure_channel('localhost:%d' % port, options=_GRPC_OPTIONS),
+        WorkerIdInterceptor(_WORKER_ID))
+    if pre_encoded:
+      stub = data_plane.PreEncodedBeamFnDataStub(self._grpc_channel)
+    else:
+      stub = beam_fn_api_pb2_grpc.BeamFnDataStub(self._grpc_channel)
+    self.client = data_plane.GrpcClientDataChannel(stub)
+    self.runner = self.servicer.get_conn_by_worker_id(_WORKER_ID)
+
+  def close(self):
+    self.client.close()
+    self.runner.close()
+    self.client.wait()
+    self.runner.wait()
+    self._grpc_channel.close()
+    self.server.stop(None)
+
+
+def data_plane_benchmark_factory(local_data_plane, name, element_size):
+  """Creates a benchmark that sends elements through a data channel.
+
+  Args:
+    local_data_plane: the LocalDataPlane to send the elements through.
+    name: name of the data plane.
+    element_size: the size of each encoded element in bytes.
+  """
+  class DataPlaneBenchmark(object):
+    def __init__(self, num_elements_per_benchmark):
+      self._num_elements = num_elements_per_benchmark
+      self._element = b'x' * element_size
+      self._instruction_id = 'bundle_%d' % next(_INSTRUCTION_IDS)
+
+    def __call__(self):
+      output_stream = local_data_plane.client.output_stream(
+          self._instruction_id, 'transform')
+      for _ in range(self._num_elements):
+        output_stream.write(self._element)
+        output_stream.maybe_flush()
+      output_stream.close()
+      received = sum(
+          len(data.data) for data in local_data_plane.runner.input_elements(
+              self._instruction_id, ['transform']))
+      assert received == self._num_elements * element_size
+
+  DataPlaneBenchmark.__name__ = '%s, %d byte elements' % (name, element_size)
+
+  return DataPlaneBenchmark
+
+
+def run_data_plane_benchmarks(num_runs, input_size, verbose, filter_regex='.*'):
+  local_data_planes = [
+      ('pre-encoded', LocalDataPlane(pre_encoded=True)),
+      ('protobuf messages', LocalDataPlane(pre_encoded=False)),
+  ]
+  try:
+    benchmarks = [
+        data_plane_benchmark_factory(local_data_plane, name, element_size)
+        for element_size in (10, 100, 10000)
+        for name, local_data_plane in local_data_planes
+    ]
+    suite = [
+        utils.BenchmarkConfig(b, input_size, num_runs) for b in benchmarks
+        if re.search(filter_regex, b.__name__, flags=re.I)
+    ]
+    _, cost_series = utils.run_benchmarks(suite, verbose=verbose)
+  finally:
+    for _, local_data_plane in local_data_planes:
+      local_data_plane.close()
+
+  if verbose:
+    print()
+    for benchmark_config in suite:
+      name = str(benchmark_config)
+      print(
+          '%s: %.0f elements/sec' %
+          (name, benchmark_config.size / numpy.median(cost_series[name])))
+
+
+if __name__ == '__main__':
+  logging.basicConfig()
+
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--filter', default='.*')
+  parser.add_argument('--num_runs', default=20, type=int)
+  parser.add_argument('--num_elements_per_benchmark', default=100000, type=int)
+  options = parser.parse_args()
+
+  run_data_plane_benchmarks(
+      options.num_runs,
+      options.num_elements_per_benchmark,
+      verbose=True,
+      filter_regex=options.filter)
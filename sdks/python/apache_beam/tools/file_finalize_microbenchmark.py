@@ -0,0 +1,106 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A microbenchmark for measuring the cost of finalizing file writes.
+
+This moves a number of temporary files into their final destinations on the
+local filesystem, as done by the finalization of file-based sinks, with a
+varying number of threads. Half of the files of each run are moved before the
+finalization starts, to account for the cost of skipping files that a retried
+finalization already moved.
+
+Run as:
+  python -m apache_beam.tools.file_finalize_microbenchmark
+"""
+
+# pytype: skip-file
+
+import argparse
+import logging
+import os
+import re
+import tempfile
+
+from apache_beam.io import filebasedsink
+from apache_beam.tools import utils
+
+
+def finalize_benchmark_factory(max_threads, moved_fraction=0.5):
+  """Creates a benchmark that moves files into their final destinations.
+
+  Args:
+    max_threads: the maximum number of concurrent batches of renames.
+    moved_fraction: the fraction of the files that were already moved.
+  """
+  class FinalizeBenchmark(object):
+    def __init__(self, num_files_per_benchmark):
+      # Removed when the benchmark is garbage-collected, after the run.
+      self._temp_dir = tempfile.TemporaryDirectory()
+      self._dir = self._temp_dir.name
+      temp_dir = os.path.join(self._dir, 'temp')
+      os.mkdir(temp_dir)
+      self._src_files = [
+          os.path.join(temp_dir, 'file-%05d' % i)
+          for i in range(num_files_per_benchmark)
+      ]
+      self._dst_files = [
+          os.path.join(self._dir, 'file-%05d' % i)
+          for i in range(num_files_per_benchmark)
+      ]
+      num_moved = int(num_files_per_benchmark * moved_fraction)
+      for i, (src, dst) in enumerate(zip(self._src_files, self._dst_files)):
+        with open(dst if i < num_moved else src, 'wb') as f:
+          f.write(b'x')
+
+    def __call__(self):
+      exceptions = filebasedsink._FileFinalizer(
+          self._dir, 'benchmark',
+          max_threads=max_threads).rename(self._src_files, self._dst_files)
+      assert not exceptions, exceptions
+
+  FinalizeBenchmark.__name__ = 'finalize, %d thread(s)' % max_threads
+
+  return FinalizeBenchmark
+
+
+def run_file_finalize_benchmarks(
+    num_runs, input_size, verbose, filter_regex='.*'):
+  benchmarks = [
+      finalize_benchmark_factory(max_threads) for max_threads in (1, 4, 16, 64)
+  ]
+
+  suite = [
+      utils.BenchmarkConfig(b, input_size, num_runs) for b in benchmarks
+      if re.search(filter_regex, b.__name__, flags=re.I)
+  ]
+  utils.run_benchmarks(suite, verbose=verbose)
+
+
+if __name__ == '__main__':
+  logging.basicConfig()
+
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--filter', default='.*')
+  parser.add_argument('--num_runs', default=10, type=int)
+  parser.add_argument('--num_files_per_benchmark', default=10000, type=int)
+  options = parser.parse_args()
+
+  run_file_finalize_benchmarks(
+      options.num_runs,
+      options.num_files_per_benchmark,
+      verbose=True,
+      filter_regex=options.filter)
@@ -52,16 +52,27 @@ run 10 of 10, per element time cost: 0.0103208 sec
 Fixed cost   4.537164939085642
 Per-element  0.005474923321695039
 R^2          0.95189
+
+Run as
+
+   python -m apache_beam.tools.fn_api_runner_microbenchmark --parallel_scaling
+
+to instead measure how a CPU-bound stage scales with the number of
+multi_processing workers, each of which is an SDK harness subprocess that the
+partitions of every stage are dispatched to concurrently.
 """
 
 # pytype: skip-file
 
 import argparse
 import logging
+import multiprocessing
 import random
+import time
 
 import apache_beam as beam
 from apache_beam.coders import VarIntCoder
+from apache_beam.options.pipeline_options import PipelineOptions
 from apache_beam.runners.portability.fn_api_runner import FnApiRunner
 from apache_beam.tools import utils
 from apache_beam.transforms.timeutil import TimeDomain
@@ -132,6 +143,39 @@ def run_benchmark(
   return utils.run_benchmarks(suite, verbose=verbose)
 
 
+def _burn_cpu(element, iterations):
+  total = element
+  for i in range(iterations):
+    total = (total * 31 + i) % 1000003
+  return total
+
+
+def run_parallel_scaling_benchmark(
+    max_num_workers, num_elements=1000, iterations_per_element=20000):
+  """Runs a CPU-bound pipeline with an increasing number of subprocess workers.
+
+  Returns a list of (num_workers, elapsed_seconds) tuples.
+  """
+  timings = []
+  for num_workers in range(1, max_num_workers + 1):
+    options = PipelineOptions(
+        direct_num_workers=num_workers, direct_running_mode='multi_processing')
+    start = time.time()
+    with beam.Pipeline(runner=FnApiRunner(), options=options) as p:
+      _ = (
+          p
+          | beam.Create(list(range(num_elements)))
+          | beam.Reshuffle()
+          | beam.Map(_burn_cpu, iterations_per_element)
+          | beam.combiners.Count.Globally())
+    elapsed = time.time() - start
+    timings.append((num_workers, elapsed))
+    print(
+        '%d worker(s): %.2f sec, speedup %.2fx' %
+        (num_workers, elapsed, timings[0][1] / elapsed))
+  return timings
+
+
 if __name__ == '__main__':
   logging.basicConfig()
   utils.check_compiled('apache_beam.runners.common')
@@ -141,10 +185,18 @@ if __name__ == '__main__':
   parser.add_argument('--starting_point', default=1, type=int)
   parser.add_argument('--increment', default=100, type=int)
   parser.add_argument('--verbose', default=True, type=bool)
+  parser.add_argument('--parallel_scaling', default=False, action='store_true')
+  parser.add_argument(
+      '--max_num_workers', default=multiprocessing.cpu_count(), type=int)
+  parser.add_argument('--num_elements', default=1000, type=int)
   options = parser.parse_args()
 
-  run_benchmark(
-      options.starting_point,
-      options.num_runs,
-      options.increment,
-      options.verbose)
+  if options.parallel_scaling:
+    run_parallel_scaling_benchmark(
+        options.max_num_workers, options.num_elements)
+  else:
+    run_benchmark(
+        options.starting_point,
+        options.num_runs,
+        options.increment,
+        options.verbose)
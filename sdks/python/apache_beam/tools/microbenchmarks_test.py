@@ -24,6 +24,9 @@ from importlib.metadata import PackageNotFoundError
 from importlib.metadata import distribution
 
 from apache_beam.tools import coders_microbenchmark
+from apache_beam.tools import data_plane_microbenchmark
+from apache_beam.tools import file_finalize_microbenchmark
+from apache_beam.tools import statecache_microbenchmark
 from apache_beam.tools import utils
 
 
@@ -34,6 +37,18 @@ class MicrobenchmarksTest(unittest.TestCase):
     coders_microbenchmark.run_coder_benchmarks(
         num_runs=1, input_size=10, seed=1, verbose=False)
 
+  def test_data_plane_microbenchmark(self):
+    data_plane_microbenchmark.run_data_plane_benchmarks(
+        num_runs=1, input_size=10, verbose=False)
+
+  def test_file_finalize_microbenchmark(self):
+    file_finalize_microbenchmark.run_file_finalize_benchmarks(
+        num_runs=1, input_size=10, verbose=False)
+
+  def test_statecache_microbenchmark(self):
+    statecache_microbenchmark.run_statecache_benchmarks(
+        num_runs=1, input_size=10, seed=1, verbose=False)
+
   def is_cython_installed(self):
     try:
       distribution('cython')
@@ -0,0 +1,158 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A microbenchmark for measuring the cost of weighing state cache entries.
+
+This sizes lists of elements, as cached for bag state, with each of the
+weight estimators of the state cache, and with objsize, which is the
+reference for their accuracy. Besides the timings, the ratio of each
+estimate to the objsize deep size is printed.
+
+Run as:
+  python -m apache_beam.tools.statecache_microbenchmark
+"""
+
+# pytype: skip-file
+
+import argparse
+import logging
+import random
+import re
+import string
+
+from apache_beam.runners.worker import statecache
+from apache_beam.tools import utils
+
+
+def small_int():
+  return random.randint(0, 127)
+
+
+def large_int():
+  return random.randint(1 << 40, 1 << 60)
+
+
+def random_string(length):
+  return ''.join(
+      random.choice(string.ascii_letters + string.digits)
+      for _ in range(length))
+
+
+def small_string():
+  return random_string(4)
+
+
+def large_string():
+  return random_string(100)
+
+
+def small_bytes():
+  return random_string(4).encode()
+
+
+def key_value_tuple():
+  return small_string(), large_int()
+
+
+def small_dict():
+  return {'key%d' % i: small_int() for i in range(3)}
+
+
+def estimator_benchmark_factory(name, estimator, generate_fn):
+  """Creates a benchmark that weighs a list of elements.
+
+  Args:
+    name: name of the weight estimator.
+    estimator: a callable returning the weight of a value.
+    generate_fn: a callable that generates an element.
+  """
+  class EstimatorBenchmark(object):
+    def __init__(self, num_elements_per_benchmark):
+      self._list = [generate_fn() for _ in range(num_elements_per_benchmark)]
+
+    def __call__(self):
+      _ = estimator(self._list)
+
+  EstimatorBenchmark.__name__ = '%s, %s' % (generate_fn.__name__, name)
+
+  return EstimatorBenchmark
+
+
+def estimators():
+  return [
+      ('objsize', statecache.get_deep_size),
+      ('estimate_size', statecache.estimate_size),
+  ]
+
+
+def print_estimate_ratios(input_size, generate_fns):
+  for generate_fn in generate_fns:
+    values = [generate_fn() for _ in range(input_size)]
+    deep_size = statecache.get_deep_size(values)
+    print(
+        '%s: %s' % (
+            generate_fn.__name__,
+            ', '.join(
+                '%s %.2f' % (name, estimator(values) / deep_size)
+                for name, estimator in estimators())))
+  print()
+
+
+def run_statecache_benchmarks(
+    num_runs, input_size, seed, verbose, filter_regex='.*'):
+  random.seed(seed)
+
+  generate_fns = [
+      small_int,
+      large_int,
+      small_string,
+      large_string,
+      small_bytes,
+      key_value_tuple,
+      small_dict,
+  ]
+  benchmarks = [
+      estimator_benchmark_factory(name, estimator, generate_fn)
+      for generate_fn in generate_fns for name, estimator in estimators()
+  ]
+
+  if verbose:
+    print_estimate_ratios(input_size, generate_fns)
+
+  suite = [
+      utils.BenchmarkConfig(b, input_size, num_runs) for b in benchmarks
+      if re.search(filter_regex, b.__name__, flags=re.I)
+  ]
+  utils.run_benchmarks(suite, verbose=verbose)
+
+
+if __name__ == '__main__':
+  logging.basicConfig()
+
+  parser = argparse.ArgumentParser()
+  parser.add_argument('--filter', default='.*')
+  parser.add_argument('--num_runs', default=20, type=int)
+  parser.add_argument('--num_elements_per_benchmark', default=10000, type=int)
+  parser.add_argument('--seed', default=42, type=int)
+  options = parser.parse_args()
+
+  run_statecache_benchmarks(
+      options.num_runs,
+      options.num_elements_per_benchmark,
+      options.seed,
+      verbose=True,
+      filter_regex=options.filter)
@@ -94,6 +94,10 @@ class SideInputMap(object):
   def is_globally_windowed(self) -> bool:
     return self._window_mapping_fn == _global_window_mapping_fn
 
+  def finish(self) -> None:
+    """Called at the end of each bundle. There are no metrics to publish."""
+    pass
+
 
 class _FilteringIterable(object):
   """An iterable containing only those values in the given window.